@@ -0,0 +1,65 @@
+"""add_llm_result_cache
+
+Revision ID: 3a7e51c9d2b4
+Revises: bd9b8b970fb9
+Create Date: 2026-10-19 10:12:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a7e51c9d2b4"
+down_revision: str | Sequence[str] | None = "bd9b8b970fb9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    indexes = inspector.get_indexes(table_name)
+    return any(index["name"] == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "llm_result_cache"):
+        op.create_table(
+            "llm_result_cache",
+            sa.Column("key", sa.String(), primary_key=True),
+            sa.Column("task", sa.String(), nullable=False),
+            sa.Column("result_json", sa.String(), nullable=False),
+            sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("last_used_at", sa.DateTime(), nullable=False),
+        )
+        inspector = sa.inspect(bind)
+
+    if not _index_exists(inspector, "llm_result_cache", "ix_llm_result_cache_task"):
+        op.create_index("ix_llm_result_cache_task", "llm_result_cache", ["task"])
+    if not _index_exists(
+        inspector, "llm_result_cache", "ix_llm_result_cache_last_used_at"
+    ):
+        op.create_index(
+            "ix_llm_result_cache_last_used_at", "llm_result_cache", ["last_used_at"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "llm_result_cache"):
+        op.drop_table("llm_result_cache")
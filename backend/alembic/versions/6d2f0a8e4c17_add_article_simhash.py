@@ -0,0 +1,78 @@
+"""add_article_simhash
+
+Revision ID: 6d2f0a8e4c17
+Revises: 3a7e51c9d2b4
+Create Date: 2026-10-19 11:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2f0a8e4c17"
+down_revision: str | Sequence[str] | None = "3a7e51c9d2b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def _index_exists(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    indexes = inspector.get_indexes(table_name)
+    return any(index["name"] == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _column_exists(inspector, "articles", "simhash"):
+        with op.batch_alter_table("articles", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("simhash", sa.Integer(), nullable=True))
+
+    if not _table_exists(inspector, "article_simhash_bands"):
+        op.create_table(
+            "article_simhash_bands",
+            sa.Column("article_id", sa.Integer(), nullable=False),
+            sa.Column("band", sa.Integer(), nullable=False),
+            sa.Column("value", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["article_id"], ["articles.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("article_id", "band"),
+        )
+        inspector = sa.inspect(bind)
+
+    if not _index_exists(
+        inspector, "article_simhash_bands", "ix_article_simhash_bands_band_value"
+    ):
+        op.create_index(
+            "ix_article_simhash_bands_band_value",
+            "article_simhash_bands",
+            ["band", "value"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "article_simhash_bands"):
+        op.drop_table("article_simhash_bands")
+
+    if _column_exists(inspector, "articles", "simhash"):
+        with op.batch_alter_table("articles", schema=None) as batch_op:
+            batch_op.drop_column("simhash")
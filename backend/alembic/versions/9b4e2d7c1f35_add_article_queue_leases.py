@@ -0,0 +1,72 @@
+"""add_article_queue_leases
+
+Revision ID: 9b4e2d7c1f35
+Revises: 6d2f0a8e4c17
+Create Date: 2026-10-19 14:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e2d7c1f35"
+down_revision: str | Sequence[str] | None = "6d2f0a8e4c17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_QUEUE_INDEXES = {
+    "ix_articles_categorization_queue": "categorization_state",
+    "ix_articles_scoring_queue": "scoring_state",
+}
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def _index_exists(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    indexes = inspector.get_indexes(table_name)
+    return any(index["name"] == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if not _column_exists(inspector, "articles", "lease_owner"):
+            batch_op.add_column(sa.Column("lease_owner", sa.String(), nullable=True))
+        if not _column_exists(inspector, "articles", "lease_expires_at"):
+            batch_op.add_column(
+                sa.Column("lease_expires_at", sa.DateTime(), nullable=True)
+            )
+
+    for index_name, state_column in _QUEUE_INDEXES.items():
+        if not _index_exists(inspector, "articles", index_name):
+            op.create_index(
+                index_name,
+                "articles",
+                [state_column, sa.text("scoring_priority DESC"), "published_at"],
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for index_name in _QUEUE_INDEXES:
+        if _index_exists(inspector, "articles", index_name):
+            op.drop_index(index_name, table_name="articles")
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if _column_exists(inspector, "articles", "lease_expires_at"):
+            batch_op.drop_column("lease_expires_at")
+        if _column_exists(inspector, "articles", "lease_owner"):
+            batch_op.drop_column("lease_owner")
@@ -0,0 +1,91 @@
+"""add_article_queue_lanes
+
+Revision ID: a3f9d6b2c8e1
+Revises: e4b7c2d9a1f3
+Create Date: 2026-10-19 20:15:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f9d6b2c8e1"
+down_revision: str | Sequence[str] | None = "e4b7c2d9a1f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_QUEUE_INDEXES = {
+    "ix_articles_categorization_queue": "categorization_state",
+    "ix_articles_scoring_queue": "scoring_state",
+}
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def _index_columns(
+    inspector: sa.Inspector, table_name: str, index_name: str
+) -> list[str | None] | None:
+    for index in inspector.get_indexes(table_name):
+        if index["name"] == index_name:
+            return index["column_names"]
+    return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if not _column_exists(inspector, "articles", "queue_lane"):
+            batch_op.add_column(
+                sa.Column(
+                    "queue_lane", sa.String(), nullable=False, server_default="fresh"
+                )
+            )
+        if not _column_exists(inspector, "articles", "queued_at"):
+            batch_op.add_column(sa.Column("queued_at", sa.DateTime(), nullable=True))
+
+    # Pending single rescores keep their place ahead of everything else
+    op.execute(
+        "UPDATE articles SET queue_lane = 'interactive' WHERE scoring_priority > 0"
+    )
+
+    # Queue indexes now lead with the lane instead of the priority
+    inspector = sa.inspect(bind)
+    for index_name, state_column in _QUEUE_INDEXES.items():
+        expected = [state_column, "queue_lane", "published_at"]
+        existing = _index_columns(inspector, "articles", index_name)
+        if existing == expected:
+            continue
+        if existing is not None:
+            op.drop_index(index_name, table_name="articles")
+        op.create_index(index_name, "articles", expected)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for index_name, state_column in _QUEUE_INDEXES.items():
+        if _index_columns(inspector, "articles", index_name) is not None:
+            op.drop_index(index_name, table_name="articles")
+        op.create_index(
+            index_name,
+            "articles",
+            [state_column, sa.text("scoring_priority DESC"), "published_at"],
+        )
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if _column_exists(inspector, "articles", "queued_at"):
+            batch_op.drop_column("queued_at")
+        if _column_exists(inspector, "articles", "queue_lane"):
+            batch_op.drop_column("queue_lane")
@@ -0,0 +1,51 @@
+"""add_article_score_tier
+
+Revision ID: b7e2c4f1d9a6
+Revises: a3f9d6b2c8e1
+Create Date: 2026-10-19 21:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c4f1d9a6"
+down_revision: str | Sequence[str] | None = "a3f9d6b2c8e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if not _column_exists(inspector, "articles", "score_tier"):
+            batch_op.add_column(sa.Column("score_tier", sa.String(), nullable=True))
+
+    # Every score so far came from the scoring route's own model
+    op.execute(
+        "UPDATE articles SET score_tier = 'large' "
+        "WHERE scoring_state = 'scored' "
+        "AND COALESCE(score_reasoning, '') NOT LIKE 'Blocked:%'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if _column_exists(inspector, "articles", "score_tier"):
+            batch_op.drop_column("score_tier")
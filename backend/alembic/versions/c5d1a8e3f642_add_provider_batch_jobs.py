@@ -0,0 +1,68 @@
+"""add_provider_batch_jobs
+
+Revision ID: c5d1a8e3f642
+Revises: 9b4e2d7c1f35
+Create Date: 2026-10-19 18:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d1a8e3f642"
+down_revision: str | Sequence[str] | None = "9b4e2d7c1f35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    indexes = inspector.get_indexes(table_name)
+    return any(index["name"] == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "provider_batch_jobs"):
+        op.create_table(
+            "provider_batch_jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("provider", sa.String(), nullable=False),
+            sa.Column("task", sa.String(), nullable=False),
+            sa.Column("job_name", sa.String(), nullable=False, unique=True),
+            sa.Column("model", sa.String(), nullable=False),
+            sa.Column("state", sa.String(), nullable=False, server_default="running"),
+            sa.Column("article_ids_json", sa.String(), nullable=False),
+            sa.Column("interests_hash", sa.String(), nullable=True),
+            sa.Column("lease_owner", sa.String(), nullable=False),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+        )
+        inspector = sa.inspect(bind)
+
+    if not _index_exists(
+        inspector, "provider_batch_jobs", "ix_provider_batch_jobs_state"
+    ):
+        op.create_index(
+            "ix_provider_batch_jobs_state", "provider_batch_jobs", ["state"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "provider_batch_jobs"):
+        op.drop_table("provider_batch_jobs")
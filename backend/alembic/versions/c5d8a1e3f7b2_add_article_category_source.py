@@ -0,0 +1,53 @@
+"""add_article_category_source
+
+Revision ID: c5d8a1e3f7b2
+Revises: b7e2c4f1d9a6
+Create Date: 2026-10-19 23:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d8a1e3f7b2"
+down_revision: str | Sequence[str] | None = "b7e2c4f1d9a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if not _column_exists(inspector, "articles", "category_source"):
+            batch_op.add_column(
+                sa.Column("category_source", sa.String(), nullable=True)
+            )
+
+    # Every categorization so far came from the LLM or a near-duplicate of
+    # an LLM-categorized article
+    op.execute(
+        "UPDATE articles SET category_source = 'llm' "
+        "WHERE categorization_state = 'categorized'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    with op.batch_alter_table("articles", schema=None) as batch_op:
+        if _column_exists(inspector, "articles", "category_source"):
+            batch_op.drop_column("category_source")
@@ -0,0 +1,72 @@
+"""add_prefilter_rules
+
+Revision ID: d9e4b2a7c3f1
+Revises: c5d8a1e3f7b2
+Create Date: 2026-10-19 23:50:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e4b2a7c3f1"
+down_revision: str | Sequence[str] | None = "c5d8a1e3f7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(inspector: sa.Inspector, table_name: str, index_name: str) -> bool:
+    indexes = inspector.get_indexes(table_name)
+    return any(index["name"] == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "prefilter_rules"):
+        op.create_table(
+            "prefilter_rules",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("target", sa.String(), nullable=False),
+            sa.Column("pattern", sa.String(), nullable=False, server_default=""),
+            sa.Column(
+                "is_regex", sa.Boolean(), nullable=False, server_default=sa.false()
+            ),
+            sa.Column(
+                "feed_id",
+                sa.Integer(),
+                sa.ForeignKey("feeds.id", ondelete="CASCADE"),
+                nullable=True,
+            ),
+            sa.Column(
+                "enabled", sa.Boolean(), nullable=False, server_default=sa.true()
+            ),
+            sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("last_hit_at", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        inspector = sa.inspect(bind)
+
+    if not _index_exists(inspector, "prefilter_rules", "ix_prefilter_rules_feed_id"):
+        op.create_index("ix_prefilter_rules_feed_id", "prefilter_rules", ["feed_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "prefilter_rules"):
+        op.drop_table("prefilter_rules")
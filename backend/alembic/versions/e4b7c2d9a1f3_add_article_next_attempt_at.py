@@ -0,0 +1,46 @@
+"""add_article_next_attempt_at
+
+Revision ID: e4b7c2d9a1f3
+Revises: c5d1a8e3f642
+Create Date: 2026-10-19 18:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c2d9a1f3"
+down_revision: str | Sequence[str] | None = "c5d1a8e3f642"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _column_exists(inspector: sa.Inspector, table_name: str, column_name: str) -> bool:
+    columns = inspector.get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _column_exists(inspector, "articles", "next_attempt_at"):
+        with op.batch_alter_table("articles", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("next_attempt_at", sa.DateTime(), nullable=True)
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _column_exists(inspector, "articles", "next_attempt_at"):
+        with op.batch_alter_table("articles", schema=None) as batch_op:
+            batch_op.drop_column("next_attempt_at")
@@ -0,0 +1,285 @@
+"""Offline batch jobs for large backlogs on hosted providers.
+
+When a task's backlog lane holds at least PIPELINE__BATCH_JOB_THRESHOLD
+articles (off by default) and the task is routed to a provider with a batch
+API, the pipeline claims up to PIPELINE__BATCH_JOB_MAX_ARTICLES of them under
+a lease owned by a new job, builds the same prompts the worker would send
+(one per batch size of articles), and submits them as one asynchronous job.
+Interactive rescores and fresh articles are never claimed: they stay with
+the synchronous workers. The job id is stored in
+provider_batch_jobs, so jobs survive restarts.
+
+Every pipeline run polls the running jobs. A finished job's results go
+through the task worker's usual result path (result cache, routing to
+scoring, attempt counting for articles without a result). Only articles
+still held by the job are updated: one re-queued in the meantime, e.g. by a
+rescore after an interests change, keeps its newer state. A failed or expired
+job re-queues its articles with an attempt counted.
+"""
+
+import json
+import logging
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, col, func, select
+
+from backend.config import get_settings
+from backend.deps import (
+    TASK_CATEGORIZATION,
+    TASK_SCORING,
+    TaskName,
+    TaskRuntimeResolution,
+    evaluate_task_readiness,
+    get_provider_config_row,
+    get_task_batch_size,
+)
+from backend.leases import BATCH_JOB_OWNER_PREFIX, LANE_BACKLOG, claim_batch
+from backend.llm_providers.base import BatchJobProvider, ProviderTaskConfig
+from backend.llm_providers.registry import get_provider
+from backend.models import Article, ProviderBatchJob
+from backend.prompts import BatchCategoryResponse, BatchScoringResponse
+from backend.scoring_queue import CategorizationWorker, ScoringWorker
+
+logger = logging.getLogger(__name__)
+
+# Wait this long before trying again after a job could not be submitted
+SUBMIT_RETRY_SECONDS = 600.0
+
+_TASKS = {
+    TASK_CATEGORIZATION: (
+        Article.categorization_state,
+        "categorizing",
+        BatchCategoryResponse,
+    ),
+    TASK_SCORING: (Article.scoring_state, "scoring", BatchScoringResponse),
+}
+
+# task -> monotonic time before which no new job is submitted
+_submit_retry_at: dict[str, float] = {}
+
+
+def _queue_depth(session: Session, task: TaskName) -> int:
+    state = _TASKS[task][0]
+    return session.exec(
+        select(func.count())
+        .select_from(Article)
+        .where(col(state) == "queued")
+        .where(Article.queue_lane == LANE_BACKLOG)
+    ).one()
+
+
+def _held_articles(session: Session, job: ProviderBatchJob) -> list[Article]:
+    """The job's articles that are still in progress under its lease."""
+    state, running, _ = _TASKS[job.task]
+    return list(
+        session.exec(
+            select(Article)
+            .where(col(Article.id).in_(json.loads(job.article_ids_json)))
+            .where(col(state) == running)
+            .where(Article.lease_owner == job.lease_owner)
+        ).all()
+    )
+
+
+def _job_runtime(job: ProviderBatchJob) -> TaskRuntimeResolution:
+    """Runtime the job's results were produced with, for result cache keys."""
+    return TaskRuntimeResolution(
+        task=job.task,  # pyright: ignore[reportArgumentType]
+        provider=job.provider,
+        model=job.model,
+        endpoint=None,
+        thinking=False,
+        api_key=None,
+        ready=True,
+        reason=None,
+    )
+
+
+async def submit_backlog(session: Session, task: TaskName) -> ProviderBatchJob | None:
+    """Submit part of a task's backlog as a batch job, if it is large enough.
+
+    At most one job per task runs at a time. Returns the new job, or None if
+    none was submitted.
+    """
+    settings = get_settings().pipeline
+    if settings.batch_job_threshold <= 0:
+        return None
+    if time.monotonic() < _submit_retry_at.get(task, 0.0):
+        return None
+    if _queue_depth(session, task) < settings.batch_job_threshold:
+        return None
+    running = session.exec(
+        select(ProviderBatchJob.id)
+        .where(ProviderBatchJob.task == task)
+        .where(ProviderBatchJob.state == "running")
+    ).first()
+    if running is not None:
+        return None
+
+    runtime = await evaluate_task_readiness(session, task)
+    if not runtime.ready or runtime.model is None:
+        return None
+    try:
+        provider = get_provider(runtime.provider)
+    except KeyError:
+        return None
+    if not isinstance(provider, BatchJobProvider):
+        return None
+
+    owner = f"{BATCH_JOB_OWNER_PREFIX}{uuid.uuid4().hex}"
+    articles = claim_batch(
+        session,
+        task,
+        settings.batch_job_max_articles,
+        owner=owner,
+        lease_seconds=settings.batch_job_lease_hours * 3600,
+        # Interactive rescores and fresh articles stay with the workers
+        lanes=(LANE_BACKLOG,),
+    )
+    interests_digest = None
+    per_request = settings.max_batch_size or get_task_batch_size(session, task)
+    if task == TASK_CATEGORIZATION:
+        prompts, article_ids = CategorizationWorker().prepare_batch_job(
+            session, articles, runtime, per_request
+        )
+    else:
+        prompts, article_ids, interests_digest = ScoringWorker().prepare_batch_job(
+            session, articles, runtime, per_request
+        )
+    if not prompts:
+        return None
+
+    config = ProviderTaskConfig(
+        endpoint=runtime.endpoint,
+        model=runtime.model,
+        thinking=runtime.thinking,
+        api_key=runtime.api_key,
+    )
+    state, running_state, schema = _TASKS[task]
+    try:
+        job_name = await provider.submit_batch_job(config, task, prompts, schema)
+    except Exception as e:
+        logger.warning("Could not submit %s batch job: %s", task, e)
+        _submit_retry_at[task] = time.monotonic() + SUBMIT_RETRY_SECONDS
+        # Hand the backlog back to the synchronous workers
+        session.exec(  # pyright: ignore[reportCallIssue]
+            update(Article)
+            .where(col(Article.id).in_(article_ids))
+            .where(col(state) == running_state)
+            .values({state: "queued"})
+        )
+        session.commit()
+        return None
+
+    job = ProviderBatchJob(
+        provider=runtime.provider,
+        task=task,
+        job_name=job_name,
+        model=runtime.model,
+        article_ids_json=json.dumps(article_ids),
+        interests_hash=interests_digest,
+        lease_owner=owner,
+    )
+    session.add(job)
+    session.commit()
+    logger.info(
+        "%s backlog: %d articles submitted as batch job %s",
+        task,
+        len(article_ids),
+        job_name,
+    )
+    return job
+
+
+def _complete(
+    session: Session, job: ProviderBatchJob, articles: list[Article], results: list
+) -> int:
+    if job.task == TASK_CATEGORIZATION:
+        return CategorizationWorker().complete_batch_job(
+            session, articles, results, _job_runtime(job)
+        )
+    return ScoringWorker().complete_batch_job(
+        session, articles, results, _job_runtime(job), job.interests_hash
+    )
+
+
+async def poll_batch_jobs(session: Session) -> int:
+    """Check running batch jobs and apply the results of finished ones.
+
+    Returns the number of articles that received a result.
+    """
+    applied = 0
+    jobs = session.exec(
+        select(ProviderBatchJob).where(ProviderBatchJob.state == "running")
+    ).all()
+    for job in jobs:
+        row = get_provider_config_row(session, job.provider)
+        try:
+            provider = get_provider(job.provider)
+        except KeyError:
+            continue
+        if row is None or not isinstance(provider, BatchJobProvider):
+            continue
+        config = provider.parse_config(row.config_json, job.task)
+        config.model = job.model
+        schema = _TASKS[job.task][2]
+        try:
+            status = await provider.poll_batch_job(config, job.job_name, schema)
+        except Exception as e:
+            logger.warning("Could not poll batch job %s: %s", job.job_name, e)
+            continue
+        if status.state == "running":
+            continue
+
+        articles = _held_articles(session, job)
+        if status.state == "succeeded":
+            count = _complete(session, job, articles, status.results or [])
+            applied += count
+            job.state = "applied"
+            logger.info(
+                "Batch job %s applied: %d of %d articles",
+                job.job_name,
+                count,
+                len(articles),
+            )
+        else:
+            logger.warning("Batch job %s failed: %s", job.job_name, status.error)
+            # No results: every held article counts an attempt and is re-queued
+            _complete(session, job, articles, [])
+            job.state = "failed"
+            job.error = status.error
+        job.completed_at = datetime.now()
+        session.add(job)
+        session.commit()
+    return applied
+
+
+async def run_batch_jobs(session: Session) -> None:
+    """Pipeline hook: poll running jobs, then submit large backlogs.
+
+    Never raises; the synchronous workers carry on regardless.
+    """
+    try:
+        await poll_batch_jobs(session)
+        for task in (TASK_CATEGORIZATION, TASK_SCORING):
+            await submit_backlog(session, task)
+    except Exception:
+        session.rollback()
+        logger.exception("Batch job processing failed")
+
+
+def get_batch_job_stats(session: Session) -> dict:
+    """Counters for /api/scoring/status."""
+    running = session.exec(
+        select(ProviderBatchJob.article_ids_json).where(
+            ProviderBatchJob.state == "running"
+        )
+    ).all()
+    return {
+        "threshold": get_settings().pipeline.batch_job_threshold,
+        "running_jobs": len(running),
+        "articles_in_jobs": sum(len(json.loads(ids)) for ids in running),
+    }
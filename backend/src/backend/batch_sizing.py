@@ -0,0 +1,223 @@
+"""Adaptive per-task batch sizing driven by observed LLM batch outcomes.
+
+The configured route batch size is only a starting point: the best size
+depends on the model and hardware. Each task gets a controller that grows
+the batch while per-article latency keeps improving and shrinks it as soon
+as the model starts dropping article IDs, timing out, or returning output
+that fails validation.
+
+Ephemeral in-memory state, safe in single-worker asyncio (same as the
+activity tracking in scoring.py).
+"""
+
+import logging
+
+import httpx
+
+from backend.config import get_settings
+from backend.llm_providers.base import LLMValidationError
+
+logger = logging.getLogger(__name__)
+
+# Consecutive clean full batches required before trying a larger size
+GROW_AFTER_CLEAN_BATCHES = 3
+# Missing-result rate above which a batch counts as overloaded
+MISSING_RATE_THRESHOLD = 0.2
+# A larger size must not be more than this much slower per article
+LATENCY_TOLERANCE = 0.10
+# Smoothing factor for per-article latency EWMA
+_EWMA_ALPHA = 0.3
+
+TIMEOUT_ERRORS = (TimeoutError, httpx.TimeoutException)
+
+
+def classify_batch_error(exc: BaseException) -> str | None:
+    """Map a batch failure to a controller signal, or None if it says nothing about size."""
+    if isinstance(exc, LLMValidationError):
+        return "validation"
+    if isinstance(exc, TIMEOUT_ERRORS):
+        return "timeout"
+    return None
+
+
+class AdaptiveBatchController:
+    """AIMD-style batch size controller for a single task route."""
+
+    def __init__(self, task: str, min_size: int, max_size: int | None) -> None:
+        self.task = task
+        self.min_size = max(1, min_size)
+        # None: the configured size is the upper bound (set in effective_size)
+        self._max_bound = max_size
+        self.max_size = max(self.min_size, max_size or self.min_size)
+        self.configured: int | None = None
+        self.current: int | None = None
+        self.reason = "not started"
+        self.clean_streak = 0
+        self.batches = 0
+        self.missing_rate = 0.0
+        self.validation_errors = 0
+        self.timeouts = 0
+        self._latency_by_size: dict[int, float] = {}
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
+
+    def effective_size(self, configured: int) -> int:
+        """Return the batch size to use next, re-seeding on config changes."""
+        if configured != self.configured:
+            self.configured = configured
+            if self._max_bound is None:
+                self.max_size = max(self.min_size, configured)
+            self.current = self._clamp(configured)
+            self.clean_streak = 0
+            self._latency_by_size.clear()
+            self.reason = f"configured size {configured}"
+        assert self.current is not None
+        return self.current
+
+    def _shrink(self, new_size: int, reason: str) -> None:
+        assert self.current is not None
+        new_size = self._clamp(new_size)
+        if new_size < self.current:
+            logger.info(
+                "Batch size for %s reduced %d -> %d (%s)",
+                self.task,
+                self.current,
+                new_size,
+                reason,
+            )
+        self.current = new_size
+        self.clean_streak = 0
+        self.reason = reason
+
+    def record_success(self, requested: int, returned: int, elapsed: float) -> None:
+        """Record a completed batch call.
+
+        Args:
+            requested: Number of articles sent to the LLM
+            returned: Number of matching results the LLM returned
+            elapsed: Wall-clock seconds for the LLM call
+        """
+        if self.current is None or requested <= 0:
+            return
+        self.batches += 1
+        missing = max(0, requested - returned)
+        rate = missing / requested
+        self.missing_rate = (1 - _EWMA_ALPHA) * self.missing_rate + _EWMA_ALPHA * rate
+
+        per_article = elapsed / requested
+        prev = self._latency_by_size.get(requested)
+        self._latency_by_size[requested] = (
+            per_article
+            if prev is None
+            else (1 - _EWMA_ALPHA) * prev + _EWMA_ALPHA * per_article
+        )
+
+        if rate > MISSING_RATE_THRESHOLD:
+            self._shrink(
+                self.current - max(1, missing),
+                f"{missing}/{requested} results missing at size {requested}",
+            )
+            return
+
+        # Partial batches (short queue) say nothing about the current size
+        if requested < self.current:
+            return
+
+        self.clean_streak += 1
+        if self.clean_streak < GROW_AFTER_CLEAN_BATCHES:
+            return
+        if self.current >= self.max_size:
+            self.reason = f"at upper bound {self.max_size}"
+            return
+
+        smaller = self._latency_by_size.get(self.current - 1)
+        current_latency = self._latency_by_size[self.current]
+        if smaller is not None and current_latency > smaller * (1 + LATENCY_TOLERANCE):
+            self.reason = (
+                f"holding at {self.current}: per-article latency "
+                f"{current_latency:.2f}s vs {smaller:.2f}s at {self.current - 1}"
+            )
+            self.clean_streak = 0
+            return
+
+        self.current += 1
+        self.clean_streak = 0
+        self.reason = f"grew after {GROW_AFTER_CLEAN_BATCHES} clean batches"
+        logger.info("Batch size for %s increased to %d", self.task, self.current)
+
+    def record_failure(self, requested: int, signal: str) -> None:
+        """Record a failed batch call classified by classify_batch_error."""
+        if self.current is None or requested <= 0:
+            return
+        self.batches += 1
+        if signal == "validation":
+            self.validation_errors += 1
+        elif signal == "timeout":
+            self.timeouts += 1
+        self._shrink(self.current // 2, f"{signal} failure at size {requested}")
+
+    def snapshot(self) -> dict:
+        """Current state for the status endpoint."""
+        latency = (
+            self._latency_by_size.get(self.current)
+            if self.current is not None
+            else None
+        )
+        return {
+            "effective": self.current,
+            "configured": self.configured,
+            "min": self.min_size,
+            "max": self.max_size,
+            "reason": self.reason,
+            "per_article_latency_s": round(latency, 3) if latency is not None else None,
+            "missing_rate": round(self.missing_rate, 3),
+            "validation_errors": self.validation_errors,
+            "timeouts": self.timeouts,
+        }
+
+
+_controllers: dict[str, AdaptiveBatchController] = {}
+
+
+def get_batch_controller(task: str) -> AdaptiveBatchController:
+    """Return the process-wide controller for a task, creating it lazily."""
+    controller = _controllers.get(task)
+    if controller is None:
+        pipeline = get_settings().pipeline
+        controller = AdaptiveBatchController(
+            task, pipeline.min_batch_size, pipeline.max_batch_size
+        )
+        _controllers[task] = controller
+    return controller
+
+
+def resolve_batch_size(task: str, configured: int) -> int:
+    """Effective batch size for a task given its configured route size."""
+    if not get_settings().pipeline.adaptive_batch_size:
+        return configured
+    return get_batch_controller(task).effective_size(configured)
+
+
+def record_batch_success(
+    task: str, requested: int, returned: int, elapsed: float
+) -> None:
+    """Feed a completed batch into the task's controller."""
+    if get_settings().pipeline.adaptive_batch_size:
+        get_batch_controller(task).record_success(requested, returned, elapsed)
+
+
+def record_batch_failure(task: str, requested: int, exc: BaseException) -> None:
+    """Feed a failed batch into the task's controller if the error is size-related."""
+    if not get_settings().pipeline.adaptive_batch_size:
+        return
+    signal = classify_batch_error(exc)
+    if signal is not None:
+        get_batch_controller(task).record_failure(requested, signal)
+
+
+def get_batch_size_status(task: str) -> dict:
+    """Snapshot for /api/scoring/status."""
+    if not get_settings().pipeline.adaptive_batch_size:
+        return {"effective": None, "reason": "adaptive batch sizing disabled"}
+    return get_batch_controller(task).snapshot()
@@ -0,0 +1,4 @@
+"""Standalone benchmarks for pipeline hot paths.
+
+Run with ``uv run python -m backend.benchmarks.<name>``.
+"""
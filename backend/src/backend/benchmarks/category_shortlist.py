@@ -0,0 +1,222 @@
+"""Benchmark the per-batch category shortlist in categorization prompts.
+
+Usage:
+    uv run python -m backend.benchmarks.category_shortlist [--db PATH] [--size K]
+
+Replays already categorized articles in batches and builds the batch
+categorization system prompt twice: with every category, and with the
+shortlist. Reports prompt size (tokens estimated at 4 characters each) and
+agreement, i.e. how many of the categories previously assigned to an article
+the shortlist still offers. A category that is not offered can only come
+back as a new suggestion, so this is an upper bound on how often the LLM can
+reproduce its earlier answer.
+
+With --db the articles and categories come from an existing database (only
+read). Without it a synthetic catalog of a few hundred categories is built;
+a fifth of the synthetic labels are never mentioned in the article text, so
+lexical retrieval cannot find them from the article alone.
+"""
+
+import argparse
+import random
+import tempfile
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+from backend.category_catalog import get_catalog
+from backend.category_shortlist import shortlist_categories
+from backend.models import Article, ArticleCategoryLink, Category, Feed
+from backend.prompts import (
+    DEFAULT_CATEGORY_HIERARCHY,
+    build_batch_categorization_prompt,
+)
+
+CHARS_PER_TOKEN = 4
+
+_MODIFIERS = [
+    "Open Source", "Quantum", "Urban", "Renewable", "Mobile", "Cloud", "Rural",
+    "Consumer", "Industrial", "Public", "Digital", "Marine",
+]  # fmt: skip
+_NOUNS = [
+    "Robotics", "Energy", "Transport", "Privacy", "Hardware", "Agriculture",
+    "Policy", "Medicine", "Gaming", "Photography", "Architecture", "Linguistics",
+    "Astronomy", "Retail", "Banking", "Journalism", "Typography", "Chemistry",
+    "Genetics", "Aviation", "Cooking", "Fashion", "Sports", "Housing",
+]  # fmt: skip
+_FILLER = (
+    "the report says that new results were announced this week after a long "
+    "period of work and discussion among people who follow these developments "
+    "closely while critics argue the change will take years to matter"
+).split()
+
+
+def _populate_synthetic(engine, articles: int, rng: random.Random) -> None:
+    with Session(engine) as session:
+        feed = Feed(url="https://example.com/feed.xml", title="Bench")
+        session.add(feed)
+        parents = {
+            name: Category(display_name=name, slug=name.lower())
+            for name in DEFAULT_CATEGORY_HIERARCHY
+        }
+        session.add_all(parents.values())
+        session.commit()
+        categories = list(parents.values())
+        for parent, children in DEFAULT_CATEGORY_HIERARCHY.items():
+            for child in children:
+                categories.append(
+                    Category(
+                        display_name=child,
+                        slug=child.lower(),
+                        parent_id=parents[parent].id,
+                    )
+                )
+        for modifier in _MODIFIERS:
+            for noun in _NOUNS:
+                name = f"{modifier} {noun}"
+                categories.append(
+                    Category(
+                        display_name=name,
+                        slug=name.lower().replace(" ", "-"),
+                        is_hidden=rng.random() < 0.03,
+                    )
+                )
+        session.add_all(categories)
+        session.commit()
+        visible = [c for c in categories if not c.is_hidden]
+
+        links = []
+        rows = []
+        for i in range(articles):
+            labels = rng.sample(visible, rng.randint(1, 3))
+            words = rng.choices(_FILLER, k=120)
+            for label in labels:
+                if rng.random() < 0.8:
+                    position = rng.randrange(len(words))
+                    words[position:position] = label.display_name.lower().split()
+                links.append({"article_id": i + 1, "category_id": label.id})
+            rows.append(
+                {
+                    "id": i + 1,
+                    "feed_id": feed.id,
+                    "title": " ".join(rng.choices(_FILLER, k=8)).capitalize(),
+                    "url": f"https://example.com/{i}",
+                    "content": " ".join(words),
+                    "published_at": datetime.now(),
+                    "is_read": False,
+                    "scoring_state": "scored",
+                    "categorization_state": "categorized",
+                    "scoring_priority": 0,
+                    "categorization_attempts": 0,
+                    "scoring_attempts": 0,
+                }
+            )
+        session.execute(insert(Article), rows)
+        session.execute(insert(ArticleCategoryLink), links)
+        session.commit()
+
+
+def _load_sample(session: Session, articles: int) -> tuple[list[dict], dict]:
+    recent = session.exec(
+        select(Article)
+        .where(Article.categorization_state == "categorized")
+        .order_by(col(Article.published_at).desc())
+        .limit(articles)
+    ).all()
+    dicts = [
+        {
+            "id": art.id,
+            "title": art.title,
+            "content_markdown": art.content_markdown
+            or art.content
+            or art.summary
+            or "",
+        }
+        for art in recent
+    ]
+    assigned: dict[int, set[int]] = defaultdict(set)
+    for aid, cid in session.exec(
+        select(ArticleCategoryLink.article_id, ArticleCategoryLink.category_id).where(
+            col(ArticleCategoryLink.article_id).in_([a["id"] for a in dicts])
+        )
+    ).all():
+        assigned[aid].add(cid)
+    return dicts, assigned
+
+
+def _prompt_tokens(batch, names, hierarchy, hidden) -> int:
+    system_prompt, _ = build_batch_categorization_prompt(
+        batch, names, category_hierarchy=hierarchy, hidden_categories=hidden or None
+    )
+    return len(system_prompt) // CHARS_PER_TOKEN
+
+
+def _report(session: Session, articles: int, batch_size: int, size: int) -> None:
+    catalog = get_catalog(session)
+    sample, assigned = _load_sample(session, articles)
+    full_tokens = short_tokens = 0
+    pairs = kept = covered = 0
+    for start in range(0, len(sample), batch_size):
+        batch = sample[start : start + batch_size]
+        names, hierarchy, hidden = shortlist_categories(catalog, batch, size)
+        full_tokens += _prompt_tokens(
+            batch, catalog.active_names, catalog.hierarchy, catalog.hidden_names
+        )
+        short_tokens += _prompt_tokens(batch, names, hierarchy, hidden)
+        offered = set(names)
+        for article in batch:
+            labels = [
+                catalog.by_id[cid].display_name
+                for cid in assigned[article["id"]]
+                if cid in catalog.by_id and not catalog.by_id[cid].is_hidden
+            ]
+            hits = sum(label in offered for label in labels)
+            pairs += len(labels)
+            kept += hits
+            covered += hits == len(labels)
+
+    batches = -(-len(sample) // batch_size) or 1
+    print(f"categories:               {len(catalog.active_names)} active, "
+          f"{len(catalog.hidden_names)} hidden")  # fmt: skip
+    print(f"articles replayed:        {len(sample)} in {batches} batches")
+    print(f"system prompt (full):     {full_tokens / batches:.0f} tokens/batch")
+    print(f"system prompt (top {size}):  {short_tokens / batches:.0f} tokens/batch")
+    if full_tokens:
+        print(f"prompt tokens saved:      {1 - short_tokens / full_tokens:.1%}")
+    if pairs:
+        print(f"assigned labels offered:  {kept / pairs:.1%}")
+        print(f"articles fully covered:   {covered / len(sample):.1%}")
+
+
+def run(db: Path | None, articles: int, batch_size: int, size: int) -> None:
+    if db is not None:
+        engine = create_engine(f"sqlite:///{db}")
+        with Session(engine) as session:
+            _report(session, articles, batch_size, size)
+        engine.dispose()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        _populate_synthetic(engine, articles, random.Random(0))
+        with Session(engine) as session:
+            _report(session, articles, batch_size, size)
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="existing database to replay")
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--size", type=int, default=40, help="shortlist size")
+    args = parser.parse_args()
+    run(args.db, args.articles, args.batch_size, args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""A/B combined categorize-and-score against the two-stage path.
+
+Usage:
+    uv run python -m backend.benchmarks.combined --db PATH \\
+        [--articles 50] [--batch-size 5]
+    uv run python -m backend.benchmarks.combined --fake
+
+Takes the most recent articles with content from the database and sends
+each batch both ways through the routed providers: categorize on the
+categorization route then score on the scoring route, and one
+categorize_and_score call on the scoring route, as PIPELINE__COMBINED_MODE
+does. Which path goes first alternates per batch, so a warm prompt cache
+favours neither. The database is only read.
+
+Reports wall time and articles per minute for each path, LLM tokens per
+article where the provider reports them, and how closely the combined
+results agree with the two-stage ones: category overlap (Jaccard), mean
+absolute interest and quality difference, the share of interest scores
+within one point, and the mean composite difference after category weights
+and blocking.
+
+--fake runs against FakeProvider on synthetic articles in a throwaway
+database, to exercise the tool without a model; its agreement numbers are
+random.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from slugify import slugify
+from sqlmodel import Session, col, select
+
+from backend.config import get_settings
+from backend.metrics import LLM_TOKENS
+
+
+def _populate_fake(engine, articles: int) -> None:
+    import random
+
+    from backend.benchmarks.fake_provider import FAKE_PROVIDER, FakeProvider
+    from backend.benchmarks.pipeline import _configure, _synthetic_documents
+    from backend.feeds import save_articles
+    from backend.llm_providers.registry import register_provider
+
+    register_provider(FakeProvider(latency=0.2, tokens_per_sec=500.0))
+    feed_id = _configure(engine, batch_size=5)
+    documents = _synthetic_documents(random.Random(0), articles)
+    with Session(engine) as session:
+        save_articles(
+            session,
+            feed_id,
+            [
+                {
+                    "link": f"https://bench.example/{i}",
+                    "title": doc["title"],
+                    "content": [{"value": f"<p>{doc['content_markdown']}</p>"}],
+                }
+                for i, doc in enumerate(documents)
+            ],
+        )
+    print(f"(fake provider {FAKE_PROVIDER!r}: agreement numbers are random)")
+
+
+def _composite(result, catalog) -> float:
+    from backend.scoring import compute_composite_score, is_blocked
+
+    categories = [
+        catalog.by_slug[slug]
+        for slug in (slugify(name) for name in result["categories"])
+        if slug in catalog.by_slug
+    ]
+    if is_blocked(categories):
+        return 0.0
+    return compute_composite_score(
+        result["interest_score"], result["quality_score"], categories
+    )
+
+
+def _tokens(provider: str, task: str) -> float:
+    return sum(
+        LLM_TOKENS.value(provider=provider, task=task, direction=direction)
+        for direction in ("in", "out")
+    )
+
+
+async def _run(args) -> None:
+    # Imported here: the engine is created from DATABASE__PATH at import
+    from backend.category_catalog import get_catalog
+    from backend.category_shortlist import shortlist_categories
+    from backend.database import create_db_and_tables, engine
+    from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, evaluate_task_readiness
+    from backend.llm_providers.base import CombinedTaskProvider, ProviderTaskConfig
+    from backend.llm_providers.registry import get_provider
+    from backend.models import Article, UserPreferences
+
+    if args.fake:
+        create_db_and_tables()
+        _populate_fake(engine, args.articles)
+
+    with Session(engine) as session:
+        routes = {}
+        for task in (TASK_CATEGORIZATION, TASK_SCORING):
+            runtime = await evaluate_task_readiness(session, task)
+            if not runtime.ready:
+                raise SystemExit(f"{task} route not ready: {runtime.reason}")
+            routes[task] = (
+                get_provider(runtime.provider),
+                ProviderTaskConfig(
+                    endpoint=runtime.endpoint,
+                    model=runtime.model,
+                    thinking=runtime.thinking,
+                    api_key=runtime.api_key,
+                    endpoints=runtime.endpoints,
+                ),
+            )
+        cat_provider, cat_config = routes[TASK_CATEGORIZATION]
+        score_provider, score_config = routes[TASK_SCORING]
+        if not isinstance(score_provider, CombinedTaskProvider):
+            raise SystemExit(f"{score_provider.name} cannot categorize and score")
+        preferences = session.exec(select(UserPreferences)).first()
+        interests = preferences.interests if preferences else ""
+        anti_interests = preferences.anti_interests if preferences else ""
+        catalog = get_catalog(session)
+        articles = [
+            {"id": a.id, "title": a.title, "content_markdown": a.content_markdown}
+            for a in session.exec(
+                select(Article)
+                .where(col(Article.content_markdown).is_not(None))
+                .order_by(col(Article.published_at).desc())
+                .limit(args.articles)
+            ).all()
+        ]
+
+    two_stage: dict[int, dict] = {}
+    combined: dict[int, dict] = {}
+    elapsed = {"two-stage": 0.0, "combined": 0.0}
+    tokens_before = {
+        "two-stage": _tokens(cat_provider.name, "categorization")
+        + _tokens(score_provider.name, "scoring"),
+        "combined": _tokens(score_provider.name, "combined"),
+    }
+
+    async def run_two_stage(batch, active, hierarchy, hidden):
+        categorized = await cat_provider.categorize(
+            batch,
+            active,
+            config=cat_config,
+            category_hierarchy=hierarchy,
+            hidden_categories=hidden or None,
+        )
+        scored = await score_provider.score(
+            batch, interests, anti_interests, config=score_config
+        )
+        for result in categorized:
+            two_stage.setdefault(result.article_id, {}).update(
+                categories=result.categories + result.suggested_new
+            )
+        for result in scored:
+            two_stage.setdefault(result.article_id, {}).update(
+                interest_score=result.interest_score,
+                quality_score=result.quality_score,
+            )
+
+    async def run_combined(batch, active, hierarchy, hidden):
+        for result in await score_provider.categorize_and_score(
+            batch,
+            active,
+            interests,
+            anti_interests,
+            config=score_config,
+            category_hierarchy=hierarchy,
+            hidden_categories=hidden or None,
+        ):
+            combined[result.article_id] = {
+                "categories": result.categories + result.suggested_new,
+                "interest_score": result.interest_score,
+                "quality_score": result.quality_score,
+            }
+
+    for number, start in enumerate(range(0, len(articles), args.batch_size)):
+        batch = articles[start : start + args.batch_size]
+        shortlist = shortlist_categories(
+            catalog, batch, get_settings().pipeline.category_shortlist_size
+        )
+        paths = [("two-stage", run_two_stage), ("combined", run_combined)]
+        for name, run in paths if number % 2 == 0 else paths[::-1]:
+            started = time.perf_counter()
+            try:
+                await run(batch, *shortlist)
+            except Exception as e:
+                print(f"batch {number}: {name} failed: {e}")
+            elapsed[name] += time.perf_counter() - started
+
+    pairs = [
+        (two_stage[aid], combined[aid])
+        for aid in combined
+        if {"categories", "interest_score"} <= two_stage.get(aid, {}).keys()
+    ]
+    tokens = {
+        "two-stage": _tokens(cat_provider.name, "categorization")
+        + _tokens(score_provider.name, "scoring")
+        - tokens_before["two-stage"],
+        "combined": _tokens(score_provider.name, "combined")
+        - tokens_before["combined"],
+    }
+    for name, results in (("two-stage", two_stage), ("combined", combined)):
+        rate = len(results) / elapsed[name] * 60 if elapsed[name] else 0.0
+        per_article = tokens[name] / len(results) if results else 0.0
+        print(
+            f"{name + ':':<20}{len(results)} articles in {elapsed[name]:.1f}s "
+            f"({rate:.1f}/min), {per_article:.0f} tokens per article"
+        )
+    if not pairs:
+        print("agreement:          no article has results from both paths")
+        return
+
+    def jaccard(a: list[str], b: list[str]) -> float:
+        a_set, b_set = {slugify(n) for n in a}, {slugify(n) for n in b}
+        return len(a_set & b_set) / len(a_set | b_set) if a_set | b_set else 1.0
+
+    print(f"compared:           {len(pairs)} articles")
+    print(
+        "category overlap:   "
+        f"{statistics.mean(jaccard(a['categories'], b['categories']) for a, b in pairs):.2f}"
+    )
+    for field in ("interest_score", "quality_score"):
+        mae = statistics.mean(abs(a[field] - b[field]) for a, b in pairs)
+        print(f"{field.split('_')[0] + ' MAE:':<20}{mae:.2f}")
+    within_one = sum(
+        abs(a["interest_score"] - b["interest_score"]) <= 1 for a, b in pairs
+    )
+    print(f"interest within 1:  {within_one / len(pairs):.0%}")
+    print(
+        "composite MAE:      "
+        f"{statistics.mean(abs(_composite(a, catalog) - _composite(b, catalog)) for a, b in pairs):.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="existing database to read articles from")
+    source.add_argument(
+        "--fake", action="store_true", help="synthetic articles and FakeProvider"
+    )
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE__PATH"] = args.db or os.path.join(tmp, "benchmark.db")
+        get_settings.cache_clear()
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
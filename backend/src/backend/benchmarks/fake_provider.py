@@ -0,0 +1,179 @@
+"""Deterministic stand-in LLM provider for benchmarks.
+
+FakeProvider implements the full LLMProvider contract without a model: every
+request waits a fixed latency (time to first token), then streams one result
+per article at the configured output rate; FAKE_SMALL_MODEL, the scoring
+cascade's first tier, is small_model_speedup times faster. A seeded RNG decides which
+requests fail with malformed output and which article IDs are left out of a
+response, so runs with the same seed see the same failures.
+"""
+
+import asyncio
+import random
+
+from backend.llm_providers.base import LLMValidationError, ProviderTaskConfig
+from backend.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
+from backend.prompts import (
+    ArticleCategoryResult,
+    ArticleCombinedResult,
+    ArticleScoringResult,
+)
+from backend.prompts.grouping import GroupingResponse
+
+FAKE_PROVIDER = "fake"
+FAKE_MODEL = "fake-model"
+FAKE_SMALL_MODEL = "fake-small-model"
+
+# Rough output size of one result, in tokens
+_CATEGORIZATION_RESULT_TOKENS = 25
+_SCORING_RESULT_TOKENS = 60
+_COMBINED_RESULT_TOKENS = 80
+
+
+class FakeProvider:
+    """LLMProvider with simulated latency, throughput and failures."""
+
+    name = FAKE_PROVIDER
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        tokens_per_sec: float = 50.0,
+        failure_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int = 0,
+        small_model_speedup: float = 4.0,
+    ) -> None:
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.small_model_speedup = small_model_speedup
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+        self.dropped = 0
+
+    def parse_config(self, config_json: str, task: str) -> ProviderTaskConfig:
+        return ProviderTaskConfig(
+            endpoint="fake://local", model=FAKE_MODEL, thinking=False
+        )
+
+    async def health(self, config: ProviderTaskConfig) -> dict:
+        return {"connected": True}
+
+    async def list_models(self, config: ProviderTaskConfig) -> list[dict]:
+        return [{"name": FAKE_MODEL}, {"name": FAKE_SMALL_MODEL}]
+
+    async def _respond(
+        self, task, articles, make_result, result_tokens, on_result, config=None
+    ):
+        self.requests += 1
+        speedup = 1.0
+        if config is not None and config.model == FAKE_SMALL_MODEL:
+            speedup = self.small_model_speedup
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.sleep(self.latency / speedup)
+        if self.rng.random() < self.failure_rate:
+            self.failures += 1
+            LLM_REQUEST_SECONDS.observe(
+                loop.time() - started, provider=FAKE_PROVIDER, task=task
+            )
+            raise LLMValidationError(
+                '{"results": [', ValueError("truncated"), is_retryable=True
+            )
+
+        results = []
+        for article in articles:
+            if self.rng.random() < self.drop_rate:
+                self.dropped += 1
+                continue
+            await asyncio.sleep(result_tokens / self.tokens_per_sec / speedup)
+            result = make_result(article["id"])
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+        LLM_REQUEST_SECONDS.observe(
+            loop.time() - started, provider=FAKE_PROVIDER, task=task
+        )
+        LLM_TOKENS.inc(
+            result_tokens * len(results),
+            provider=FAKE_PROVIDER,
+            task=task,
+            direction="out",
+        )
+        return results
+
+    async def categorize(
+        self,
+        articles,
+        existing_categories,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCategoryResult]:
+        def _result(article_id: int) -> ArticleCategoryResult:
+            picks = self.rng.sample(
+                existing_categories, min(2, len(existing_categories))
+            )
+            return ArticleCategoryResult(
+                article_id=article_id, categories=picks or ["general"]
+            )
+
+        return await self._respond(
+            "categorization",
+            articles,
+            _result,
+            _CATEGORIZATION_RESULT_TOKENS,
+            on_result,
+        )
+
+    async def score(
+        self, articles, interests, anti_interests, config, on_result=None
+    ) -> list[ArticleScoringResult]:
+        def _result(article_id: int) -> ArticleScoringResult:
+            return ArticleScoringResult(
+                article_id=article_id,
+                interest_score=self.rng.randint(0, 10),
+                quality_score=self.rng.randint(0, 10),
+                reasoning="fake",
+            )
+
+        return await self._respond(
+            "scoring", articles, _result, _SCORING_RESULT_TOKENS, on_result, config
+        )
+
+    async def categorize_and_score(
+        self,
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCombinedResult]:
+        def _result(article_id: int) -> ArticleCombinedResult:
+            picks = self.rng.sample(
+                existing_categories, min(2, len(existing_categories))
+            )
+            return ArticleCombinedResult(
+                article_id=article_id,
+                categories=picks or ["general"],
+                interest_score=self.rng.randint(0, 10),
+                quality_score=self.rng.randint(0, 10),
+                reasoning="fake",
+            )
+
+        return await self._respond(
+            "combined", articles, _result, _COMBINED_RESULT_TOKENS, on_result
+        )
+
+    async def suggest_groups(self, all_categories, existing_groups, config):
+        return GroupingResponse(groups=[])
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,105 @@
+"""Benchmark SimHash fingerprinting cost per article.
+
+Usage:
+    uv run python -m backend.benchmarks.fingerprint [--articles N]
+
+Generates synthetic markdown articles at several lengths, times
+compute_simhash per article, and reports the Hamming distance between each
+article and a lightly edited copy (the syndicated-story case) and an
+unrelated article (the false-positive case).
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from backend.fingerprint import compute_simhash, hamming_distance
+
+_VOCABULARY = [
+    f"{stem}{suffix}"
+    for stem in (
+        "model",
+        "market",
+        "policy",
+        "launch",
+        "research",
+        "energy",
+        "release",
+        "network",
+        "security",
+        "climate",
+        "device",
+        "budget",
+    )
+    for suffix in ("", "s", "ing", "ed", "er", "al")
+]
+
+ARTICLE_WORDS = (150, 600, 2000)
+
+
+def _make_article(rng: random.Random, words: int) -> str:
+    paragraphs = []
+    remaining = words
+    while remaining > 0:
+        size = min(remaining, rng.randint(40, 90))
+        paragraphs.append(" ".join(rng.choices(_VOCABULARY, k=size)))
+        remaining -= size
+    return "\n\n".join(paragraphs)
+
+
+def _syndicated_copy(rng: random.Random, text: str) -> str:
+    """Simulate a re-published copy: new byline, tracking link, a few edits."""
+    words = text.split(" ")
+    for _ in range(max(1, len(words) // 100)):
+        words[rng.randrange(len(words))] = rng.choice(_VOCABULARY)
+    return (
+        "By Staff Reporter\n\n"
+        + " ".join(words)
+        + "\n\n[Read more](https://example.com/?utm_source=rss)"
+    )
+
+
+def run(articles: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    print(
+        f"{'words':>6} {'us/article':>11} {'p95 us':>8} {'dup dist':>9} {'other dist':>11}"
+    )
+    for words in ARTICLE_WORDS:
+        texts = [_make_article(rng, words) for _ in range(articles)]
+
+        timings = []
+        fingerprints = []
+        for text in texts:
+            started = time.perf_counter()
+            fingerprints.append(compute_simhash(text))
+            timings.append((time.perf_counter() - started) * 1e6)
+
+        dup_distances = []
+        other_distances = []
+        for i, text in enumerate(texts):
+            fp = fingerprints[i]
+            copy_fp = compute_simhash(_syndicated_copy(rng, text))
+            other_fp = fingerprints[(i + 1) % len(fingerprints)]
+            assert fp is not None and copy_fp is not None and other_fp is not None
+            dup_distances.append(hamming_distance(fp, copy_fp))
+            other_distances.append(hamming_distance(fp, other_fp))
+
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(
+            f"{words:>6} {statistics.mean(timings):>11.0f} {p95:>8.0f} "
+            f"{statistics.median(dup_distances):>9.1f} "
+            f"{statistics.median(other_distances):>11.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.articles, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark per-request overhead of the shared Google GenAI client.
+
+Usage:
+    uv run python -m backend.benchmarks.google_client [--requests N]
+
+Points the GenAI SDK at a local HTTP stand-in for the Gemini API (answering
+generateContent immediately) and sends N requests twice:
+
+- before: decrypt the stored API key and build a new genai.Client per call
+- after: the memoized key and the shared per-key client
+
+Reports median and p95 latency per request and how many TCP connections the
+stand-in accepted. The stand-in is plain HTTP, so the TLS handshake a real
+connection saves on every reused request is not included.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from backend.config import get_settings
+from backend.encryption import decrypt_value, encrypt_value, get_or_create_key
+from backend.llm_providers import google
+from backend.llm_providers.google import GoogleProviderConfig
+
+_RESPONSE = json.dumps(
+    {
+        "candidates": [
+            {"content": {"role": "model", "parts": [{"text": '{"results": []}'}]}}
+        ],
+        "usageMetadata": {"promptTokenCount": 100, "totalTokenCount": 110},
+    }
+).encode()
+
+
+class FakeGemini:
+    """Plain HTTP/1.1 server answering every request with one generateContent reply."""
+
+    def __init__(self):
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+        self.endpoint = ""
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.endpoint = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while await reader.readline():
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(_RESPONSE)}\r\n\r\n".encode()
+                    + _RESPONSE
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):  # fmt: skip
+            pass
+        finally:
+            writer.close()
+
+
+async def _before(config: GoogleProviderConfig, keyfile: str):
+    from google import genai
+
+    api_key = decrypt_value(config.api_key_encrypted, keyfile)
+    client = genai.Client(api_key=api_key)
+    return await client.aio.models.generate_content(
+        model="gemini-2.5-flash", contents="hi"
+    )
+
+
+async def _after(config: GoogleProviderConfig, _keyfile: str):
+    client = await google._get_client(google._decrypt_api_key(config))
+    return await client.aio.models.generate_content(
+        model="gemini-2.5-flash", contents="hi"
+    )
+
+
+async def _run(requests: int) -> None:
+    for mode, call in (("before", _before), ("after", _after)):
+        server = FakeGemini()
+        await server.start()
+        os.environ["GOOGLE_GEMINI_BASE_URL"] = server.endpoint
+        keyfile = os.path.join(
+            os.path.dirname(get_settings().database.path), ".keyfile"
+        )
+        get_or_create_key(keyfile)
+        config = GoogleProviderConfig(
+            api_key_encrypted=encrypt_value("benchmark-key", keyfile)
+        )
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            await call(config, keyfile)
+            timings.append((time.perf_counter() - started) * 1000)
+        await google.close_google_clients()
+        await server.stop()
+        timings.sort()
+        print(
+            f"{mode:<6} median {statistics.median(timings):6.2f}ms, "
+            f"p95 {timings[int(len(timings) * 0.95) - 1]:6.2f}ms, "
+            f"{server.connections} connections for {requests} requests"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE__PATH"] = os.path.join(tmp, "benchmark.db")
+        get_settings.cache_clear()
+        asyncio.run(_run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Benchmark scoring throughput across several Ollama endpoints.
+
+Usage:
+    uv run python -m backend.benchmarks.ollama_endpoints \\
+        [--endpoints 4] [--batches 24] [--latency 0.2] [--fail-one]
+
+Starts --endpoints fake Ollama servers on localhost. Each answers /api/chat
+after --latency seconds and handles one request at a time, like a single
+Ollama instance running one model. Scores --batches batches through
+score_articles with one batch in flight per endpoint, as the scheduler
+runs them, for 1..N endpoints, and reports batches per second and how the
+batches were spread. --fail-one stops the last server, to show it being
+ejected and its share moving to the others.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+
+from backend.llm_providers import ollama
+from backend.llm_providers.ollama import close_ollama_client, score_articles
+
+_ARTICLE_ID = re.compile(r"<article id:(\d+)>")
+
+
+class FakeOllama:
+    """Minimal HTTP/1.1 server speaking just enough of the Ollama chat API."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lock = asyncio.Lock()
+        self.server: asyncio.Server | None = None
+        self.endpoint = ""
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.endpoint = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.split()[1].decode()
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length) if length else b""
+                if path == "/api/chat":
+                    payload = await self._chat(json.loads(body))
+                else:
+                    payload = json.dumps({"version": "fake"}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):  # fmt: skip
+            pass
+        finally:
+            writer.close()
+
+    async def _chat(self, request: dict) -> bytes:
+        async with self.lock:
+            await asyncio.sleep(self.latency)
+        ids = _ARTICLE_ID.findall(request["messages"][-1]["content"])
+        content = json.dumps(
+            {
+                "results": [
+                    {
+                        "article_id": int(i),
+                        "interest_score": 5,
+                        "quality_score": 5,
+                        "reasoning": "fake",
+                    }
+                    for i in ids
+                ]
+            }
+        )
+        chunks = [
+            {"message": {"role": "assistant", "content": content}, "done": False},
+            {"message": {"role": "assistant", "content": ""}, "done": True},
+        ]
+        return "".join(json.dumps(c) + "\n" for c in chunks).encode()
+
+
+async def _score_all(endpoints: list[str], batches: int) -> None:
+    queue = list(range(batches))
+
+    async def _worker() -> None:
+        while queue:
+            batch = queue.pop()
+            articles = [
+                {"id": batch * 5 + i, "title": "t", "content_markdown": "c"}
+                for i in range(5)
+            ]
+            await score_articles(articles, "ai", "gossip", host=endpoints, model="m")
+
+    await asyncio.gather(*(_worker() for _ in endpoints))
+
+
+def _served() -> dict[str, tuple[int, bool]]:
+    """Requests leased so far and current health, per endpoint."""
+    return {
+        s["endpoint"]: (s["requests"], s["healthy"])
+        for s in ollama.endpoint_pool.snapshot()
+    }
+
+
+async def _run(args) -> None:
+    servers = [FakeOllama(args.latency) for _ in range(args.endpoints)]
+    for server in servers:
+        await server.start()
+    if args.fail_one and len(servers) > 1:
+        await servers[-1].stop()
+
+    baseline = None
+    for count in range(1, args.endpoints + 1):
+        endpoints = [s.endpoint for s in servers[:count]]
+        before = _served()
+        started = time.perf_counter()
+        await _score_all(endpoints, args.batches)
+        rate = args.batches / (time.perf_counter() - started)
+        baseline = baseline or rate
+        after = _served()
+        spread = ", ".join(
+            f"{after[e][0] - before.get(e, (0, 0))[0]}"
+            + ("" if after[e][1] else " (ejected)")
+            for e in endpoints
+        )
+        print(
+            f"{count} endpoint(s): {rate:6.2f} batches/s "
+            f"({rate / baseline:.2f}x), requests per endpoint: {spread}"
+        )
+    await close_ollama_client()
+    for server in servers:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoints", type=int, default=4)
+    parser.add_argument("--batches", type=int, default=24)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--fail-one", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""Benchmark end-to-end pipeline throughput against a fake LLM provider.
+
+Usage:
+    uv run python -m backend.benchmarks.pipeline \\
+        [--articles 300] [--arrival-rate 0] [--batch-size 5] [--latency 0.5] \\
+        [--tokens-per-sec 200] [--failure-rate 0] [--drop-rate 0] [--seed 0] \\
+        [--retry-backoff 1] [--cascade [--small-speedup 4]] \\
+        [--replay cassette.jsonl [--fast]]
+
+Creates a throwaway database with the real schema and registers FakeProvider
+(see fake_provider.py) under the name "fake", with both task routes pointing
+at it. Synthetic articles go through the real ingest path (save_articles,
+then the categorization queue), all up front or at --arrival-rate articles
+per second, and scheduler.process_pipeline runs back to back until every
+article is scored or failed.
+
+Reports articles per minute, p50/p99 time from ingest to scored, the share
+of wall time spent executing SQLite statements, and event-loop lag (how late
+a 10ms timer fires). The same seed gives the same failures and dropped IDs,
+so runs before and after a change are comparable.
+
+--cascade turns on the scoring cascade with FakeProvider's small model
+(--small-speedup times faster than the route's model) and reports the share
+of articles it escalated. The same arguments are first run without the
+cascade in a subprocess, to report the throughput gain.
+
+--replay serves the LLM from a cassette recorded with PIPELINE__LLM_RECORD_PATH
+(see backend.llm_providers.cassette) and ingests the articles it contains,
+with the recorded response timing unless --fast is given.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, col, func, or_, select
+
+from backend.benchmarks.fake_provider import (
+    FAKE_MODEL,
+    FAKE_PROVIDER,
+    FAKE_SMALL_MODEL,
+    FakeProvider,
+)
+from backend.config import get_settings
+from backend.metrics import DB_STATEMENT_SECONDS, LLM_CASCADE_ARTICLES
+
+_VOCABULARY = [f"term{i}" for i in range(3000)]
+_LAG_INTERVAL = 0.01
+
+
+def _synthetic_documents(rng: random.Random, count: int) -> list[dict]:
+    """Distinct bodies, so nothing is a near-duplicate."""
+    documents = []
+    for _ in range(count):
+        words = rng.sample(_VOCABULARY, 120)
+        documents.append(
+            {"title": " ".join(words[:8]), "content_markdown": " ".join(words)}
+        )
+    return documents
+
+
+def _cassette_documents(path: str) -> list[dict]:
+    """The distinct articles sent to the LLM in a recorded cassette."""
+    documents: dict[tuple, dict] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            for article in json.loads(line).get("articles") or []:
+                key = (article["title"], article["content_markdown"])
+                documents.setdefault(key, article)
+    return list(documents.values())
+
+
+def _configure(engine, batch_size: int) -> int:
+    from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, upsert_task_route
+    from backend.models import Feed, LLMProviderConfig, UserPreferences
+
+    with Session(engine) as session:
+        session.add(LLMProviderConfig(provider=FAKE_PROVIDER, config_json="{}"))
+        for task in (TASK_CATEGORIZATION, TASK_SCORING):
+            upsert_task_route(session, task, FAKE_PROVIDER, FAKE_MODEL, batch_size)
+        session.add(UserPreferences(interests="term1 term2", anti_interests="term3"))
+        feed = Feed(url="https://bench.example/feed.xml", title="Bench")
+        session.add(feed)
+        session.commit()
+        return feed.id  # pyright: ignore[reportReturnType]
+
+
+async def _ingest(
+    engine, feed_id: int, args, documents: list[dict], ingested: dict[str, datetime]
+) -> None:
+    from backend.feeds import save_articles
+    from backend.models import Article
+    from backend.scheduler import categorization_worker
+
+    total = len(documents)
+    chunk = total if args.arrival_rate <= 0 else max(1, args.arrival_rate // 10)
+    while len(ingested) < total:
+        start = len(ingested)
+        batch = documents[start : start + chunk]
+        entries = [
+            {
+                "link": f"https://bench.example/{start + i}",
+                "title": doc["title"],
+                "content": [{"value": f"<p>{doc['content_markdown']}</p>"}],
+            }
+            for i, doc in enumerate(batch)
+        ]
+        with Session(engine) as session:
+            _, ids = save_articles(session, feed_id, entries)
+            if args.replay:
+                # Keep the recorded text exactly, so content hashes match
+                for entry, doc in zip(entries, batch, strict=True):
+                    session.exec(  # pyright: ignore[reportCallIssue]
+                        update(Article)
+                        .where(col(Article.url) == entry["link"])
+                        .values(content_markdown=doc["content_markdown"])
+                    )
+                session.commit()
+            categorization_worker.enqueue_articles(session, ids)
+        now = datetime.now()
+        ingested.update((e["link"], now) for e in entries)
+        if args.arrival_rate > 0:
+            await asyncio.sleep(len(batch) / args.arrival_rate)
+
+
+def _pending(engine) -> tuple[int, bool]:
+    """Articles still in the pipeline, and whether any of them can be claimed."""
+    from backend.leases import is_due
+    from backend.models import Article
+
+    in_flight = or_(
+        col(Article.categorization_state).in_(["categorizing"]),
+        col(Article.scoring_state).in_(["scoring"]),
+    )
+    queued = or_(
+        Article.categorization_state == "queued", Article.scoring_state == "queued"
+    )
+    with Session(engine) as session:
+        pending = session.exec(
+            select(func.count()).select_from(Article).where(or_(in_flight, queued))
+        ).one()
+        due = session.exec(
+            select(Article.id).where(queued).where(is_due(datetime.now())).limit(1)
+        ).first()
+    return pending, due is not None
+
+
+async def _watch_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(_LAG_INTERVAL)
+        samples.append(loop.time() - started - _LAG_INTERVAL)
+
+
+def _baseline_throughput() -> float | None:
+    """Articles/min of the same run without the cascade, in a subprocess."""
+    argv = [arg for arg in sys.argv[1:] if arg != "--cascade"]
+    output = subprocess.run(
+        [sys.executable, "-m", "backend.benchmarks.pipeline", *argv],
+        capture_output=True,
+        text=True,
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith("throughput:"):
+            return float(line.split()[1])
+    return None
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+async def _run(args, baseline: float | None = None) -> None:
+    # Imported here: the engine is created from DATABASE__PATH at import
+    from backend import scheduler
+    from backend.database import create_db_and_tables, engine
+    from backend.llm_providers.cassette import ReplayProvider, replay_provider
+    from backend.llm_providers.registry import register_provider
+    from backend.models import Article
+
+    create_db_and_tables()
+    rng = random.Random(args.seed)
+    if args.replay:
+        provider = replay_provider(
+            args.replay, realtime=not args.fast, name=FAKE_PROVIDER
+        )
+        documents = _cassette_documents(args.replay)
+    else:
+        provider = FakeProvider(
+            latency=args.latency,
+            tokens_per_sec=args.tokens_per_sec,
+            failure_rate=args.failure_rate,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+            small_model_speedup=args.small_speedup,
+        )
+        documents = _synthetic_documents(rng, args.articles)
+    register_provider(provider)
+    feed_id = _configure(engine, args.batch_size)
+
+    ingested: dict[str, datetime] = {}
+    lag: list[float] = []
+    stop = asyncio.Event()
+    db_before = DB_STATEMENT_SECONDS.total()
+    started = time.perf_counter()
+    monitor = asyncio.create_task(_watch_loop_lag(lag, stop))
+    ingest = asyncio.create_task(_ingest(engine, feed_id, args, documents, ingested))
+
+    while True:
+        await asyncio.sleep(0)
+        pending, due = _pending(engine)
+        if due:
+            await scheduler.process_pipeline()
+        elif not pending and ingest.done():
+            break
+        else:
+            # Waiting for arrivals or for failed articles to cool down
+            await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    db_time = DB_STATEMENT_SECONDS.total() - db_before
+    stop.set()
+    await asyncio.gather(monitor, ingest)
+
+    with Session(engine) as session:
+        scored = session.exec(
+            select(Article.url, Article.scored_at).where(
+                Article.scoring_state == "scored"
+            )
+        ).all()
+        failed = session.exec(
+            select(func.count())
+            .select_from(Article)
+            .where(
+                or_(
+                    Article.scoring_state == "failed",
+                    Article.categorization_state == "failed",
+                )
+            )
+        ).one()
+    latencies = [
+        (scored_at - ingested[url]).total_seconds()
+        for url, scored_at in scored
+        if scored_at is not None and url in ingested
+    ]
+
+    print(f"articles:           {len(scored)} scored, {failed} failed")
+    print(f"wall time:          {elapsed:.1f}s")
+    print(f"throughput:         {len(scored) / elapsed * 60:.1f} articles/min")
+    print(
+        f"ingest -> scored:   p50 {statistics.median(latencies or [0]):.2f}s, "
+        f"p99 {_percentile(latencies, 0.99):.2f}s"
+    )
+    if args.cascade:
+        kept = LLM_CASCADE_ARTICLES.value(outcome="kept")
+        escalated = LLM_CASCADE_ARTICLES.value(outcome="escalated")
+        print(
+            f"cascade:            {escalated / max(kept + escalated, 1):.1%} "
+            f"of {kept + escalated:.0f} small-model scores escalated"
+        )
+        if baseline:
+            gain = len(scored) / elapsed * 60 / baseline
+            print(f"cascade gain:       x{gain:.2f} vs {baseline:.1f} articles/min")
+    print(f"DB time share:      {db_time / elapsed:.1%} ({db_time:.2f}s)")
+    print(
+        f"event-loop lag:     p50 {_percentile(lag, 0.5) * 1000:.1f}ms, "
+        f"p99 {_percentile(lag, 0.99) * 1000:.1f}ms, "
+        f"max {max(lag, default=0) * 1000:.1f}ms"
+    )
+    if isinstance(provider, ReplayProvider):
+        print(
+            f"cassette:           {provider.hits} recorded batches replayed, "
+            f"{provider.article_hits} assembled per article, {provider.misses} misses"
+        )
+    else:
+        print(
+            f"fake provider:      {provider.requests} requests, "
+            f"{provider.failures} failed, {provider.dropped} IDs dropped"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument(
+        "--arrival-rate",
+        type=int,
+        default=0,
+        help="articles ingested per second; 0 ingests all up front",
+    )
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--tokens-per-sec", type=float, default=200.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=1.0,
+        help="base retry delay for failed articles, in seconds",
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="score with the fake small model first, escalating uncertain scores",
+    )
+    parser.add_argument(
+        "--small-speedup",
+        type=float,
+        default=4.0,
+        help="how much faster the fake small model responds",
+    )
+    parser.add_argument(
+        "--replay", help="serve the LLM from this cassette and ingest its articles"
+    )
+    parser.add_argument(
+        "--fast", action="store_true", help="replay without the recorded timing"
+    )
+    args = parser.parse_args()
+    # Per-batch warnings (dropped IDs, simulated failures) would drown the report
+    logging.basicConfig(level=logging.CRITICAL)
+    baseline = _baseline_throughput() if args.cascade else None
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE__PATH"] = os.path.join(tmp, "benchmark.db")
+        os.environ["PIPELINE__RETRY_BACKOFF_SECONDS"] = str(args.retry_backoff)
+        if args.cascade:
+            os.environ["PIPELINE__CASCADE_MODEL"] = FAKE_SMALL_MODEL
+        get_settings.cache_clear()
+        asyncio.run(_run(args, baseline))
+
+
+if __name__ == "__main__":
+    main()
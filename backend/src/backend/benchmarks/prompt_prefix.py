@@ -0,0 +1,150 @@
+"""Benchmark time-to-first-token with and without prompt-prefix reuse.
+
+Usage:
+    uv run python -m backend.benchmarks.prompt_prefix --model MODEL \\
+        [--host http://localhost:11434] [--batches N] [--idle SECONDS]
+
+Needs a running Ollama server. Sends N scoring and N categorization batches
+of synthetic articles twice:
+
+- before: the previous layout (category list between the rules and the
+  output instructions) with the server's default keep_alive and context size
+- after: static instructions first, with PIPELINE__OLLAMA_KEEP_ALIVE and
+  PIPELINE__OLLAMA_NUM_CTX sent on every request
+
+The model is unloaded before each mode. Each batch gets a different category
+shortlist, as the worker produces. --idle waits between batches, to show a
+model being unloaded in between.
+Reports time-to-first-token and how many prompt tokens Ollama evaluated
+(tokens served from the KV cache are not evaluated).
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from ollama import AsyncClient
+
+from backend.config import get_settings
+from backend.prompts import (
+    BATCH_CATEGORIZATION_INSTRUCTIONS,
+    DEFAULT_CATEGORY_HIERARCHY,
+    build_batch_categorization_prompt,
+    build_batch_scoring_prompt,
+)
+
+_OUTPUT_INSTRUCTIONS = "\n\nYou will receive multiple articles"
+_WORDS = (
+    "model release benchmark city council vote climate data launch orbit "
+    "market funding startup election court ruling film review album tour "
+    "security breach patch research paper trial vaccine school policy"
+).split()
+
+
+def _articles(rng: random.Random, batch: int, size: int) -> list[dict]:
+    return [
+        {
+            "id": batch * size + i + 1,
+            "title": " ".join(rng.choices(_WORDS, k=6)).capitalize(),
+            "content_markdown": " ".join(rng.choices(_WORDS, k=400)),
+        }
+        for i in range(size)
+    ]
+
+
+def _legacy_layout(system_prompt: str) -> str:
+    """Move the output instructions behind the category context again."""
+    rules, _, _ = BATCH_CATEGORIZATION_INSTRUCTIONS.partition(_OUTPUT_INSTRUCTIONS)
+    output = BATCH_CATEGORIZATION_INSTRUCTIONS[len(rules) :]
+    context = system_prompt[len(BATCH_CATEGORIZATION_INSTRUCTIONS) :]
+    return rules + context + output
+
+
+async def _first_token(client: AsyncClient, model: str, messages, extra: dict):
+    started = time.monotonic()
+    ttft = None
+    evaluated = None
+    async for chunk in await client.chat(
+        model=model, messages=messages, stream=True, **extra
+    ):
+        if ttft is None:
+            ttft = time.monotonic() - started
+        if chunk.get("done"):
+            evaluated = chunk.get("prompt_eval_count")
+    return ttft or 0.0, evaluated or 0
+
+
+async def _run_mode(args, mode: str) -> dict[str, list[tuple[float, int]]]:
+    settings = get_settings().pipeline
+    client = AsyncClient(host=args.host)
+    # Start each mode from an unloaded model
+    await client.generate(model=args.model, prompt="", keep_alive=0)
+    rng = random.Random(0)
+    categories = sorted(
+        {
+            name
+            for parent, kids in DEFAULT_CATEGORY_HIERARCHY.items()
+            for name in [parent, *kids]
+        }
+    )
+    extra: dict = {"options": {"temperature": 0, "num_predict": 1}}
+    if mode == "after":
+        extra["keep_alive"] = settings.ollama_keep_alive
+        if settings.ollama_num_ctx:
+            extra["options"]["num_ctx"] = settings.ollama_num_ctx
+
+    timings: dict[str, list[tuple[float, int]]] = {"scoring": [], "categorization": []}
+    for batch in range(args.batches):
+        articles = _articles(rng, batch, args.batch_size)
+        scoring_system, scoring_user = build_batch_scoring_prompt(
+            articles, "AI research, space exploration", "celebrity gossip"
+        )
+        shortlist = rng.sample(categories, len(categories) // 2)
+        cat_system, cat_user = build_batch_categorization_prompt(articles, shortlist)
+        if mode == "before":
+            cat_system = _legacy_layout(cat_system)
+
+        for task, system, user in (
+            ("scoring", scoring_system, scoring_user),
+            ("categorization", cat_system, cat_user),
+        ):
+            messages = [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ]
+            timings[task].append(
+                await _first_token(client, args.model, messages, extra)
+            )
+        if args.idle:
+            await asyncio.sleep(args.idle)
+    return timings
+
+
+def _report(mode: str, timings: dict[str, list[tuple[float, int]]]) -> None:
+    print(f"{mode}:")
+    for task, values in timings.items():
+        ttfts = [t for t, _ in values]
+        evaluated = [e for _, e in values]
+        print(
+            f"  {task:<15} ttft first {ttfts[0]:.2f}s, "
+            f"median {statistics.median(ttfts):.2f}s; "
+            f"prompt tokens evaluated median {statistics.median(evaluated):.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="http://localhost:11434")
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--batches", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--idle", type=float, default=0.0)
+    args = parser.parse_args()
+    for mode in ("before", "after"):
+        _report(mode, asyncio.run(_run_mode(args, mode)))
+
+
+if __name__ == "__main__":
+    main()
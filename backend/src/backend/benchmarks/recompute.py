@@ -0,0 +1,116 @@
+"""Benchmark set-based composite score recomputation.
+
+Usage:
+    uv run python -m backend.benchmarks.recompute [--articles N]
+
+Builds a throwaway SQLite database with N scored articles spread over a
+two-level category tree, changes the weight of a parent category that covers
+every article, and times recompute_for_categories end to end.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import insert, update
+from sqlmodel import Session, SQLModel, create_engine
+
+from backend.models import Article, ArticleCategoryLink, Category, Feed
+from backend.recompute import recompute_for_categories
+
+CHILD_CATEGORIES = 40
+WEIGHTS = [None, None, "reduce", "boost", "max"]
+
+
+def _populate(engine, articles: int, rng: random.Random) -> int:
+    now = datetime.now()
+    with Session(engine) as session:
+        feed = Feed(url="https://example.com/feed.xml", title="Bench")
+        root = Category(display_name="Root", slug="root")
+        session.add(feed)
+        session.add(root)
+        session.commit()
+        children = [
+            Category(
+                display_name=f"Child {i}",
+                slug=f"child-{i}",
+                parent_id=root.id,
+                weight=rng.choice(WEIGHTS),
+            )
+            for i in range(CHILD_CATEGORIES)
+        ]
+        session.add_all(children)
+        session.commit()
+        child_ids = [c.id for c in children]
+
+        session.execute(
+            insert(Article),
+            [
+                {
+                    "feed_id": feed.id,
+                    "title": f"Article {i}",
+                    "url": f"https://example.com/{i}",
+                    "published_at": now,
+                    "is_read": False,
+                    "interest_score": rng.randint(0, 10),
+                    "quality_score": rng.randint(0, 10),
+                    "composite_score": 0.0,
+                    "scoring_state": "scored",
+                    "categorization_state": "categorized",
+                    "scoring_priority": 0,
+                    "categorization_attempts": 0,
+                    "scoring_attempts": 0,
+                }
+                for i in range(articles)
+            ],
+        )
+        session.execute(
+            insert(ArticleCategoryLink),
+            [
+                {"article_id": article_id, "category_id": category_id}
+                for article_id in range(1, articles + 1)
+                for category_id in rng.sample(child_ids, rng.randint(1, 3))
+            ],
+        )
+        session.commit()
+        assert root.id is not None
+        return root.id
+
+
+def run(articles: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        root_id = _populate(engine, articles, rng)
+
+        with Session(engine) as session:
+            session.exec(
+                update(Category).where(Category.id == root_id).values(weight="max")  # pyright: ignore[reportCallIssue, reportArgumentType]
+            )
+            session.commit()
+
+        started = time.perf_counter()
+        stats = recompute_for_categories(engine, [root_id])
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+
+    print(f"articles affected:  {stats.articles}")
+    print(f"articles updated:   {stats.updated}")
+    print(f"total time:         {elapsed:.2f}s")
+    print(f"per 1k articles:    {elapsed / max(stats.articles, 1) * 1000 * 1000:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.articles, args.seed)
+
+
+if __name__ == "__main__":
+    main()
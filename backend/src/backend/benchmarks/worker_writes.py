@@ -0,0 +1,196 @@
+"""Benchmark write transactions issued by the pipeline workers.
+
+Usage:
+    uv run python -m backend.benchmarks.worker_writes [--articles N] [--batch-size B]
+
+Builds a throwaway SQLite database with N queued articles, drives the
+categorization and scoring workers against an instant fake provider, and
+reports per batch how many write transactions were opened and how long the
+SQLite write lock was held (from the first INSERT/UPDATE/DELETE of a
+transaction until its commit or rollback).
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from sqlalchemy import event, insert
+from sqlmodel import Session, SQLModel, create_engine
+
+import backend.scoring_queue as scoring_queue
+from backend.models import Article, Category, Feed
+from backend.prompts import ArticleCategoryResult, ArticleScoringResult
+
+CATEGORIES = 50
+_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+
+
+@dataclass
+class WriteLockStats:
+    transactions: int = 0
+    statements: int = 0
+    held: float = 0.0
+    per_batch: list[tuple[int, float]] = field(default_factory=list)
+
+
+def _instrument(engine) -> SimpleNamespace:
+    """Attach listeners recording into ``recorder.stats`` (swap per task)."""
+    recorder = SimpleNamespace(stats=WriteLockStats())
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, _cursor, statement, _params, _context, _executemany):
+        if not statement.lstrip().upper().startswith(_WRITE_PREFIXES):
+            return
+        recorder.stats.statements += 1
+        conn.info.setdefault("write_started", time.perf_counter())
+
+    def _end(conn):
+        started = conn.info.pop("write_started", None)
+        if started is not None:
+            recorder.stats.transactions += 1
+            recorder.stats.held += time.perf_counter() - started
+
+    event.listen(engine, "commit", _end)
+    event.listen(engine, "rollback", _end)
+    return recorder
+
+
+class _InstantProvider:
+    """Returns plausible results immediately, without streaming."""
+
+    def __init__(self, category_names: list[str], rng: random.Random):
+        self.category_names = category_names
+        self.rng = rng
+
+    async def categorize(self, articles, *_args, **_kwargs):
+        return [
+            ArticleCategoryResult(
+                article_id=a["id"],
+                categories=self.rng.sample(self.category_names, 3),
+            )
+            for a in articles
+        ]
+
+    async def score(self, articles, *_args, **_kwargs):
+        return [
+            ArticleScoringResult(
+                article_id=a["id"],
+                interest_score=self.rng.randint(0, 10),
+                quality_score=self.rng.randint(0, 10),
+                reasoning="benchmark",
+            )
+            for a in articles
+        ]
+
+
+def _populate(engine, articles: int) -> list[str]:
+    now = datetime.now()
+    with Session(engine) as session:
+        feed = Feed(url="https://example.com/feed.xml", title="Bench")
+        session.add(feed)
+        categories = [
+            Category(display_name=f"Topic {i}", slug=f"topic-{i}")
+            for i in range(CATEGORIES)
+        ]
+        session.add_all(categories)
+        session.commit()
+        session.execute(
+            insert(Article),
+            [
+                {
+                    "feed_id": feed.id,
+                    "title": f"Article {i}",
+                    "url": f"https://example.com/{i}",
+                    "content": f"Body of article {i}",
+                    "published_at": now - timedelta(minutes=i),
+                    "is_read": False,
+                    "scoring_state": "unscored",
+                    "categorization_state": "queued",
+                    "scoring_priority": 0,
+                    "categorization_attempts": 0,
+                    "scoring_attempts": 0,
+                }
+                for i in range(articles)
+            ],
+        )
+        session.commit()
+        return [c.display_name for c in categories]
+
+
+def _patch_workers(provider: _InstantProvider) -> None:
+    async def _ready(*_args, **_kwargs):
+        return SimpleNamespace(
+            ready=True,
+            provider="bench",
+            model="bench-model",
+            endpoint=None,
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    scoring_queue.evaluate_task_readiness = _ready  # pyright: ignore[reportAttributeAccessIssue]
+    scoring_queue.get_provider = lambda _name: provider  # pyright: ignore[reportAttributeAccessIssue]
+    scoring_queue.is_categorization_rate_limited = lambda: False
+    scoring_queue.is_scoring_rate_limited = lambda: False
+
+
+async def _drain(engine, worker, batch_size: int, stats: WriteLockStats) -> None:
+    while True:
+        before = (stats.transactions, stats.held)
+        with Session(engine) as session:
+            session.expire_on_commit = False
+            processed = await worker.process_next_batch(session, batch_size)
+        if not processed:
+            return
+        stats.per_batch.append((stats.transactions - before[0], stats.held - before[1]))
+
+
+def _report(task: str, stats: WriteLockStats) -> None:
+    batches = len(stats.per_batch) or 1
+    txns = sum(t for t, _ in stats.per_batch)
+    held = [h for _, h in stats.per_batch] or [0.0]
+    print(f"{task}:")
+    print(f"  batches:                 {len(stats.per_batch)}")
+    print(f"  write txns per batch:    {txns / batches:.1f}")
+    print(f"  lock held per batch:     {sum(held) / batches * 1000:.2f}ms (mean)")
+    print(f"  lock held per batch:     {max(held) * 1000:.2f}ms (max)")
+    print(f"  write statements:        {stats.statements}")
+
+
+def run(articles: int, batch_size: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        category_names = _populate(engine, articles)
+        _patch_workers(_InstantProvider(category_names, rng))
+        recorder = _instrument(engine)
+
+        for task, worker in (
+            ("categorization", scoring_queue.CategorizationWorker()),
+            ("scoring", scoring_queue.ScoringWorker()),
+        ):
+            recorder.stats = WriteLockStats()
+            asyncio.run(_drain(engine, worker, batch_size, recorder.stats))
+            _report(task, recorder.stats)
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.articles, args.batch_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Process-wide in-memory snapshot of the category table.
+
+The categorization worker needs, for every batch, the slug -> category map,
+the parent graph, effective weights and the hidden set. The table is small
+and changes rarely, so it is loaded once into a CategoryCatalog and reused
+until the catalog version changes.
+
+Any session that commits an insert, update or delete of a Category row
+(through the ORM or a bulk ``update``/``delete`` statement) bumps the version,
+so every category-mutating endpoint and the worker invalidate the snapshot
+without having to remember to. Code writing categories with raw SQL must call
+bump_catalog_version() itself.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session, select
+
+from backend.models import Category
+
+logger = logging.getLogger(__name__)
+
+_SESSION_FLAG = "category_catalog_dirty"
+
+
+@dataclass(eq=False)
+class CatalogCategory:
+    """Read-only view of a Category row.
+
+    Exposes the attributes get_effective_weight and is_blocked read, so
+    entries can be passed wherever those take Category objects.
+    """
+
+    id: int
+    slug: str
+    display_name: str
+    parent_id: int | None
+    weight: str | None
+    is_hidden: bool
+    parent: CatalogCategory | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_model(
+        cls, category: Category, parent: CatalogCategory | None = None
+    ) -> CatalogCategory:
+        """Entry for a category created after the catalog was built."""
+        return cls(
+            id=category.id,  # pyright: ignore[reportArgumentType]
+            slug=category.slug,
+            display_name=category.display_name,
+            parent_id=category.parent_id,
+            weight=category.weight,
+            is_hidden=category.is_hidden,
+            parent=parent,
+        )
+
+
+class CategoryCatalog:
+    """Immutable snapshot of all categories at a given catalog version."""
+
+    def __init__(self, version: int, entries: list[CatalogCategory]) -> None:
+        self.version = version
+        self.by_id = {entry.id: entry for entry in entries}
+        self.by_slug = {entry.slug: entry for entry in entries}
+        for entry in entries:
+            if entry.parent_id is not None:
+                entry.parent = self.by_id.get(entry.parent_id)
+
+        active = [entry for entry in entries if not entry.is_hidden]
+        self.active_names = sorted((e.display_name for e in active), key=str.lower)
+        hierarchy: dict[str, list[str]] = {}
+        for entry in active:
+            if entry.parent is not None:
+                hierarchy.setdefault(entry.parent.display_name, []).append(
+                    entry.display_name
+                )
+        for children in hierarchy.values():
+            children.sort(key=str.lower)
+        self.hierarchy = hierarchy or None
+        self.hidden_names = sorted(
+            (e.display_name for e in entries if e.is_hidden), key=str.lower
+        )
+
+    def categories(self, category_ids: list[int]) -> list[CatalogCategory]:
+        """Entries for the given IDs, skipping unknown ones."""
+        return [self.by_id[cid] for cid in category_ids if cid in self.by_id]
+
+
+_version = 0
+_catalog: CategoryCatalog | None = None
+_catalog_bind: Engine | None = None
+
+
+def get_catalog(session: Session) -> CategoryCatalog:
+    """Return the current catalog, rebuilding it with one query if stale."""
+    global _catalog, _catalog_bind
+    bind = session.get_bind()
+    if _catalog is not None and _catalog.version == _version and _catalog_bind is bind:
+        return _catalog
+
+    version = _version
+    rows = session.exec(
+        select(
+            Category.id,
+            Category.slug,
+            Category.display_name,
+            Category.parent_id,
+            Category.weight,
+            Category.is_hidden,
+        )
+    ).all()
+    catalog = CategoryCatalog(version, [CatalogCategory(*row) for row in rows])  # pyright: ignore[reportArgumentType]
+    _catalog, _catalog_bind = catalog, bind  # pyright: ignore[reportAttributeAccessIssue]
+    logger.debug("Category catalog v%d built (%d categories)", version, len(rows))
+    return catalog
+
+
+def bump_catalog_version() -> None:
+    """Invalidate the catalog after categories changed."""
+    global _version
+    _version += 1
+
+
+# --- Automatic invalidation on committed category writes ---
+
+
+@event.listens_for(SASession, "after_flush")
+def _mark_category_flush(session: SASession, _flush_context) -> None:
+    if any(
+        isinstance(obj, Category)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(SASession, "do_orm_execute")
+def _mark_category_statement(state: ORMExecuteState) -> None:
+    if (state.is_update or state.is_delete) and state.bind_mapper is not None:
+        if state.bind_mapper.class_ is Category:
+            state.session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(SASession, "after_commit")
+def _bump_after_commit(session: SASession) -> None:
+    if session.info.pop(_SESSION_FLAG, False):
+        bump_catalog_version()
+
+
+@event.listens_for(SASession, "after_rollback")
+def _clear_after_rollback(session: SASession) -> None:
+    session.info.pop(_SESSION_FLAG, None)
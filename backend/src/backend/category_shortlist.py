@@ -0,0 +1,128 @@
+"""Per-batch category shortlist for categorization prompts.
+
+Every category name, the hierarchy and the hidden list go into the
+categorization system prompt. Once ``suggested_new`` has grown the table to
+hundreds of names they dominate the prompt, although a batch of ten articles
+only touches a handful of topics.
+
+shortlist_categories() ranks the catalog's categories lexically against each
+article (name words weighted by how rare they are among category names,
+title hits counting double) and interleaves the per-article rankings until
+the shortlist is full, so every article gets its best candidates. Parents of
+shortlisted categories are always kept, remaining slots go to top-level
+categories so the broad fallbacks stay available, and the hierarchy is cut
+down to the shortlisted branches. The hidden list is always sent in full: it
+tells the LLM which categories never to assign, and a blocked category left
+out of it could be returned and unhidden. See
+backend.benchmarks.category_shortlist for the prompt savings and how often
+previously assigned categories survive the cut.
+"""
+
+import math
+import re
+from collections import Counter
+
+from backend.category_catalog import CatalogCategory, CategoryCatalog
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+_STOPWORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "the", "to"})
+_SUFFIXES = ("ing", "ed", "s")
+
+# Article text beyond this many characters adds noise rather than signal
+_CONTENT_CHARS = 2000
+_TITLE_WEIGHT = 2.0
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping so 'Games', 'game' and 'gaming' all match."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and not word.endswith("ss"):
+            if len(word) - len(suffix) >= 3:
+                word = word[: -len(suffix)]
+            break
+    return word[:-1] if word.endswith("e") and len(word) > 3 else word
+
+
+def _terms(text: str) -> set[str]:
+    return {
+        _stem(word) for word in _WORD_RE.findall(text.lower()) if word not in _STOPWORDS
+    }
+
+
+def _rank(
+    entries: list[tuple[CatalogCategory, set[str]]],
+    article: dict,
+    idf: dict[str, float],
+) -> list[tuple[float, CatalogCategory]]:
+    """Entries (with their name terms) matching the article, best first."""
+    title = _terms(article.get("title") or "")
+    body = _terms((article.get("content_markdown") or "")[:_CONTENT_CHARS])
+    ranked = []
+    for entry, terms in entries:
+        score = sum(
+            idf[t] * (_TITLE_WEIGHT if t in title else 1.0)
+            for t in terms
+            if t in title or t in body
+        ) / len(terms)
+        if score > 0:
+            ranked.append((score, entry))
+    ranked.sort(key=lambda item: (-item[0], item[1].display_name.lower()))
+    return ranked
+
+
+def shortlist_categories(
+    catalog: CategoryCatalog, articles: list[dict], size: int
+) -> tuple[list[str], dict[str, list[str]] | None, list[str]]:
+    """Return (active names, hierarchy, hidden names) for a batch's prompt.
+
+    Args:
+        catalog: Current category catalog
+        articles: Batch article dicts with title and content_markdown
+        size: Target number of active categories; 0 disables the shortlist
+
+    Returns:
+        The same triple as get_active_categories, with active names and
+        hierarchy restricted to the shortlist; hidden names are never cut.
+        The full catalog is returned when it is no larger than ``size``.
+    """
+    if size <= 0 or len(catalog.active_names) <= size:
+        return catalog.active_names, catalog.hierarchy, catalog.hidden_names
+
+    entries = [(e, _terms(e.display_name)) for e in catalog.by_id.values()]
+    entries = [(e, terms) for e, terms in entries if terms]
+    term_counts = Counter(t for _, terms in entries for t in terms)
+    idf = {t: math.log(1 + len(entries) / n) for t, n in term_counts.items()}
+
+    active = [(e, terms) for e, terms in entries if not e.is_hidden]
+    rankings = [_rank(active, article, idf) for article in articles]
+
+    chosen: dict[int, CatalogCategory] = {}
+    depth = 0
+    while len(chosen) < size and any(depth < len(r) for r in rankings):
+        for ranking in rankings:
+            if depth < len(ranking) and len(chosen) < size:
+                entry = ranking[depth][1]
+                chosen.setdefault(entry.id, entry)
+        depth += 1
+
+    # Parents of chosen categories, then top-level categories as fallbacks
+    for entry in list(chosen.values()):
+        if entry.parent is not None and not entry.parent.is_hidden:
+            chosen.setdefault(entry.parent.id, entry.parent)
+    for entry, _ in sorted(active, key=lambda item: item[0].display_name.lower()):
+        if len(chosen) >= size:
+            break
+        if entry.parent is None:
+            chosen.setdefault(entry.id, entry)
+
+    names = sorted((e.display_name for e in chosen.values()), key=str.lower)
+    hierarchy: dict[str, list[str]] = {}
+    for entry in chosen.values():
+        if entry.parent is not None and entry.parent.id in chosen:
+            hierarchy.setdefault(entry.parent.display_name, []).append(
+                entry.display_name
+            )
+    for children in hierarchy.values():
+        children.sort(key=str.lower)
+
+    return names, hierarchy or None, catalog.hidden_names
@@ -35,6 +35,109 @@ class SchedulerConfig(BaseModel):
     log_job_execution: bool = False
 
 
+class PipelineConfig(BaseModel):
+    """Categorization/scoring pipeline tuning."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    # Adaptive batch sizing: bounds for the per-task controller. Without a
+    # max_batch_size the configured route batch size is the upper bound
+    adaptive_batch_size: bool = True
+    min_batch_size: int = 1
+    max_batch_size: int | None = None
+
+    # Content-addressed LLM result cache; least recently used entries are
+    # evicted once the stored results exceed the size budget
+    result_cache_enabled: bool = True
+    result_cache_max_bytes: int = 20_000_000
+
+    # Near-duplicate detection: articles whose SimHash is within this many
+    # bits of an already scored article inherit its categories and scores
+    near_duplicate_enabled: bool = True
+    near_duplicate_max_distance: int = 6
+
+    # Queue leases: a claimed batch returns to the queue if its worker has not
+    # finished within this many seconds (covers retries of slow LLM calls)
+    lease_seconds: int = 900
+
+    # Retry backoff per article: a failed attempt re-queues it with a delay
+    # doubling from retry_backoff_seconds up to the cap, with jitter
+    retry_backoff_seconds: float = 60.0
+    retry_backoff_max_seconds: float = 3600.0
+
+    # Share of claims reserved for fresh articles while bulk rescores are
+    # also queued; interactive rescores always go first
+    fresh_lane_share: float = 0.75
+
+    # Categorize and score each article in one LLM call on the scoring route,
+    # instead of one call per task; needs a provider that supports it
+    combined_mode: bool = False
+
+    # Scoring cascade: this smaller model on the scoring route's provider
+    # scores every article first; only interest scores inside the uncertain
+    # band (inclusive) and outputs that fail validation go to the route's
+    # model. Empty disables the cascade
+    cascade_model: str = ""
+    cascade_uncertain_min: int = 4
+    cascade_uncertain_max: int = 6
+
+    # Local pre-scorer (see backend.prescorer), retrained in a background
+    # process from LLM scores. Once it has learned from min_examples articles,
+    # articles it predicts with at least min_confidence (the estimated chance
+    # the LLM would score within one point) skip the LLM
+    prescorer_enabled: bool = False
+    prescorer_min_confidence: float = 0.8
+    prescorer_min_examples: int = 500
+
+    # k-NN categorization (see backend.embeddings): articles are embedded with
+    # this model on the categorization route's provider, and an article whose
+    # knn_k nearest categorized neighbours (at least knn_min_similarity cosine)
+    # agree on its categories by at least knn_min_agreement of the
+    # similarity-weighted vote skips the LLM. Empty disables it
+    embedding_model: str = ""
+    knn_k: int = 10
+    knn_min_similarity: float = 0.8
+    knn_min_agreement: float = 0.8
+
+    # A batch that fails validation deterministically, or again after an
+    # earlier failure, is retried in halves until the articles that break it
+    # are isolated; only those are marked failed
+    bisect_failed_batches: bool = True
+
+    # Categorization prompts list only this many categories picked by lexical
+    # similarity to the batch (plus their parents); 0 sends the full list
+    category_shortlist_size: int = 40
+
+    # Ollama: keep the model, and the KV cache of the shared prompt prefix,
+    # loaded between batches. ollama_num_ctx is sent with every request (a
+    # different num_ctx reloads the model); 0 keeps the server default. Set
+    # it (e.g. 16384) so long shared prefixes stay cached, if the host has
+    # memory for the larger KV cache
+    ollama_keep_alive: str = "30m"
+    ollama_num_ctx: int = 0
+    # Preload routed Ollama models before the pipeline runs; if the
+    # categorization and scoring models cannot stay loaded together, finish
+    # the categorization backlog before switching to the scoring model
+    ollama_residency: bool = True
+
+    # Offline batch jobs on hosted providers with a batch API (Google): once
+    # this many articles are queued in a task's backlog lane, up to
+    # batch_job_max_articles of them go out as one asynchronous job instead
+    # of synchronous calls, held for at most batch_job_lease_hours; 0 (the
+    # default) disables them
+    batch_job_threshold: int = 0
+    batch_job_max_articles: int = 1000
+    batch_job_lease_hours: int = 48
+
+    # Record/replay cassettes (see backend.llm_providers.cassette): append
+    # every LLM exchange to llm_record_path, or serve calls from the cassette
+    # at llm_replay_path instead of the provider, with the recorded timing
+    # unless llm_replay_realtime is off
+    llm_record_path: str = ""
+    llm_replay_path: str = ""
+    llm_replay_realtime: bool = True
+
+
 class Settings(BaseSettings):
     """Application settings with nested configuration sections.
 
@@ -57,6 +160,7 @@ class Settings(BaseSettings):
     database: DatabaseConfig = DatabaseConfig()
     logging: LoggingConfig = LoggingConfig()
     scheduler: SchedulerConfig = SchedulerConfig()
+    pipeline: PipelineConfig = PipelineConfig()
 
     @classmethod
     def settings_customise_sources(
@@ -1,11 +1,14 @@
 import logging
+import time
 from pathlib import Path
 
 from slugify import slugify
-from sqlalchemy import event, text
+from sqlalchemy import event, or_, text
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from backend.config import get_settings
+from backend.metrics import DB_STATEMENT_SECONDS
+from backend.models import CATEGORY_SOURCE_RULE
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,27 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor.close()
 
 
+_STATEMENT_KINDS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info["statement_started"] = time.perf_counter()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _record_statement_time(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("statement_started", None)
+    if started is None:
+        return
+    head = statement.lstrip()[:6].split()
+    kind = head[0].upper() if head else ""
+    DB_STATEMENT_SECONDS.observe(
+        time.perf_counter() - started,
+        statement=kind.lower() if kind in _STATEMENT_KINDS else "other",
+    )
+
+
 # --- Smart casing helpers ---
 
 SMART_CASE_MAP = {
@@ -109,24 +133,14 @@ def _set_schema_version(conn, version: int):
 
 
 def _recover_stuck_scoring(conn):
-    """Reset articles orphaned in 'scoring' or 'categorizing' state back to queued."""
-    result = conn.execute(
-        text(
-            "UPDATE articles SET scoring_state = 'queued' WHERE scoring_state = 'scoring'"
-        )
-    )
-    if result.rowcount > 0:
-        logger.info(f"Recovered {result.rowcount} articles stuck in scoring state")
+    """Reset articles orphaned in 'scoring' or 'categorizing' state back to queued.
 
-    result2 = conn.execute(
-        text(
-            "UPDATE articles SET categorization_state = 'queued' WHERE categorization_state = 'categorizing'"
-        )
-    )
-    if result2.rowcount > 0:
-        logger.info(
-            f"Recovered {result2.rowcount} articles stuck in categorizing state"
-        )
+    No worker has claimed anything yet at startup, so every lease is stale.
+    While running, the scheduler's reaper releases only expired leases.
+    """
+    from backend.leases import reap_expired_leases
+
+    reap_expired_leases(conn, expired_only=False)
 
 
 def _seed_default_categories(conn):
@@ -134,6 +148,7 @@ def _seed_default_categories(conn):
 
     Only runs on fresh installs (empty categories table).
     """
+    from backend.category_catalog import bump_catalog_version
     from backend.models import Category
     from backend.prompts import DEFAULT_CATEGORY_HIERARCHY
 
@@ -180,6 +195,8 @@ def _seed_default_categories(conn):
                 child_cat.parent_id = parent_cat.id
 
     session.flush()
+    # Flushed on the caller's connection, so the session commit hook never fires
+    bump_catalog_version()
 
     logger.info(f"Seeded {len(slug_to_cat)} categories from default hierarchy")
 
@@ -236,6 +253,52 @@ def _backfill_content_markdown():
         logger.info("Backfilled content_markdown for %d articles", converted)
 
 
+_FINGERPRINT_BACKFILL_CHUNK = 500
+
+
+def _backfill_fingerprints():
+    """Fingerprint existing articles so new copies can match them.
+
+    Runs in ID-ordered chunks. Articles too short to fingerprint are marked
+    (see fingerprint.NO_FINGERPRINT) so later startups skip them. Articles
+    blocked by a pre-filter rule are left unfingerprinted, as at ingestion.
+    """
+    from backend.fingerprint import NO_FINGERPRINT, fingerprint_article
+    from backend.models import Article
+
+    fingerprinted = 0
+    last_id = 0
+    with Session(engine) as session:
+        while True:
+            articles = session.exec(
+                select(Article)
+                .where(  # pyright: ignore[reportArgumentType]
+                    Article.simhash.is_(None),  # pyright: ignore[reportAttributeAccessIssue]
+                    Article.content_markdown.is_not(None),  # pyright: ignore[reportAttributeAccessIssue]
+                    Article.id > last_id,  # pyright: ignore[reportOptionalOperand]
+                    or_(
+                        Article.category_source.is_(None),  # pyright: ignore[reportAttributeAccessIssue]
+                        Article.category_source != CATEGORY_SOURCE_RULE,
+                    ),
+                )
+                .order_by(Article.id)  # pyright: ignore[reportArgumentType]
+                .limit(_FINGERPRINT_BACKFILL_CHUNK)
+            ).all()
+            if not articles:
+                break
+
+            for article in articles:
+                fingerprint_article(session, article)
+                if article.simhash != NO_FINGERPRINT:
+                    fingerprinted += 1
+            last_id = articles[-1].id  # pyright: ignore[reportAssignmentType]
+            session.commit()
+            session.expunge_all()
+
+    if fingerprinted:
+        logger.info("Backfilled fingerprints for %d articles", fingerprinted)
+
+
 # --- Startup ---
 
 
@@ -279,5 +342,6 @@ def create_db_and_tables():
         _recover_stuck_scoring(conn)
 
     _backfill_content_markdown()
+    _backfill_fingerprints()
 
     logger.info(f"Database ready at schema version {CURRENT_SCHEMA_VERSION}")
@@ -42,6 +42,7 @@ class TaskRuntimeResolution:
     api_key: str | None
     ready: bool
     reason: ReadinessReason | None
+    endpoints: list[str] | None = None
 
 
 def get_session():
@@ -202,6 +203,7 @@ def resolve_task_runtime(session: Session, task: TaskName) -> TaskRuntimeResolut
         api_key=parsed.api_key,
         ready=True,
         reason=None,
+        endpoints=parsed.endpoints,
     )
 
 
@@ -251,6 +253,7 @@ async def evaluate_task_readiness(
         model=runtime.model,
         thinking=runtime.thinking,
         api_key=runtime.api_key,
+        endpoints=runtime.endpoints,
     )
 
     try:
@@ -0,0 +1,481 @@
+"""Embedding index and k-NN categorization.
+
+A new article usually covers ground the LLM has categorized many times
+before. Each article the LLM categorizes is embedded (PIPELINE__EMBEDDING_MODEL
+on the categorization route's provider) and added to an index; a new article
+whose nearest indexed neighbours agree on their categories takes those
+categories without an LLM call (category_source "knn"). Only LLM
+categorizations are indexed, so k-NN results never vote for later articles.
+
+The index lives in an "embeddings" directory next to the database and
+survives restarts:
+
+- vectors.f32: unit-length float32 rows, memory-mapped for search
+- rows.i64: the article ID of each row
+- signatures.i32: each row's bucket in every LSH table
+- meta.json: the embedding model, its dimension and the backfill position
+
+Files are only appended to. An article indexed again (recategorized) gets a
+new row and the old one is ignored. Changing the embedding model starts a
+new index.
+
+Search is approximate: random-hyperplane LSH over _TABLES tables of _BITS
+bits each picks candidates, which are then ranked by exact cosine
+similarity. Pure Python, like backend.prescorer: math.sumprod over a
+memoryview of the mapped file keeps a query around ten milliseconds at tens
+of thousands of articles without a numeric dependency.
+"""
+
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import random
+from array import array
+from collections.abc import Mapping
+from dataclasses import replace
+
+from sqlmodel import Session, col, select
+
+from backend.category_catalog import get_catalog
+from backend.config import get_settings
+from backend.llm_providers.base import (
+    EmbeddingProvider,
+    LLMProvider,
+    ProviderTaskConfig,
+)
+from backend.metrics import KNN_ARTICLES
+from backend.models import Article, ArticleCategoryLink
+from backend.prompts import ArticleCategoryResult
+
+logger = logging.getLogger(__name__)
+
+_TABLES = 16
+_BITS = 10
+_PLANE_SEED = 20261019
+# Title and opening of the article; embedding models truncate long input
+_EMBED_CHARS = 2000
+# Fewer agreeing neighbours than this is not evidence enough
+_MIN_NEIGHBOURS = 3
+# Same cap as the categorization prompt's response schema
+_MAX_CATEGORIES = 4
+BACKFILL_BATCH = 256
+
+_VECTORS = "vectors.f32"
+_ROWS = "rows.i64"
+_SIGNATURES = "signatures.i32"
+_META = "meta.json"
+
+
+def _normalized(vector: list[float]) -> list[float]:
+    norm = math.sqrt(math.sumprod(vector, vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class EmbeddingIndex:
+    """Append-only vector store with an LSH index over it."""
+
+    def __init__(self, directory: str, model: str, dim: int) -> None:
+        self.directory = directory
+        self.model = model
+        self.dim = dim
+        rng = random.Random(_PLANE_SEED + dim)
+        self._planes = [
+            [rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(_TABLES * _BITS)
+        ]
+        self._rows = array("q")
+        self._signatures = array("i")
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(_TABLES)]
+        self._latest: dict[int, int] = {}  # article ID -> its newest row
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self.backfill_before: int | None = None
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def __contains__(self, article_id: int) -> bool:
+        return article_id in self._latest
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path(_META)) as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):  # fmt: skip
+            meta = {}
+        if meta.get("model") != self.model or meta.get("dim") != self.dim:
+            if meta:
+                logger.info(
+                    "Embedding model changed to %s; starting a new index", self.model
+                )
+            self._reset()
+            return
+
+        self.backfill_before = meta.get("backfill_before")
+        try:
+            with open(self._path(_ROWS), "rb") as f:
+                self._rows.frombytes(f.read())
+            with open(self._path(_SIGNATURES), "rb") as f:
+                self._signatures.frombytes(f.read())
+            vector_bytes = os.path.getsize(self._path(_VECTORS))
+        except (FileNotFoundError, ValueError) as e:  # fmt: skip
+            logger.warning("Embedding index unreadable (%s); starting over", e)
+            self._rows, self._signatures = array("q"), array("i")
+            self.backfill_before = None
+            self._reset()
+            return
+        # A crash between appends leaves the files at different lengths; cut
+        # them back to the rows complete in all three
+        count = min(
+            len(self._rows),
+            len(self._signatures) // _TABLES,
+            vector_bytes // (4 * self.dim),
+        )
+        del self._rows[count:]
+        del self._signatures[count * _TABLES :]
+        os.truncate(self._path(_ROWS), count * self._rows.itemsize)
+        os.truncate(
+            self._path(_SIGNATURES), count * _TABLES * self._signatures.itemsize
+        )
+        os.truncate(self._path(_VECTORS), count * 4 * self.dim)
+        for row, article_id in enumerate(self._rows):
+            self._insert(row, article_id)
+
+    def _reset(self) -> None:
+        for name in (_VECTORS, _ROWS, _SIGNATURES):
+            open(self._path(name), "wb").close()
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        tmp = self._path(f"{_META}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "model": self.model,
+                    "dim": self.dim,
+                    "backfill_before": self.backfill_before,
+                },
+                f,
+            )
+        os.replace(tmp, self._path(_META))
+
+    def set_backfill_before(self, article_id: int) -> None:
+        self.backfill_before = article_id
+        self._write_meta()
+
+    def _signature(self, vector: list[float]) -> list[int]:
+        signature = []
+        for table in range(_TABLES):
+            bucket = 0
+            for plane in self._planes[table * _BITS : (table + 1) * _BITS]:
+                bucket = bucket << 1 | (math.sumprod(plane, vector) >= 0.0)
+            signature.append(bucket)
+        return signature
+
+    def _insert(self, row: int, article_id: int) -> None:
+        for table in range(_TABLES):
+            bucket = self._signatures[row * _TABLES + table]
+            self._buckets[table].setdefault(bucket, []).append(row)
+        self._latest[article_id] = row
+
+    def _vectors(self) -> memoryview:
+        if self._view is None:
+            with open(self._path(_VECTORS), "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap).cast("f")
+        return self._view
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def add(self, vectors: Mapping[int, list[float]]) -> None:
+        """Index one vector per article ID."""
+        if not vectors:
+            return
+        packed = array("f")
+        signatures = array("i")
+        for vector in vectors.values():
+            unit = _normalized(vector)
+            packed.extend(unit)
+            signatures.extend(self._signature(unit))
+        first_row = len(self._rows)
+        with open(self._path(_VECTORS), "ab") as f:
+            f.write(packed.tobytes())
+        with open(self._path(_SIGNATURES), "ab") as f:
+            f.write(signatures.tobytes())
+        rows = array("q", vectors.keys())
+        with open(self._path(_ROWS), "ab") as f:
+            f.write(rows.tobytes())
+        self._rows.extend(rows)
+        self._signatures.extend(signatures)
+        for offset, article_id in enumerate(rows):
+            self._insert(first_row + offset, article_id)
+        # Remap on the next search, to cover the appended rows
+        self.close()
+
+    def search(
+        self, vector: list[float], k: int, exclude: int | None = None
+    ) -> list[tuple[int, float]]:
+        """Approximate k nearest articles as (article ID, cosine similarity)."""
+        if not self._rows:
+            return []
+        unit = _normalized(vector)
+        candidates: set[int] = set()
+        for table, bucket in enumerate(self._signature(unit)):
+            candidates.update(self._buckets[table].get(bucket, ()))
+        vectors = self._vectors()
+        dim = self.dim
+        scored = []
+        for row in candidates:
+            article_id = self._rows[row]
+            if article_id == exclude or self._latest[article_id] != row:
+                continue
+            similarity = math.sumprod(unit, vectors[row * dim : (row + 1) * dim])
+            scored.append((similarity, article_id))
+        return [(aid, sim) for sim, aid in heapq.nlargest(k, scored)]
+
+
+# --- Runtime ---------------------------------------------------------------
+
+_index: EmbeddingIndex | None = None
+
+
+def index_directory() -> str:
+    """The index lives next to the database."""
+    database = os.path.abspath(get_settings().database.path)
+    return os.path.join(os.path.dirname(database), "embeddings")
+
+
+def _get_index(dim: int | None = None) -> EmbeddingIndex | None:
+    """The index of the configured model; opened from disk on first use.
+
+    Without `dim` (nothing embedded yet in this process), the stored index
+    is opened if there is one. A different `dim` starts a new index.
+    """
+    global _index
+    model = get_settings().pipeline.embedding_model
+    if not model:
+        return None
+    if _index is not None and _index.model == model:
+        if dim is None or _index.dim == dim:
+            return _index
+    directory = index_directory()
+    if dim is None:
+        try:
+            with open(os.path.join(directory, _META)) as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):  # fmt: skip
+            return None
+        if meta.get("model") != model:
+            return None
+        dim = meta["dim"]
+    if _index is not None:
+        _index.close()
+    _index = EmbeddingIndex(directory, model, dim)  # pyright: ignore[reportArgumentType]
+    return _index
+
+
+def reset() -> None:
+    """Drop the in-memory index; the next use reopens it from disk."""
+    global _index
+    if _index is not None:
+        _index.close()
+        _index = None
+
+
+def _embedding_text(article: dict) -> str:
+    return f"{article['title']}\n\n{article['content_markdown']}"[:_EMBED_CHARS]
+
+
+async def embed_articles(
+    provider: LLMProvider, config: ProviderTaskConfig, articles: list[dict]
+) -> dict[int, list[float]]:
+    """Embed prompt-input article dicts (id, title, content_markdown).
+
+    Returns nothing when k-NN categorization is off, the provider cannot
+    embed, or the call fails: the articles then simply go to the LLM.
+    """
+    model = get_settings().pipeline.embedding_model
+    if not model or not articles or not isinstance(provider, EmbeddingProvider):
+        return {}
+    try:
+        vectors = await provider.embed(
+            [_embedding_text(a) for a in articles],
+            replace(config, model=model, thinking=False),
+        )
+    except Exception as e:
+        logger.warning("Embedding failed, categorizing with the LLM: %s", e)
+        return {}
+    if len(vectors) != len(articles):
+        logger.warning(
+            "Embedding returned %d vectors for %d articles", len(vectors), len(articles)
+        )
+        return {}
+    return {a["id"]: vector for a, vector in zip(articles, vectors, strict=True)}
+
+
+def index_vectors(vectors: Mapping[int, list[float]]) -> None:
+    """Add LLM-categorized articles to the index."""
+    if not vectors:
+        return
+    index = _get_index(len(next(iter(vectors.values()))))
+    if index is None:
+        return
+    try:
+        index.add(vectors)
+    except OSError as e:
+        logger.warning("Could not extend the embedding index: %s", e)
+
+
+def categorize_by_neighbours(
+    session: Session, vectors: Mapping[int, list[float]]
+) -> dict[int, ArticleCategoryResult]:
+    """Categories for the articles whose nearest neighbours agree on them.
+
+    Neighbours below PIPELINE__KNN_MIN_SIMILARITY are ignored. Each remaining
+    neighbour votes for its current categories with its similarity; the
+    categories with at least PIPELINE__KNN_MIN_AGREEMENT of the total vote
+    are assigned, provided at least _MIN_NEIGHBOURS neighbours voted and no
+    agreed category is hidden (only the LLM unhides categories).
+    """
+    if not vectors:
+        return {}
+    index = _get_index(len(next(iter(vectors.values()))))
+    if index is None or not index:
+        return {}
+    settings = get_settings().pipeline
+
+    neighbours = {
+        aid: [
+            (neighbour, similarity)
+            for neighbour, similarity in index.search(
+                vector, settings.knn_k, exclude=aid
+            )
+            if similarity >= settings.knn_min_similarity
+        ]
+        for aid, vector in vectors.items()
+    }
+    neighbour_ids = {n for found in neighbours.values() for n, _ in found}
+    categories_of: dict[int, list[int]] = {}
+    if neighbour_ids:
+        for article_id, category_id in session.exec(
+            select(ArticleCategoryLink.article_id, ArticleCategoryLink.category_id)
+            .join(Article, col(Article.id) == ArticleCategoryLink.article_id)
+            .where(
+                col(ArticleCategoryLink.article_id).in_(neighbour_ids),
+                Article.categorization_state == "categorized",
+            )
+        ).all():
+            categories_of.setdefault(article_id, []).append(category_id)
+
+    catalog = get_catalog(session)
+    results: dict[int, ArticleCategoryResult] = {}
+    for aid, found in neighbours.items():
+        if len(found) < _MIN_NEIGHBOURS:
+            continue
+        # Neighbours without categories count against every category
+        total = sum(similarity for _, similarity in found)
+        votes: dict[int, float] = {}
+        for neighbour, similarity in found:
+            for category_id in categories_of.get(neighbour, ()):
+                votes[category_id] = votes.get(category_id, 0.0) + similarity
+        agreed = [
+            category_id
+            for category_id, weight in votes.items()
+            if weight >= settings.knn_min_agreement * total
+        ]
+        entries = catalog.categories(agreed)
+        if (
+            not entries
+            or len(entries) != len(agreed)
+            or len(entries) > _MAX_CATEGORIES
+            or any(entry.is_hidden for entry in entries)
+        ):
+            continue
+        # Slugs resolve to the same categories when the results are applied
+        results[aid] = ArticleCategoryResult(
+            article_id=aid, categories=[entry.slug for entry in entries]
+        )
+
+    KNN_ARTICLES.inc(len(results), outcome="assigned")
+    KNN_ARTICLES.inc(len(vectors) - len(results), outcome="llm")
+    if results:
+        logger.info(
+            "k-NN categorized %d of %d articles without the LLM",
+            len(results),
+            len(vectors),
+        )
+    return results
+
+
+async def backfill(
+    session: Session, provider: LLMProvider, config: ProviderTaskConfig
+) -> int:
+    """Index up to BACKFILL_BATCH LLM-categorized articles from before the index.
+
+    Walks down from the newest article, remembering the position in
+    meta.json. Returns the number of articles embedded.
+    """
+    if not get_settings().pipeline.embedding_model:
+        return 0
+    index = _get_index()
+    query = (
+        select(Article)
+        .where(Article.category_source == "llm")
+        .order_by(col(Article.id).desc())
+        .limit(BACKFILL_BATCH)
+    )
+    if index is not None and index.backfill_before is not None:
+        query = query.where(col(Article.id) < index.backfill_before)
+    articles = session.exec(query).all()
+    if not articles:
+        return 0
+
+    todo = [
+        {
+            "id": art.id,
+            "title": art.title,
+            "content_markdown": art.content_markdown
+            or art.content
+            or art.summary
+            or "",
+        }
+        for art in articles
+        if index is None or art.id not in index
+    ]
+    vectors = await embed_articles(provider, config, todo)
+    if todo and not vectors:
+        return 0  # retried on the next run
+    index_vectors(vectors)
+    index = _get_index()
+    if index is not None:
+        index.set_backfill_before(articles[-1].id)  # pyright: ignore[reportArgumentType]
+    return len(vectors)
+
+
+def get_knn_stats() -> dict:
+    """Counters for /api/scoring/status."""
+    settings = get_settings().pipeline
+    index = _get_index() if settings.embedding_model else None
+    assigned = int(KNN_ARTICLES.value(outcome="assigned"))
+    checked = assigned + int(KNN_ARTICLES.value(outcome="llm"))
+    return {
+        "enabled": bool(settings.embedding_model),
+        "model": settings.embedding_model or None,
+        "indexed": len(index) if index is not None else 0,
+        "assigned": assigned,
+        "sent_to_llm": checked - assigned,
+        "llm_calls_avoided": round(assigned / checked, 3) if checked else 0.0,
+    }
@@ -1,4 +1,6 @@
 import logging
+import time
+from collections import Counter
 from datetime import datetime
 from time import struct_time
 
@@ -6,8 +8,19 @@ import feedparser
 import httpx
 from sqlmodel import Session, select
 
+from backend.fingerprint import fingerprint_article
 from backend.markdown import html_to_markdown
+from backend.metrics import (
+    ARTICLES_INGESTED,
+    FEED_FETCH_BYTES,
+    FEED_FETCH_SECONDS,
+    FEED_PARSE_SECONDS,
+    MARKDOWN_SECONDS,
+)
 from backend.models import Article, Feed
+from backend.prefilter import block as prefilter_block
+from backend.prefilter import get_matcher
+from backend.prefilter import record_hits as record_rule_hits
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +51,21 @@ async def fetch_feed(url: str) -> feedparser.FeedParserDict:
     Raises:
         httpx.HTTPError: If the feed cannot be fetched
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    started = time.perf_counter()
+    try:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+    except Exception:
+        FEED_FETCH_SECONDS.observe(time.perf_counter() - started, outcome="error")
+        raise
+    FEED_FETCH_SECONDS.observe(time.perf_counter() - started, outcome="ok")
+    FEED_FETCH_BYTES.inc(len(response.content))
 
     # feedparser.parse() accepts both URLs and strings
+    started = time.perf_counter()
     feed = feedparser.parse(response.text)
+    FEED_PARSE_SECONDS.observe(time.perf_counter() - started)
 
     if feed.bozo:  # feedparser sets bozo=1 for malformed feeds
         logger.warning(f"Feed {url} has parsing issues: {feed.get('bozo_exception')}")
@@ -57,6 +79,10 @@ def save_articles(
     """
     Save articles from feed entries, deduplicating by URL.
 
+    Articles matching a pre-filter rule are saved already blocked and are
+    not fingerprinted, so they never reach the LLM or serve as a
+    near-duplicate source.
+
     Args:
         session: Database session
         feed_id: Feed ID to associate articles with
@@ -67,6 +93,8 @@ def save_articles(
     """
     new_count = 0
     new_article_ids = []
+    matcher = get_matcher(session)
+    rule_hits: Counter[int] = Counter()
 
     for entry in entries:
         # Skip entries without a link (URL)
@@ -99,8 +127,10 @@ def save_articles(
 
         raw_html = article.content or article.summary or ""
         if raw_html:
+            started = time.perf_counter()
             try:
                 article.content_markdown = html_to_markdown(raw_html)
+                MARKDOWN_SECONDS.observe(time.perf_counter() - started)
                 logger.info(
                     "Converted article %s to markdown", article.id or article.title
                 )
@@ -109,12 +139,26 @@ def save_articles(
                     "Markdown conversion failed for article '%s': %s", article.title, e
                 )
 
+        rule_id = matcher.match(article) if matcher else None
+        if rule_id is not None:
+            prefilter_block(article, matcher.names[rule_id])
+            rule_hits[rule_id] += 1
+
         session.add(article)
         session.flush()  # Flush to get ID without committing
+        if rule_id is None:
+            fingerprint_article(session, article)
         new_article_ids.append(article.id)
         new_count += 1
 
+    if rule_hits:
+        record_rule_hits(session, rule_hits)
+        logger.info(
+            f"Blocked {rule_hits.total()} new articles from feed {feed_id} "
+            "by pre-filter rules"
+        )
     session.commit()
+    ARTICLES_INGESTED.inc(new_count)
     logger.info(f"Saved {new_count} new articles from feed {feed_id}")
 
     return new_count, new_article_ids
@@ -0,0 +1,201 @@
+"""SimHash fingerprints and LSH band index for near-duplicate article detection.
+
+Syndicated stories show up in many feeds with small edits (tracking links,
+bylines, a trailing paragraph). A 64-bit SimHash over word shingles of
+``content_markdown`` maps such copies to fingerprints a few bits apart.
+
+The fingerprint is split into SIMHASH_BANDS bands stored in their own indexed
+table. By the pigeonhole principle two fingerprints within
+``SIMHASH_BANDS - 1`` bits share at least one band exactly, so an indexed
+equality lookup finds every candidate and the exact Hamming distance is
+checked in Python. Eight 8-bit bands cover the 4-7 bit distances lightly
+edited copies land at (see backend.benchmarks.fingerprint).
+
+Within d bits, at most d bands differ, so a match shares at least
+``SIMHASH_BANDS - d`` bands. Lookups require that many shared bands: at the
+default distance of 6 an unrelated article shares two of eight 8-bit bands
+with probability ~1/2300, against ~1/32 for any one band. The candidate
+query is also capped at MAX_CANDIDATES, most recently scored first.
+"""
+
+import hashlib
+import logging
+import re
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, col, func, select
+
+from backend.config import get_settings
+from backend.models import CATEGORY_SOURCE_RULE, Article, ArticleSimhashBand
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8
+_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_MASK64 = (1 << SIMHASH_BITS) - 1
+_DIGEST_SIZE = SIMHASH_BITS // 8
+
+# translate() tables mapping a byte to 1 if the given bit is set, else 0
+_BIT_TABLES = [bytes((value >> bit) & 1 for value in range(256)) for bit in range(8)]
+
+# Most candidates whose exact distance is checked per lookup
+MAX_CANDIDATES = 200
+
+# Word n-gram size for shingles
+SHINGLE_SIZE = 3
+# Texts shorter than this are too small for a meaningful fingerprint
+MIN_WORDS = 30
+# Stored for articles that were checked but are too short to fingerprint, so
+# the startup backfill does not select them again. They get no band rows.
+NO_FINGERPRINT = 0
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+_stats: dict[str, int] = {"inherited": 0}
+
+
+def compute_simhash(text: str | None) -> int | None:
+    """Return the 64-bit SimHash of text as a signed int, or None if too short.
+
+    Signed so the value fits SQLite's INTEGER column.
+    """
+    if not text:
+        return None
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    blob = b"".join(
+        hashlib.blake2b(s.encode(), digest_size=_DIGEST_SIZE).digest() for s in shingles
+    )
+
+    # Tally set bits per position column-wise so the counting runs in C:
+    # blob[pos::8] holds byte `pos` of every shingle hash (big-endian).
+    half = len(shingles) / 2
+    fingerprint = 0
+    for pos in range(_DIGEST_SIZE):
+        column = blob[pos::_DIGEST_SIZE]
+        shift = (_DIGEST_SIZE - 1 - pos) * 8
+        for bit, table in enumerate(_BIT_TABLES):
+            if column.translate(table).count(1) > half:
+                fingerprint |= 1 << (shift + bit)
+
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >> 63 else fingerprint
+
+
+def simhash_bands(fingerprint: int) -> list[int]:
+    """Split a fingerprint into SIMHASH_BANDS band values."""
+    unsigned = fingerprint & _MASK64
+    return [
+        (unsigned >> (band * _BAND_BITS)) & _BAND_MASK for band in range(SIMHASH_BANDS)
+    ]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return ((a ^ b) & _MASK64).bit_count()
+
+
+def fingerprint_article(session: Session, article: Article) -> None:
+    """Compute and index an article's fingerprint. The article must have an ID.
+
+    Articles too short to fingerprint are marked with NO_FINGERPRINT.
+    """
+    fingerprint = compute_simhash(article.content_markdown)
+    article.simhash = NO_FINGERPRINT if fingerprint is None else fingerprint
+    session.add(article)
+    if fingerprint is None:
+        return
+    for band, value in enumerate(simhash_bands(fingerprint)):
+        session.add(
+            ArticleSimhashBand(
+                article_id=article.id,  # pyright: ignore[reportArgumentType]
+                band=band,
+                value=value,
+            )
+        )
+
+
+def _band_match(fingerprint: int):
+    """WHERE clause matching band rows that share any band with fingerprint."""
+    return or_(
+        *(
+            and_(
+                col(ArticleSimhashBand.band) == band,
+                col(ArticleSimhashBand.value) == value,
+            )
+            for band, value in enumerate(simhash_bands(fingerprint))
+        )
+    )
+
+
+def find_near_duplicate(session: Session, article: Article) -> Article | None:
+    """Find the closest already-processed near-duplicate of an article.
+
+    Only articles that completed both categorization and scoring qualify as
+    sources, except those blocked by a pre-filter rule: the rule may not
+    cover the copy (another feed, another title). Ties go to the most
+    recently scored one. Returns None when disabled, unfingerprinted, or
+    nothing is within the configured distance.
+    """
+    settings = get_settings().pipeline
+    if not settings.near_duplicate_enabled or article.simhash in (
+        None,
+        NO_FINGERPRINT,
+    ):
+        return None
+    max_distance = min(settings.near_duplicate_max_distance, SIMHASH_BANDS - 1)
+    min_shared_bands = SIMHASH_BANDS - max_distance
+
+    candidates = session.exec(
+        select(Article.id, Article.simhash)
+        .where(
+            col(Article.id).in_(
+                select(ArticleSimhashBand.article_id)
+                .where(_band_match(article.simhash))
+                .group_by(col(ArticleSimhashBand.article_id))
+                .having(func.count() >= min_shared_bands)
+            )
+        )
+        .where(Article.id != article.id)
+        .where(Article.categorization_state == "categorized")
+        .where(Article.scoring_state == "scored")
+        .where(
+            or_(
+                col(Article.category_source).is_(None),
+                col(Article.category_source) != CATEGORY_SOURCE_RULE,
+            )
+        )
+        .order_by(col(Article.scored_at).desc())
+        .limit(MAX_CANDIDATES)
+    ).all()
+
+    best_id: int | None = None
+    best_distance = max_distance + 1
+    for candidate_id, candidate_simhash in candidates:
+        if candidate_simhash is None:
+            continue
+        distance = hamming_distance(article.simhash, candidate_simhash)
+        if distance < best_distance:
+            best_id, best_distance = candidate_id, distance
+    return session.get(Article, best_id) if best_id is not None else None
+
+
+def record_inherited(count: int) -> None:
+    """Count articles that reused a near-duplicate's results."""
+    _stats["inherited"] += count
+
+
+def get_near_duplicate_stats() -> dict:
+    """Counters for /api/scoring/status."""
+    return {
+        "enabled": get_settings().pipeline.near_duplicate_enabled,
+        "max_distance": get_settings().pipeline.near_duplicate_max_distance,
+        "inherited": _stats["inherited"],
+    }
@@ -0,0 +1,222 @@
+"""Lease-based claiming of queued articles for the pipeline workers.
+
+Queued articles sit in one of three lanes: interactive (a single rescore a
+user is waiting on), fresh (newly fetched articles) and backlog (bulk rescore
+campaigns). Interactive work preempts: the next claim takes all of it first.
+The remaining slots are dealt between fresh and backlog by smooth weighted
+round robin, with PIPELINE__FRESH_LANE_SHARE of them reserved for fresh
+articles while both lanes have work, so a large rescore cannot hold up newly
+published stories. Slots a lane cannot fill go to the other one. Within a
+lane the oldest article comes first.
+
+A worker claims the picked rows with one atomic ``UPDATE ... RETURNING``,
+moving them to the in-progress state and stamping them with a lease owner
+and expiry. The update only matches rows that are still queued, so
+concurrent claimers can never receive the same article.
+
+If a worker dies mid-batch its rows stay in-progress until the lease expires;
+the scheduler's reaper job then puts them back in the queue, so recovery does
+not need a restart.
+
+Offline batch jobs (see backend.batch_jobs) hold their articles under a
+long lease owned by the job rather than this process, so a restart does not
+release them.
+"""
+
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Connection, case, or_, update
+from sqlmodel import Session, col, select
+
+from backend.config import get_settings
+from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, TaskName
+from backend.metrics import QUEUE_WAIT_SECONDS
+from backend.models import Article
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process as the holder of its leases
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+# Lease owners of offline batch jobs start with this
+BATCH_JOB_OWNER_PREFIX = "batch:"
+
+# Queue lanes, in order of precedence
+LANE_INTERACTIVE = "interactive"
+LANE_FRESH = "fresh"
+LANE_BACKLOG = "backlog"
+LANES = (LANE_INTERACTIVE, LANE_FRESH, LANE_BACKLOG)
+
+# (task, lane) -> smooth weighted round-robin credit, kept across claims so
+# the shares hold even when each claim is a single article
+_lane_credit: dict[tuple[str, str], float] = {}
+
+# task -> (state column, in-progress state)
+_TASK_STATES = {
+    TASK_CATEGORIZATION: (col(Article.categorization_state), "categorizing"),
+    TASK_SCORING: (col(Article.scoring_state), "scoring"),
+}
+
+
+def is_due(now: datetime):
+    """Queued articles not cooling down after a failed attempt."""
+    return or_(
+        col(Article.next_attempt_at).is_(None), col(Article.next_attempt_at) <= now
+    )
+
+
+def _lane_slots(
+    task: str, batch_size: int, available: dict[str, int]
+) -> dict[str, int]:
+    """Split a claim of batch_size between the lanes with due work."""
+    slots = dict.fromkeys(LANES, 0)
+    slots[LANE_INTERACTIVE] = min(batch_size, available[LANE_INTERACTIVE])
+    share = get_settings().pipeline.fresh_lane_share
+    weights = {LANE_FRESH: share, LANE_BACKLOG: 1 - share}
+    for _ in range(batch_size - slots[LANE_INTERACTIVE]):
+        eligible = [lane for lane in weights if slots[lane] < available[lane]]
+        if not eligible:
+            break
+        for lane in eligible:
+            _lane_credit[task, lane] = (
+                _lane_credit.get((task, lane), 0.0) + weights[lane]
+            )
+        pick = max(eligible, key=lambda lane: _lane_credit[task, lane])
+        _lane_credit[task, pick] -= sum(weights[lane] for lane in eligible)
+        slots[pick] += 1
+    return slots
+
+
+def claim_batch(
+    session: Session,
+    task: TaskName,
+    batch_size: int,
+    *,
+    owner: str = WORKER_ID,
+    lease_seconds: int | None = None,
+    lanes: tuple[str, ...] = LANES,
+) -> list[Article]:
+    """Atomically claim up to batch_size queued articles for a task.
+
+    Articles whose next_attempt_at is still in the future are skipped, so a
+    failing batch cools down while the rest of the queue moves on. Only the
+    given lanes are claimed from. Returns the claimed articles in queue
+    order (lane precedence, then oldest).
+    """
+    state, running = _TASK_STATES[task]
+    if lease_seconds is None:
+        lease_seconds = get_settings().pipeline.lease_seconds
+    now = datetime.now()
+    expires = now + timedelta(seconds=lease_seconds)
+
+    # Up to batch_size candidates per lane, each read off the queue index
+    candidates = {
+        lane: list(
+            session.exec(
+                select(Article.id)
+                .where(state == "queued")
+                .where(Article.queue_lane == lane)
+                .where(is_due(now))
+                .order_by(col(Article.published_at).asc())
+                .limit(batch_size)
+            ).all()
+        )
+        if lane in lanes
+        else []
+        for lane in LANES
+    }
+    slots = _lane_slots(
+        task, batch_size, {lane: len(ids) for lane, ids in candidates.items()}
+    )
+    picked = [aid for lane in LANES for aid in candidates[lane][: slots[lane]]]
+    if not picked:
+        session.commit()
+        return []
+
+    claimed_ids = list(
+        session.exec(  # pyright: ignore[reportCallIssue]
+            update(Article)
+            .where(col(Article.id).in_(picked))
+            .where(state == "queued")
+            .values(
+                {
+                    state: running,
+                    Article.lease_owner: owner,
+                    Article.lease_expires_at: expires,
+                }
+            )
+            .returning(Article.id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
+    session.commit()
+    if not claimed_ids:
+        return []
+
+    articles = list(
+        session.exec(
+            select(Article)
+            .where(col(Article.id).in_(claimed_ids))
+            .order_by(
+                case(
+                    {lane: rank for rank, lane in enumerate(LANES)},
+                    value=Article.queue_lane,
+                ),
+                col(Article.published_at).asc(),
+            )
+            .execution_options(populate_existing=True)
+        ).all()
+    )
+    for article in articles:
+        if article.queued_at is not None:
+            QUEUE_WAIT_SECONDS.observe(
+                (now - article.queued_at).total_seconds(),
+                task=task,
+                lane=article.queue_lane,
+            )
+    return articles
+
+
+def reap_expired_leases(conn: Connection, *, expired_only: bool = True) -> int:
+    """Return in-progress articles whose lease has lapsed to their queue.
+
+    Rows without a lease (claimed before leases existed) always count as
+    expired. With expired_only=False every in-progress row is released
+    except those held by offline batch jobs, which is what startup wants
+    since no worker is running yet.
+    """
+    now = datetime.now()
+    released = 0
+    for task, (state, running) in _TASK_STATES.items():
+        stmt = update(Article).where(state == running)
+        if expired_only:
+            stmt = stmt.where(
+                or_(
+                    col(Article.lease_expires_at).is_(None),
+                    col(Article.lease_expires_at) < now,
+                )
+            )
+        else:
+            stmt = stmt.where(
+                or_(
+                    col(Article.lease_owner).is_(None),
+                    ~col(Article.lease_owner).startswith(BATCH_JOB_OWNER_PREFIX),
+                    col(Article.lease_expires_at) < now,
+                )
+            )
+        count = conn.execute(
+            stmt.values(
+                {
+                    state: "queued",
+                    Article.lease_owner: None,
+                    Article.lease_expires_at: None,
+                }
+            )
+        ).rowcount
+        if count:
+            logger.info("Released %d expired %s leases back to the queue", count, task)
+        released += count
+    return released
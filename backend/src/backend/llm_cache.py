@@ -0,0 +1,209 @@
+"""Content-addressed cache for per-article LLM categorization and scoring results.
+
+Rescores, cross-posted articles and feeds that re-publish an item under a new
+URL all send identical content to the LLM. Results are stored keyed by
+everything that determines the model's answer (task, provider, model,
+prompt-template version, the content as it appears in the prompt and, for
+scoring, the user's interests) so repeated content costs no LLM call.
+
+The table is bounded by total result size; least recently used entries are
+evicted once the budget is exceeded. The total is measured once per engine
+and then kept as a running estimate, so storing results costs no table
+scan until the estimate crosses the budget. Hit/miss counters are ephemeral
+in-memory state (same as the activity tracking in scoring.py).
+"""
+
+import hashlib
+import logging
+import weakref
+from datetime import datetime
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, col, select
+
+from backend.config import get_settings
+from backend.models import LLMResultCache
+from backend.prompts.content import truncate_at_paragraph
+
+logger = logging.getLogger(__name__)
+
+_stats: dict[str, dict[str, int]] = {}
+# Estimated total size_bytes per database. Upserts are counted at their full
+# size, so it can only overestimate; evict() replaces it with the real total
+_size_estimate: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _sha256(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def content_hash(article: dict, max_chars: int) -> str:
+    """Hash an article dict as the prompt will see it (title + truncated content)."""
+    text = truncate_at_paragraph(article.get("content_markdown") or "", max_chars)
+    return _sha256(article.get("title") or "", text)
+
+
+def interests_hash(interests: str, anti_interests: str) -> str:
+    """Hash the user's scoring preferences."""
+    return _sha256(interests.strip(), anti_interests.strip())
+
+
+def cache_key(
+    task: str,
+    provider: str,
+    model: str,
+    prompt_version: int,
+    content_digest: str,
+    interests_digest: str | None = None,
+) -> str:
+    """Build the cache key for one article's result."""
+    return _sha256(
+        task,
+        provider,
+        model,
+        str(prompt_version),
+        content_digest,
+        interests_digest or "",
+    )
+
+
+def _record(task: str, hits: int, misses: int) -> None:
+    counters = _stats.setdefault(task, {"hits": 0, "misses": 0})
+    counters["hits"] += hits
+    counters["misses"] += misses
+
+
+def lookup(session: Session, task: str, keys: list[str]) -> dict[str, str]:
+    """Return cached result JSON for the given keys and bump their recency.
+
+    Returns:
+        Mapping of key -> result JSON for keys present in the cache
+    """
+    if not keys or not get_settings().pipeline.result_cache_enabled:
+        return {}
+
+    rows = session.exec(
+        select(LLMResultCache.key, LLMResultCache.result_json).where(
+            col(LLMResultCache.key).in_(keys)
+        )
+    ).all()
+    found = dict(rows)
+
+    if found:
+        session.exec(  # pyright: ignore[reportCallIssue, reportArgumentType]
+            update(LLMResultCache)
+            .where(col(LLMResultCache.key).in_(list(found)))
+            .values(
+                last_used_at=datetime.now(),
+                hit_count=LLMResultCache.hit_count + 1,
+            )
+        )
+        session.commit()
+
+    _record(task, len(found), len(set(keys)) - len(found))
+    return found
+
+
+def _total_bytes(session: Session) -> int:
+    return session.exec(
+        select(func.coalesce(func.sum(LLMResultCache.size_bytes), 0))
+    ).one()
+
+
+def store(session: Session, task: str, entries: dict[str, str]) -> None:
+    """Upsert result JSON by key, evicting once over the size budget.
+
+    Does not commit: the caller's commit covers the upsert together with
+    the results it applies.
+    """
+    settings = get_settings().pipeline
+    if not entries or not settings.result_cache_enabled:
+        return
+
+    now = datetime.now()
+    rows = [
+        {
+            "key": key,
+            "task": task,
+            "result_json": result_json,
+            "size_bytes": len(key) + len(result_json.encode("utf-8")),
+            "hit_count": 0,
+            "created_at": now,
+            "last_used_at": now,
+        }
+        for key, result_json in entries.items()
+    ]
+    upsert = sqlite_insert(LLMResultCache)
+    session.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[LLMResultCache.key],
+            set_={
+                "result_json": upsert.excluded.result_json,
+                "size_bytes": upsert.excluded.size_bytes,
+                "last_used_at": upsert.excluded.last_used_at,
+            },
+        ),
+        rows,
+    )
+
+    bind = session.get_bind()
+    if bind in _size_estimate:
+        _size_estimate[bind] += sum(row["size_bytes"] for row in rows)
+    else:
+        _size_estimate[bind] = _total_bytes(session)
+    if _size_estimate[bind] > settings.result_cache_max_bytes:
+        evict(session, settings.result_cache_max_bytes)
+
+
+def evict(session: Session, max_bytes: int) -> int:
+    """Delete least recently used entries until total size fits max_bytes.
+
+    Does not commit.
+
+    Returns:
+        Number of entries evicted
+    """
+    total = _total_bytes(session)
+    _size_estimate[session.get_bind()] = total
+    if total <= max_bytes:
+        return 0
+
+    excess = total - max_bytes
+    victims: list[str] = []
+    freed = 0
+    for key, size in session.exec(
+        select(LLMResultCache.key, LLMResultCache.size_bytes).order_by(
+            col(LLMResultCache.last_used_at).asc()
+        )
+    ):
+        victims.append(key)
+        freed += size
+        if freed >= excess:
+            break
+
+    session.exec(  # pyright: ignore[reportCallIssue, reportArgumentType]
+        delete(LLMResultCache).where(col(LLMResultCache.key).in_(victims))
+    )
+    _size_estimate[session.get_bind()] = total - freed
+    logger.info("LLM result cache evicted %d entries (%d bytes)", len(victims), freed)
+    return len(victims)
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters for /api/scoring/status."""
+    tasks = {task: dict(counters) for task, counters in _stats.items()}
+    hits = sum(c["hits"] for c in tasks.values())
+    misses = sum(c["misses"] for c in tasks.values())
+    lookups = hits + misses
+    return {
+        "enabled": get_settings().pipeline.result_cache_enabled,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 3) if lookups else None,
+        "tasks": tasks,
+    }
@@ -5,15 +5,22 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Literal, Protocol, runtime_checkable
 
 from pydantic import BaseModel
 
-from backend.prompts import ArticleCategoryResult, ArticleScoringResult
+from backend.metrics import LLM_VALIDATION_FAILURES
+from backend.prompts import (
+    ArticleCategoryResult,
+    ArticleCombinedResult,
+    ArticleScoringResult,
+    BatchCategoryResponse,
+    BatchScoringResponse,
+)
 from backend.prompts.grouping import GroupingResponse
 
 if TYPE_CHECKING:
-    pass
+    from backend.llm_providers.streaming import ResultCallback
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,7 @@ def validate_llm_response[T: BaseModel](raw: str | None, schema: type[T]) -> T:
     """
     stripped = (raw or "").strip()
     if not stripped:
+        LLM_VALIDATION_FAILURES.inc(kind="empty")
         raise LLMValidationError(
             raw, ValueError("LLM returned empty response"), is_retryable=True
         )
@@ -68,12 +76,14 @@ def validate_llm_response[T: BaseModel](raw: str | None, schema: type[T]) -> T:
     try:
         json.loads(stripped)
     except json.JSONDecodeError as e:
+        LLM_VALIDATION_FAILURES.inc(kind="json")
         raise LLMValidationError(raw, e, is_retryable=True) from e
 
     # Step 2: Does it match the Pydantic schema?
     try:
         return schema.model_validate_json(stripped)
     except Exception as e:
+        LLM_VALIDATION_FAILURES.inc(kind="schema")
         raise LLMValidationError(raw, e, is_retryable=False) from e
 
 
@@ -84,6 +94,8 @@ class ProviderTaskConfig:
     thinking: bool
     api_key: str | None = None
     selected_models: list[str] | None = None
+    # Several endpoints serving the same models, balanced per request
+    endpoints: list[str] | None = None
 
 
 class LLMProvider(Protocol):
@@ -104,7 +116,11 @@ class LLMProvider(Protocol):
         config: ProviderTaskConfig,
         category_hierarchy: dict[str, list[str]] | None,
         hidden_categories: list[str] | None,
-    ) -> list[ArticleCategoryResult]: ...
+        on_result: ResultCallback[ArticleCategoryResult] | None = None,
+    ) -> list[ArticleCategoryResult]:
+        """Categorize a batch. Streaming providers pass each result to
+        on_result as soon as it is complete; all results are also returned."""
+        ...
 
     async def score(
         self,
@@ -112,7 +128,10 @@ class LLMProvider(Protocol):
         interests: str,
         anti_interests: str,
         config: ProviderTaskConfig,
-    ) -> list[ArticleScoringResult]: ...
+        on_result: ResultCallback[ArticleScoringResult] | None = None,
+    ) -> list[ArticleScoringResult]:
+        """Score a batch; on_result behaves as in categorize()."""
+        ...
 
     async def suggest_groups(
         self,
@@ -122,3 +141,66 @@ class LLMProvider(Protocol):
     ) -> GroupingResponse: ...
 
     async def close(self) -> None: ...
+
+
+@runtime_checkable
+class CombinedTaskProvider(Protocol):
+    """Optional contract for providers that categorize and score in one call."""
+
+    async def categorize_and_score(
+        self,
+        articles: list[dict],
+        existing_categories: list[str],
+        interests: str,
+        anti_interests: str,
+        config: ProviderTaskConfig,
+        category_hierarchy: dict[str, list[str]] | None,
+        hidden_categories: list[str] | None,
+        on_result: ResultCallback[ArticleCombinedResult] | None = None,
+    ) -> list[ArticleCombinedResult]:
+        """Categorize and score a batch; on_result behaves as in categorize()."""
+        ...
+
+
+@runtime_checkable
+class EmbeddingProvider(Protocol):
+    """Optional contract for providers that serve embedding models."""
+
+    async def embed(
+        self, texts: list[str], config: ProviderTaskConfig
+    ) -> list[list[float]]:
+        """One vector per text, from config.model."""
+        ...
+
+
+@dataclass
+class BatchJobStatus:
+    """State of an offline batch job; results are set once it succeeded."""
+
+    state: Literal["running", "succeeded", "failed"]
+    results: list[ArticleCategoryResult] | list[ArticleScoringResult] | None = None
+    error: str | None = None
+
+
+@runtime_checkable
+class BatchJobProvider(Protocol):
+    """Optional contract for providers with an asynchronous batch API."""
+
+    async def submit_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        task: str,
+        prompts: list[tuple[str, str]],
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> str:
+        """Submit (system prompt, user message) requests; return the job id."""
+        ...
+
+    async def poll_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        job_name: str,
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> BatchJobStatus:
+        """Report the job's state, with the per-article results once done."""
+        ...
@@ -0,0 +1,647 @@
+"""Record/replay cassettes for LLM calls.
+
+With PIPELINE__LLM_RECORD_PATH set, every provider returned by the registry
+is wrapped in RecordingProvider, which appends one JSON line per
+categorize/score/categorize_and_score/suggest_groups exchange to the
+cassette: the prompt hash, the articles sent, each streamed result with its
+offset from the start of the call, the total duration, and the error if the
+call failed. Embedding calls are recorded with their vectors.
+
+With PIPELINE__LLM_REPLAY_PATH set, calls are served by ReplayProvider from a
+cassette instead, either with the recorded timing or as fast as possible
+(PIPELINE__LLM_REPLAY_REALTIME). Article IDs in the prompt are replaced by
+their position before hashing, so a cassette replays against a database
+where the same articles got different IDs. A batch whose prompt was never
+recorded (batches formed differently, a category list that changed) is
+assembled from the recorded per-article results instead, keyed by content
+hash like the result cache; articles missing from the cassette get no
+result, as if the model had dropped them.
+
+The optional protocols (combined calls, embeddings, batch jobs) are detected
+with isinstance, so recording_provider() and replay_provider() build a
+wrapper exposing exactly those the wrapped provider implements. Batch jobs
+are forwarded unrecorded when recording and never offered on replay: a job
+outlives the call that submitted it, so the synchronous workers take the
+backlog instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import re
+import time
+from typing import TYPE_CHECKING, cast
+
+from backend.llm_cache import content_hash, interests_hash
+from backend.llm_providers.base import (
+    BatchJobProvider,
+    BatchJobStatus,
+    CombinedTaskProvider,
+    EmbeddingProvider,
+    ProviderTaskConfig,
+)
+from backend.prompts import (
+    ArticleCategoryResult,
+    ArticleCombinedResult,
+    ArticleScoringResult,
+    BatchCategoryResponse,
+    BatchScoringResponse,
+    build_batch_categorization_prompt,
+    build_batch_combined_prompt,
+    build_batch_scoring_prompt,
+)
+from backend.prompts.content import CATEGORIZATION_MAX_CHARS, SCORING_MAX_CHARS
+from backend.prompts.grouping import GroupingResponse, build_grouping_prompt
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pydantic import BaseModel
+
+    from backend.llm_providers.base import LLMProvider
+    from backend.llm_providers.streaming import ResultCallback
+
+_ARTICLE_ID = re.compile(r"<article id:\d+>")
+
+
+class CassetteMiss(LookupError):
+    """No recorded exchange or per-article result matches the call."""
+
+
+class ReplayedError(Exception):
+    """A call that failed when it was recorded, raised again on replay."""
+
+
+def _prompt_key(method: str, *prompt: str) -> str:
+    """Hash a prompt with article IDs replaced by their position in the batch."""
+    position = itertools.count()
+    digest = hashlib.sha256(method.encode())
+    for part in prompt:
+        normalized = _ARTICLE_ID.sub(lambda _m: f"<article id:{next(position)}>", part)
+        digest.update(b"\x00" + normalized.encode())
+    return digest.hexdigest()
+
+
+def _article_keys(method: str, articles: list[dict], digest: str = "") -> list[str]:
+    """Per-article keys: content hash, plus the preferences hash for scoring."""
+    max_chars = (
+        CATEGORIZATION_MAX_CHARS if method == "categorize" else SCORING_MAX_CHARS
+    )
+    return [f"{method}:{content_hash(a, max_chars)}:{digest}" for a in articles]
+
+
+def _categorize_keys(
+    articles, existing_categories, category_hierarchy, hidden_categories
+) -> tuple[str, list[str]]:
+    system, user = build_batch_categorization_prompt(
+        articles,
+        existing_categories,
+        category_hierarchy,
+        hidden_categories=hidden_categories,
+    )
+    return _prompt_key("categorize", system, user), _article_keys(
+        "categorize", articles
+    )
+
+
+def _score_keys(articles, interests, anti_interests) -> tuple[str, list[str]]:
+    system, user = build_batch_scoring_prompt(articles, interests, anti_interests)
+    return _prompt_key("score", system, user), _article_keys(
+        "score", articles, interests_hash(interests, anti_interests)
+    )
+
+
+def _combined_keys(
+    articles,
+    existing_categories,
+    interests,
+    anti_interests,
+    category_hierarchy,
+    hidden_categories,
+) -> tuple[str, list[str]]:
+    system, user = build_batch_combined_prompt(
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        category_hierarchy,
+        hidden_categories=hidden_categories,
+    )
+    return _prompt_key("categorize_and_score", system, user), _article_keys(
+        "categorize_and_score", articles, interests_hash(interests, anti_interests)
+    )
+
+
+def _text_key(model: str, text: str) -> str:
+    """Key of one embedded text: the vector depends on the model too."""
+    return hashlib.sha256(f"{model}\x00{text}".encode()).hexdigest()
+
+
+class RecordingProvider:
+    """Wraps a provider and appends each exchange to a cassette file."""
+
+    def __init__(self, inner: LLMProvider, path: str) -> None:
+        self.inner = inner
+        self.name = inner.name
+        self.path = path
+
+    def parse_config(self, config_json: str, task: str) -> ProviderTaskConfig:
+        return self.inner.parse_config(config_json, task)
+
+    async def health(self, config: ProviderTaskConfig) -> dict:
+        return await self.inner.health(config)
+
+    async def list_models(self, config: ProviderTaskConfig) -> list[dict]:
+        return await self.inner.list_models(config)
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+    def _write(self, entry: dict) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    async def _record[T: BaseModel](
+        self,
+        method: str,
+        keys: tuple[str, list[str]],
+        articles: list[dict],
+        config: ProviderTaskConfig,
+        call: Callable[[ResultCallback[T]], Awaitable[list[T]]],
+        on_result: ResultCallback[T] | None,
+    ) -> list[T]:
+        key, article_keys = keys
+        position = {a["id"]: i for i, a in enumerate(articles)}
+        events: dict[int, tuple[float, dict]] = {}
+        started = time.monotonic()
+
+        def _capture(result: T) -> None:
+            pos = position.get(result.article_id)  # pyright: ignore[reportAttributeAccessIssue]
+            if pos is not None and pos not in events:
+                events[pos] = (
+                    time.monotonic() - started,
+                    result.model_dump(exclude={"article_id"}),
+                )
+            if on_result is not None:
+                on_result(result)
+
+        entry = {
+            "method": method,
+            "key": key,
+            "provider": self.name,
+            "model": config.model,
+            "articles": [
+                {"title": a.get("title"), "content_markdown": a.get("content_markdown")}
+                for a in articles
+            ],
+            "article_keys": article_keys,
+        }
+        try:
+            results = await call(_capture)
+        except Exception as e:
+            entry |= {
+                "elapsed": time.monotonic() - started,
+                "events": [],
+                "error": f"{type(e).__name__}: {e}",
+            }
+            self._write(entry)
+            raise
+        elapsed = time.monotonic() - started
+        # Results the provider returned without streaming arrive at the end
+        for result in results:
+            pos = position.get(result.article_id)  # pyright: ignore[reportAttributeAccessIssue]
+            if pos is not None and pos not in events:
+                events[pos] = (elapsed, result.model_dump(exclude={"article_id"}))
+        entry |= {
+            "elapsed": elapsed,
+            "events": sorted(
+                [offset, pos, result] for pos, (offset, result) in events.items()
+            ),
+            "error": None,
+        }
+        self._write(entry)
+        return results
+
+    async def categorize(
+        self,
+        articles,
+        existing_categories,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCategoryResult]:
+        return await self._record(
+            "categorize",
+            _categorize_keys(
+                articles, existing_categories, category_hierarchy, hidden_categories
+            ),
+            articles,
+            config,
+            lambda capture: self.inner.categorize(
+                articles,
+                existing_categories,
+                config=config,
+                category_hierarchy=category_hierarchy,
+                hidden_categories=hidden_categories,
+                on_result=capture,
+            ),
+            on_result,
+        )
+
+    async def score(
+        self, articles, interests, anti_interests, config, on_result=None
+    ) -> list[ArticleScoringResult]:
+        return await self._record(
+            "score",
+            _score_keys(articles, interests, anti_interests),
+            articles,
+            config,
+            lambda capture: self.inner.score(
+                articles, interests, anti_interests, config=config, on_result=capture
+            ),
+            on_result,
+        )
+
+    async def suggest_groups(
+        self, all_categories, existing_groups, config
+    ) -> GroupingResponse:
+        key = _prompt_key(
+            "suggest_groups", build_grouping_prompt(all_categories, existing_groups)
+        )
+        started = time.monotonic()
+        entry: dict = {"method": "suggest_groups", "key": key, "provider": self.name}
+        try:
+            response = await self.inner.suggest_groups(
+                all_categories, existing_groups, config
+            )
+        except Exception as e:
+            self._write(
+                entry
+                | {
+                    "elapsed": time.monotonic() - started,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+            raise
+        self._write(
+            entry
+            | {
+                "elapsed": time.monotonic() - started,
+                "response": response.model_dump(),
+                "error": None,
+            }
+        )
+        return response
+
+
+class _CombinedRecordingProvider(RecordingProvider):
+    async def categorize_and_score(
+        self,
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCombinedResult]:
+        inner = cast("CombinedTaskProvider", self.inner)
+        return await self._record(
+            "categorize_and_score",
+            _combined_keys(
+                articles,
+                existing_categories,
+                interests,
+                anti_interests,
+                category_hierarchy,
+                hidden_categories,
+            ),
+            articles,
+            config,
+            lambda capture: inner.categorize_and_score(
+                articles,
+                existing_categories,
+                interests,
+                anti_interests,
+                config=config,
+                category_hierarchy=category_hierarchy,
+                hidden_categories=hidden_categories,
+                on_result=capture,
+            ),
+            on_result,
+        )
+
+
+class _EmbeddingRecordingProvider(RecordingProvider):
+    async def embed(
+        self, texts: list[str], config: ProviderTaskConfig
+    ) -> list[list[float]]:
+        inner = cast("EmbeddingProvider", self.inner)
+        started = time.monotonic()
+        entry: dict = {
+            "method": "embed",
+            "key": _prompt_key("embed", config.model, *texts),
+            "provider": self.name,
+            "model": config.model,
+            "text_keys": [_text_key(config.model, text) for text in texts],
+        }
+        try:
+            vectors = await inner.embed(texts, config)
+        except Exception as e:
+            self._write(
+                entry
+                | {
+                    "elapsed": time.monotonic() - started,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+            raise
+        self._write(
+            entry
+            | {
+                "elapsed": time.monotonic() - started,
+                "vectors": vectors,
+                "error": None,
+            }
+        )
+        return vectors
+
+
+class _BatchJobRecordingProvider(RecordingProvider):
+    async def submit_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        task: str,
+        prompts: list[tuple[str, str]],
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> str:
+        inner = cast("BatchJobProvider", self.inner)
+        return await inner.submit_batch_job(config, task, prompts, schema)
+
+    async def poll_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        job_name: str,
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> BatchJobStatus:
+        inner = cast("BatchJobProvider", self.inner)
+        return await inner.poll_batch_job(config, job_name, schema)
+
+
+class ReplayProvider:
+    """Serves LLM calls from a cassette written by RecordingProvider."""
+
+    def __init__(
+        self,
+        path: str,
+        realtime: bool = True,
+        inner: LLMProvider | None = None,
+        name: str = "replay",
+    ) -> None:
+        self.inner = inner
+        self.name = inner.name if inner is not None else name
+        self.realtime = realtime
+        self.exchanges: dict[str, list[dict]] = {}
+        self._served: dict[str, int] = {}
+        # article key -> (offset within its batch, result without article_id)
+        self.article_results: dict[str, tuple[float, dict]] = {}
+        # text key -> recorded embedding
+        self.vectors: dict[str, list[float]] = {}
+        self.hits = 0
+        self.article_hits = 0
+        self.misses = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self._load(json.loads(line))
+
+    def _load(self, entry: dict) -> None:
+        self.exchanges.setdefault(entry["key"], []).append(entry)
+        for offset, pos, result in entry.get("events") or []:
+            self.article_results.setdefault(
+                entry["article_keys"][pos], (offset, result)
+            )
+        for text_key, vector in zip(
+            entry.get("text_keys") or [], entry.get("vectors") or [], strict=False
+        ):
+            self.vectors.setdefault(text_key, vector)
+
+    def parse_config(self, config_json: str, task: str) -> ProviderTaskConfig:
+        if self.inner is not None:
+            return self.inner.parse_config(config_json, task)
+        return ProviderTaskConfig(
+            endpoint="replay://cassette", model="replay", thinking=False
+        )
+
+    async def health(self, config: ProviderTaskConfig) -> dict:
+        return {"connected": True}
+
+    async def list_models(self, config: ProviderTaskConfig) -> list[dict]:
+        # Whatever model the task is routed to is "installed"
+        return [{"name": config.model}] if config.model else []
+
+    async def close(self) -> None:
+        pass
+
+    def _next_exchange(self, key: str) -> dict | None:
+        """Recorded exchanges for a prompt, in order; the last one repeats."""
+        recorded = self.exchanges.get(key)
+        if not recorded:
+            return None
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return recorded[min(served, len(recorded) - 1)]
+
+    async def _wait_until(self, started: float, offset: float) -> None:
+        if self.realtime:
+            delay = started + offset - asyncio.get_running_loop().time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _replay[T: BaseModel](
+        self,
+        keys: tuple[str, list[str]],
+        articles: list[dict],
+        schema: type[T],
+        on_result: ResultCallback[T] | None,
+    ) -> list[T]:
+        key, article_keys = keys
+        started = asyncio.get_running_loop().time()
+        exchange = self._next_exchange(key)
+        if exchange is not None:
+            self.hits += 1
+            if exchange["error"]:
+                await self._wait_until(started, exchange["elapsed"])
+                raise ReplayedError(exchange["error"])
+            events = [
+                (offset, articles[pos]["id"], result)
+                for offset, pos, result in exchange["events"]
+                if pos < len(articles)
+            ]
+            elapsed = exchange["elapsed"]
+        else:
+            events = []
+            for article, article_key in zip(articles, article_keys, strict=True):
+                found = self.article_results.get(article_key)
+                if found is not None:
+                    events.append((found[0], article["id"], found[1]))
+            if not events:
+                self.misses += 1
+                raise CassetteMiss(f"No recorded results for batch {key[:12]}")
+            self.article_hits += 1
+            events.sort(key=lambda event: event[0])
+            elapsed = events[-1][0]
+
+        results: list[T] = []
+        for offset, article_id, result in events:
+            await self._wait_until(started, offset)
+            item = schema.model_validate({**result, "article_id": article_id})
+            results.append(item)
+            if on_result is not None:
+                on_result(item)
+        await self._wait_until(started, elapsed)
+        return results
+
+    async def categorize(
+        self,
+        articles,
+        existing_categories,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCategoryResult]:
+        return await self._replay(
+            _categorize_keys(
+                articles, existing_categories, category_hierarchy, hidden_categories
+            ),
+            articles,
+            ArticleCategoryResult,
+            on_result,
+        )
+
+    async def score(
+        self, articles, interests, anti_interests, config, on_result=None
+    ) -> list[ArticleScoringResult]:
+        return await self._replay(
+            _score_keys(articles, interests, anti_interests),
+            articles,
+            ArticleScoringResult,
+            on_result,
+        )
+
+    async def suggest_groups(
+        self, all_categories, existing_groups, config
+    ) -> GroupingResponse:
+        key = _prompt_key(
+            "suggest_groups", build_grouping_prompt(all_categories, existing_groups)
+        )
+        exchange = self._next_exchange(key)
+        if exchange is None:
+            self.misses += 1
+            raise CassetteMiss(f"No recorded grouping for prompt {key[:12]}")
+        self.hits += 1
+        await self._wait_until(asyncio.get_running_loop().time(), exchange["elapsed"])
+        if exchange["error"]:
+            raise ReplayedError(exchange["error"])
+        return GroupingResponse.model_validate(exchange["response"])
+
+
+class _CombinedReplayProvider(ReplayProvider):
+    async def categorize_and_score(
+        self,
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ) -> list[ArticleCombinedResult]:
+        return await self._replay(
+            _combined_keys(
+                articles,
+                existing_categories,
+                interests,
+                anti_interests,
+                category_hierarchy,
+                hidden_categories,
+            ),
+            articles,
+            ArticleCombinedResult,
+            on_result,
+        )
+
+
+class _EmbeddingReplayProvider(ReplayProvider):
+    async def embed(
+        self, texts: list[str], config: ProviderTaskConfig
+    ) -> list[list[float]]:
+        started = asyncio.get_running_loop().time()
+        exchange = self._next_exchange(_prompt_key("embed", config.model, *texts))
+        if exchange is not None:
+            self.hits += 1
+            await self._wait_until(started, exchange["elapsed"])
+            if exchange["error"]:
+                raise ReplayedError(exchange["error"])
+            return exchange["vectors"]
+        keys = [_text_key(config.model, text) for text in texts]
+        if not all(key in self.vectors for key in keys):
+            self.misses += 1
+            raise CassetteMiss(f"No recorded embeddings for {len(texts)} texts")
+        self.article_hits += 1
+        return [self.vectors[key] for key in keys]
+
+
+_RECORDING_EXTENSIONS: tuple[tuple[type, type[RecordingProvider]], ...] = (
+    (CombinedTaskProvider, _CombinedRecordingProvider),
+    (EmbeddingProvider, _EmbeddingRecordingProvider),
+    (BatchJobProvider, _BatchJobRecordingProvider),
+)
+_REPLAY_EXTENSIONS: tuple[tuple[type, type[ReplayProvider]], ...] = (
+    (CombinedTaskProvider, _CombinedReplayProvider),
+    (EmbeddingProvider, _EmbeddingReplayProvider),
+)
+
+
+@functools.cache
+def _extended[T](base: type[T], extensions: tuple[type[T], ...]) -> type[T]:
+    """Subclass of base with the given protocol extensions mixed in."""
+    if not extensions:
+        return base
+    return cast("type[T]", type(base.__name__, extensions, {}))
+
+
+def recording_provider(inner: LLMProvider, path: str) -> RecordingProvider:
+    """RecordingProvider exposing the optional protocols inner implements."""
+    extensions = tuple(
+        extension
+        for protocol, extension in _RECORDING_EXTENSIONS
+        if isinstance(inner, protocol)
+    )
+    return _extended(RecordingProvider, extensions)(inner, path)
+
+
+def replay_provider(
+    path: str,
+    realtime: bool = True,
+    inner: LLMProvider | None = None,
+    name: str = "replay",
+) -> ReplayProvider:
+    """ReplayProvider exposing the optional protocols inner implements.
+
+    Without an inner provider, combined calls and embeddings are both served.
+    """
+    extensions = tuple(
+        extension
+        for protocol, extension in _REPLAY_EXTENSIONS
+        if inner is None or isinstance(inner, protocol)
+    )
+    return _extended(ReplayProvider, extensions)(path, realtime, inner, name)
@@ -3,27 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, TypeVar
 
+import httpx
 from pydantic import BaseModel, Field
 
+from backend.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
 from backend.prompts import (
     ArticleCategoryResult,
+    ArticleCombinedResult,
     ArticleScoringResult,
     BatchCategoryResponse,
+    BatchCombinedResponse,
     BatchScoringResponse,
     build_batch_categorization_prompt,
+    build_batch_combined_prompt,
     build_batch_scoring_prompt,
 )
 from backend.prompts.grouping import GroupingResponse, build_grouping_prompt
 
 if TYPE_CHECKING:
+    from google import genai
     from sqlmodel import Session
 
-    from backend.llm_providers.base import ProviderTaskConfig
+    from backend.llm_providers.base import BatchJobStatus, ProviderTaskConfig
+    from backend.llm_providers.streaming import ResultCallback
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +89,176 @@ def invalidate_model_cache() -> None:
     _model_cache_time = 0
 
 
+# --- Shared clients, one per API key ---
+
+# The configured key plus any being tried out in settings
+_MAX_CLIENTS = 4
+# Keep idle connections across pipeline ticks instead of httpx's 5s default
+_KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+# sha256(api key) -> client, least recently used first
+_clients: dict[str, genai.Client] = {}
+
+
+async def _get_client(api_key: str) -> genai.Client:
+    """Return the shared client for an API key, creating it lazily.
+
+    Each client owns a pooled httpx connection, so successive calls reuse the
+    TLS connection instead of building a client and handshaking per request.
+    """
+    from google import genai
+    from google.genai import types
+
+    key_id = hashlib.sha256(api_key.encode()).hexdigest()
+    client = _clients.pop(key_id, None)
+    if client is None:
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(
+                async_client_args={
+                    "limits": httpx.Limits(
+                        max_keepalive_connections=10,
+                        keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+                    )
+                }
+            ),
+        )
+    _clients[key_id] = client
+    while len(_clients) > _MAX_CLIENTS:
+        await _close_client(_clients.pop(next(iter(_clients))))
+    return client
+
+
+async def _close_client(client: genai.Client) -> None:
+    try:
+        await client.aio.aclose()
+        client.close()
+    except Exception:
+        logger.debug("Error closing Google client", exc_info=True)
+
+
+async def close_google_clients() -> None:
+    """Close every shared client's connection pool."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await _close_client(client)
+
+
+# --- Explicit context caching of the shared system prompt ---
+
+# Gemini refuses to cache prompts below a model-specific minimum (1,024
+# tokens on Flash, more on Pro); shorter system prompts are sent in full and
+# benefit from Gemini's implicit prefix caching instead.
+_CONTEXT_CACHE_MIN_CHARS = 4096
+_CONTEXT_CACHE_TTL_SECONDS = 3600
+_CONTEXT_CACHE_REFRESH_MARGIN = 60.0
+# After a failed create, wait this long before trying again, doubling per
+# consecutive failure up to the cache TTL
+_CONTEXT_CACHE_RETRY_SECONDS = 60.0
+
+
+@dataclass
+class _ContextCache:
+    """Explicit cache state for one (api key, model, task) system prompt."""
+
+    prompt_hash: str
+    name: str | None = None
+    expires_at: float = 0.0
+    failures: int = 0
+    retry_at: float = 0.0
+
+
+_context_caches: dict[tuple[str, str, str], _ContextCache] = {}
+
+
+async def _cached_system_prompt(
+    client: genai.Client, config: ProviderTaskConfig, task: str, system_prompt: str
+) -> str | None:
+    """Return the name of a context cache holding system_prompt, if worthwhile.
+
+    A prompt is only cached once a second request reuses it, so batches whose
+    prompt differs every time (category shortlists) never create caches. A
+    changed prompt (preferences or categories edited) replaces the entry and
+    deletes the superseded cache. A failed create is retried after a backoff.
+    """
+    from google.genai import types
+
+    if len(system_prompt) < _CONTEXT_CACHE_MIN_CHARS:
+        return None
+    key = (config.api_key or "", config.model or "", task)
+    prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()
+    entry = _context_caches.get(key)
+    if entry is None or entry.prompt_hash != prompt_hash:
+        _context_caches[key] = _ContextCache(prompt_hash)
+        if entry is not None and entry.name:
+            await _delete_context_cache(client, entry.name)
+        return None
+    now = time.monotonic()
+    if now < entry.retry_at:
+        return None
+    if entry.name and now < entry.expires_at - _CONTEXT_CACHE_REFRESH_MARGIN:
+        return entry.name
+
+    try:
+        cache = await client.aio.caches.create(
+            model=config.model,  # pyright: ignore[reportArgumentType]
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_prompt,
+                ttl=f"{_CONTEXT_CACHE_TTL_SECONDS}s",
+                display_name=f"rss-reader-{task}",
+            ),
+        )
+    except Exception as e:
+        logger.info(
+            "Gemini context cache not created for %s, sending prompt in full: %s",
+            task,
+            extract_google_error_message(e),
+        )
+        entry.failures += 1
+        entry.retry_at = now + min(
+            _CONTEXT_CACHE_RETRY_SECONDS * 2 ** (entry.failures - 1),
+            _CONTEXT_CACHE_TTL_SECONDS,
+        )
+        return None
+    entry.name = cache.name
+    entry.expires_at = now + _CONTEXT_CACHE_TTL_SECONDS
+    entry.failures = 0
+    logger.info("Created Gemini context cache for %s: %s", task, cache.name)
+    return entry.name
+
+
+async def _delete_context_cache(client: genai.Client, name: str) -> None:
+    """Delete a superseded cache instead of paying for its storage until expiry."""
+    try:
+        await client.aio.caches.delete(name=name)
+    except Exception as e:
+        logger.info(
+            "Gemini context cache %s not deleted: %s",
+            name,
+            extract_google_error_message(e),
+        )
+
+
+def _is_cache_rejection(exc: Exception) -> bool:
+    """Whether a client error means the referenced cache is gone or invalid.
+
+    Other 4xx responses, such as 429 RESOURCE_EXHAUSTED, say nothing about
+    the cache and must not cause a full-prompt resend.
+    """
+    code = getattr(exc, "code", None)
+    message = (getattr(exc, "message", None) or str(exc)).lower()
+    return code == 404 or (code in (400, 403) and "cache" in message)
+
+
+def _forget_context_cache(name: str) -> None:
+    """Drop a cache the API no longer accepts so it is recreated on reuse."""
+    for entry in _context_caches.values():
+        if entry.name == name:
+            entry.name = None
+            entry.expires_at = 0.0
+
+
 # --- Config helpers ---
 
 
@@ -97,8 +276,17 @@ def get_google_provider_config(session: Session) -> GoogleProviderConfig:
     return GoogleProviderConfig()
 
 
+# (keyfile, ciphertext) -> plaintext of the last key decrypted
+_decrypted_key: tuple[tuple[str, str], str] | None = None
+
+
 def _decrypt_api_key(config: GoogleProviderConfig) -> str:
-    """Decrypt the stored API key. Returns empty string on failure."""
+    """Decrypt the stored API key. Returns empty string on failure.
+
+    parse_config runs on every pipeline tick; the result is memoized until the
+    stored ciphertext changes (every save re-encrypts, so any change does).
+    """
+    global _decrypted_key
     if not config.api_key_encrypted:
         return ""
     try:
@@ -109,7 +297,12 @@ def _decrypt_api_key(config: GoogleProviderConfig) -> str:
 
         settings = get_settings()
         keyfile = os.path.join(os.path.dirname(settings.database.path), ".keyfile")
-        return decrypt_value(config.api_key_encrypted, keyfile)
+        memo_key = (keyfile, config.api_key_encrypted)
+        if _decrypted_key is not None and _decrypted_key[0] == memo_key:
+            return _decrypted_key[1]
+        api_key = decrypt_value(config.api_key_encrypted, keyfile)
+        _decrypted_key = (memo_key, api_key)
+        return api_key
     except Exception:
         logger.warning("Failed to decrypt Google API key — treating as unconfigured")
         return ""
@@ -215,9 +408,7 @@ class GoogleProvider:
         if not config.api_key:
             return {"connected": False, "error": "No API key configured"}
         try:
-            from google import genai
-
-            client = genai.Client(api_key=config.api_key)
+            client = await _get_client(config.api_key)
             async for _ in await client.aio.models.list(config={"page_size": 1}):
                 break
             return {"connected": True}
@@ -242,9 +433,7 @@ class GoogleProvider:
             return []
         else:
             try:
-                from google import genai
-
-                client = genai.Client(api_key=config.api_key)
+                client = await _get_client(config.api_key)
                 models = []
                 async for model in await client.aio.models.list(
                     config={"page_size": 100}
@@ -287,28 +476,76 @@ class GoogleProvider:
         system_prompt: str,
         user_message: str,
         schema: type[_T],
+        cache_task: str | None = None,
     ) -> _T:
-        """Call Gemini with structured JSON output and return a validated model."""
-        from google import genai
-        from google.genai import types
+        """Call Gemini with structured JSON output and return a validated model.
+
+        With cache_task set, a reused system prompt is served from an
+        explicit context cache instead of being sent (and billed) in full.
+        """
+        from google.genai import errors, types
 
         from backend.llm_providers.base import LLMValidationError, validate_llm_response
 
-        client = genai.Client(api_key=config.api_key)
+        client = await _get_client(config.api_key)  # pyright: ignore[reportArgumentType]
+        cached_content = (
+            await _cached_system_prompt(client, config, cache_task, system_prompt)
+            if cache_task
+            else None
+        )
 
-        last_error: LLMValidationError | None = None
-        for attempt in range(2):
-            response = await client.aio.models.generate_content(
+        def _send(cached: str | None):
+            return client.aio.models.generate_content(
                 model=config.model,  # pyright: ignore[reportArgumentType]
                 contents=user_message,
                 config=types.GenerateContentConfig(
-                    system_instruction=system_prompt,
+                    cached_content=cached,
+                    system_instruction=None if cached else system_prompt,
                     response_mime_type="application/json",
                     response_schema=schema.model_json_schema(),
                     temperature=0,
                 ),
             )
 
+        last_error: LLMValidationError | None = None
+        for attempt in range(2):
+            started = time.monotonic()
+            try:
+                response = await _send(cached_content)
+            except errors.ClientError as e:
+                if cached_content is None or not _is_cache_rejection(e):
+                    raise
+                # Cache expired or was deleted server-side; resend in full
+                logger.info("Gemini context cache %s rejected", cached_content)
+                _forget_context_cache(cached_content)
+                cached_content = None
+                response = await _send(None)
+
+            elapsed = time.monotonic() - started
+            usage = response.usage_metadata
+            task = cache_task or "generate"
+            LLM_REQUEST_SECONDS.observe(elapsed, provider=GOOGLE_PROVIDER, task=task)
+            if usage:
+                LLM_TOKENS.inc(
+                    usage.prompt_token_count or 0,
+                    provider=GOOGLE_PROVIDER,
+                    task=task,
+                    direction="in",
+                )
+                LLM_TOKENS.inc(
+                    usage.candidates_token_count or 0,
+                    provider=GOOGLE_PROVIDER,
+                    task=task,
+                    direction="out",
+                )
+            logger.info(
+                "Gemini %s call: %.2fs, %s of %s prompt tokens cached",
+                task,
+                elapsed,
+                (usage.cached_content_token_count or 0) if usage else 0,
+                usage.prompt_token_count if usage else None,
+            )
+
             if response.text is None:
                 logger.debug(
                     "Google returned null text; candidates=%s",
@@ -331,6 +568,93 @@ class GoogleProvider:
         assert last_error is not None  # loop always runs at least once
         raise last_error
 
+    # --- Offline batch jobs ---
+
+    async def submit_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        task: str,
+        prompts: list[tuple[str, str]],
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> str:
+        """Submit prompts as one inline Gemini batch job; return its name."""
+        from google.genai import types
+
+        client = await _get_client(config.api_key)  # pyright: ignore[reportArgumentType]
+        job = await client.aio.batches.create(
+            model=config.model,  # pyright: ignore[reportArgumentType]
+            src=[
+                types.InlinedRequest(
+                    contents=user_message,
+                    metadata={"request": str(i)},
+                    config=types.GenerateContentConfig(
+                        system_instruction=system_prompt,
+                        response_mime_type="application/json",
+                        response_schema=schema.model_json_schema(),
+                        temperature=0,
+                    ),
+                )
+                for i, (system_prompt, user_message) in enumerate(prompts)
+            ],
+            config=types.CreateBatchJobConfig(display_name=f"rss-reader-{task}"),
+        )
+        logger.info(
+            "Submitted Gemini %s batch job %s (%d requests)",
+            task,
+            job.name,
+            len(prompts),
+        )
+        return job.name  # pyright: ignore[reportReturnType]
+
+    async def poll_batch_job(
+        self,
+        config: ProviderTaskConfig,
+        job_name: str,
+        schema: type[BatchCategoryResponse] | type[BatchScoringResponse],
+    ) -> BatchJobStatus:
+        """Check a Gemini batch job; parse its inline responses once done.
+
+        A request whose response is missing or invalid only loses its own
+        articles, which the caller re-queues.
+        """
+        from google.genai import types
+
+        from backend.llm_providers.base import (
+            BatchJobStatus,
+            LLMValidationError,
+            validate_llm_response,
+        )
+
+        client = await _get_client(config.api_key)  # pyright: ignore[reportArgumentType]
+        job = await client.aio.batches.get(name=job_name)
+        if job.state in (
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+        ):
+            results: list = []
+            responses = (job.dest.inlined_responses if job.dest else None) or []
+            for item in responses:
+                if item.error is not None or item.response is None:
+                    logger.warning(
+                        "Gemini batch %s request failed: %s", job_name, item.error
+                    )
+                    continue
+                try:
+                    results.extend(
+                        validate_llm_response(item.response.text, schema).results
+                    )
+                except LLMValidationError as e:
+                    logger.warning("Gemini batch %s response invalid: %s", job_name, e)
+            return BatchJobStatus(state="succeeded", results=results)
+        if job.state in (
+            types.JobState.JOB_STATE_FAILED,
+            types.JobState.JOB_STATE_CANCELLED,
+            types.JobState.JOB_STATE_EXPIRED,
+        ):
+            error = job.error.message if job.error else None
+            return BatchJobStatus(state="failed", error=error or str(job.state))
+        return BatchJobStatus(state="running")
+
     async def categorize(
         self,
         articles: list[dict],
@@ -338,7 +662,10 @@ class GoogleProvider:
         config: ProviderTaskConfig,
         category_hierarchy: dict[str, list[str]] | None,
         hidden_categories: list[str] | None,
+        on_result: ResultCallback[ArticleCategoryResult] | None = None,
     ) -> list[ArticleCategoryResult]:
+        # Responses are not streamed, so on_result is never called early;
+        # callers apply the returned results.
         system_prompt, user_message = build_batch_categorization_prompt(
             articles,
             existing_categories,
@@ -346,7 +673,11 @@ class GoogleProvider:
             hidden_categories=hidden_categories,
         )
         result = await self._generate(
-            config, system_prompt, user_message, BatchCategoryResponse
+            config,
+            system_prompt,
+            user_message,
+            BatchCategoryResponse,
+            cache_task="categorization",
         )
         logger.info("Google categorized %d articles", len(result.results))
         return result.results
@@ -357,16 +688,50 @@ class GoogleProvider:
         interests: str,
         anti_interests: str,
         config: ProviderTaskConfig,
+        on_result: ResultCallback[ArticleScoringResult] | None = None,
     ) -> list[ArticleScoringResult]:
         system_prompt, user_message = build_batch_scoring_prompt(
             articles, interests, anti_interests
         )
         result = await self._generate(
-            config, system_prompt, user_message, BatchScoringResponse
+            config,
+            system_prompt,
+            user_message,
+            BatchScoringResponse,
+            cache_task="scoring",
         )
         logger.info("Google scored %d articles", len(result.results))
         return result.results
 
+    async def categorize_and_score(
+        self,
+        articles: list[dict],
+        existing_categories: list[str],
+        interests: str,
+        anti_interests: str,
+        config: ProviderTaskConfig,
+        category_hierarchy: dict[str, list[str]] | None,
+        hidden_categories: list[str] | None,
+        on_result: ResultCallback[ArticleCombinedResult] | None = None,
+    ) -> list[ArticleCombinedResult]:
+        system_prompt, user_message = build_batch_combined_prompt(
+            articles,
+            existing_categories,
+            interests,
+            anti_interests,
+            category_hierarchy,
+            hidden_categories=hidden_categories,
+        )
+        result = await self._generate(
+            config,
+            system_prompt,
+            user_message,
+            BatchCombinedResponse,
+            cache_task="combined",
+        )
+        logger.info("Google categorized and scored %d articles", len(result.results))
+        return result.results
+
     async def suggest_groups(
         self,
         all_categories: list[str],
@@ -380,4 +745,4 @@ class GoogleProvider:
         return result
 
     async def close(self) -> None:
-        """No persistent connection pool to close."""
+        await close_google_clients()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -18,22 +20,33 @@ from tenacity import (
 )
 
 from backend import ollama_service
+from backend.config import get_settings
 from backend.llm_providers.base import LLMValidationError, validate_llm_response
+from backend.llm_providers.ollama_pool import EndpointPool
+from backend.llm_providers.streaming import StreamingResultsParser
+from backend.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
 from backend.scoring import set_categorization_phase, set_scoring_phase
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+    from ollama import ChatResponse
     from sqlmodel import Session
 
     from backend.llm_providers.base import ProviderTaskConfig
+    from backend.llm_providers.streaming import ResultCallback
 
 from backend.prompts import (
     ArticleCategoryResult,
+    ArticleCombinedResult,
     ArticleScoringResult,
     BatchCategoryResponse,
+    BatchCombinedResponse,
     BatchScoringResponse,
     CategoryResponse,
     ScoringResponse,
     build_batch_categorization_prompt,
+    build_batch_combined_prompt,
     build_batch_scoring_prompt,
     build_categorization_prompt,
     build_scoring_prompt,
@@ -47,40 +60,37 @@ OLLAMA_PROVIDER = "ollama"
 DEFAULT_OLLAMA_BASE_URL = "http://localhost"
 DEFAULT_OLLAMA_PORT = 11434
 
-# --- Shared Ollama AsyncClient singleton ---
+# --- Shared Ollama AsyncClients, one per endpoint ---
 
 OLLAMA_CONNECT_TIMEOUT = 10.0
 OLLAMA_READ_TIMEOUT = 300.0  # Time-to-first-chunk can be long (model loading, thinking)
 
-_client: AsyncClient | None = None
-_client_host: str | None = None
+_clients: dict[str, AsyncClient] = {}
 
 
 def get_ollama_client(host: str) -> AsyncClient:
-    """Return a shared AsyncClient, creating one lazily on first call."""
-    global _client, _client_host
-    if _client is None or _client_host != host:
+    """Return the shared AsyncClient for a host, creating it lazily."""
+    client = _clients.get(host)
+    if client is None:
         timeout = httpx.Timeout(
             connect=OLLAMA_CONNECT_TIMEOUT,
             read=OLLAMA_READ_TIMEOUT,
             write=30.0,
             pool=10.0,
         )
-        _client = AsyncClient(host=host, timeout=timeout)
-        _client_host = host
-    return _client
+        client = _clients[host] = AsyncClient(host=host, timeout=timeout)
+    return client
 
 
 async def close_ollama_client() -> None:
-    """Close the shared client's underlying httpx connection pool."""
-    global _client, _client_host
-    if _client is not None:
+    """Close every shared client's underlying httpx connection pool."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
         try:
-            await _client._client.aclose()  # noqa: SLF001
+            await client._client.aclose()  # noqa: SLF001
         except Exception:
             logger.debug("Error closing Ollama client", exc_info=True)
-        _client = None
-        _client_host = None
 
 
 # --- Transient errors for retry logic ---
@@ -98,9 +108,118 @@ _RETRYABLE = retry_if_exception_type(TRANSIENT_ERRORS) | retry_if_exception(
 )
 
 
+# --- Endpoint routing ---
+
+
+async def _probe_endpoint(host: str) -> bool:
+    return (await ollama_service.check_health(host))["connected"]
+
+
+endpoint_pool = EndpointPool(TRANSIENT_ERRORS, _probe_endpoint)
+
+
+def _endpoint_list(host: str | Sequence[str]) -> list[str]:
+    return [host] if isinstance(host, str) else list(host)
+
+
 # --- Scoring / categorization functions ---
 
 
+def chat_options() -> dict:
+    """Options sent with every chat request.
+
+    num_ctx is the same for all requests: Ollama reloads the model when it
+    changes, discarding the KV cache of the shared system prompt prefix.
+    """
+    options: dict = {"temperature": 0}
+    num_ctx = get_settings().pipeline.ollama_num_ctx
+    if num_ctx:
+        options["num_ctx"] = num_ctx
+    return options
+
+
+_BATCH_TASKS: dict[type[BaseModel], str] = {
+    BatchCategoryResponse: "categorization",
+    BatchScoringResponse: "scoring",
+    BatchCombinedResponse: "combined",
+}
+
+
+async def _collect_batch_results[T: BaseModel](
+    stream: AsyncIterator[ChatResponse],
+    batch_schema: type[BatchCategoryResponse]
+    | type[BatchScoringResponse]
+    | type[BatchCombinedResponse],
+    item_schema: type[T],
+    set_phase: Callable[[str], None],
+    answer_phase: str,
+    on_result: ResultCallback[T] | None,
+) -> list[T]:
+    """Accumulate a streamed batch response, emitting each result as it closes.
+
+    Once a result has been emitted, a dropped stream or malformed tail no
+    longer fails the call: the emitted results are returned instead, so the
+    retry decorator does not re-run (and re-emit) a partially applied batch.
+    """
+    parser = StreamingResultsParser(item_schema)
+    emitted: list[T] = []
+    content = ""
+    task = _BATCH_TASKS[batch_schema]
+    started = time.monotonic()
+    first_token: float | None = None
+    try:
+        async for chunk in stream:
+            if first_token is None:
+                first_token = time.monotonic() - started
+            if chunk.get("done"):
+                LLM_TOKENS.inc(
+                    chunk.get("prompt_eval_count") or 0,
+                    provider=OLLAMA_PROVIDER,
+                    task=task,
+                    direction="in",
+                )
+                LLM_TOKENS.inc(
+                    chunk.get("eval_count") or 0,
+                    provider=OLLAMA_PROVIDER,
+                    task=task,
+                    direction="out",
+                )
+                # Prompt tokens actually evaluated; a reused prefix is skipped
+                logger.info(
+                    "Ollama %s batch: first token after %.2fs "
+                    "(load %.2fs, %s prompt tokens evaluated)",
+                    answer_phase,
+                    first_token,
+                    (chunk.get("load_duration") or 0) / 1e9,
+                    chunk.get("prompt_eval_count"),
+                )
+            if chunk["message"].get("thinking"):
+                set_phase("thinking")
+            text = chunk["message"].get("content") or ""
+            if not text:
+                continue
+            set_phase(answer_phase)
+            content += text
+            if on_result is not None:
+                for item in parser.feed(text):
+                    emitted.append(item)
+                    on_result(item)
+        return validate_llm_response(content, batch_schema).results  # pyright: ignore[reportReturnType]
+    except (LLMValidationError, *TRANSIENT_ERRORS) as e:
+        if not emitted:
+            raise
+        logger.warning(
+            "Batch response failed after %d streamed results; keeping them: %s",
+            len(emitted),
+            e,
+        )
+        return emitted
+    finally:
+        LLM_REQUEST_SECONDS.observe(
+            time.monotonic() - started, provider=OLLAMA_PROVIDER, task=task
+        )
+
+
 @retry(
     retry=_RETRYABLE,
     stop=stop_after_attempt(3),
@@ -150,7 +269,8 @@ async def categorize_article(
         model=model,
         messages=[{"role": "user", "content": prompt}],
         format=CategoryResponse.model_json_schema(),
-        options={"temperature": 0},
+        options=chat_options(),
+        keep_alive=get_settings().pipeline.ollama_keep_alive,
         stream=True,
         think=True if thinking else None,
     ):
@@ -214,7 +334,8 @@ async def score_article(
         model=model,
         messages=[{"role": "user", "content": prompt}],
         format=ScoringResponse.model_json_schema(),
-        options={"temperature": 0},
+        options=chat_options(),
+        keep_alive=get_settings().pipeline.ollama_keep_alive,
         stream=True,
         think=True if thinking else None,
     ):
@@ -244,22 +365,24 @@ async def score_article(
 async def categorize_articles(
     articles: list[dict],
     existing_categories: list[str],
-    host: str,
+    host: str | Sequence[str],
     model: str,
     thinking: bool = False,
     category_hierarchy: dict[str, list[str]] | None = None,
     hidden_categories: list[str] | None = None,
+    on_result: ResultCallback[ArticleCategoryResult] | None = None,
 ) -> list[ArticleCategoryResult]:
     """Categorize a batch of articles using Ollama LLM.
 
     Args:
         articles: List of dicts with keys: id, title, content_markdown
         existing_categories: List of existing categories to reuse
-        host: Ollama server URL
+        host: Ollama server URL, or several to balance the batch across
         model: Ollama model name
         thinking: Whether to enable extended thinking mode
         category_hierarchy: Optional parent-child hierarchy
         hidden_categories: Optional list of hidden category names to avoid
+        on_result: Optional callback invoked with each result as it streams in
 
     Returns:
         List of ArticleCategoryResult for each article
@@ -271,28 +394,29 @@ async def categorize_articles(
         hidden_categories=hidden_categories,
     )
 
-    client = get_ollama_client(host)
-    content = ""
-    async for chunk in await client.chat(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ],
-        format=BatchCategoryResponse.model_json_schema(),
-        options={"temperature": 0},
-        stream=True,
-        think=True if thinking else None,
-    ):
-        if chunk["message"].get("thinking"):
-            set_categorization_phase("thinking")
-        if chunk["message"].get("content"):
-            set_categorization_phase("categorizing")
-        content += chunk["message"].get("content") or ""
-
-    result = validate_llm_response(content, BatchCategoryResponse)
-    logger.info("Categorized %d articles in batch", len(result.results))
-    return result.results
+    async with endpoint_pool.lease(_endpoint_list(host)) as endpoint:
+        client = get_ollama_client(endpoint)
+        results = await _collect_batch_results(
+            await client.chat(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message},
+                ],
+                format=BatchCategoryResponse.model_json_schema(),
+                options=chat_options(),
+                keep_alive=get_settings().pipeline.ollama_keep_alive,
+                stream=True,
+                think=True if thinking else None,
+            ),
+            BatchCategoryResponse,
+            ArticleCategoryResult,
+            set_categorization_phase,
+            "categorizing",
+            on_result,
+        )
+    logger.info("Categorized %d articles in batch", len(results))
+    return results
 
 
 @retry(
@@ -305,9 +429,10 @@ async def score_articles(
     articles: list[dict],
     interests: str,
     anti_interests: str,
-    host: str,
+    host: str | Sequence[str],
     model: str,
     thinking: bool = False,
+    on_result: ResultCallback[ArticleScoringResult] | None = None,
 ) -> list[ArticleScoringResult]:
     """Score a batch of articles using Ollama LLM.
 
@@ -315,9 +440,10 @@ async def score_articles(
         articles: List of dicts with keys: id, title, content_markdown
         interests: User's interest preferences
         anti_interests: User's anti-interest preferences
-        host: Ollama server URL
+        host: Ollama server URL, or several to balance the batch across
         model: Ollama model name
         thinking: Whether to enable extended thinking mode
+        on_result: Optional callback invoked with each result as it streams in
 
     Returns:
         List of ArticleScoringResult for each article
@@ -326,28 +452,136 @@ async def score_articles(
         articles, interests, anti_interests
     )
 
-    client = get_ollama_client(host)
-    content = ""
-    async for chunk in await client.chat(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ],
-        format=BatchScoringResponse.model_json_schema(),
-        options={"temperature": 0},
-        stream=True,
-        think=True if thinking else None,
-    ):
-        if chunk["message"].get("thinking"):
-            set_scoring_phase("thinking")
-        if chunk["message"].get("content"):
-            set_scoring_phase("scoring")
-        content += chunk["message"].get("content") or ""
+    async with endpoint_pool.lease(_endpoint_list(host)) as endpoint:
+        client = get_ollama_client(endpoint)
+        results = await _collect_batch_results(
+            await client.chat(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message},
+                ],
+                format=BatchScoringResponse.model_json_schema(),
+                options=chat_options(),
+                keep_alive=get_settings().pipeline.ollama_keep_alive,
+                stream=True,
+                think=True if thinking else None,
+            ),
+            BatchScoringResponse,
+            ArticleScoringResult,
+            set_scoring_phase,
+            "scoring",
+            on_result,
+        )
+    logger.info("Scored %d articles in batch", len(results))
+    return results
+
+
+@retry(
+    retry=_RETRYABLE,
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    reraise=True,
+)
+async def categorize_and_score_articles(
+    articles: list[dict],
+    existing_categories: list[str],
+    interests: str,
+    anti_interests: str,
+    host: str | Sequence[str],
+    model: str,
+    thinking: bool = False,
+    category_hierarchy: dict[str, list[str]] | None = None,
+    hidden_categories: list[str] | None = None,
+    on_result: ResultCallback[ArticleCombinedResult] | None = None,
+) -> list[ArticleCombinedResult]:
+    """Categorize and score a batch of articles in one Ollama call.
+
+    Args:
+        articles: List of dicts with keys: id, title, content_markdown
+        existing_categories: List of existing categories to reuse
+        interests: User's interest preferences
+        anti_interests: User's anti-interest preferences
+        host: Ollama server URL, or several to balance the batch across
+        model: Ollama model name
+        thinking: Whether to enable extended thinking mode
+        category_hierarchy: Optional parent-child hierarchy
+        hidden_categories: Optional list of hidden category names to avoid
+        on_result: Optional callback invoked with each result as it streams in
+
+    Returns:
+        List of ArticleCombinedResult for each article
+    """
+    system_prompt, user_message = build_batch_combined_prompt(
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        category_hierarchy,
+        hidden_categories=hidden_categories,
+    )
+
+    async with endpoint_pool.lease(_endpoint_list(host)) as endpoint:
+        client = get_ollama_client(endpoint)
+        results = await _collect_batch_results(
+            await client.chat(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message},
+                ],
+                format=BatchCombinedResponse.model_json_schema(),
+                options=chat_options(),
+                keep_alive=get_settings().pipeline.ollama_keep_alive,
+                stream=True,
+                think=True if thinking else None,
+            ),
+            BatchCombinedResponse,
+            ArticleCombinedResult,
+            set_categorization_phase,
+            "categorizing",
+            on_result,
+        )
+    logger.info("Categorized and scored %d articles in batch", len(results))
+    return results
+
+
+@retry(
+    retry=retry_if_exception_type(TRANSIENT_ERRORS),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    reraise=True,
+)
+async def embed_texts(
+    texts: list[str], host: str | Sequence[str], model: str
+) -> list[list[float]]:
+    """Embed texts with an Ollama embedding model, one vector per text.
 
-    result = validate_llm_response(content, BatchScoringResponse)
-    logger.info("Scored %d articles in batch", len(result.results))
-    return result.results
+    Args:
+        texts: Texts to embed; longer ones are truncated by the server
+        host: Ollama server URL, or several to balance the request across
+        model: Ollama embedding model name
+    """
+    started = time.monotonic()
+    try:
+        async with endpoint_pool.lease(_endpoint_list(host)) as endpoint:
+            response = await get_ollama_client(endpoint).embed(
+                model=model,
+                input=texts,
+                truncate=True,
+                keep_alive=get_settings().pipeline.ollama_keep_alive,
+            )
+    finally:
+        LLM_REQUEST_SECONDS.observe(
+            time.monotonic() - started, provider=OLLAMA_PROVIDER, task="embedding"
+        )
+    LLM_TOKENS.inc(
+        response.get("prompt_eval_count") or 0,
+        provider=OLLAMA_PROVIDER,
+        task="embedding",
+        direction="in",
+    )
+    return [list(vector) for vector in response["embeddings"]]
 
 
 # --- Config models ---
@@ -376,6 +610,8 @@ class OllamaProviderConfig(BaseModel):
     use_separate_models: bool = False
     thinking: bool = False
     batch_size: int = Field(default=1, ge=1, le=10)
+    # Further servers (scheme://host[:port]) serving the same models
+    extra_endpoints: list[str] = Field(default_factory=list, max_length=16)
 
     @field_validator("base_url")
     @classmethod
@@ -399,10 +635,31 @@ class OllamaProviderConfig(BaseModel):
             hostname = f"[{hostname}]"
         return f"{parsed.scheme}://{hostname}"
 
+    @field_validator("extra_endpoints")
+    @classmethod
+    def _validate_extra_endpoints(cls, values: list[str]) -> list[str]:
+        endpoints = []
+        for value in values:
+            parsed = urlparse(value.strip())
+            if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+                raise ValueError("extra endpoints must be http(s)://host[:port]")
+            if parsed.path not in {"", "/"} or parsed.query or parsed.fragment:
+                raise ValueError("extra endpoints must not include a path")
+            if parsed.username or parsed.password:
+                raise ValueError("extra endpoints must not include credentials")
+            base_url, port = split_ollama_host(value.strip())
+            endpoints.append(f"{base_url}:{port}")
+        return list(dict.fromkeys(endpoints))
+
     @property
     def endpoint(self) -> str:
         return f"{self.base_url}:{self.port}"
 
+    @property
+    def endpoints(self) -> list[str]:
+        """Primary endpoint followed by the extra ones, without duplicates."""
+        return list(dict.fromkeys([self.endpoint, *self.extra_endpoints]))
+
     def default_model_for_task(self, task: str) -> str | None:
         if task == "categorization":
             return self.categorization_model
@@ -442,14 +699,25 @@ class OllamaProvider:
         from backend.llm_providers.base import ProviderTaskConfig
 
         config = OllamaProviderConfig.model_validate_json(config_json)
+        endpoints = config.endpoints
         return ProviderTaskConfig(
             endpoint=config.endpoint,
             model=config.default_model_for_task(task),
             thinking=config.thinking,
+            endpoints=endpoints if len(endpoints) > 1 else None,
         )
 
     async def health(self, config: ProviderTaskConfig) -> dict:
-        return await ollama_service.check_health(config.endpoint)
+        if not config.endpoints:
+            return await ollama_service.check_health(config.endpoint)
+        # Ready while any endpoint answers; the pool routes around the others
+        results = await asyncio.gather(
+            *(ollama_service.check_health(e) for e in config.endpoints)
+        )
+        for endpoint, result in zip(config.endpoints, results, strict=True):
+            if not result["connected"]:
+                endpoint_pool.report_unhealthy(endpoint)
+        return next((r for r in results if r["connected"]), results[0])
 
     async def list_models(self, config: ProviderTaskConfig) -> list[dict]:
         return await ollama_service.list_models(config.endpoint)
@@ -461,15 +729,17 @@ class OllamaProvider:
         config: ProviderTaskConfig,
         category_hierarchy: dict[str, list[str]] | None,
         hidden_categories: list[str] | None,
+        on_result: ResultCallback[ArticleCategoryResult] | None = None,
     ) -> list[ArticleCategoryResult]:
         return await categorize_articles(
             articles,
             existing_categories,
-            host=config.endpoint,
+            host=config.endpoints or config.endpoint,
             model=config.model,
             thinking=config.thinking,
             category_hierarchy=category_hierarchy,
             hidden_categories=hidden_categories,
+            on_result=on_result,
         )
 
     async def score(
@@ -478,14 +748,47 @@ class OllamaProvider:
         interests: str,
         anti_interests: str,
         config: ProviderTaskConfig,
+        on_result: ResultCallback[ArticleScoringResult] | None = None,
     ) -> list[ArticleScoringResult]:
         return await score_articles(
             articles,
             interests,
             anti_interests,
-            host=config.endpoint,
+            host=config.endpoints or config.endpoint,
+            model=config.model,
+            thinking=config.thinking,
+            on_result=on_result,
+        )
+
+    async def categorize_and_score(
+        self,
+        articles: list[dict],
+        existing_categories: list[str],
+        interests: str,
+        anti_interests: str,
+        config: ProviderTaskConfig,
+        category_hierarchy: dict[str, list[str]] | None,
+        hidden_categories: list[str] | None,
+        on_result: ResultCallback[ArticleCombinedResult] | None = None,
+    ) -> list[ArticleCombinedResult]:
+        return await categorize_and_score_articles(
+            articles,
+            existing_categories,
+            interests,
+            anti_interests,
+            host=config.endpoints or config.endpoint,
             model=config.model,
             thinking=config.thinking,
+            category_hierarchy=category_hierarchy,
+            hidden_categories=hidden_categories,
+            on_result=on_result,
+        )
+
+    async def embed(
+        self, texts: list[str], config: ProviderTaskConfig
+    ) -> list[list[float]]:
+        return await embed_texts(
+            texts, host=config.endpoints or config.endpoint, model=config.model
         )
 
     async def suggest_groups(
@@ -502,7 +805,8 @@ class OllamaProvider:
             model=config.model,
             messages=[{"role": "user", "content": prompt}],
             format=GroupingResponse.model_json_schema(),
-            options={"temperature": 0},
+            options=chat_options(),
+            keep_alive=get_settings().pipeline.ollama_keep_alive,
             stream=True,
         ):
             content += chunk["message"].get("content") or ""
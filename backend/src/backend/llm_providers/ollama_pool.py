@@ -0,0 +1,124 @@
+"""Least-loaded routing across several Ollama endpoints.
+
+Each request leases an endpoint from an EndpointPool: the healthy endpoint
+with the fewest requests in flight (ties go to the one that has served the
+fewest requests). An endpoint whose request fails with a connection-level
+error is ejected with exponential backoff; once the backoff has passed it
+must answer a health probe before it takes traffic again. When every
+endpoint is ejected the one due back first is used rather than failing
+outright, so a single-endpoint setup behaves exactly as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+BASE_BACKOFF_SECONDS = 5.0
+MAX_BACKOFF_SECONDS = 300.0
+
+
+@dataclass
+class EndpointState:
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    retry_at: float = 0.0
+
+
+class EndpointPool:
+    """Tracks load and health per endpoint and hands out leases."""
+
+    def __init__(
+        self,
+        errors: tuple[type[BaseException], ...],
+        probe: Callable[[str], Awaitable[bool]],
+        *,
+        base_backoff: float = BASE_BACKOFF_SECONDS,
+        max_backoff: float = MAX_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._errors = errors
+        self._probe = probe
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._states: dict[str, EndpointState] = {}
+
+    def _state(self, endpoint: str) -> EndpointState:
+        return self._states.setdefault(endpoint, EndpointState())
+
+    def _available(self, endpoint: str) -> bool:
+        return self._state(endpoint).retry_at <= self._clock()
+
+    def eject(self, endpoint: str) -> None:
+        """Take an endpoint out of rotation for the next backoff step."""
+        state = self._state(endpoint)
+        state.failures += 1
+        backoff = min(self._max_backoff, self._base_backoff * 2 ** (state.failures - 1))
+        state.retry_at = self._clock() + backoff
+        logger.warning(
+            "Ollama endpoint %s ejected for %.0fs (%d consecutive failures)",
+            endpoint,
+            backoff,
+            state.failures,
+        )
+
+    def report_unhealthy(self, endpoint: str) -> None:
+        """Eject an endpoint a health check found down, unless already out."""
+        if self._available(endpoint):
+            self.eject(endpoint)
+
+    async def _choose(self, endpoints: Sequence[str]) -> str:
+        candidates = list(dict.fromkeys(endpoints))
+        while True:
+            available = [e for e in candidates if self._available(e)]
+            if not available:
+                # Everything is ejected: use the endpoint due back first
+                return min(endpoints, key=lambda e: self._state(e).retry_at)
+            endpoint = min(
+                available,
+                key=lambda e: (self._state(e).in_flight, self._state(e).requests),
+            )
+            if self._state(endpoint).failures == 0 or await self._probe(endpoint):
+                return endpoint
+            self.eject(endpoint)
+            candidates.remove(endpoint)
+
+    @asynccontextmanager
+    async def lease(self, endpoints: Sequence[str]) -> AsyncIterator[str]:
+        """Yield the endpoint to use for one request and account for it."""
+        endpoint = await self._choose(endpoints)
+        state = self._state(endpoint)
+        state.in_flight += 1
+        state.requests += 1
+        try:
+            yield endpoint
+        except self._errors:
+            self.eject(endpoint)
+            raise
+        else:
+            state.failures = 0
+        finally:
+            state.in_flight -= 1
+
+    def snapshot(self) -> list[dict]:
+        """Per-endpoint load and health for status reporting."""
+        return [
+            {
+                "endpoint": endpoint,
+                "healthy": self._available(endpoint),
+                "in_flight": state.in_flight,
+                "requests": state.requests,
+                "failures": state.failures,
+            }
+            for endpoint, state in self._states.items()
+        ]
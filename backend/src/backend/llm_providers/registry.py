@@ -1,6 +1,8 @@
-"""Static provider registry for this release."""
+"""Provider registry: the built-in providers, plus any registered at runtime."""
 
+from backend.config import get_settings
 from backend.llm_providers.base import LLMProvider
+from backend.llm_providers.cassette import recording_provider, replay_provider
 from backend.llm_providers.google import GoogleProvider
 from backend.llm_providers.ollama import OllamaProvider
 
@@ -10,12 +12,46 @@ PROVIDERS: dict[str, LLMProvider] = {
 }
 
 
+def register_provider(provider: LLMProvider) -> None:
+    """Make a provider resolvable by its name, replacing any with the same name.
+
+    Used by benchmarks and tests to route tasks to a stand-in provider.
+    """
+    PROVIDERS[provider.name] = provider
+
+
+# (provider name, mode, cassette path) -> wrapped provider
+_cassette_providers: dict[tuple[str, str, str], LLMProvider] = {}
+
+
+def _with_cassette(provider: LLMProvider) -> LLMProvider:
+    """Wrap the provider for recording or replay when a cassette is configured."""
+    settings = get_settings().pipeline
+    if settings.llm_replay_path:
+        key = (provider.name, "replay", settings.llm_replay_path)
+        if key not in _cassette_providers:
+            _cassette_providers[key] = replay_provider(
+                settings.llm_replay_path,
+                realtime=settings.llm_replay_realtime,
+                inner=provider,
+            )
+        return _cassette_providers[key]
+    if settings.llm_record_path:
+        key = (provider.name, "record", settings.llm_record_path)
+        if key not in _cassette_providers:
+            _cassette_providers[key] = recording_provider(
+                provider, settings.llm_record_path
+            )
+        return _cassette_providers[key]
+    return provider
+
+
 def get_provider(name: str) -> LLMProvider:
     """Resolve a provider by name."""
     provider = PROVIDERS.get(name)
     if provider is None:
         raise KeyError(f"Unknown provider: {name}")
-    return provider
+    return _with_cassette(provider)
 
 
 async def close_all_providers() -> None:
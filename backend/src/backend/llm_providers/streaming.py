@@ -0,0 +1,103 @@
+"""Incremental parsing of streamed batch LLM responses.
+
+Batch categorization and scoring responses have the shape
+``{"results": [{...}, {...}]}``. Waiting for the full document before
+persisting anything means nothing shows up in the UI until the slowest batch
+finishes, and a malformed tail throws away every result before it.
+
+StreamingResultsParser scans chunks as they arrive and yields each object in
+the ``results`` array as soon as its closing brace is seen, validated against
+the per-article schema.
+"""
+
+import logging
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+type ResultCallback[T: BaseModel] = Callable[[T], None]
+
+
+class StreamingResultsParser[T: BaseModel]:
+    """Extract complete items of a top-level JSON array from partial text.
+
+    Only tracks structure (nesting depth and string/escape state), so each
+    character is inspected once regardless of how the text is chunked.
+    """
+
+    def __init__(self, item_schema: type[T], key: str = "results") -> None:
+        self.item_schema = item_schema
+        self.key = key
+        self.invalid = 0
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._current_key: str | None = None
+        self._array_depth: int | None = None
+        self._array_done = False
+        self._item_start: int | None = None
+
+    def feed(self, chunk: str) -> list[T]:
+        """Consume a chunk and return items whose objects closed within it."""
+        self._buffer += chunk
+        items: list[T] = []
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            c = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buffer[self._string_start + 1 : i]
+            elif c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c == ":" and self._depth == 1:
+                self._current_key = self._last_string
+            elif c in "{[":
+                self._depth += 1
+                if (
+                    c == "["
+                    and self._depth == 2
+                    and self._current_key == self.key
+                    and not self._array_done
+                ):
+                    self._array_depth = 2
+                elif c == "{" and self._in_array_item_depth():
+                    self._item_start = i
+            elif c in "}]":
+                if c == "}" and self._in_array_item_depth():
+                    if self._item_start is not None:
+                        item = self._validate(buffer[self._item_start : i + 1])
+                        if item is not None:
+                            items.append(item)
+                    self._item_start = None
+                elif c == "]" and self._depth == self._array_depth:
+                    self._array_depth = None
+                    self._array_done = True
+                self._depth -= 1
+        self._pos = len(buffer)
+        return items
+
+    def _in_array_item_depth(self) -> bool:
+        return self._array_depth is not None and self._depth == self._array_depth + 1
+
+    def _validate(self, raw: str) -> T | None:
+        try:
+            return self.item_schema.model_validate_json(raw)
+        except ValueError as e:
+            self.invalid += 1
+            logger.warning(
+                "Skipping invalid streamed %s: %s", self.item_schema.__name__, e
+            )
+            return None
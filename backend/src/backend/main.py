@@ -6,10 +6,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from backend.config import get_settings
 from backend.database import create_db_and_tables
 from backend.llm_providers.registry import close_all_providers
+from backend.metrics import CONTENT_TYPE, render_metrics
 from backend.routers import (
     articles,
     categories,
@@ -18,6 +20,7 @@ from backend.routers import (
     google,
     ollama,
     preferences,
+    prefilter,
     providers,
     scoring,
 )
@@ -76,6 +79,7 @@ app.include_router(feeds.router)
 app.include_router(feed_folders.router)
 app.include_router(categories.router)
 app.include_router(preferences.router)
+app.include_router(prefilter.router)
 app.include_router(providers.router)
 app.include_router(ollama.router)
 app.include_router(google.router)
@@ -88,6 +92,12 @@ def health_check():
     return HealthResponse(status="healthy")
 
 
+@app.get("/metrics", tags=["monitoring"], include_in_schema=False)
+def metrics():
+    """Prometheus scrape target; renders in-memory metrics without DB queries."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 @app.get("/", status_code=200)
 def root():
     """Legacy root health probe used by existing tests/scripts."""
@@ -0,0 +1,269 @@
+"""In-process metrics exposed in the Prometheus text format at /metrics.
+
+Hot paths only bump in-memory counters and histogram buckets, so a scrape
+renders what is already there and never touches the database. Queue depth is
+a gauge refreshed by the pipeline run that already reads the queue.
+
+Instruments are module-level singletons, created once at import. Each holds a
+lock because DB statement timing fires from FastAPI's threadpool as well as
+the event loop.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+# Seconds; covers sub-millisecond DB statements up to slow LLM batches
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list[_Metric] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[n]) for n in self.labels)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Exposition lines for this metric: HELP, TYPE, then its samples."""
+
+
+class Counter(_Metric):
+    """Monotonic total, e.g. articles ingested or tokens sent."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labels, k)} {_format_value(v)}"
+            for k, v in values
+        ]
+
+
+class Gauge(Counter):
+    """Point-in-time value, e.g. queue depth."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets, with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def total(self) -> float:
+        """Sum of all observed values across every label set."""
+        with self._lock:
+            return sum(series[1] for series in self._series.values())
+
+    def render(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted(
+                (k, (list(s[0]), s[1], s[2])) for k, s in self._series.items()
+            )
+        lines = self._header()
+        for key, (counts, total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(
+                (*self.buckets, float("inf")), counts, strict=True
+            ):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*self.labels, "le"), (*key, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+def render_metrics() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# --- Feeds ---
+
+FEED_FETCH_SECONDS = Histogram(
+    "rss_feed_fetch_seconds", "Feed HTTP fetch latency.", ["outcome"]
+)
+FEED_FETCH_BYTES = Counter(
+    "rss_feed_fetch_bytes_total", "Bytes downloaded while fetching feeds."
+)
+FEED_PARSE_SECONDS = Histogram("rss_feed_parse_seconds", "feedparser parse time.")
+MARKDOWN_SECONDS = Histogram(
+    "rss_markdown_seconds", "HTML to markdown conversion time per article."
+)
+ARTICLES_INGESTED = Counter(
+    "rss_articles_ingested_total", "New articles saved from feeds."
+)
+ARTICLES_PREFILTERED = Counter(
+    "rss_articles_prefiltered_total",
+    "New articles blocked by a pre-filter rule before any LLM call.",
+)
+
+# --- Pipeline ---
+
+QUEUE_DEPTH = Gauge(
+    "rss_queue_depth",
+    "Articles per task state, as of the last pipeline run.",
+    ["task", "state"],
+)
+QUEUE_WAIT_SECONDS = Histogram(
+    "rss_queue_wait_seconds",
+    "Time from enqueue to claim, per queue lane.",
+    ["task", "lane"],
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "rss_llm_request_seconds", "LLM request latency.", ["provider", "task"]
+)
+LLM_TOKENS = Counter(
+    "rss_llm_tokens_total",
+    "LLM tokens reported by the provider.",
+    ["provider", "task", "direction"],
+)
+LLM_VALIDATION_FAILURES = Counter(
+    "rss_llm_validation_failures_total",
+    "LLM responses that failed JSON or schema validation.",
+    ["kind"],
+)
+LLM_ISOLATION_CALLS = Counter(
+    "rss_llm_isolation_calls_total",
+    "LLM calls spent bisecting failed batches to isolate bad articles.",
+    ["task"],
+)
+LLM_ISOLATED_ARTICLES = Counter(
+    "rss_llm_isolated_articles_total",
+    "Articles marked failed after failing validation on their own.",
+    ["task"],
+)
+LLM_CASCADE_ARTICLES = Counter(
+    "rss_llm_cascade_articles_total",
+    "Articles scored by the cascade's small model, kept or escalated.",
+    ["outcome"],
+)
+PRESCORER_ARTICLES = Counter(
+    "rss_prescorer_articles_total",
+    "Articles seen by the local pre-scorer, scored locally or sent to the LLM.",
+    ["outcome"],
+)
+KNN_ARTICLES = Counter(
+    "rss_knn_articles_total",
+    "Articles checked against their nearest neighbours, categorized from them "
+    "or sent to the LLM.",
+    ["outcome"],
+)
+RATE_LIMIT_WAITS = Counter(
+    "rss_rate_limit_waits_total", "Times a task was paused by a rate limit.", ["task"]
+)
+RATE_LIMIT_WAIT_SECONDS = Counter(
+    "rss_rate_limit_wait_seconds_total",
+    "Seconds a task was asked to wait by rate limits.",
+    ["task"],
+)
+
+# --- Database ---
+
+DB_STATEMENT_SECONDS = Histogram(
+    "rss_db_statement_seconds", "SQLite statement execution time.", ["statement"]
+)
@@ -0,0 +1,198 @@
+"""Keep the routed Ollama models loaded while the pipeline has work.
+
+Before each pipeline run, models routed to tasks with queued articles are
+loaded (with the configured keep_alive) if Ollama does not report them as
+loaded, so the first batch after an idle period does not spend its read
+timeout on the model load.
+
+When categorization and scoring use different models on the same server,
+the first run with work for both loads both and checks whether they stay
+loaded together. If not, the pair is run exclusively: the categorization
+backlog is drained before scoring starts, and the idle model is unloaded
+when switching, instead of the two evicting each other on every run.
+
+A task balanced across several Ollama endpoints runs one batch on each, so
+every endpoint is prepared, and checked for co-residency, on its own.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlmodel import Session, col, select
+
+from backend import ollama_service
+from backend.config import get_settings
+from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, resolve_task_runtime
+from backend.leases import is_due
+from backend.llm_providers.ollama import OLLAMA_PROVIDER, chat_options
+from backend.models import Article
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PipelinePlan:
+    """Which workers the pipeline should run this time."""
+
+    categorize: bool = True
+    score: bool = True
+
+
+_stats: dict[str, int] = {"model_loads": 0, "model_swaps": 0}
+# (endpoint, categorization model, scoring model) -> both fit in memory
+_co_resident: dict[tuple[str, str, str], bool] = {}
+# endpoint -> model last run for an exclusive pair
+_active_model: dict[str, str] = {}
+
+
+def _tagged(model: str) -> str:
+    """Model name as Ollama reports it (untagged names mean ':latest')."""
+    return model if ":" in model else f"{model}:latest"
+
+
+async def _loaded_models(endpoint: str) -> set[str]:
+    models = await ollama_service.list_models(endpoint)
+    return {m["name"] for m in models if m["is_loaded"]}
+
+
+async def _ensure_loaded(endpoint: str, model: str, loaded: set[str]) -> None:
+    if _tagged(model) in loaded:
+        return
+    started = time.monotonic()
+    await ollama_service.load_model(
+        endpoint, model, get_settings().pipeline.ollama_keep_alive, chat_options()
+    )
+    loaded.add(_tagged(model))
+    _stats["model_loads"] += 1
+    logger.info("Loaded Ollama model %s in %.1fs", model, time.monotonic() - started)
+
+
+def _has_queued(session: Session, state_column) -> bool:
+    return (
+        session.exec(
+            select(Article.id)
+            .where(col(state_column) == "queued")
+            .where(is_due(datetime.now()))
+            .limit(1)
+        )
+    ).first() is not None
+
+
+async def _plan_exclusive(
+    endpoint: str,
+    cat_model: str,
+    score_model: str,
+    pending: dict[str, bool],
+    loaded: set[str],
+) -> PipelinePlan:
+    categorize = pending[TASK_CATEGORIZATION]
+    target, other = (cat_model, score_model) if categorize else (score_model, cat_model)
+    previous = _active_model.get(endpoint)
+    if previous is not None and previous != target:
+        _stats["model_swaps"] += 1
+        logger.info("Switching Ollama model %s -> %s", previous, target)
+        if _tagged(other) in loaded:
+            await ollama_service.unload_model(endpoint, other)
+            loaded.discard(_tagged(other))
+    _active_model[endpoint] = target
+    await _ensure_loaded(endpoint, target, loaded)
+    return PipelinePlan(categorize=categorize, score=not categorize)
+
+
+async def prepare_pipeline(session: Session) -> PipelinePlan:
+    """Load the models the next pipeline run needs and decide what it runs.
+
+    Never raises: if Ollama cannot be queried, both workers run as usual and
+    surface the error themselves.
+    """
+    if not get_settings().pipeline.ollama_residency:
+        return PipelinePlan()
+
+    try:
+        pending = {
+            TASK_CATEGORIZATION: _has_queued(session, Article.categorization_state),
+            TASK_SCORING: _has_queued(session, Article.scoring_state),
+        }
+        # task -> (endpoints, model) for tasks routed to a ready Ollama provider
+        local: dict[str, tuple[list[str], str]] = {}
+        for task in pending:
+            runtime = resolve_task_runtime(session, task)
+            if runtime.ready and runtime.provider == OLLAMA_PROVIDER:
+                endpoints = runtime.endpoints or [runtime.endpoint]
+                if all(endpoints) and runtime.model:
+                    local[task] = (endpoints, runtime.model)  # pyright: ignore[reportArgumentType]
+        if not any(pending[task] for task in local):
+            return PipelinePlan()
+        return await _prepare(local, pending)
+    except Exception as e:
+        logger.warning("Ollama model residency check failed: %s", e)
+        return PipelinePlan()
+
+
+async def _prepare(
+    local: dict[str, tuple[list[str], str]], pending: dict[str, bool]
+) -> PipelinePlan:
+    endpoints = dict.fromkeys(e for hosts, _ in local.values() for e in hosts)
+    plans = await asyncio.gather(
+        *(
+            _prepare_endpoint(
+                endpoint,
+                {
+                    task: model
+                    for task, (hosts, model) in local.items()
+                    if endpoint in hosts
+                },
+                pending,
+            )
+            for endpoint in endpoints
+        )
+    )
+    # Exclusive plans only depend on which tasks have work, so they agree;
+    # one endpoint that cannot hold both models makes the whole run exclusive
+    return next((plan for plan in plans if plan != PipelinePlan()), PipelinePlan())
+
+
+async def _prepare_endpoint(
+    endpoint: str, models: dict[str, str], pending: dict[str, bool]
+) -> PipelinePlan:
+    cat_model = models.get(TASK_CATEGORIZATION)
+    score_model = models.get(TASK_SCORING)
+    loaded = await _loaded_models(endpoint)
+    if cat_model and score_model and _tagged(cat_model) != _tagged(score_model):
+        key = (endpoint, cat_model, score_model)
+        if key not in _co_resident and all(pending.values()):
+            await _ensure_loaded(endpoint, cat_model, loaded)
+            await _ensure_loaded(endpoint, score_model, loaded)
+            loaded = await _loaded_models(endpoint)
+            fits = {_tagged(cat_model), _tagged(score_model)} <= loaded
+            _co_resident[key] = fits
+            logger.info(
+                "Ollama models %s and %s %s on %s",
+                cat_model,
+                score_model,
+                "fit in memory together"
+                if fits
+                else "evict each other; draining categorization first",
+                endpoint,
+            )
+        if _co_resident.get(key) is False:
+            return await _plan_exclusive(
+                endpoint, cat_model, score_model, pending, loaded
+            )
+
+    for task, model in models.items():
+        if pending[task]:
+            await _ensure_loaded(endpoint, model, loaded)
+    return PipelinePlan()
+
+
+def get_residency_stats() -> dict:
+    """Counters for /api/scoring/status."""
+    return {
+        "enabled": get_settings().pipeline.ollama_residency,
+        "model_loads": _stats["model_loads"],
+        "model_swaps": _stats["model_swaps"],
+    }
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -53,6 +53,19 @@ class ArticleCategoryLink(SQLModel, table=True):
     )
 
 
+class ArticleSimhashBand(SQLModel, table=True):
+    """LSH band index over Article.simhash for near-duplicate lookup."""
+
+    __tablename__ = "article_simhash_bands"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (Index("ix_article_simhash_bands_band_value", "band", "value"),)
+
+    article_id: int = Field(
+        foreign_key="articles.id", primary_key=True, ondelete="CASCADE"
+    )
+    band: int = Field(primary_key=True)
+    value: int
+
+
 class Category(SQLModel, table=True):
     """A topic category for articles."""
 
@@ -87,10 +100,32 @@ class Category(SQLModel, table=True):
     )
 
 
+# Article.category_source values
+CATEGORY_SOURCE_LLM = "llm"
+CATEGORY_SOURCE_KNN = "knn"
+CATEGORY_SOURCE_DUPLICATE = "duplicate"
+CATEGORY_SOURCE_RULE = "rule"
+
+
 class Article(SQLModel, table=True):
     """Article from an RSS feed."""
 
     __tablename__ = "articles"  # pyright: ignore[reportAssignmentType]
+    # Queue scans: WHERE <state> = 'queued' AND queue_lane = ? ORDER BY published_at
+    __table_args__ = (
+        Index(
+            "ix_articles_categorization_queue",
+            "categorization_state",
+            "queue_lane",
+            "published_at",
+        ),
+        Index(
+            "ix_articles_scoring_queue",
+            "scoring_state",
+            "queue_lane",
+            "published_at",
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     feed_id: int = Field(foreign_key="feeds.id", index=True, ondelete="CASCADE")
@@ -101,6 +136,7 @@ class Article(SQLModel, table=True):
     summary: str | None = None
     content: str | None = None
     content_markdown: str | None = None
+    simhash: int | None = Field(default=None)
     is_read: bool = Field(default=False)
 
     # LLM scoring fields
@@ -110,6 +146,9 @@ class Article(SQLModel, table=True):
     score_reasoning: str | None = Field(default=None)
     scoring_state: str = Field(default="unscored", index=True)
     scored_at: datetime | None = Field(default=None)
+    # What produced the score: "local" (backend.prescorer), or the small or
+    # large model of the scoring cascade; None for blocked articles
+    score_tier: str | None = Field(default=None)
 
     # Re-scoring support
     scoring_priority: int = Field(default=0)
@@ -118,8 +157,22 @@ class Article(SQLModel, table=True):
     # Categorization pipeline
     categorization_state: str = Field(default="uncategorized", index=True)
     categorization_attempts: int = Field(default=0)
+    # What assigned the categories: "llm", "knn" (backend.embeddings),
+    # "duplicate" (inherited from a near-duplicate) or "rule" (blocked by a
+    # pre-filter rule, see backend.prefilter)
+    category_source: str | None = Field(default=None)
     scoring_attempts: int = Field(default=0)
 
+    # Worker lease while categorizing/scoring (see backend.leases)
+    lease_owner: str | None = Field(default=None)
+    lease_expires_at: datetime | None = Field(default=None)
+    # Set when a failed attempt re-queues the article; not claimed before then
+    next_attempt_at: datetime | None = Field(default=None)
+    # Queue lane (interactive/fresh/backlog, see backend.leases) and when the
+    # article last entered a task queue, for per-lane wait metrics
+    queue_lane: str = Field(default="fresh")
+    queued_at: datetime | None = Field(default=None)
+
     # Relationships
     categories_rel: list[Category] = Relationship(
         back_populates="articles",
@@ -169,3 +222,65 @@ class LLMTaskRoute(SQLModel, table=True):
     model: str | None = Field(default=None)
     batch_size: int | None = Field(default=None)
     updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class LLMResultCache(SQLModel, table=True):
+    """Content-addressed cache of per-article LLM task results."""
+
+    __tablename__ = "llm_result_cache"  # pyright: ignore[reportAssignmentType]
+
+    key: str = Field(primary_key=True)
+    task: str = Field(index=True)
+    result_json: str
+    size_bytes: int = Field(default=0)
+    hit_count: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.now)
+    last_used_at: datetime = Field(default_factory=datetime.now, index=True)
+
+
+class ProviderBatchJob(SQLModel, table=True):
+    """Offline batch job submitted to a hosted provider for a queue backlog.
+
+    The job's articles stay in the in-progress state under the job's lease
+    until its results are applied (see backend.batch_jobs).
+    """
+
+    __tablename__ = "provider_batch_jobs"  # pyright: ignore[reportAssignmentType]
+
+    id: int | None = Field(default=None, primary_key=True)
+    provider: str
+    task: str
+    job_name: str = Field(unique=True)
+    model: str
+    state: str = Field(default="running", index=True)
+    article_ids_json: str
+    interests_hash: str | None = Field(default=None)
+    lease_owner: str
+    error: str | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.now)
+    completed_at: datetime | None = Field(default=None)
+
+
+class PrefilterRule(SQLModel, table=True):
+    """User-defined rule that blocks matching articles before any LLM call.
+
+    See backend.prefilter.
+    """
+
+    __tablename__ = "prefilter_rules"  # pyright: ignore[reportAssignmentType]
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str
+    # "feed" blocks the whole of feed_id; "url", "title", "content" and
+    # "author" match pattern, anywhere or only within feed_id if it is set
+    target: str
+    pattern: str = Field(default="")
+    is_regex: bool = Field(default=False)
+    feed_id: int | None = Field(
+        default=None, foreign_key="feeds.id", ondelete="CASCADE", index=True
+    )
+    enabled: bool = Field(default=True)
+    hit_count: int = Field(default=0)
+    last_hit_at: datetime | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
@@ -176,3 +176,25 @@ async def delete_model(host: str, model: str) -> dict:
     client = _get_ollama_client(host)
     await client.delete(model)  # pyright: ignore[reportAttributeAccessIssue]
     return {"status": "success"}
+
+
+async def load_model(host: str, model: str, keep_alive: str, options: dict) -> None:
+    """Load a model into memory without generating anything.
+
+    Args:
+        host: Ollama server URL
+        model: Model name to load
+        keep_alive: How long Ollama should keep the model loaded afterwards
+        options: Runtime options; must match those of later chat requests,
+            since a different num_ctx reloads the model
+    """
+    client = _get_ollama_client(host)
+    await client.generate(  # pyright: ignore[reportAttributeAccessIssue]
+        model=model, prompt="", keep_alive=keep_alive, options=options
+    )
+
+
+async def unload_model(host: str, model: str) -> None:
+    """Evict a model from memory right away."""
+    client = _get_ollama_client(host)
+    await client.generate(model=model, prompt="", keep_alive=0)  # pyright: ignore[reportAttributeAccessIssue]
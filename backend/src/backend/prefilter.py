@@ -0,0 +1,173 @@
+"""User-defined pre-filter rules, applied when articles are saved.
+
+Category blocking only takes effect after an LLM call has categorized the
+article. Pre-filter rules block what is known to be unwanted up front: every
+article of a feed, or articles whose URL, title, content or author matches a
+keyword or regular expression, optionally only within one feed. A matching
+article is saved already scored as blocked (score_reasoning "Blocked: rule
+...", category_source "rule") and is never queued for the LLM. Rules apply
+to articles saved after they are created.
+
+All enabled rules are compiled into one matcher: per target, and per feed
+for feed-scoped rules, a single alternation in which each rule is a named
+group. Checking an article costs at most two regex searches per target
+however many rules there are. The matcher is rebuilt when the rules change.
+"""
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, col, func, select
+
+from backend.metrics import ARTICLES_PREFILTERED
+from backend.models import CATEGORY_SOURCE_RULE, Article, PrefilterRule
+
+logger = logging.getLogger(__name__)
+
+TARGET_FEED = "feed"
+PATTERN_TARGETS = ("url", "title", "content", "author")
+
+# Numbered or named backreferences would point at the wrong group once the
+# pattern is part of the combined alternation
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def rule_regex(target: str, pattern: str, is_regex: bool) -> str:
+    """The regular expression a rule's pattern stands for.
+
+    Keywords match case-insensitively: anywhere in URLs, as whole words
+    elsewhere. Raises ValueError for a pattern the matcher cannot use.
+    """
+    if not pattern.strip():
+        raise ValueError("Pattern is required")
+    if not is_regex:
+        keyword = re.escape(pattern.strip())
+        return keyword if target == "url" else rf"(?<!\w){keyword}(?!\w)"
+    if _BACKREFERENCE_RE.search(pattern):
+        raise ValueError("Backreferences are not supported")
+    try:
+        compiled = re.compile(f"(?:{pattern})", re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression: {e}") from e
+    if compiled.groupindex:
+        raise ValueError("Named groups are not supported")
+    return pattern
+
+
+def _article_text(article: Article, target: str) -> str | None:
+    if target == "url":
+        return article.url
+    if target == "title":
+        return article.title
+    if target == "author":
+        return article.author
+    return article.content_markdown or article.content or article.summary
+
+
+class PrefilterMatcher:
+    """All enabled rules, compiled for matching."""
+
+    def __init__(self, rules: Iterable[PrefilterRule]) -> None:
+        self.names: dict[int, str] = {}
+        self._blocked_feeds: dict[int, int] = {}  # feed ID -> rule ID
+        alternatives: dict[tuple[int | None, str], list[str]] = {}
+        for rule in rules:
+            if rule.target == TARGET_FEED:
+                if rule.feed_id is not None:
+                    self._blocked_feeds.setdefault(rule.feed_id, rule.id)  # pyright: ignore[reportArgumentType]
+                    self.names[rule.id] = rule.name  # pyright: ignore[reportArgumentType]
+                continue
+            try:
+                regex = rule_regex(rule.target, rule.pattern, rule.is_regex)
+            except ValueError as e:
+                logger.warning("Skipping pre-filter rule %s: %s", rule.id, e)
+                continue
+            alternatives.setdefault((rule.feed_id, rule.target), []).append(
+                f"(?P<r{rule.id}>{regex})"
+            )
+            self.names[rule.id] = rule.name  # pyright: ignore[reportArgumentType]
+        self._patterns = {
+            key: re.compile("|".join(parts), re.IGNORECASE)
+            for key, parts in alternatives.items()
+        }
+        self._targets = [
+            target
+            for target in PATTERN_TARGETS
+            if any(key[1] == target for key in self._patterns)
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.names)
+
+    def match(self, article: Article) -> int | None:
+        """ID of a rule blocking the article, if any."""
+        rule_id = self._blocked_feeds.get(article.feed_id)
+        if rule_id is not None:
+            return rule_id
+        for target in self._targets:
+            text = _article_text(article, target)
+            if not text:
+                continue
+            for scope in (None, article.feed_id):
+                pattern = self._patterns.get((scope, target))
+                found = pattern.search(text) if pattern else None
+                if found:
+                    # The rule's group closes last, so it is the lastgroup
+                    return int(found.lastgroup[1:])  # pyright: ignore[reportOptionalSubscript]
+        return None
+
+
+_matcher: tuple[tuple, PrefilterMatcher] | None = None
+
+
+def get_matcher(session: Session) -> PrefilterMatcher:
+    """The matcher for the current rules, rebuilt whenever they change."""
+    global _matcher
+    # Adding, deleting (also by feed deletion) and editing a rule all change
+    # this; hit counts do not
+    stamp = tuple(
+        session.exec(
+            select(
+                func.count(col(PrefilterRule.id)),
+                func.max(PrefilterRule.id),
+                func.max(PrefilterRule.updated_at),
+            )
+        ).one()
+    )
+    if _matcher is None or _matcher[0] != stamp:
+        rules = session.exec(
+            select(PrefilterRule)
+            .where(col(PrefilterRule.enabled))
+            .order_by(col(PrefilterRule.id))
+        ).all()
+        _matcher = (stamp, PrefilterMatcher(rules))
+    return _matcher[1]
+
+
+def block(article: Article, rule_name: str) -> None:
+    """Store the article as scored and blocked by a rule."""
+    article.categorization_state = "categorized"
+    article.category_source = CATEGORY_SOURCE_RULE
+    article.scoring_state = "scored"
+    article.interest_score = 0
+    article.quality_score = 0
+    article.composite_score = 0.0
+    article.score_reasoning = f"Blocked: rule '{rule_name}'"
+    article.score_tier = None
+    article.scored_at = datetime.now()
+
+
+def record_hits(session: Session, hits: Counter[int]) -> None:
+    """Add to the rules' hit counts. Does not commit."""
+    now = datetime.now()
+    for rule_id, count in hits.items():
+        session.exec(  # pyright: ignore[reportCallIssue]
+            update(PrefilterRule)
+            .where(col(PrefilterRule.id) == rule_id)
+            .values(hit_count=PrefilterRule.hit_count + count, last_hit_at=now)
+        )
+    ARTICLES_PREFILTERED.inc(sum(hits.values()))
@@ -0,0 +1,482 @@
+"""Local pre-scorer trained on past LLM scores.
+
+Most new articles resemble ones the LLM has already scored: same feeds, same
+topics, same kind of writing. A linear model over hashed TF-IDF features of
+the title, body, feed and categories predicts interest and quality instantly,
+and the scoring worker only sends the articles it is unsure about to the LLM.
+
+Each score has a second linear head that predicts the absolute error the
+first will make on that article, trained on progressive-validation residuals
+(the error before the example is learned). Treating the error as Laplace
+distributed turns it into a confidence: the chance the LLM's score would be
+within one point. Articles whose interest and quality confidence both reach
+PIPELINE__PRESCORER_MIN_CONFIDENCE are scored locally (score_tier "local").
+
+Training is online AdaGrad, so each run only reads articles scored since the
+previous one. It runs in a background process on a schedule, since a pass
+over tens of thousands of articles would stall the event loop, and writes
+the model next to the database. Articles whose ID is divisible by
+HOLDOUT_MODULUS are never trained on; every run ends with an accuracy report
+against them. The model starts over when the interests change, since older
+scores reflect the previous ones.
+
+Pure Python: the features are sparse (a few hundred per article), so plain
+arrays keep training fast enough without a numeric dependency.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+import re
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, col, select
+
+from backend import llm_cache
+from backend.category_catalog import CatalogCategory, get_catalog
+from backend.config import get_settings
+from backend.metrics import PRESCORER_ARTICLES
+from backend.models import Article, ArticleCategoryLink, UserPreferences
+from backend.prompts import ArticleScoringResult
+
+logger = logging.getLogger(__name__)
+
+HASH_BITS = 17
+_BUCKETS = 1 << HASH_BITS
+_BIAS = _BUCKETS  # index of the bias weight, after the hashed features
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+# Article text beyond this many characters adds little signal
+_CONTENT_CHARS = 4000
+
+# Articles with id % HOLDOUT_MODULUS == 0 are only used for evaluation
+HOLDOUT_MODULUS = 10
+_HOLDOUT_LIMIT = 2000
+_TRAIN_CHUNK = 2000
+
+_LEARNING_RATE = 0.5
+_L2 = 1e-6
+_SCORE_PRIOR = 5.0
+_ERROR_PRIOR = 2.0
+_SCORES = ("interest", "quality")
+_HEADS = (*_SCORES, *(f"{name}_error" for name in _SCORES))
+
+# Scores that came from an LLM (not from this model, not blocked)
+_LABEL_TIERS = ("small", "large")
+
+
+# Hashed word counts, and buckets of the feed and category tags
+type Features = tuple[Counter[int], list[int]]
+
+
+@dataclass(frozen=True)
+class Prescore:
+    interest_score: int
+    quality_score: int
+    confidence: float
+
+
+def _bucket(token: str) -> int:
+    return zlib.crc32(token.encode()) & (_BUCKETS - 1)
+
+
+def _features(
+    title: str | None,
+    content: str | None,
+    feed_id: int | None,
+    category_slugs: Iterable[str],
+) -> Features:
+    """Hashed word counts (title words kept apart from body words), and the
+    buckets of the feed and categories."""
+    words = [f"t:{word}" for word in _WORD_RE.findall((title or "").lower())]
+    words.extend(_WORD_RE.findall((content or "")[:_CONTENT_CHARS].lower()))
+    tags = [f"f:{feed_id}", *(f"c:{slug}" for slug in category_slugs)]
+    return Counter(_bucket(word) for word in words), [_bucket(tag) for tag in tags]
+
+
+def _within_one(expected_error: float) -> float:
+    """P(|error| <= 1) for a Laplace error with this mean absolute value."""
+    return 1.0 - math.exp(-1.0 / max(expected_error, 1e-6))
+
+
+def _clamp_score(value: float) -> int:
+    return min(10, max(0, round(value)))
+
+
+@dataclass
+class PrescorerModel:
+    """Weights and training state; pickled to disk between runs."""
+
+    interests_digest: str | None
+    labels_since: datetime | None
+    weights: dict[str, array] = field(
+        default_factory=lambda: {
+            h: array("d", bytes(8 * (_BUCKETS + 1))) for h in _HEADS
+        }
+    )
+    sq_grads: dict[str, array] = field(
+        default_factory=lambda: {
+            h: array("d", bytes(8 * (_BUCKETS + 1))) for h in _HEADS
+        }
+    )
+    doc_freq: array = field(default_factory=lambda: array("q", bytes(8 * _BUCKETS)))
+    documents: int = 0
+    trained: int = 0
+    # (scored_at, id) of the last article learned, to resume from
+    watermark: tuple[datetime, int] | None = None
+    report: dict | None = None
+
+    def _vector(self, features: Features) -> list[tuple[int, float]]:
+        """Sublinear TF-IDF of the words, L2-normalized, then the tags and the
+        bias at full weight, so a long body does not drown out its feed."""
+        counts, tags = features
+        vector = [
+            (
+                bucket,
+                (1.0 + math.log(count))
+                * (math.log((1 + self.documents) / (1 + self.doc_freq[bucket])) + 1.0),
+            )
+            for bucket, count in counts.items()
+        ]
+        norm = math.sqrt(sum(value * value for _, value in vector)) or 1.0
+        return [
+            *((bucket, value / norm) for bucket, value in vector),
+            *((bucket, 1.0) for bucket in tags),
+            (_BIAS, 1.0),
+        ]
+
+    def _dot(self, head: str, vector: list[tuple[int, float]]) -> float:
+        weights = self.weights[head]
+        return sum(weights[bucket] * value for bucket, value in vector)
+
+    def _step(self, head: str, vector: list[tuple[int, float]], error: float) -> None:
+        weights = self.weights[head]
+        sq_grads = self.sq_grads[head]
+        for bucket, value in vector:
+            grad = error * value + _L2 * weights[bucket]
+            sq_grads[bucket] += grad * grad
+            weights[bucket] -= (
+                _LEARNING_RATE * grad / (math.sqrt(sq_grads[bucket]) + 1e-8)
+            )
+
+    def _predict(self, vector: list[tuple[int, float]]) -> dict[str, float]:
+        return {
+            head: (_ERROR_PRIOR if head.endswith("_error") else _SCORE_PRIOR)
+            + self._dot(head, vector)
+            for head in _HEADS
+        }
+
+    def predict(self, features: Features) -> Prescore:
+        heads = self._predict(self._vector(features))
+        return Prescore(
+            interest_score=_clamp_score(heads["interest"]),
+            quality_score=_clamp_score(heads["quality"]),
+            confidence=min(_within_one(heads[f"{name}_error"]) for name in _SCORES),
+        )
+
+    def learn(self, features: Features, interest: int, quality: int) -> None:
+        for bucket in features[0]:
+            self.doc_freq[bucket] += 1
+        self.documents += 1
+        vector = self._vector(features)
+        heads = self._predict(vector)
+        for name, target in (("interest", interest), ("quality", quality)):
+            residual = heads[name] - target
+            self._step(name, vector, residual)
+            error_head = f"{name}_error"
+            self._step(error_head, vector, heads[error_head] - abs(residual))
+        self.trained += 1
+
+
+def _labelled(labels_since: datetime | None):
+    """Filter for articles carrying a usable LLM score."""
+    conditions = [
+        Article.scoring_state == "scored",
+        col(Article.score_tier).in_(_LABEL_TIERS),
+        col(Article.interest_score).is_not(None),
+        col(Article.quality_score).is_not(None),
+        col(Article.scored_at).is_not(None),
+    ]
+    if labels_since is not None:
+        conditions.append(col(Article.scored_at) >= labels_since)
+    return and_(*conditions)
+
+
+_LABEL_COLUMNS = (
+    Article.id,
+    Article.feed_id,
+    Article.title,
+    Article.content_markdown,
+    Article.interest_score,
+    Article.quality_score,
+    Article.scored_at,
+)
+
+
+def _category_slugs(session: Session, article_ids: list[int]) -> dict[int, list[str]]:
+    catalog = get_catalog(session)
+    slugs: dict[int, list[str]] = {aid: [] for aid in article_ids}
+    for aid, category_id in session.exec(
+        select(ArticleCategoryLink.article_id, ArticleCategoryLink.category_id).where(
+            col(ArticleCategoryLink.article_id).in_(article_ids)
+        )
+    ).all():
+        if category_id in catalog.by_id:
+            slugs[aid].append(catalog.by_id[category_id].slug)
+    return slugs
+
+
+def train(session: Session, model: PrescorerModel | None) -> PrescorerModel:
+    """Learn from articles scored since the model's watermark, then report.
+
+    Starts a new model when there is none or the interests have changed.
+    """
+    preferences = session.exec(select(UserPreferences)).first()
+    digest = llm_cache.interests_hash(
+        preferences.interests if preferences else "",
+        preferences.anti_interests if preferences else "",
+    )
+    if model is None or model.interests_digest != digest:
+        model = PrescorerModel(
+            interests_digest=digest,
+            labels_since=preferences.updated_at if preferences else None,
+        )
+
+    while True:
+        query = (
+            select(*_LABEL_COLUMNS)
+            .where(_labelled(model.labels_since))
+            .where(col(Article.id) % HOLDOUT_MODULUS != 0)
+        )
+        if model.watermark is not None:
+            scored_at, last_id = model.watermark
+            query = query.where(
+                or_(
+                    col(Article.scored_at) > scored_at,
+                    and_(
+                        col(Article.scored_at) == scored_at, col(Article.id) > last_id
+                    ),
+                )
+            )
+        rows = session.exec(
+            query.order_by(col(Article.scored_at), col(Article.id)).limit(_TRAIN_CHUNK)
+        ).all()
+        if not rows:
+            break
+        slugs = _category_slugs(session, [row.id for row in rows])
+        for row in rows:
+            model.learn(
+                _features(row.title, row.content_markdown, row.feed_id, slugs[row.id]),
+                row.interest_score,
+                row.quality_score,
+            )
+        model.watermark = (rows[-1].scored_at, rows[-1].id)
+
+    model.report = evaluate(session, model)
+    return model
+
+
+def evaluate(session: Session, model: PrescorerModel) -> dict:
+    """Accuracy against the most recent held-out LLM scores."""
+    threshold = get_settings().pipeline.prescorer_min_confidence
+    rows = session.exec(
+        select(*_LABEL_COLUMNS)
+        .where(_labelled(model.labels_since))
+        .where(col(Article.id) % HOLDOUT_MODULUS == 0)
+        .order_by(col(Article.scored_at).desc())
+        .limit(_HOLDOUT_LIMIT)
+    ).all()
+    report: dict = {
+        "trained": model.trained,
+        "held_out": len(rows),
+        "min_confidence": threshold,
+        "evaluated_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    if not rows:
+        return report
+
+    slugs = _category_slugs(session, [row.id for row in rows])
+    pairs = [
+        (
+            model.predict(
+                _features(row.title, row.content_markdown, row.feed_id, slugs[row.id])
+            ),
+            row,
+        )
+        for row in rows
+    ]
+    confident = [(p, row) for p, row in pairs if p.confidence >= threshold]
+
+    def interest_mae(items):
+        return sum(
+            abs(p.interest_score - row.interest_score) for p, row in items
+        ) / len(items)
+
+    def interest_within_one(items):
+        return sum(
+            abs(p.interest_score - row.interest_score) <= 1 for p, row in items
+        ) / len(items)
+
+    report.update(
+        interest_mae=round(interest_mae(pairs), 3),
+        quality_mae=round(
+            sum(abs(p.quality_score - row.quality_score) for p, row in pairs)
+            / len(pairs),
+            3,
+        ),
+        interest_within_one=round(interest_within_one(pairs), 3),
+        confident_share=round(len(confident) / len(pairs), 3),
+        confident_interest_mae=round(interest_mae(confident), 3) if confident else None,
+        confident_interest_within_one=(
+            round(interest_within_one(confident), 3) if confident else None
+        ),
+    )
+    return report
+
+
+# --- Runtime ---------------------------------------------------------------
+
+_model: PrescorerModel | None = None
+_model_mtime: float | None = None
+_executor: ProcessPoolExecutor | None = None
+
+
+def model_path() -> str:
+    """The model file lives next to the database."""
+    database = os.path.abspath(get_settings().database.path)
+    return os.path.join(os.path.dirname(database), "prescorer.pkl")
+
+
+def read_model(path: str) -> PrescorerModel | None:
+    try:
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable pre-scorer model %s: %s", path, e)
+        return None
+    return model if isinstance(model, PrescorerModel) else None
+
+
+def write_model(model: PrescorerModel, path: str) -> None:
+    """Write atomically, so a reader never sees a half-written model."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _current_model() -> PrescorerModel | None:
+    """The trained model, reloaded whenever the training process rewrote it."""
+    global _model, _model_mtime
+    path = model_path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        _model, _model_mtime = None, None
+        return None
+    if mtime != _model_mtime:
+        _model, _model_mtime = read_model(path), mtime
+    return _model
+
+
+def _train_process(path: str) -> dict | None:
+    """Entry point of the training process."""
+    from backend.database import engine
+
+    with Session(engine) as session:
+        model = train(session, read_model(path))
+    write_model(model, path)
+    return model.report
+
+
+async def train_in_background() -> dict | None:
+    """Run an incremental training pass in a separate process."""
+    global _executor
+    if not get_settings().pipeline.prescorer_enabled:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+    loop = asyncio.get_running_loop()
+    report = await loop.run_in_executor(_executor, _train_process, model_path())
+    logger.info("Pre-scorer trained: %s", report)
+    return report
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def prescore(
+    articles: list[Article],
+    categories_by_article: dict[int, list[CatalogCategory]],
+    preferences: UserPreferences,
+) -> dict[int, ArticleScoringResult]:
+    """Scores for the articles the local model is confident about.
+
+    Returns nothing while disabled, before the model has seen
+    PIPELINE__PRESCORER_MIN_EXAMPLES scores, or while it was trained
+    under different interests.
+    """
+    settings = get_settings().pipeline
+    if not settings.prescorer_enabled or not articles:
+        return {}
+    model = _current_model()
+    if (
+        model is None
+        or model.trained < settings.prescorer_min_examples
+        or model.interests_digest
+        != llm_cache.interests_hash(preferences.interests, preferences.anti_interests)
+    ):
+        return {}
+
+    results: dict[int, ArticleScoringResult] = {}
+    for art in articles:
+        prediction = model.predict(
+            _features(
+                art.title,
+                art.content_markdown,
+                art.feed_id,
+                (c.slug for c in categories_by_article.get(art.id, [])),  # pyright: ignore[reportArgumentType]
+            )
+        )
+        if prediction.confidence < settings.prescorer_min_confidence:
+            continue
+        results[art.id] = ArticleScoringResult(  # pyright: ignore[reportArgumentType]
+            article_id=art.id,  # pyright: ignore[reportArgumentType]
+            interest_score=prediction.interest_score,
+            quality_score=prediction.quality_score,
+            reasoning=f"Local pre-score ({prediction.confidence:.0%} confidence)",
+        )
+    PRESCORER_ARTICLES.inc(len(results), outcome="kept")
+    PRESCORER_ARTICLES.inc(len(articles) - len(results), outcome="escalated")
+    return results
+
+
+def get_prescorer_stats() -> dict:
+    """Counters for /api/scoring/status."""
+    settings = get_settings().pipeline
+    model = _current_model() if settings.prescorer_enabled else None
+    return {
+        "enabled": settings.prescorer_enabled,
+        "min_confidence": settings.prescorer_min_confidence,
+        "trained": model.trained if model else 0,
+        "kept": int(PRESCORER_ARTICLES.value(outcome="kept")),
+        "escalated": int(PRESCORER_ARTICLES.value(outcome="escalated")),
+        "report": model.report if model else None,
+    }
@@ -4,6 +4,8 @@ Re-exports all public names for backward compatibility.
 """
 
 from backend.prompts.categorization import (
+    BATCH_CATEGORIZATION_INSTRUCTIONS,
+    CATEGORIZATION_PROMPT_VERSION,
     DEFAULT_CATEGORY_HIERARCHY,
     ArticleCategoryResult,
     BatchCategoryResponse,
@@ -11,12 +13,20 @@ from backend.prompts.categorization import (
     build_batch_categorization_prompt,
     build_categorization_prompt,
 )
+from backend.prompts.combined import (
+    BATCH_COMBINED_INSTRUCTIONS,
+    ArticleCombinedResult,
+    BatchCombinedResponse,
+    build_batch_combined_prompt,
+)
 from backend.prompts.grouping import (
     GroupingResponse,
     GroupSuggestion,
     build_grouping_prompt,
 )
 from backend.prompts.scoring import (
+    BATCH_SCORING_INSTRUCTIONS,
+    SCORING_PROMPT_VERSION,
     ArticleScoringResult,
     BatchScoringResponse,
     ScoringResponse,
@@ -26,15 +36,23 @@ from backend.prompts.scoring import (
 
 __all__ = [
     "ArticleCategoryResult",
+    "ArticleCombinedResult",
     "ArticleScoringResult",
+    "BATCH_CATEGORIZATION_INSTRUCTIONS",
+    "BATCH_COMBINED_INSTRUCTIONS",
+    "BATCH_SCORING_INSTRUCTIONS",
     "BatchCategoryResponse",
+    "BatchCombinedResponse",
     "BatchScoringResponse",
+    "CATEGORIZATION_PROMPT_VERSION",
     "CategoryResponse",
     "DEFAULT_CATEGORY_HIERARCHY",
     "GroupSuggestion",
     "GroupingResponse",
+    "SCORING_PROMPT_VERSION",
     "ScoringResponse",
     "build_batch_categorization_prompt",
+    "build_batch_combined_prompt",
     "build_batch_scoring_prompt",
     "build_categorization_prompt",
     "build_grouping_prompt",
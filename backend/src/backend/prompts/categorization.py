@@ -2,6 +2,10 @@
 
 from pydantic import BaseModel, Field
 
+# Bump whenever the categorization prompt or schema changes; part of the
+# LLM result cache key so stale results are never reused.
+CATEGORIZATION_PROMPT_VERSION = 2
+
 # Default category hierarchy for new installs (parent -> children)
 DEFAULT_CATEGORY_HIERARCHY: dict[str, list[str]] = {
     "Technology": ["Cybersecurity", "AI", "Programming"],
@@ -117,25 +121,34 @@ Categorize this article now."""
     return prompt
 
 
-def build_batch_categorization_prompt(
-    articles: list[dict],
+# Static instructions lead the batch system prompt so that every request
+# shares a byte-identical prefix; the category context follows in a fixed
+# order (categories, hierarchy, hidden) and the articles go in the user message.
+BATCH_CATEGORIZATION_INSTRUCTIONS = """Categorize articles into 1-4 topic categories each.
+
+**Rules (follow strictly):**
+1. ONLY categorize each article's PRIMARY topics — what the article is fundamentally about.
+2. IGNORE incidental mentions, anecdotes, metaphors, and examples used to illustrate a point.
+3. REUSE existing categories from the list below. Strongly prefer existing categories.
+4. Category names should be human-readable English (e.g., "Artificial Intelligence", "Web Development", "Open Source"). Do NOT use kebab-case, underscores, or slashes. Even if the article is in another language, always use English category names.
+5. Keep categories BROAD. Use "AI" not "AI-Assisted Programming" or "Generative AI". Use "Programming" not "Python Development".
+6. Only suggest a new category if NO existing category covers the article's primary topic AND the topic is likely to recur across many articles.
+7. Maximum 4 categories per article. Fewer is better.
+8. When suggesting a new category, suggest which existing parent it should belong under in the suggested_parent field.
+
+You will receive multiple articles wrapped in `<article>` tags. Return a JSON object with a `results` array. Each entry must include the `article_id` from the input."""
+
+
+def format_category_context(
     existing_categories: list[str],
     category_hierarchy: dict[str, list[str]] | None = None,
     hidden_categories: list[str] | None = None,
-) -> tuple[str, str]:
-    """Build system prompt and user message for batch categorization.
-
-    Args:
-        articles: List of dicts with keys: id, title, content_markdown
-        existing_categories: List of known categories to reuse
-        category_hierarchy: Optional parent->children hierarchy
-        hidden_categories: Optional list of hidden categories to avoid
+) -> str:
+    """Existing categories, hierarchy and hidden categories for a batch prompt.
 
-    Returns:
-        Tuple of (system_prompt, user_message)
+    Every list is sorted, so equal inputs give byte-identical text regardless
+    of the order they were passed in.
     """
-    from backend.prompts.content import CATEGORIZATION_MAX_CHARS, format_articles_block
-
     # Format existing categories
     categories_list = ", ".join(sorted(existing_categories))
 
@@ -145,7 +158,7 @@ def build_batch_categorization_prompt(
         hierarchy_lines = []
         for parent, children in sorted(category_hierarchy.items()):
             if children:
-                children_str = ", ".join(children)
+                children_str = ", ".join(sorted(children, key=str.lower))
                 hierarchy_lines.append(f"{parent} > {children_str}")
         if hierarchy_lines:
             hierarchy_section = (
@@ -159,24 +172,42 @@ def build_batch_categorization_prompt(
     if hidden_categories:
         hidden_section = (
             "\n\n**NEVER assign these categories or similar topics (they are blocked):**\n"
-            + ", ".join(hidden_categories)
+            + ", ".join(sorted(hidden_categories, key=str.lower))
         )
 
-    system_prompt = f"""Categorize articles into 1-4 topic categories each.
+    return (
+        f"**Existing categories:** {categories_list}{hierarchy_section}{hidden_section}"
+    )
+
 
-**Rules (follow strictly):**
-1. ONLY categorize each article's PRIMARY topics — what the article is fundamentally about.
-2. IGNORE incidental mentions, anecdotes, metaphors, and examples used to illustrate a point.
-3. REUSE existing categories from the list below. Strongly prefer existing categories.
-4. Category names should be human-readable English (e.g., "Artificial Intelligence", "Web Development", "Open Source"). Do NOT use kebab-case, underscores, or slashes. Even if the article is in another language, always use English category names.
-5. Keep categories BROAD. Use "AI" not "AI-Assisted Programming" or "Generative AI". Use "Programming" not "Python Development".
-6. Only suggest a new category if NO existing category covers the article's primary topic AND the topic is likely to recur across many articles.
-7. Maximum 4 categories per article. Fewer is better.
-8. When suggesting a new category, suggest which existing parent it should belong under in the suggested_parent field.
+def build_batch_categorization_prompt(
+    articles: list[dict],
+    existing_categories: list[str],
+    category_hierarchy: dict[str, list[str]] | None = None,
+    hidden_categories: list[str] | None = None,
+) -> tuple[str, str]:
+    """Build system prompt and user message for batch categorization.
 
-**Existing categories:** {categories_list}{hierarchy_section}{hidden_section}
+    The system prompt is BATCH_CATEGORIZATION_INSTRUCTIONS followed by the
+    category context (see format_category_context).
 
-You will receive multiple articles wrapped in `<article>` tags. Return a JSON object with a `results` array. Each entry must include the `article_id` from the input."""
+    Args:
+        articles: List of dicts with keys: id, title, content_markdown
+        existing_categories: List of known categories to reuse
+        category_hierarchy: Optional parent->children hierarchy
+        hidden_categories: Optional list of hidden categories to avoid
+
+    Returns:
+        Tuple of (system_prompt, user_message)
+    """
+    from backend.prompts.content import CATEGORIZATION_MAX_CHARS, format_articles_block
+
+    system_prompt = (
+        f"{BATCH_CATEGORIZATION_INSTRUCTIONS}\n\n"
+        + format_category_context(
+            existing_categories, category_hierarchy, hidden_categories
+        )
+    )
 
     user_message = format_articles_block(articles, max_chars=CATEGORIZATION_MAX_CHARS)
 
@@ -0,0 +1,124 @@
+"""LLM prompt template and response schema for combined categorize-and-score.
+
+One call returns what the categorization and scoring prompts return
+separately, so each article's content is sent (and paid for) once. Results
+are split back into the two task results and applied by the usual paths.
+"""
+
+from pydantic import BaseModel, Field
+
+from backend.prompts.categorization import (
+    ArticleCategoryResult,
+    format_category_context,
+)
+from backend.prompts.scoring import ArticleScoringResult
+
+
+class ArticleCombinedResult(BaseModel):
+    """Single article result within a batch categorize-and-score response."""
+
+    article_id: int
+    categories: list[str] = Field(max_length=4)
+    suggested_new: list[str] = Field(default_factory=list, max_length=2)
+    suggested_parent: str | None = None
+    interest_score: int = Field(ge=0, le=10)
+    quality_score: int = Field(ge=0, le=10)
+    reasoning: str
+
+    def categorization(self) -> ArticleCategoryResult:
+        return ArticleCategoryResult(
+            article_id=self.article_id,
+            categories=self.categories,
+            suggested_new=self.suggested_new,
+            suggested_parent=self.suggested_parent,
+        )
+
+    def scoring(self) -> ArticleScoringResult:
+        return ArticleScoringResult(
+            article_id=self.article_id,
+            interest_score=self.interest_score,
+            quality_score=self.quality_score,
+            reasoning=self.reasoning,
+        )
+
+
+class BatchCombinedResponse(BaseModel):
+    """Batch response containing combined results for multiple articles."""
+
+    results: list[ArticleCombinedResult]
+
+
+# Static instructions lead, then the preferences (stable until edited), then
+# the per-batch category shortlist, so consecutive requests share the
+# longest possible prefix.
+BATCH_COMBINED_INSTRUCTIONS = """Categorize articles into 1-4 topic categories each, then score them based on user preferences.
+
+**Categorization rules (follow strictly):**
+1. ONLY categorize each article's PRIMARY topics — what the article is fundamentally about.
+2. IGNORE incidental mentions, anecdotes, metaphors, and examples used to illustrate a point.
+3. REUSE existing categories from the list below. Strongly prefer existing categories.
+4. Category names should be human-readable English (e.g., "Artificial Intelligence", "Web Development", "Open Source"). Do NOT use kebab-case, underscores, or slashes. Even if the article is in another language, always use English category names.
+5. Keep categories BROAD. Use "AI" not "AI-Assisted Programming" or "Generative AI". Use "Programming" not "Python Development".
+6. Only suggest a new category if NO existing category covers the article's primary topic AND the topic is likely to recur across many articles.
+7. Maximum 4 categories per article. Fewer is better.
+8. When suggesting a new category, suggest which existing parent it should belong under in the suggested_parent field.
+
+**Scoring instructions:**
+- Interest Score (0-10): How well does this match the user's interests?
+  - 0-2: Strongly misaligned or explicitly avoided topic
+  - 3-4: Somewhat misaligned or low relevance
+  - 5-6: Neutral or moderate relevance
+  - 7-8: Good match with interests
+  - 9-10: Excellent match, highly relevant
+
+- Quality Score (0-10): Assess content quality regardless of interest
+  - 0-2: Clickbait, spam, or very low quality
+  - 3-4: Poor quality or shallow content
+  - 5-6: Average quality
+  - 7-8: Good quality, well-written
+  - 9-10: Excellent quality, insightful
+
+For each article provide its categories, an interest score (0-10), a quality score (0-10) and brief reasoning (1-2 sentences explaining the scores).
+
+You will receive multiple articles wrapped in `<article>` tags. Return a JSON object with a `results` array. Each entry must include the `article_id` from the input."""
+
+
+def build_batch_combined_prompt(
+    articles: list[dict],
+    existing_categories: list[str],
+    interests: str,
+    anti_interests: str,
+    category_hierarchy: dict[str, list[str]] | None = None,
+    hidden_categories: list[str] | None = None,
+) -> tuple[str, str]:
+    """Build system prompt and user message for batch categorize-and-score.
+
+    Articles are truncated to the scoring limit, since scoring needs more of
+    the content than categorization.
+
+    Args:
+        articles: List of dicts with keys: id, title, content_markdown
+        existing_categories: List of known categories to reuse
+        interests: User's interest preferences (prose)
+        anti_interests: User's anti-interest preferences (prose)
+        category_hierarchy: Optional parent->children hierarchy
+        hidden_categories: Optional list of hidden categories to avoid
+
+    Returns:
+        Tuple of (system_prompt, user_message)
+    """
+    from backend.prompts.content import SCORING_MAX_CHARS, format_articles_block
+
+    system_prompt = f"""{BATCH_COMBINED_INSTRUCTIONS}
+
+**User Interests:**
+{interests if interests else "Not specified"}
+
+**User Anti-Interests:**
+{anti_interests if anti_interests else "Not specified"}
+
+{format_category_context(existing_categories, category_hierarchy, hidden_categories)}"""
+
+    user_message = format_articles_block(articles, max_chars=SCORING_MAX_CHARS)
+
+    return system_prompt, user_message
@@ -2,6 +2,10 @@
 
 from pydantic import BaseModel, Field
 
+# Bump whenever the scoring prompt or schema changes; part of the
+# LLM result cache key so stale results are never reused.
+SCORING_PROMPT_VERSION = 2
+
 
 class ScoringResponse(BaseModel):
     """Response schema for article interest scoring."""
@@ -84,24 +88,10 @@ Score this article now."""
     return prompt
 
 
-def build_batch_scoring_prompt(
-    articles: list[dict],
-    interests: str,
-    anti_interests: str,
-) -> tuple[str, str]:
-    """Build system prompt and user message for batch scoring.
-
-    Args:
-        articles: List of dicts with keys: id, title, content_markdown
-        interests: User's interest preferences (prose)
-        anti_interests: User's anti-interest preferences (prose)
-
-    Returns:
-        Tuple of (system_prompt, user_message)
-    """
-    from backend.prompts.content import SCORING_MAX_CHARS, format_articles_block
-
-    system_prompt = f"""Score articles based on user preferences.
+# Static instructions lead the batch system prompt so that every request
+# shares a byte-identical prefix (reusable KV cache / context cache); the
+# user's preferences follow and the articles go in the user message.
+BATCH_SCORING_INSTRUCTIONS = """Score articles based on user preferences.
 
 **Scoring Instructions:**
 - Interest Score (0-10): How well does this match the user's interests?
@@ -123,13 +113,36 @@ For each article provide:
 2. Quality score (0-10)
 3. Brief reasoning (1-2 sentences explaining your scores)
 
+You will receive multiple articles wrapped in `<article>` tags. Return a JSON object with a `results` array. Each entry must include the `article_id` from the input."""
+
+
+def build_batch_scoring_prompt(
+    articles: list[dict],
+    interests: str,
+    anti_interests: str,
+) -> tuple[str, str]:
+    """Build system prompt and user message for batch scoring.
+
+    The system prompt is BATCH_SCORING_INSTRUCTIONS followed by the
+    preferences, so it is identical for every batch until they change.
+
+    Args:
+        articles: List of dicts with keys: id, title, content_markdown
+        interests: User's interest preferences (prose)
+        anti_interests: User's anti-interest preferences (prose)
+
+    Returns:
+        Tuple of (system_prompt, user_message)
+    """
+    from backend.prompts.content import SCORING_MAX_CHARS, format_articles_block
+
+    system_prompt = f"""{BATCH_SCORING_INSTRUCTIONS}
+
 **User Interests:**
 {interests if interests else "Not specified"}
 
 **User Anti-Interests:**
-{anti_interests if anti_interests else "Not specified"}
-
-You will receive multiple articles wrapped in `<article>` tags. Return a JSON object with a `results` array. Each entry must include the `article_id` from the input."""
+{anti_interests if anti_interests else "Not specified"}"""
 
     user_message = format_articles_block(articles, max_chars=SCORING_MAX_CHARS)
 
@@ -0,0 +1,177 @@
+"""Set-based composite score recomputation after category edits.
+
+Weight changes, hiding and reparenting only affect the category multiplier
+and blocked status of an article; the stored LLM interest/quality scores are
+still valid. Rather than re-running the LLM, affected articles are rescored
+in SQL using the same rules as ``compute_composite_score`` and ``is_blocked``
+in scoring.py, in chunked UPDATE ... FROM statements so the scoring workers
+can interleave their own writes between chunks.
+
+Articles blocked at categorization time were never sent to the LLM (their
+interest/quality scores are zero placeholders), so when such an article is
+no longer blocked it is re-queued for scoring instead, in the backlog lane
+like any other rescore.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import DateTime, Engine, bindparam, text
+from sqlmodel import Session, col, select
+
+from backend.leases import LANE_BACKLOG
+from backend.models import ArticleCategoryLink, Category
+from backend.scoring import MAX_COMPOSITE_SCORE
+
+logger = logging.getLogger(__name__)
+
+# Articles per UPDATE; each chunk is its own short write transaction
+RECOMPUTE_CHUNK_SIZE = 5000
+
+# Per-article category multiplier and blocked flag, mirroring
+# get_effective_weight / compute_composite_score / is_blocked. Written as a
+# FROM subquery rather than a leading WITH so the driver reports rowcounts.
+_ARTICLE_WEIGHTS_SQL = """
+SELECT a.id AS article_id,
+       COALESCE(AVG(linked.multiplier), 1.0) AS multiplier,
+       COALESCE(MAX(linked.blocked), 0) AS blocked
+FROM articles a
+LEFT JOIN (
+    SELECT l.article_id,
+           CASE COALESCE(c.weight, p.weight, 'normal')
+               WHEN 'block' THEN 0.0
+               WHEN 'reduce' THEN 0.5
+               WHEN 'boost' THEN 1.5
+               WHEN 'max' THEN 2.0
+               ELSE 1.0
+           END AS multiplier,
+           CASE
+               WHEN c.is_hidden OR COALESCE(c.weight, p.weight) = 'block' THEN 1
+               ELSE 0
+           END AS blocked
+    FROM article_category_link l
+    JOIN categories c ON c.id = l.category_id
+    LEFT JOIN categories p ON p.id = c.parent_id
+    WHERE l.article_id IN :ids
+) AS linked ON linked.article_id = a.id
+WHERE a.id IN :ids
+GROUP BY a.id
+"""
+
+_REQUEUE_UNBLOCKED_SQL = f"""
+UPDATE articles
+SET scoring_state = 'queued',
+    scoring_attempts = 0,
+    next_attempt_at = NULL,
+    queue_lane = :lane,
+    queued_at = :now
+FROM ({_ARTICLE_WEIGHTS_SQL}) AS weights
+WHERE articles.id = weights.article_id
+  AND weights.blocked = 0
+  AND articles.scoring_state = 'scored'
+  AND articles.interest_score = 0
+  AND articles.quality_score = 0
+  AND articles.score_reasoning LIKE 'Blocked:%'
+"""
+
+_UPDATE_COMPOSITE_SQL = f"""
+UPDATE articles
+SET composite_score = CASE
+    WHEN weights.blocked THEN 0.0
+    ELSE MIN(
+        :max_score,
+        articles.interest_score * weights.multiplier
+            * (0.5 + (articles.quality_score / 10.0) * 0.5)
+    )
+END
+FROM ({_ARTICLE_WEIGHTS_SQL}) AS weights
+WHERE articles.id = weights.article_id
+  AND articles.scoring_state = 'scored'
+  AND articles.interest_score IS NOT NULL
+  AND articles.quality_score IS NOT NULL
+"""
+
+
+@dataclass
+class RecomputeStats:
+    articles: int = 0
+    updated: int = 0
+    requeued: int = 0
+    elapsed: float = 0.0
+
+
+def with_children(session: Session, category_ids: Iterable[int]) -> set[int]:
+    """Category IDs plus their direct children (which may inherit weight)."""
+    ids = set(category_ids)
+    if not ids:
+        return ids
+    children = session.exec(
+        select(Category.id).where(col(Category.parent_id).in_(ids))
+    ).all()
+    return ids | {cid for cid in children if cid is not None}
+
+
+def affected_article_ids(session: Session, category_ids: Iterable[int]) -> list[int]:
+    """IDs of articles linked to the given categories or their children."""
+    ids = with_children(session, category_ids)
+    if not ids:
+        return []
+    return list(
+        session.exec(
+            select(ArticleCategoryLink.article_id)
+            .where(col(ArticleCategoryLink.category_id).in_(ids))
+            .distinct()
+            .order_by(col(ArticleCategoryLink.article_id))
+        ).all()
+    )
+
+
+def recompute_composite_scores(
+    bind: Engine,
+    article_ids: list[int],
+    chunk_size: int = RECOMPUTE_CHUNK_SIZE,
+) -> RecomputeStats:
+    """Recompute composite score and blocked status for the given articles.
+
+    Runs in its own sessions so it can be scheduled as a background task
+    after the request session is closed.
+    """
+    stats = RecomputeStats(articles=len(article_ids))
+    started = time.monotonic()
+    requeue = text(_REQUEUE_UNBLOCKED_SQL).bindparams(
+        bindparam("ids", expanding=True), bindparam("now", type_=DateTime)
+    )
+    update = text(_UPDATE_COMPOSITE_SQL).bindparams(bindparam("ids", expanding=True))
+
+    for start in range(0, len(article_ids), chunk_size):
+        chunk = article_ids[start : start + chunk_size]
+        with Session(bind) as session:
+            stats.requeued += session.execute(  # pyright: ignore[reportAttributeAccessIssue]
+                requeue, {"ids": chunk, "lane": LANE_BACKLOG, "now": datetime.now()}
+            ).rowcount
+            stats.updated += session.execute(  # pyright: ignore[reportAttributeAccessIssue]
+                update, {"ids": chunk, "max_score": MAX_COMPOSITE_SCORE}
+            ).rowcount
+            session.commit()
+
+    stats.elapsed = time.monotonic() - started
+    if stats.articles:
+        logger.info(
+            "Recomputed composite scores for %d articles in %.2fs "
+            "(%d updated, %d re-queued for scoring)",
+            stats.articles,
+            stats.elapsed,
+            stats.updated,
+            stats.requeued,
+        )
+    return stats
+
+
+def recompute_for_categories(bind: Engine, category_ids: list[int]) -> RecomputeStats:
+    """Background entry point: recompute articles affected by category edits."""
+    with Session(bind) as session:
+        article_ids = affected_article_ids(session, category_ids)
+    return recompute_composite_scores(bind, article_ids)
@@ -86,6 +86,7 @@ def _article_to_response(article: Article) -> ArticleResponse:
         quality_score=article.quality_score,
         composite_score=article.composite_score,
         score_reasoning=article.score_reasoning,
+        score_tier=article.score_tier,
         scoring_state=display_state,
         scored_at=article.scored_at,
         re_evaluating=re_eval,
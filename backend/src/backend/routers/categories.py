@@ -1,6 +1,6 @@
 """Category CRUD, batch, merge, and auto-group endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from slugify import slugify
 from sqlmodel import Session, func, select
 
@@ -8,6 +8,11 @@ from backend.database import smart_case
 from backend.deps import get_session, resolve_task_runtime
 from backend.llm_providers.registry import get_provider
 from backend.models import ArticleCategoryLink, Category
+from backend.recompute import (
+    affected_article_ids,
+    recompute_composite_scores,
+    recompute_for_categories,
+)
 from backend.schemas import (
     AutoGroupApplyRequest,
     AutoGroupApplyResponse,
@@ -164,6 +169,7 @@ def mark_seen(
 @router.post("/merge")
 def merge_categories(
     body: CategoryMerge,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Merge source category into target. Moves article associations, reparents children, deletes source."""
@@ -211,6 +217,9 @@ def merge_categories(
 
     session.delete(source)
     session.commit()
+    background_tasks.add_task(
+        recompute_for_categories, session.get_bind(), [body.target_id]
+    )
 
     return {"ok": True, "articles_moved": articles_moved}
 
@@ -218,6 +227,7 @@ def merge_categories(
 @router.post("/batch-move")
 def batch_move_categories(
     body: CategoryBatchMove,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Move multiple categories to a new parent, or ungroup them (target_parent_id=-1)."""
@@ -263,6 +273,9 @@ def batch_move_categories(
             updated += 1
 
     session.commit()
+    background_tasks.add_task(
+        recompute_for_categories, session.get_bind(), body.category_ids
+    )
     return {"ok": True, "updated": updated}
 
 
@@ -340,6 +353,7 @@ async def auto_group_suggest(
 @router.post("/auto-group/apply", response_model=AutoGroupApplyResponse)
 def auto_group_apply(
     body: AutoGroupApplyRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Apply confirmed groupings: flatten existing groups, then apply new ones."""
@@ -347,6 +361,7 @@ def auto_group_apply(
     children_with_parents = session.exec(
         select(Category).where(Category.parent_id.isnot(None))  # type: ignore[union-attr]
     ).all()
+    reparented: set[int] = {c.id for c in children_with_parents}  # pyright: ignore[reportAssignmentType]
     for child in children_with_parents:
         # Inherit parent weight if child has no explicit weight
         if child.weight is None and child.parent_id is not None:
@@ -384,6 +399,7 @@ def auto_group_apply(
                 continue
             child_cat.parent_id = parent_cat.id
             session.add(child_cat)
+            reparented.add(child_cat.id)  # pyright: ignore[reportArgumentType]
             assigned_slugs.add(child_slug)
             moved_in_group += 1
 
@@ -392,6 +408,9 @@ def auto_group_apply(
             categories_moved += moved_in_group
 
     session.commit()
+    background_tasks.add_task(
+        recompute_for_categories, session.get_bind(), sorted(reparented)
+    )
     return AutoGroupApplyResponse(
         ok=True,
         groups_applied=groups_applied,
@@ -402,6 +421,7 @@ def auto_group_apply(
 @router.post("/batch-hide")
 def batch_hide_categories(
     body: CategoryBatchAction,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Hide multiple categories. Sets is_hidden=True and clears parent_id."""
@@ -416,17 +436,24 @@ def batch_hide_categories(
         updated += 1
 
     session.commit()
+    background_tasks.add_task(
+        recompute_for_categories, session.get_bind(), body.category_ids
+    )
     return {"ok": True, "updated": updated}
 
 
 @router.post("/batch-delete")
 def batch_delete_categories(
     body: CategoryBatchAction,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Delete multiple categories. Releases children to root, deletes article links."""
     from sqlalchemy import delete as sa_delete
 
+    # Collect before links are deleted; these articles lose a category
+    article_ids = affected_article_ids(session, body.category_ids)
+
     deleted = 0
     for cat_id in body.category_ids:
         category = session.get(Category, cat_id)
@@ -449,6 +476,9 @@ def batch_delete_categories(
         deleted += 1
 
     session.commit()
+    background_tasks.add_task(
+        recompute_composite_scores, session.get_bind(), article_ids
+    )
     return {"ok": True, "deleted": deleted}
 
 
@@ -456,12 +486,16 @@ def batch_delete_categories(
 def update_category(
     category_id: int,
     body: CategoryUpdate,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Update a category (rename, reparent, weight change, hide/unhide, etc.)."""
     category = session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
+    previous_weight = category.weight
+    previous_parent_id = category.parent_id
+    previous_hidden = category.is_hidden
 
     if body.display_name is not None:
         new_slug = slugify(body.display_name)
@@ -524,16 +558,28 @@ def update_category(
     if body.is_seen is not None:
         category.is_seen = body.is_seen
 
+    scoring_inputs_changed = (
+        category.weight,
+        category.parent_id,
+        category.is_hidden,
+    ) != (previous_weight, previous_parent_id, previous_hidden)
+
     session.add(category)
     session.commit()
     session.refresh(category)
 
+    if scoring_inputs_changed:
+        background_tasks.add_task(
+            recompute_for_categories, session.get_bind(), [category_id]
+        )
+
     return _category_to_response(session, category)
 
 
 @router.delete("/{category_id}")
 def delete_category(
     category_id: int,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Delete a category. Children are released to root."""
@@ -541,6 +587,9 @@ def delete_category(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
+    # Collect before links are deleted; these articles lose a category
+    article_ids = affected_article_ids(session, [category_id])
+
     children = session.exec(
         select(Category).where(Category.parent_id == category_id)
     ).all()
@@ -558,6 +607,9 @@ def delete_category(
 
     session.delete(category)
     session.commit()
+    background_tasks.add_task(
+        recompute_composite_scores, session.get_bind(), article_ids
+    )
 
     return {"ok": True}
 
@@ -565,6 +617,7 @@ def delete_category(
 @router.post("/{category_id}/ungroup")
 def ungroup_parent(
     category_id: int,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ):
     """Ungroup a parent category: release all children to root, preserving inherited weights."""
@@ -583,4 +636,9 @@ def ungroup_parent(
         session.add(child)
 
     session.commit()
+    background_tasks.add_task(
+        recompute_for_categories,
+        session.get_bind(),
+        [c.id for c in children],
+    )
     return {"ok": True, "children_ungrouped": len(children)}
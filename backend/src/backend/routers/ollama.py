@@ -46,6 +46,7 @@ class OllamaConfigUpdate(BaseModel):
     scoring_model: str | None
     use_separate_models: bool
     batch_size: int = Field(default=1, ge=1, le=50)
+    extra_endpoints: list[str] = []
 
 
 class OllamaConfigResponse(OllamaConfigUpdate):
@@ -114,6 +115,7 @@ def get_ollama_config(
         scoring_model=config.scoring_model,
         use_separate_models=config.use_separate_models,
         batch_size=config.batch_size,
+        extra_endpoints=config.extra_endpoints,
     )
 
 
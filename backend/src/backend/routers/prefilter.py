@@ -0,0 +1,93 @@
+"""Pre-filter rule CRUD endpoints."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session, col, select
+
+from backend.deps import get_session
+from backend.models import Feed, PrefilterRule
+from backend.prefilter import TARGET_FEED, rule_regex
+from backend.schemas import (
+    PrefilterRuleCreate,
+    PrefilterRuleResponse,
+    PrefilterRuleUpdate,
+)
+
+router = APIRouter(prefix="/api/prefilter-rules", tags=["prefilter-rules"])
+
+
+def _validate_rule(session: Session, rule: PrefilterRule) -> None:
+    rule.name = rule.name.strip()
+    if not rule.name:
+        raise HTTPException(status_code=400, detail="Rule name is required")
+    if rule.feed_id is not None and session.get(Feed, rule.feed_id) is None:
+        raise HTTPException(status_code=404, detail="Feed not found")
+    if rule.target == TARGET_FEED:
+        if rule.feed_id is None:
+            raise HTTPException(status_code=400, detail="A feed rule needs a feed_id")
+        return
+    try:
+        rule_regex(rule.target, rule.pattern, rule.is_regex)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get("", response_model=list[PrefilterRuleResponse])
+def list_prefilter_rules(session: Session = Depends(get_session)):
+    """List all pre-filter rules with their hit counts."""
+    return session.exec(select(PrefilterRule).order_by(col(PrefilterRule.id))).all()
+
+
+@router.post("", response_model=PrefilterRuleResponse, status_code=201)
+def create_prefilter_rule(
+    payload: PrefilterRuleCreate,
+    session: Session = Depends(get_session),
+):
+    """Create a rule; it applies to articles saved from now on."""
+    rule = PrefilterRule(**payload.model_dump())
+    _validate_rule(session, rule)
+    session.add(rule)
+    session.commit()
+    session.refresh(rule)
+    return rule
+
+
+@router.patch("/{rule_id}", response_model=PrefilterRuleResponse)
+def update_prefilter_rule(
+    rule_id: int,
+    payload: PrefilterRuleUpdate,
+    session: Session = Depends(get_session),
+):
+    """Update a rule; hit counts are kept."""
+    rule = session.get(PrefilterRule, rule_id)
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+
+    for field in payload.model_fields_set:
+        value = getattr(payload, field)
+        if value is None and field != "feed_id":
+            continue
+        setattr(rule, field, value)
+    _validate_rule(session, rule)
+    rule.updated_at = datetime.now()
+    session.add(rule)
+    session.commit()
+    session.refresh(rule)
+    return rule
+
+
+@router.delete("/{rule_id}")
+def delete_prefilter_rule(
+    rule_id: int,
+    session: Session = Depends(get_session),
+):
+    """Delete a rule. Articles it already blocked stay blocked."""
+    rule = session.get(PrefilterRule, rule_id)
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+
+    session.delete(rule)
+    session.commit()
+
+    return {"ok": True}
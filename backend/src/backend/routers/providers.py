@@ -18,6 +18,7 @@ from backend.deps import (
 from backend.llm_providers.ollama import (
     OLLAMA_PROVIDER,
     OllamaProviderConfig,
+    get_ollama_provider_config,
 )
 from backend.llm_providers.registry import get_provider
 from backend.models import LLMProviderConfig, LLMTaskRoute
@@ -43,6 +44,10 @@ def _save_ollama_config(
     body: dict,
 ) -> dict:
     """Validate and save Ollama provider config."""
+    # Keep stored extra endpoints when a client does not send the field
+    extra_endpoints = body.get(
+        "extra_endpoints", get_ollama_provider_config(session).extra_endpoints
+    )
     try:
         config = OllamaProviderConfig(
             base_url=body.get("base_url", ""),
@@ -52,6 +57,7 @@ def _save_ollama_config(
             use_separate_models=body.get("use_separate_models", False),
             thinking=False,
             batch_size=body.get("batch_size", 1),
+            extra_endpoints=extra_endpoints,
         )
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
@@ -88,6 +94,7 @@ def _save_ollama_config(
         "scoring_model": config.scoring_model,
         "use_separate_models": config.use_separate_models,
         "batch_size": config.batch_size,
+        "extra_endpoints": config.extra_endpoints,
     }
 
 
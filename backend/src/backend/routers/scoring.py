@@ -3,6 +3,8 @@
 from fastapi import APIRouter, Depends
 from sqlmodel import Session, func, select
 
+from backend.batch_jobs import get_batch_job_stats
+from backend.batch_sizing import get_batch_size_status
 from backend.deps import (
     TASK_CATEGORIZATION,
     TASK_SCORING,
@@ -10,7 +12,14 @@ from backend.deps import (
     format_readiness_reason,
     get_session,
 )
+from backend.embeddings import get_knn_stats
+from backend.fingerprint import get_near_duplicate_stats
+from backend.llm_cache import get_cache_stats
+from backend.llm_providers.ollama import endpoint_pool
+from backend.model_residency import get_residency_stats
 from backend.models import Article
+from backend.prescorer import get_prescorer_stats
+from backend.scoring_queue import get_cascade_stats
 
 router = APIRouter(prefix="/api/scoring", tags=["scoring"])
 
@@ -126,6 +135,7 @@ async def get_scoring_status(
         "rate_limit_retry_after": round(get_categorization_rate_limit_remaining())
         if is_categorization_rate_limited()
         else None,
+        "batch_size": get_batch_size_status(TASK_CATEGORIZATION),
     }
     counts["scoring_worker"] = {
         "ready": scoring_runtime.ready,
@@ -134,7 +144,16 @@ async def get_scoring_status(
         "rate_limit_retry_after": round(get_scoring_rate_limit_remaining())
         if is_scoring_rate_limited()
         else None,
+        "batch_size": get_batch_size_status(TASK_SCORING),
     }
+    counts["result_cache"] = get_cache_stats()
+    counts["near_duplicates"] = get_near_duplicate_stats()
+    counts["cascade"] = get_cascade_stats()
+    counts["prescorer"] = get_prescorer_stats()
+    counts["knn"] = get_knn_stats()
+    counts["model_residency"] = get_residency_stats()
+    counts["ollama_endpoints"] = endpoint_pool.snapshot()
+    counts["batch_jobs"] = get_batch_job_stats(session)
 
     # Overlay rate-limit state — takes precedence when providers are otherwise ready
     if counts["scoring_ready"] and (
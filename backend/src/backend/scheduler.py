@@ -1,14 +1,32 @@
 import asyncio
 import logging
+from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlmodel import Session, select
+from sqlmodel import Session, col, func, select
 
+from backend.batch_jobs import run_batch_jobs
+from backend.batch_sizing import resolve_batch_size
 from backend.config import get_settings
 from backend.database import engine
-from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, get_task_batch_size
+from backend.deps import (
+    TASK_CATEGORIZATION,
+    TASK_SCORING,
+    TaskName,
+    evaluate_task_readiness,
+    get_task_batch_size,
+    resolve_task_runtime,
+)
+from backend.embeddings import backfill as backfill_embedding_index
 from backend.feeds import refresh_feed
-from backend.models import Feed, UserPreferences
+from backend.leases import reap_expired_leases
+from backend.llm_providers.base import ProviderTaskConfig
+from backend.llm_providers.registry import get_provider
+from backend.metrics import QUEUE_DEPTH
+from backend.model_residency import prepare_pipeline
+from backend.models import Article, Feed, UserPreferences
+from backend.prescorer import shutdown as shutdown_prescorer
+from backend.prescorer import train_in_background
 from backend.scoring_queue import CategorizationWorker, ScoringWorker
 
 settings = get_settings()
@@ -16,6 +34,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FEED_REFRESH_INTERVAL = 1800  # seconds
 SCORING_INTERVAL_SECONDS = 30
+LEASE_REAP_INTERVAL_SECONDS = 60
+PRESCORER_TRAIN_INTERVAL_SECONDS = 3600
+EMBEDDING_BACKFILL_INTERVAL_SECONDS = 60
 
 scheduler = AsyncIOScheduler()
 categorization_worker = CategorizationWorker()
@@ -50,20 +71,81 @@ async def process_pipeline():
     if settings.scheduler.log_job_execution:
         logger.info("Running pipeline processor...")
 
+    with Session(engine) as session:
+        session.expire_on_commit = False
+        # Large backlogs on hosted providers go out as offline batch jobs
+        await run_batch_jobs(session)
+        plan = await prepare_pipeline(session)
+        _record_queue_depth(session)
+
+    if plan.categorize:
+        await _run_categorization()
+    if plan.score:
+        await _run_scoring()
+
+
+def _record_queue_depth(session: Session) -> None:
+    """Refresh the queue depth gauges so /metrics never has to query."""
+    for task, state_column, states in (
+        (
+            TASK_CATEGORIZATION,
+            Article.categorization_state,
+            ("uncategorized", "queued", "categorizing", "categorized", "failed"),
+        ),
+        (
+            TASK_SCORING,
+            Article.scoring_state,
+            ("unscored", "queued", "scoring", "scored", "failed"),
+        ),
+    ):
+        counts = dict(
+            session.exec(
+                select(state_column, func.count()).group_by(col(state_column))
+            ).all()
+        )
+        # Zero states that emptied since the last run instead of keeping stale values
+        for state in {*states, *counts}:
+            QUEUE_DEPTH.set(counts.get(state, 0), task=task, state=state)
+
+
+def _parallel_batches(task: TaskName) -> int:
+    """One concurrent batch per endpoint the task's requests are balanced across."""
+    with Session(engine) as session:
+        return len(resolve_task_runtime(session, task).endpoints or ()) or 1
+
+
+async def _run_categorization():
+    parallel = _parallel_batches(TASK_CATEGORIZATION)
+    await asyncio.gather(*(_categorize_batch() for _ in range(parallel)))
+
+
+async def _run_scoring():
+    parallel = _parallel_batches(TASK_SCORING)
+    await asyncio.gather(*(_score_batch() for _ in range(parallel)))
+
+
+async def _categorize_batch():
     with Session(engine) as session:
         session.expire_on_commit = False
         try:
-            cat_batch = get_task_batch_size(session, TASK_CATEGORIZATION)
+            cat_batch = resolve_batch_size(
+                TASK_CATEGORIZATION,
+                get_task_batch_size(session, TASK_CATEGORIZATION),
+            )
             await categorization_worker.process_next_batch(session, cat_batch)
         except asyncio.CancelledError:
             logger.info("Pipeline cancelled during categorization")
         except Exception as e:
             logger.error(f"Categorization failed: {e}")
 
+
+async def _score_batch():
     with Session(engine) as session:
         session.expire_on_commit = False
         try:
-            score_batch = get_task_batch_size(session, TASK_SCORING)
+            score_batch = resolve_batch_size(
+                TASK_SCORING, get_task_batch_size(session, TASK_SCORING)
+            )
             await scoring_worker.process_next_batch(session, score_batch)
         except asyncio.CancelledError:
             logger.info("Pipeline cancelled during scoring")
@@ -71,6 +153,41 @@ async def process_pipeline():
             logger.error(f"Scoring failed: {e}")
 
 
+def reap_leases():
+    """Background job: re-queue articles whose worker lease has expired."""
+    with engine.begin() as conn:
+        reap_expired_leases(conn)
+
+
+async def train_prescorer():
+    """Background job: retrain the local pre-scorer on new LLM scores."""
+    try:
+        await train_in_background()
+    except Exception as e:
+        logger.error(f"Pre-scorer training failed: {e}")
+
+
+async def backfill_embeddings():
+    """Background job: embed LLM-categorized articles from before the index."""
+    with Session(engine) as session:
+        try:
+            runtime = await evaluate_task_readiness(session, TASK_CATEGORIZATION)
+            if not runtime.ready:
+                return
+            config = ProviderTaskConfig(
+                endpoint=runtime.endpoint,
+                model=runtime.model,
+                thinking=runtime.thinking,
+                api_key=runtime.api_key,
+                endpoints=runtime.endpoints,
+            )
+            await backfill_embedding_index(
+                session, get_provider(runtime.provider), config
+            )
+        except Exception as e:
+            logger.error(f"Embedding backfill failed: {e}")
+
+
 def start_scheduler():
     """Start the background scheduler."""
     # Read feed refresh interval from DB
@@ -97,6 +214,33 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        reap_leases,
+        "interval",
+        seconds=LEASE_REAP_INTERVAL_SECONDS,
+        id="reap_leases",
+        replace_existing=True,
+    )
+
+    if settings.pipeline.prescorer_enabled:
+        scheduler.add_job(
+            train_prescorer,
+            "interval",
+            seconds=PRESCORER_TRAIN_INTERVAL_SECONDS,
+            id="train_prescorer",
+            replace_existing=True,
+            next_run_time=datetime.now(),
+        )
+
+    if settings.pipeline.embedding_model:
+        scheduler.add_job(
+            backfill_embeddings,
+            "interval",
+            seconds=EMBEDDING_BACKFILL_INTERVAL_SECONDS,
+            id="backfill_embeddings",
+            replace_existing=True,
+        )
+
     scheduler.start()
     logger.info(
         f"Scheduler started - feeds will refresh every {interval_seconds} seconds, "
@@ -115,4 +259,5 @@ def reschedule_feed_refresh(interval_seconds: int):
 def shutdown_scheduler():
     """Shutdown the scheduler."""
     scheduler.shutdown()
+    shutdown_prescorer()
     logger.info("Scheduler shut down")
@@ -1,6 +1,7 @@
 """Pydantic request/response models for all API endpoints."""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -71,6 +72,7 @@ class ArticleResponse(BaseModel):
     quality_score: int | None
     composite_score: float | None
     score_reasoning: str | None
+    score_tier: str | None = None
     scoring_state: str
     scored_at: datetime | None
     re_evaluating: bool = False
@@ -195,6 +197,45 @@ class CategoryBatchAction(BaseModel):
     category_ids: list[int]
 
 
+# --- Pre-filter rules ---
+
+type PrefilterTarget = Literal["feed", "url", "title", "content", "author"]
+
+
+class PrefilterRuleResponse(BaseModel):
+    """Pre-filter rule returned by API, with how many articles it blocked."""
+
+    id: int
+    name: str
+    target: PrefilterTarget
+    pattern: str
+    is_regex: bool
+    feed_id: int | None
+    enabled: bool
+    hit_count: int
+    last_hit_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class PrefilterRuleCreate(BaseModel):
+    name: str
+    target: PrefilterTarget
+    pattern: str = ""
+    is_regex: bool = False
+    feed_id: int | None = None
+    enabled: bool = True
+
+
+class PrefilterRuleUpdate(BaseModel):
+    name: str | None = None
+    target: PrefilterTarget | None = None
+    pattern: str | None = None
+    is_regex: bool | None = None
+    feed_id: int | None = None
+    enabled: bool | None = None
+
+
 # --- Providers ---
 
 
@@ -1,64 +1,107 @@
 """LLM-powered article scoring and categorization."""
 
+import itertools
 import logging
+from collections.abc import Sequence
+from contextvars import ContextVar
 
 from slugify import slugify
 from sqlmodel import Session, select
 
+from backend.category_catalog import CatalogCategory, get_catalog
 from backend.database import smart_case
+from backend.metrics import RATE_LIMIT_WAIT_SECONDS, RATE_LIMIT_WAITS
 from backend.models import Category
 
 logger = logging.getLogger(__name__)
 
 MAX_COMPOSITE_SCORE = 20.0
 
-# Ephemeral in-memory state for real-time phase tracking, per task.
+# Ephemeral in-memory state for real-time phase tracking, per task and per
+# running batch (the scheduler runs one batch per endpoint concurrently, each
+# in its own asyncio task, so a context variable tells them apart).
 # Safe in single-worker asyncio — no threading concerns.
-# Shape: {"article_id": int | None, "phase": str}
-_categorization_activity: dict = {"article_id": None, "phase": "idle"}
-_scoring_activity: dict = {"article_id": None, "phase": "idle"}
+# Shape: {batch number: {"article_id": int, "phase": str}}
+_categorization_batches: dict[int, dict] = {}
+_scoring_batches: dict[int, dict] = {}
+_current_categorization_batch: ContextVar[int | None] = ContextVar(
+    "current_categorization_batch", default=None
+)
+_current_scoring_batch: ContextVar[int | None] = ContextVar(
+    "current_scoring_batch", default=None
+)
+_batch_numbers = itertools.count(1)
 
 # Per-task rate-limit tracking: timestamp (time.time()) until which we're throttled.
 _categorization_rate_limited_until: float = 0.0
 _scoring_rate_limited_until: float = 0.0
 
 
+def _set_context(
+    batches: dict[int, dict], current: ContextVar[int | None], article_id: int | None
+) -> None:
+    """Start (article_id set) or end (None) the calling batch's activity."""
+    batch = current.get()
+    if article_id is None:
+        if batch is not None:
+            batches.pop(batch, None)
+            current.set(None)
+        return
+    if batch is None or batch not in batches:
+        batch = next(_batch_numbers)
+        current.set(batch)
+    batches[batch] = {"article_id": article_id, "phase": "starting"}
+
+
+def _set_phase(
+    batches: dict[int, dict], current: ContextVar[int | None], phase: str
+) -> None:
+    batch = current.get()
+    if batch in batches:
+        batches[batch]["phase"] = phase
+
+
+def _get_activity(batches: dict[int, dict]) -> dict:
+    """The most recently started running batch, or idle if none is running."""
+    if not batches:
+        return {"article_id": None, "phase": "idle"}
+    return batches[max(batches)].copy()
+
+
 # --- Categorization activity ---
 
 
 def set_categorization_context(article_id: int | None) -> None:
-    """Set the article currently being categorized."""
-    _categorization_activity["article_id"] = article_id
-    _categorization_activity["phase"] = "starting" if article_id else "idle"
+    """Set the article the calling batch is categorizing; None ends the batch."""
+    _set_context(_categorization_batches, _current_categorization_batch, article_id)
 
 
 def set_categorization_phase(phase: str) -> None:
-    """Set the current categorization phase without changing article_id."""
-    _categorization_activity["phase"] = phase
+    """Set the calling batch's categorization phase without changing article_id."""
+    _set_phase(_categorization_batches, _current_categorization_batch, phase)
 
 
 def get_categorization_activity() -> dict:
     """Get current categorization activity state."""
-    return _categorization_activity.copy()
+    return _get_activity(_categorization_batches)
 
 
 # --- Scoring activity ---
 
 
 def set_scoring_context(article_id: int | None) -> None:
-    """Set the article currently being scored. Called by scoring_queue."""
-    _scoring_activity["article_id"] = article_id
-    _scoring_activity["phase"] = "starting" if article_id else "idle"
+    """Set the article the calling batch is scoring. Called by scoring_queue."""
+    _set_context(_scoring_batches, _current_scoring_batch, article_id)
 
 
 def set_scoring_phase(phase: str) -> None:
-    """Set the current scoring phase without changing article_id."""
-    _scoring_activity["phase"] = phase
+    """Set the calling batch's scoring phase without changing article_id."""
+    _set_phase(_scoring_batches, _current_scoring_batch, phase)
 
 
 def get_scoring_activity() -> dict:
     """Get current scoring activity state. Called by API endpoint."""
-    return _scoring_activity.copy()
+    return _get_activity(_scoring_batches)
 
 
 # --- Categorization rate-limit ---
@@ -70,6 +113,8 @@ def set_categorization_rate_limited(retry_after_seconds: float) -> None:
 
     global _categorization_rate_limited_until
     _categorization_rate_limited_until = time.time() + retry_after_seconds
+    RATE_LIMIT_WAITS.inc(task="categorization")
+    RATE_LIMIT_WAIT_SECONDS.inc(retry_after_seconds, task="categorization")
 
 
 def is_categorization_rate_limited() -> bool:
@@ -95,6 +140,8 @@ def set_scoring_rate_limited(retry_after_seconds: float) -> None:
 
     global _scoring_rate_limited_until
     _scoring_rate_limited_until = time.time() + retry_after_seconds
+    RATE_LIMIT_WAITS.inc(task="scoring")
+    RATE_LIMIT_WAIT_SECONDS.inc(retry_after_seconds, task="scoring")
 
 
 def is_scoring_rate_limited() -> bool:
@@ -158,7 +205,7 @@ def get_or_create_category(
     return category
 
 
-def get_effective_weight(category: Category) -> str:
+def get_effective_weight(category: Category | CatalogCategory) -> str:
     """Resolve weight: explicit override > parent weight > 'normal'."""
     if category.weight is not None:
         return category.weight
@@ -171,7 +218,7 @@ def get_effective_weight(category: Category) -> str:
 def compute_composite_score(
     interest_score: int,
     quality_score: int,
-    categories: list[Category],
+    categories: Sequence[Category | CatalogCategory],
 ) -> float:
     """Compute final composite score from interest, quality, and category weights.
 
@@ -218,7 +265,7 @@ def compute_composite_score(
     return min(composite, MAX_COMPOSITE_SCORE)
 
 
-def is_blocked(categories: list[Category]) -> bool:
+def is_blocked(categories: Sequence[Category | CatalogCategory]) -> bool:
     """Check if any category is blocked or hidden.
 
     Args:
@@ -245,40 +292,13 @@ def get_active_categories(
 ) -> tuple[list[str], dict[str, list[str]] | None, list[str]]:
     """Get active (non-hidden) categories, hierarchy, and hidden category names.
 
+    Served from the in-memory category catalog; only queries when it is stale.
+
     Args:
         session: Database session
 
     Returns:
         Tuple of (sorted display name list, category hierarchy dict or None, sorted hidden names)
     """
-    # Query all non-hidden categories
-    categories = session.exec(
-        select(Category).where(Category.is_hidden == False)  # noqa: E712
-    ).all()
-
-    # Collect display names
-    display_names = sorted(
-        [cat.display_name for cat in categories],
-        key=str.lower,
-    )
-
-    # Build hierarchy from parent-child relationships
-    hierarchy: dict[str, list[str]] = {}
-    for cat in categories:
-        if cat.parent_id is not None and cat.parent is not None:
-            hierarchy.setdefault(cat.parent.display_name, []).append(cat.display_name)
-
-    # Sort children lists for consistency
-    for children in hierarchy.values():
-        children.sort(key=str.lower)
-
-    # Query hidden categories
-    hidden_categories = session.exec(
-        select(Category).where(Category.is_hidden == True)  # noqa: E712
-    ).all()
-    hidden_names = sorted(
-        [cat.display_name for cat in hidden_categories],
-        key=str.lower,
-    )
-
-    return display_names, hierarchy if hierarchy else None, hidden_names
+    catalog = get_catalog(session)
+    return catalog.active_names, catalog.hierarchy, catalog.hidden_names
@@ -1,23 +1,73 @@
 """Queue workers for categorization and scoring pipelines."""
 
 import asyncio
+import json
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Container, Mapping
+from dataclasses import replace
 from datetime import datetime, timedelta
 
+from pydantic import BaseModel
 from slugify import slugify
-from sqlmodel import Session, select
-
+from sqlalchemy import case, delete, insert, or_, update
+from sqlmodel import Session, col, select
+
+from backend import llm_cache
+from backend.batch_sizing import record_batch_failure, record_batch_success
+from backend.category_catalog import CatalogCategory, CategoryCatalog, get_catalog
+from backend.category_shortlist import shortlist_categories
+from backend.config import get_settings
 from backend.deps import (
     TASK_CATEGORIZATION,
     TASK_SCORING,
+    TaskRuntimeResolution,
     evaluate_task_readiness,
     format_readiness_reason,
 )
+from backend.embeddings import (
+    categorize_by_neighbours,
+    embed_articles,
+    index_vectors,
+)
+from backend.fingerprint import find_near_duplicate, record_inherited
+from backend.leases import LANE_BACKLOG, LANE_FRESH, LANE_INTERACTIVE, claim_batch
+from backend.llm_providers.base import (
+    CombinedTaskProvider,
+    LLMProvider,
+    LLMValidationError,
+    ProviderTaskConfig,
+)
 from backend.llm_providers.registry import get_provider
-from backend.models import Article, ArticleCategoryLink, Category, UserPreferences
+from backend.metrics import (
+    LLM_CASCADE_ARTICLES,
+    LLM_ISOLATED_ARTICLES,
+    LLM_ISOLATION_CALLS,
+)
+from backend.models import (
+    CATEGORY_SOURCE_DUPLICATE,
+    CATEGORY_SOURCE_KNN,
+    CATEGORY_SOURCE_LLM,
+    CATEGORY_SOURCE_RULE,
+    Article,
+    ArticleCategoryLink,
+    Category,
+    UserPreferences,
+)
+from backend.prescorer import prescore
+from backend.prompts import (
+    CATEGORIZATION_PROMPT_VERSION,
+    SCORING_PROMPT_VERSION,
+    ArticleCategoryResult,
+    ArticleCombinedResult,
+    ArticleScoringResult,
+    build_batch_categorization_prompt,
+    build_batch_scoring_prompt,
+)
+from backend.prompts.content import CATEGORIZATION_MAX_CHARS, SCORING_MAX_CHARS
 from backend.scoring import (
     compute_composite_score,
-    get_active_categories,
     get_or_create_category,
     is_blocked,
     is_categorization_rate_limited,
@@ -37,6 +87,11 @@ RESCORE_MAX_ARTICLES = 100
 MAX_TASK_RETRIES = 3
 _DEFAULT_RATE_LIMIT_BACKOFF = 60.0  # seconds
 
+# Article.score_tier: the local pre-scorer, the cascade's small model, or the
+# scoring route's model
+SCORE_TIER_LOCAL = "local"
+SCORE_TIER_SMALL = "small"
+SCORE_TIER_LARGE = "large"
 
 def _extract_rate_limit_delay(exc: Exception) -> float | None:
     """If exc is a transient server error (429/503), return retry-after seconds (or default)."""
@@ -53,26 +108,336 @@ def _extract_rate_limit_delay(exc: Exception) -> float | None:
     return _DEFAULT_RATE_LIMIT_BACKOFF
 
 
+def _result_cache_keys(
+    task: str,
+    runtime: TaskRuntimeResolution,
+    article_dicts: list[dict],
+    prompt_version: int,
+    max_chars: int,
+    interests_digest: str | None = None,
+) -> dict[int, str]:
+    """Map article ID -> LLM result cache key for the resolved task runtime."""
+    model = runtime.model or ""
+    if runtime.thinking:
+        model += "+thinking"
+    return {
+        a["id"]: llm_cache.cache_key(
+            task,
+            runtime.provider,
+            model,
+            prompt_version,
+            llm_cache.content_hash(a, max_chars),
+            interests_digest,
+        )
+        for a in article_dicts
+    }
+
+
+def _current_categorizations(
+    catalog: CategoryCatalog, cached: dict[int, ArticleCategoryResult]
+) -> dict[int, ArticleCategoryResult]:
+    """Restrict cached categorizations to categories that are still visible.
+
+    A cached answer may predate the user hiding or deleting a category;
+    applying it as is would unhide or recreate that category. Names that are
+    now hidden or missing are dropped, and a result left without any counts
+    as a cache miss.
+    """
+
+    def _visible(names: list[str]) -> list[str]:
+        entries = (catalog.by_slug.get(slugify(name)) for name in names)
+        return [e.display_name for e in entries if e is not None and not e.is_hidden]
+
+    current: dict[int, ArticleCategoryResult] = {}
+    for aid, result in cached.items():
+        categories = _visible(result.categories)
+        suggested = _visible(result.suggested_new)
+        if categories or suggested:
+            current[aid] = result.model_copy(
+                update={"categories": categories, "suggested_new": suggested}
+            )
+    return current
+
+
+def _load_cached_results[T: BaseModel](
+    session: Session, task: str, keys: dict[int, str], schema: type[T]
+) -> dict[int, T]:
+    """Fetch cached per-article results, re-keyed to the requesting article IDs."""
+    found = llm_cache.lookup(session, task, list(keys.values()))
+    results: dict[int, T] = {}
+    for aid, key in keys.items():
+        raw = found.get(key)
+        if raw is None:
+            continue
+        try:
+            results[aid] = schema.model_validate({**json.loads(raw), "article_id": aid})
+        except ValueError:
+            logger.warning("Ignoring unreadable %s cache entry %s", task, key)
+    return results
+
+
+def _store_results(
+    session: Session,
+    task: str,
+    keys: dict[int, str],
+    results: Mapping[int, BaseModel],
+) -> None:
+    """Cache fresh per-article results under their content-addressed keys."""
+    llm_cache.store(
+        session,
+        task,
+        {
+            keys[aid]: result.model_dump_json(exclude={"article_id"})
+            for aid, result in results.items()
+            if aid in keys
+        },
+    )
+
+
+def _article_dicts(articles: list[Article]) -> list[dict]:
+    """Prompt input for a batch: id, title and the best available text."""
+    return [
+        {
+            "id": art.id,
+            "title": art.title,
+            "content_markdown": art.content_markdown
+            or art.content
+            or art.summary
+            or "",
+        }
+        for art in articles
+    ]
+
+
+def _chunks(items: list[dict], size: int) -> list[list[dict]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt of an article that has failed `attempts`
+    times: doubling from the base delay up to the cap, with equal jitter so
+    articles that failed together do not come back together."""
+    settings = get_settings().pipeline
+    delay = min(
+        settings.retry_backoff_max_seconds,
+        settings.retry_backoff_seconds * 2 ** max(0, attempts - 1),
+    )
+    return timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))
+
+
+def _requeue_or_fail(session: Session, task: str, article_ids: list[int]) -> None:
+    """Count a failed attempt for each article, re-queueing it until it has
+    used MAX_TASK_RETRIES attempts. Re-queued articles are not claimed again
+    before their retry_delay has passed. Does not commit."""
+    if not article_ids:
+        return
+    if task == TASK_CATEGORIZATION:
+        state, attempts = Article.categorization_state, Article.categorization_attempts
+    else:
+        state, attempts = Article.scoring_state, Article.scoring_attempts
+    now = datetime.now()
+    due_at = {
+        aid: now + retry_delay(used + 1)
+        for aid, used in session.exec(
+            select(Article.id, attempts).where(col(Article.id).in_(article_ids))
+        ).all()
+    }
+    if not due_at:
+        return
+    session.exec(  # pyright: ignore[reportCallIssue]
+        update(Article)
+        .where(col(Article.id).in_(due_at))
+        .values(
+            {
+                attempts: attempts + 1,
+                state: case(
+                    (attempts + 1 >= MAX_TASK_RETRIES, "failed"), else_="queued"
+                ),
+                Article.next_attempt_at: case(due_at, value=Article.id),
+            }
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def _fail_isolated(session: Session, task: str, article_ids: list[int]) -> None:
+    """Mark articles that fail validation on their own as failed, without
+    spending their remaining attempts. Does not commit."""
+    if not article_ids:
+        return
+    if task == TASK_CATEGORIZATION:
+        values = {
+            "categorization_state": "failed",
+            "categorization_attempts": MAX_TASK_RETRIES,
+        }
+    else:
+        values = {"scoring_state": "failed", "scoring_attempts": MAX_TASK_RETRIES}
+    session.exec(  # pyright: ignore[reportCallIssue]
+        update(Article)
+        .where(col(Article.id).in_(article_ids))
+        .values(**values, next_attempt_at=None)
+        .execution_options(synchronize_session="fetch")
+    )
+    LLM_ISOLATED_ARTICLES.inc(len(article_ids), task=task)
+
+
+def _halves(items: list[dict]) -> list[list[dict]]:
+    middle = (len(items) + 1) // 2
+    return [items[:middle], items[middle:]]
+
+
+async def _call_isolating_failures[T: BaseModel](
+    task: str,
+    call: Callable[[list[dict]], Awaitable[list[T]]],
+    articles: list[dict],
+    finished: Container[int],
+    retried: bool,
+) -> tuple[list[T], list[int] | None]:
+    """Call the provider for a batch, bisecting it if it fails validation.
+
+    A batch of two or more articles whose output fails validation
+    deterministically, or after any of its articles already failed an
+    attempt, is retried in halves, and failing halves are split again
+    until single articles remain; one that still fails deterministically is
+    isolated, one with malformed output is re-queued like any missing
+    result. Articles in `finished` (already streamed) are left out of the
+    retries. Any other error stops the bisection and
+    leaves the rest without a result, to be re-queued as usual.
+
+    Returns:
+        The results from every successful call, and the IDs of isolated
+        articles, or None if the batch went through whole.
+
+    Raises:
+        The error of the whole batch if it is not worth bisecting.
+    """
+    try:
+        return await call(articles), None
+    except LLMValidationError as e:
+        if (
+            len(articles) < 2
+            or not get_settings().pipeline.bisect_failed_batches
+            or (e.is_retryable and not retried)
+        ):
+            raise
+        record_batch_failure(task, len(articles), e)
+        logger.warning(
+            "%s batch of %d failed validation; bisecting to isolate bad articles",
+            task.capitalize(),
+            len(articles),
+        )
+
+    results: list[T] = []
+    isolated: list[int] = []
+    # Halves are popped first-half first, so results keep the batch order
+    stack = _halves(articles)[::-1]
+    while stack:
+        batch = [a for a in stack.pop() if a["id"] not in finished]
+        if not batch:
+            continue
+        LLM_ISOLATION_CALLS.inc(task=task)
+        try:
+            results.extend(await call(batch))
+        except LLMValidationError as e:
+            if len(batch) > 1:
+                stack.extend(_halves(batch)[::-1])
+            elif not e.is_retryable:
+                logger.warning(
+                    "Article %s fails %s on its own; marking failed",
+                    batch[0]["id"],
+                    task,
+                )
+                isolated.append(batch[0]["id"])
+            # A lone article with malformed output keeps its normal retries
+        except Exception as e:
+            logger.warning("%s bisection stopped: %s", task.capitalize(), e)
+            break
+    return results, isolated
+
+
+def _split_combined(
+    result: ArticleCategoryResult | ArticleCombinedResult,
+    scores: dict[int, ArticleScoringResult],
+) -> ArticleCategoryResult:
+    """Set aside the score of a combined result and return its categories."""
+    if isinstance(result, ArticleCombinedResult):
+        scores[result.article_id] = result.scoring()
+        return result.categorization()
+    return result
+
+
+def _load_preferences(session: Session) -> UserPreferences:
+    preferences = session.exec(select(UserPreferences)).first()
+    if not preferences:
+        preferences = UserPreferences(interests="", anti_interests="")
+        session.add(preferences)
+        session.commit()
+    return preferences
+
+
+def _apply_scores(
+    session: Session,
+    results: list[tuple[Article, ArticleScoringResult]],
+    categories_by_article: dict[int, list[CatalogCategory]],
+    tier: str = SCORE_TIER_LARGE,
+) -> None:
+    """Persist scores for a set of articles. Does not commit; the changed
+    rows are flushed as a single executemany UPDATE."""
+    for art, scoring in results:
+        art.interest_score = scoring.interest_score
+        art.quality_score = scoring.quality_score
+        art.score_reasoning = scoring.reasoning
+        art.score_tier = tier
+        art.composite_score = compute_composite_score(
+            scoring.interest_score,
+            scoring.quality_score,
+            categories_by_article.get(art.id, []),  # pyright: ignore[reportArgumentType]
+        )
+        art.scoring_state = "scored"
+        art.scored_at = datetime.now()
+        art.scoring_priority = 0
+        art.scoring_attempts = 0
+        art.rescore_mode = None
+        session.add(art)
+        logger.info(
+            f"Article {art.id} scored ({tier}): "
+            f"interest={art.interest_score}, "
+            f"quality={art.quality_score}, "
+            f"composite={art.composite_score:.2f}"
+        )
+
+
 class CategorizationWorker:
     """Categorizes articles via LLM and routes them to scoring queue."""
 
-    def enqueue_articles(self, session: Session, article_ids: list[int]) -> int:
+    def enqueue_articles(
+        self, session: Session, article_ids: list[int], lane: str = LANE_FRESH
+    ) -> int:
         """Enqueue articles for categorization.
 
         Sets categorization_state='queued' for articles where
         categorization_state in ('uncategorized', 'failed'). Resets attempts.
+        Articles go into the given queue lane, the fresh lane by default.
 
         Returns:
             Number of articles enqueued
         """
         count = 0
-        for article_id in article_ids:
-            article = session.get(Article, article_id)
-            if article and article.categorization_state in ("uncategorized", "failed"):
-                article.categorization_state = "queued"
-                article.categorization_attempts = 0
-                session.add(article)
-                count += 1
+        if article_ids:
+            count = session.exec(  # pyright: ignore[reportCallIssue]
+                update(Article)
+                .where(col(Article.id).in_(article_ids))
+                .where(
+                    col(Article.categorization_state).in_(["uncategorized", "failed"])
+                )
+                .values(
+                    categorization_state="queued",
+                    categorization_attempts=0,
+                    next_attempt_at=None,
+                    queue_lane=lane,
+                    queued_at=datetime.now(),
+                )
+            ).rowcount
 
         session.commit()
         logger.info(f"Enqueued {count} articles for categorization")
@@ -98,25 +463,42 @@ class CategorizationWorker:
         """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        articles = session.exec(
-            select(Article)
+        recent_ids = (
+            select(Article.id)
             .where(~Article.is_read)  # pyright: ignore[reportArgumentType]
             .where(Article.published_at >= cutoff_date)  # pyright: ignore[reportOptionalOperand]
+            # Articles blocked by a pre-filter rule stay out of the LLM
+            .where(
+                or_(
+                    col(Article.category_source).is_(None),
+                    col(Article.category_source) != CATEGORY_SOURCE_RULE,
+                )
+            )
             .order_by(Article.published_at.desc())  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
             .limit(max_articles)
-        ).all()
-
-        count = 0
-        for article in articles:
-            if score_only:
-                article.scoring_state = "queued"
-                article.scoring_attempts = 0
-                article.rescore_mode = "score_only"
-            else:
-                article.categorization_state = "queued"
-                article.categorization_attempts = 0
-            session.add(article)
-            count += 1
+            .scalar_subquery()
+        )
+        if score_only:
+            values = {
+                "scoring_state": "queued",
+                "scoring_attempts": 0,
+                "rescore_mode": "score_only",
+            }
+        else:
+            values = {"categorization_state": "queued", "categorization_attempts": 0}
+        # A rescore is user-requested: do not wait out earlier failures. It
+        # goes to the backlog lane so fresh articles keep their share
+        values |= {
+            "next_attempt_at": None,
+            "queue_lane": LANE_BACKLOG,
+            "queued_at": datetime.now(),
+        }
+        count = session.exec(  # pyright: ignore[reportCallIssue]
+            update(Article)
+            .where(col(Article.id).in_(recent_ids))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
         session.commit()
         logger.info(
@@ -125,13 +507,92 @@ class CategorizationWorker:
         return count
 
     def enqueue_single_for_rescoring(self, session: Session, article: Article) -> None:
-        """Enqueue a single article for full re-scoring with high priority."""
+        """Enqueue a single article for full re-scoring in the interactive lane."""
         article.categorization_state = "queued"
         article.categorization_attempts = 0
+        article.next_attempt_at = None
         article.scoring_priority = 1
+        article.queue_lane = LANE_INTERACTIVE
+        article.queued_at = datetime.now()
         session.add(article)
         session.commit()
 
+    def inherit_near_duplicates(
+        self, session: Session, articles: list[Article]
+    ) -> set[int]:
+        """Copy categories and scores from processed near-duplicates.
+
+        Only first-time articles qualify; rescoring requests always go to the
+        LLM. Inherited articles end up scored without any LLM call.
+
+        Returns:
+            IDs of articles that inherited results
+        """
+        inherited: set[int] = set()
+        links: list[dict] = []
+        catalog = get_catalog(session)
+        for art in articles:
+            if art.scoring_state != "unscored" or art.scoring_priority > 0:
+                continue
+            source = find_near_duplicate(session, art)
+            if source is None:
+                continue
+
+            cat_list = catalog.categories(
+                list(
+                    session.exec(
+                        select(ArticleCategoryLink.category_id).where(
+                            ArticleCategoryLink.article_id == source.id
+                        )
+                    ).all()
+                )
+            )
+            links.extend(
+                {"article_id": art.id, "category_id": category.id}
+                for category in cat_list
+            )
+
+            art.categorization_state = "categorized"
+            art.category_source = CATEGORY_SOURCE_DUPLICATE
+            if is_blocked(cat_list):
+                art.interest_score = 0
+                art.quality_score = 0
+                art.composite_score = 0.0
+                blocked_cats = ", ".join(c.display_name for c in cat_list)
+                art.score_reasoning = f"Blocked: {blocked_cats}"
+                art.score_tier = None
+            else:
+                art.interest_score = source.interest_score or 0
+                art.quality_score = source.quality_score or 0
+                art.composite_score = compute_composite_score(
+                    art.interest_score, art.quality_score, cat_list
+                )
+                art.score_reasoning = source.score_reasoning
+                art.score_tier = source.score_tier
+            art.scoring_state = "scored"
+            art.scored_at = datetime.now()
+            art.scoring_attempts = 0
+            art.rescore_mode = None
+            session.add(art)
+            inherited.add(art.id)  # pyright: ignore[reportArgumentType]
+            logger.info(
+                "Article %s inherited results from near-duplicate %s",
+                art.id,
+                source.id,
+            )
+
+        if inherited:
+            session.exec(  # pyright: ignore[reportCallIssue]
+                delete(ArticleCategoryLink).where(
+                    col(ArticleCategoryLink.article_id).in_(inherited)
+                )
+            )
+            if links:
+                session.execute(insert(ArticleCategoryLink), links)
+            session.commit()
+            record_inherited(len(inherited))
+        return inherited
+
     async def process_next_batch(self, session: Session, batch_size: int = 1) -> int:
         """Process next batch of articles needing categorization.
 
@@ -160,223 +621,514 @@ class CategorizationWorker:
             logger.warning("Categorization skipped: unsupported provider")
             return 0
 
-        # Fetch queued articles
-        articles = session.exec(
-            select(Article)
-            .where(Article.categorization_state == "queued")
-            .order_by(Article.scoring_priority.desc(), Article.published_at.asc())  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
-            .limit(batch_size)
-        ).all()
+        # Claim queued articles (moves them to 'categorizing' under a lease)
+        articles = claim_batch(session, TASK_CATEGORIZATION, batch_size)
 
         if not articles:
             return 0
 
-        # Separate score_only articles from those needing categorization
-        score_only_articles: list[Article] = []
-        needs_cat_articles: list[Article] = []
-        for art in articles:
-            if art.rescore_mode == "score_only":
-                score_only_articles.append(art)
-            else:
-                needs_cat_articles.append(art)
+        score_only_articles, needs_cat_articles = self._route_score_only(
+            session, articles
+        )
 
-        # Route score_only articles directly to scoring queue
-        for art in score_only_articles:
-            art.categorization_state = "categorized"
-            art.scoring_state = "queued"
-            art.scoring_attempts = 0
-            session.add(art)
-        if score_only_articles:
-            session.commit()
+        # Near-duplicates of already processed articles skip the LLM entirely
+        inherited = self.inherit_near_duplicates(session, needs_cat_articles)
+        needs_cat_articles = [
+            art for art in needs_cat_articles if art.id not in inherited
+        ]
 
         if not needs_cat_articles:
-            return len(score_only_articles)
+            return len(score_only_articles) + len(inherited)
 
-        # Transition to 'categorizing'
-        batch_ids: set[int] = set()
-        article_map: dict[int, Article] = {}
-        for art in needs_cat_articles:
-            art.categorization_state = "categorizing"
-            session.add(art)
-            batch_ids.add(art.id)  # pyright: ignore[reportArgumentType]
-            article_map[art.id] = art  # pyright: ignore[reportArgumentType]
-        session.commit()
+        article_map: dict[int, Article] = {
+            art.id: art  # pyright: ignore[reportAssignmentType]
+            for art in needs_cat_articles
+        }
+        set_categorization_context(next(iter(article_map)))
 
-        set_categorization_context(next(iter(batch_ids)))
-
-        # Build article dicts
-        article_dicts: list[dict] = []
-        for art in needs_cat_articles:
-            text = art.content_markdown or art.content or art.summary or ""
-            article_dicts.append(
-                {
-                    "id": art.id,
-                    "title": art.title,
-                    "content_markdown": text,
-                }
-            )
+        article_dicts = _article_dicts(needs_cat_articles)
 
-        # Get active categories
-        active_categories, category_hierarchy, hidden_categories = (
-            get_active_categories(session)
+        # Categories relevant to this batch, with their hierarchy branches
+        # and any hidden categories the batch could plausibly touch
+        catalog = get_catalog(session)
+        active_categories, category_hierarchy, hidden_categories = shortlist_categories(
+            catalog,
+            article_dicts,
+            get_settings().pipeline.category_shortlist_size,
         )
-
-        from backend.llm_providers.base import ProviderTaskConfig
+        if len(active_categories) < len(catalog.active_names):
+            logger.debug(
+                "Category shortlist: %d of %d active, %d of %d hidden",
+                len(active_categories),
+                len(catalog.active_names),
+                len(hidden_categories),
+                len(catalog.hidden_names),
+            )
 
         cat_config = ProviderTaskConfig(
             endpoint=categorization_runtime.endpoint,
             model=categorization_runtime.model,
             thinking=categorization_runtime.thinking,
             api_key=categorization_runtime.api_key,
+            endpoints=categorization_runtime.endpoints,
         )
 
-        set_categorization_phase("categorizing")
-        try:
-            cat_results = await provider.categorize(
-                article_dicts,
+        # Serve previously seen content from the result cache
+        cache_keys = _result_cache_keys(
+            TASK_CATEGORIZATION,
+            categorization_runtime,
+            article_dicts,
+            CATEGORIZATION_PROMPT_VERSION,
+            CATEGORIZATION_MAX_CHARS,
+        )
+        cached_results = _current_categorizations(
+            catalog,
+            _load_cached_results(
+                session, TASK_CATEGORIZATION, cache_keys, ArticleCategoryResult
+            ),
+        )
+        pending_dicts = [a for a in article_dicts if a["id"] not in cached_results]
+
+        # First-time articles whose nearest categorized neighbours agree take
+        # their categories; like near-duplicates, rescoring requests do not
+        vectors = await embed_articles(provider, cat_config, pending_dicts)
+        neighbour_results = categorize_by_neighbours(
+            session,
+            {
+                aid: vector
+                for aid, vector in vectors.items()
+                if article_map[aid].scoring_state == "unscored"
+                and article_map[aid].scoring_priority == 0
+            },
+        )
+        if neighbour_results:
+            self._apply_categorizations(
+                session,
+                [(article_map[aid], r) for aid, r in neighbour_results.items()],
+                source=CATEGORY_SOURCE_KNN,
+            )
+            session.commit()
+            pending_dicts = [
+                a for a in pending_dicts if a["id"] not in neighbour_results
+            ]
+
+        pending_articles = [
+            art
+            for art in needs_cat_articles
+            if art.id not in cached_results and art.id not in neighbour_results
+        ]
+        pending_ids = {a["id"] for a in pending_dicts}
+        fresh_results: dict[int, ArticleCategoryResult] = {}
+        # Scores from a combined call, applied together with the categories
+        fresh_scores: dict[int, ArticleScoringResult] = {}
+
+        def apply_result(result: ArticleCategoryResult | ArticleCombinedResult) -> None:
+            # Persist each result as soon as the provider has it, ignoring
+            # hallucinated IDs and repeats of already applied results
+            aid = result.article_id
+            if aid not in pending_ids or aid in fresh_results:
+                return
+            fresh_results[aid] = _split_combined(result, fresh_scores)
+            self._apply_categorizations(
+                session, [(article_map[aid], fresh_results[aid])], fresh_scores
+            )
+            session.commit()
+
+        # Combined mode also scores each article, in one call on the scoring route
+        combined = await self._combined_route(session) if pending_dicts else None
+        preferences = _load_preferences(session) if combined else None
+
+        async def call_llm(
+            batch: list[dict],
+        ) -> list[ArticleCategoryResult] | list[ArticleCombinedResult]:
+            if combined is None or preferences is None:
+                return await provider.categorize(
+                    batch,
+                    active_categories,
+                    config=cat_config,
+                    category_hierarchy=category_hierarchy,
+                    hidden_categories=hidden_categories or None,
+                    on_result=apply_result,
+                )
+            combined_provider, combined_config = combined
+            return await combined_provider.categorize_and_score(
+                batch,
                 active_categories,
-                config=cat_config,
+                preferences.interests,
+                preferences.anti_interests,
+                config=combined_config,
                 category_hierarchy=category_hierarchy,
                 hidden_categories=hidden_categories or None,
+                on_result=apply_result,
+            )
+
+        set_categorization_phase("categorizing")
+        call_started = time.monotonic()
+        call_failed = False
+        isolated: list[int] | None = None
+        try:
+            cat_results, isolated = (
+                await _call_isolating_failures(
+                    TASK_CATEGORIZATION,
+                    call_llm,
+                    pending_dicts,
+                    fresh_results,
+                    retried=any(a.categorization_attempts for a in pending_articles),
+                )
+                if pending_dicts
+                else ([], None)
             )
         except asyncio.CancelledError:
             logger.info("Categorization cancelled; re-queueing batch")
             set_categorization_context(None)
             session.rollback()
-            for art in needs_cat_articles:
-                art.categorization_state = "queued"
-                session.add(art)
+            session.exec(  # pyright: ignore[reportCallIssue]
+                update(Article)
+                .where(
+                    col(Article.id).in_(
+                        article_map.keys()
+                        - fresh_results.keys()
+                        - neighbour_results.keys()
+                    )
+                )
+                .values(categorization_state="queued")
+            )
             session.commit()
             raise
         except Exception as e:
             set_categorization_context(None)
+            unfinished = [
+                art.id for art in pending_articles if art.id not in fresh_results
+            ]
+            record_batch_failure(TASK_CATEGORIZATION, len(unfinished), e)
             rate_limit_delay = _extract_rate_limit_delay(e)
             if rate_limit_delay is not None:
                 logger.warning(
                     "Categorization rate-limited; re-queueing (retry in %.0fs)",
                     rate_limit_delay,
                 )
-                set_categorization_rate_limited(rate_limit_delay)
+                if combined is None:
+                    set_categorization_rate_limited(rate_limit_delay)
+                else:
+                    # The combined call went to the scoring route; this also
+                    # sends the next batch through the two-stage pipeline
+                    set_scoring_rate_limited(rate_limit_delay)
 
             else:
                 logger.error("Categorization failed: %s", e, exc_info=True)
 
-            # Increment attempts and re-queue or fail
-            for art in needs_cat_articles:
-                art.categorization_attempts += 1
-                if art.categorization_attempts >= MAX_TASK_RETRIES:
-                    art.categorization_state = "failed"
-                else:
-                    art.categorization_state = "queued"
-                session.add(art)
+            # Increment attempts and re-queue or fail; streamed results stay
+            _requeue_or_fail(session, TASK_CATEGORIZATION, unfinished)
             session.commit()
-            return len(score_only_articles)
+            call_failed = True
+            cat_results = []
 
-        # Build result map, ignoring hallucinated IDs
-        cat_result_map: dict[int, object] = {}
+        # Results the provider returned without streaming them, plus cache
+        # hits, are applied together in one transaction
+        unapplied: list[tuple[Article, ArticleCategoryResult]] = []
         for result in cat_results:
-            if result.article_id in batch_ids:
-                cat_result_map[result.article_id] = result
+            aid = result.article_id
+            if aid in pending_ids and aid not in fresh_results:
+                fresh_results[aid] = _split_combined(result, fresh_scores)
+                unapplied.append((article_map[aid], fresh_results[aid]))
+        unapplied.extend((article_map[aid], r) for aid, r in cached_results.items())
+        # A combined call ran on the scoring route and does more per article,
+        # so it says nothing about the categorization batch size
+        if pending_dicts and not call_failed and isolated is None and combined is None:
+            record_batch_success(
+                TASK_CATEGORIZATION,
+                len(pending_dicts),
+                len(fresh_results),
+                time.monotonic() - call_started,
+            )
+        if combined is None:
+            # Combined results came from another prompt, maybe another model
+            _store_results(session, TASK_CATEGORIZATION, cache_keys, fresh_results)
+
+        # Re-queue articles the LLM returned no result for; articles that
+        # broke the batch on their own fail outright
+        _fail_isolated(session, TASK_CATEGORIZATION, isolated or [])
+        missing = (
+            []
+            if call_failed
+            else sorted(pending_ids - fresh_results.keys() - set(isolated or []))
+        )
+        for aid in missing:
+            logger.warning("Article %s: no categorization result, re-queued", aid)
+        _requeue_or_fail(session, TASK_CATEGORIZATION, missing)
+        self._apply_categorizations(session, unapplied, fresh_scores)
+        session.commit()
+        index_vectors({aid: vectors[aid] for aid in fresh_results if aid in vectors})
 
-        # Delete old category links and persist new ones
-        categories_by_article: dict[int, list[Category]] = {
-            aid: [] for aid in batch_ids
-        }
+        set_categorization_context(None)
+        return (
+            len(score_only_articles)
+            + len(inherited)
+            + len(neighbour_results)
+            + len(fresh_results)
+            + len(cached_results)
+        )
 
-        seen_slugs: dict[str, Category] = {}
-        with session.no_autoflush:
-            for aid, categorization in cat_result_map.items():
-                for cat_name in categorization.categories:
-                    slug = slugify(cat_name)
-                    if slug not in seen_slugs:
-                        seen_slugs[slug] = get_or_create_category(session, cat_name)
-                    categories_by_article[aid].append(seen_slugs[slug])
+    async def _combined_route(
+        self, session: Session
+    ) -> tuple[CombinedTaskProvider, ProviderTaskConfig] | None:
+        """The scoring route's provider and config, if combined mode is on and
+        the route is ready, not rate limited and able to serve it."""
+        if not get_settings().pipeline.combined_mode or is_scoring_rate_limited():
+            return None
+        runtime = await evaluate_task_readiness(session, TASK_SCORING)
+        if not runtime.ready or runtime.model is None:
+            return None
+        try:
+            provider = get_provider(runtime.provider)
+        except KeyError:
+            return None
+        if not isinstance(provider, CombinedTaskProvider):
+            return None
+        return provider, ProviderTaskConfig(
+            endpoint=runtime.endpoint,
+            model=runtime.model,
+            thinking=runtime.thinking,
+            api_key=runtime.api_key,
+            endpoints=runtime.endpoints,
+        )
 
-                for cat_name in categorization.suggested_new:
-                    slug = slugify(cat_name)
-                    if slug not in seen_slugs:
-                        seen_slugs[slug] = get_or_create_category(
-                            session,
-                            cat_name,
-                            suggested_parent=categorization.suggested_parent,
-                        )
-                    categories_by_article[aid].append(seen_slugs[slug])
+    def _route_score_only(
+        self, session: Session, articles: list[Article]
+    ) -> tuple[list[Article], list[Article]]:
+        """Send score_only rescoring requests straight to the scoring queue.
 
-        session.commit()  # persist new categories, get IDs
+        Returns (score_only articles, articles needing categorization).
+        """
+        score_only = [art for art in articles if art.rescore_mode == "score_only"]
+        if score_only:
+            session.exec(  # pyright: ignore[reportCallIssue]
+                update(Article)
+                .where(col(Article.id).in_([art.id for art in score_only]))
+                .values(
+                    categorization_state="categorized",
+                    scoring_state="queued",
+                    scoring_attempts=0,
+                    queued_at=datetime.now(),
+                )
+            )
+            session.commit()
+        return score_only, [art for art in articles if art.rescore_mode != "score_only"]
 
-        # Delete old links, write new links, unhide categories
-        for aid, cat_list in categories_by_article.items():
-            if aid not in cat_result_map:
-                continue  # unmatched — will be re-queued below
+    def prepare_batch_job(
+        self,
+        session: Session,
+        articles: list[Article],
+        runtime: TaskRuntimeResolution,
+        batch_size: int,
+    ) -> tuple[list[tuple[str, str]], list[int]]:
+        """Resolve what a claimed backlog can without the LLM, then build prompts.
+
+        Score-only requests, near-duplicates and result cache hits are applied
+        now, as in process_next_batch. Returns one (system prompt, user
+        message) per batch_size articles, and the IDs those prompts cover.
+        """
+        _, needs_cat = self._route_score_only(session, articles)
+        inherited = self.inherit_near_duplicates(session, needs_cat)
+        needs_cat = [art for art in needs_cat if art.id not in inherited]
+        article_map = {art.id: art for art in needs_cat}
+
+        article_dicts = _article_dicts(needs_cat)
+        catalog = get_catalog(session)
+        cached = _current_categorizations(
+            catalog,
+            _load_cached_results(
+                session,
+                TASK_CATEGORIZATION,
+                _result_cache_keys(
+                    TASK_CATEGORIZATION,
+                    runtime,
+                    article_dicts,
+                    CATEGORIZATION_PROMPT_VERSION,
+                    CATEGORIZATION_MAX_CHARS,
+                ),
+                ArticleCategoryResult,
+            ),
+        )
+        self._apply_categorizations(
+            session, [(article_map[aid], r) for aid, r in cached.items()]
+        )
+        session.commit()
 
-            # Delete old links for this article
-            old_links = session.exec(
-                select(ArticleCategoryLink).where(
-                    ArticleCategoryLink.article_id == aid,
-                )
-            ).all()
-            for old_link in old_links:
-                session.delete(old_link)
-
-            # Insert new links
-            for category in cat_list:
-                link = ArticleCategoryLink(
-                    article_id=aid,  # pyright: ignore[reportArgumentType]
-                    category_id=category.id,  # pyright: ignore[reportArgumentType]
+        pending = [a for a in article_dicts if a["id"] not in cached]
+        prompts = []
+        for chunk in _chunks(pending, batch_size):
+            names, hierarchy, hidden = shortlist_categories(
+                catalog, chunk, get_settings().pipeline.category_shortlist_size
+            )
+            prompts.append(
+                build_batch_categorization_prompt(
+                    chunk, names, hierarchy, hidden_categories=hidden or None
                 )
-                session.add(link)
-
-            # Unhide returned categories
-            for cat in cat_list:
-                if cat.is_hidden:
-                    cat.is_hidden = False
-                    cat.is_seen = False
-                    session.add(cat)
-                    logger.info(
-                        f"Article {aid}: unhid returned category '{cat.display_name}'"
-                    )
+            )
+        return prompts, [a["id"] for a in pending]
 
+    def complete_batch_job(
+        self,
+        session: Session,
+        articles: list[Article],
+        results: list[ArticleCategoryResult],
+        runtime: TaskRuntimeResolution,
+    ) -> int:
+        """Apply an offline batch job's results like a synchronous batch's.
+
+        Results for other articles and repeats are ignored; articles without
+        a result count an attempt and are re-queued. Returns the number
+        categorized.
+        """
+        article_map = {art.id: art for art in articles}
+        fresh: dict[int, ArticleCategoryResult] = {}
+        for result in results:
+            if result.article_id in article_map:
+                fresh.setdefault(result.article_id, result)
+        cache_keys = _result_cache_keys(
+            TASK_CATEGORIZATION,
+            runtime,
+            _article_dicts(articles),
+            CATEGORIZATION_PROMPT_VERSION,
+            CATEGORIZATION_MAX_CHARS,
+        )
+        _store_results(session, TASK_CATEGORIZATION, cache_keys, fresh)
+        missing = sorted(article_map.keys() - fresh.keys())
+        for aid in missing:
+            logger.warning("Article %s: no categorization result, re-queued", aid)
+        _requeue_or_fail(session, TASK_CATEGORIZATION, missing)  # pyright: ignore[reportArgumentType]
+        self._apply_categorizations(
+            session, [(article_map[aid], r) for aid, r in fresh.items()]
+        )
         session.commit()
+        return len(fresh)
 
-        # Route categorized articles: blocked → scored with zero, non-blocked → scoring queue
-        processed = len(score_only_articles)
-        for aid, cat_list in categories_by_article.items():
-            if aid not in cat_result_map:
-                # No categorization result — re-queue
-                art = article_map[aid]
-                art.categorization_attempts += 1
-                if art.categorization_attempts >= MAX_TASK_RETRIES:
-                    art.categorization_state = "failed"
-                else:
-                    art.categorization_state = "queued"
-                session.add(art)
-                logger.warning("Article %s: no categorization result, re-queued", aid)
-                continue
+    def _apply_categorizations(
+        self,
+        session: Session,
+        results: list[tuple[Article, ArticleCategoryResult]],
+        scores: Mapping[int, ArticleScoringResult] | None = None,
+        source: str = CATEGORY_SOURCE_LLM,
+    ) -> None:
+        """Persist categories for a set of articles and route them onwards.
+
+        Blocked articles are scored with zero; the rest go to the scoring
+        queue, unless `scores` (from a combined call) has their score, which
+        is then applied with the new categories' weights. Links are replaced
+        with one DELETE and one executemany INSERT. `source` is recorded as
+        each article's category_source. Does not commit.
+        """
+        if not results:
+            return
 
-            art = article_map[aid]
-            art.categorization_state = "categorized"
+        catalog = get_catalog(session)
+        by_slug: dict[str, CatalogCategory] = {}
+        new_categories: dict[str, Category] = {}
+        slugs_by_article: dict[int, list[str]] = {}
+        with session.no_autoflush:
+            for art, categorization in results:
+                names = [(name, None) for name in categorization.categories] + [
+                    (name, categorization.suggested_parent)
+                    for name in categorization.suggested_new
+                ]
+                article_slugs: list[str] = []
+                for cat_name, suggested_parent in names:
+                    slug = slugify(cat_name)
+                    if slug not in by_slug and slug not in new_categories:
+                        entry = catalog.by_slug.get(slug)
+                        if entry is not None:
+                            by_slug[slug] = entry
+                        else:
+                            new_categories[slug] = get_or_create_category(
+                                session, cat_name, suggested_parent=suggested_parent
+                            )
+                    if slug not in article_slugs:
+                        article_slugs.append(slug)
+                slugs_by_article[art.id] = article_slugs  # pyright: ignore[reportArgumentType]
+
+        if new_categories:
+            session.flush()  # assign IDs to new categories
+            for slug, category in new_categories.items():
+                parent_id = category.parent_id
+                by_slug[slug] = CatalogCategory.from_model(
+                    category, catalog.by_id.get(parent_id) if parent_id else None
+                )
 
-            if is_blocked(cat_list):
-                art.interest_score = 0
-                art.quality_score = 0
-                art.composite_score = 0.0
-                blocked_cats = ", ".join(c.display_name for c in cat_list)
-                art.score_reasoning = f"Blocked: {blocked_cats}"
-                art.scoring_state = "scored"
-                art.scored_at = datetime.now()
-                art.scoring_priority = 0
-                art.rescore_mode = None
-                logger.info(f"Article {aid} blocked by categories: {blocked_cats}")
-            else:
-                art.scoring_state = "queued"
-                art.scoring_attempts = 0
+        # Unhide returned categories
+        unhidden = [entry for entry in by_slug.values() if entry.is_hidden]
+        if unhidden:
+            session.exec(  # pyright: ignore[reportCallIssue]
+                update(Category)
+                .where(col(Category.id).in_([entry.id for entry in unhidden]))
+                .values(is_hidden=False, is_seen=False)
+            )
+            for entry in unhidden:
+                by_slug[entry.slug] = replace(entry, is_hidden=False)
+                logger.info(f"Unhid returned category '{entry.display_name}'")
 
-            session.add(art)
-            processed += 1
+        cats_by_article = {
+            aid: [by_slug[slug] for slug in slugs]
+            for aid, slugs in slugs_by_article.items()
+        }
 
-        session.commit()
-        set_categorization_context(None)
-        return processed
+        # Replace links
+        session.exec(  # pyright: ignore[reportCallIssue]
+            delete(ArticleCategoryLink).where(
+                col(ArticleCategoryLink.article_id).in_(list(cats_by_article))
+            )
+        )
+        links = [
+            {"article_id": aid, "category_id": category.id}
+            for aid, cat_list in cats_by_article.items()
+            for category in cat_list
+        ]
+        if links:
+            session.execute(insert(ArticleCategoryLink), links)
+
+        # Route: blocked → scored with zero, non-blocked → scored now if the
+        # score came with the categories, otherwise the scoring queue
+        to_scoring: list[int] = []
+        scored: list[tuple[Article, ArticleScoringResult]] = []
+        for art, _ in results:
+            cat_list = cats_by_article[art.id]  # pyright: ignore[reportArgumentType]
+            if not is_blocked(cat_list):
+                score = scores.get(art.id) if scores else None  # pyright: ignore[reportArgumentType]
+                if score is None:
+                    to_scoring.append(art.id)  # pyright: ignore[reportArgumentType]
+                else:
+                    art.categorization_state = "categorized"
+                    art.category_source = source
+                    scored.append((art, score))
+                continue
+            art.categorization_state = "categorized"
+            art.category_source = source
+            art.interest_score = 0
+            art.quality_score = 0
+            art.composite_score = 0.0
+            blocked_cats = ", ".join(c.display_name for c in cat_list)
+            art.score_reasoning = f"Blocked: {blocked_cats}"
+            art.score_tier = None
+            art.scoring_state = "scored"
+            art.scored_at = datetime.now()
+            art.scoring_priority = 0
+            art.rescore_mode = None
+            session.add(art)
+            logger.info(f"Article {art.id} blocked by categories: {blocked_cats}")
+
+        _apply_scores(session, scored, cats_by_article)  # pyright: ignore[reportArgumentType]
+        if to_scoring:
+            session.exec(  # pyright: ignore[reportCallIssue]
+                update(Article)
+                .where(col(Article.id).in_(to_scoring))
+                .values(
+                    categorization_state="categorized",
+                    category_source=source,
+                    scoring_state="queued",
+                    scoring_attempts=0,
+                    queued_at=datetime.now(),
+                )
+            )
 
 
 class ScoringWorker:
@@ -408,91 +1160,154 @@ class ScoringWorker:
             logger.warning("Scoring skipped: unsupported provider")
             return 0
 
-        # Fetch queued articles
-        articles = session.exec(
-            select(Article)
-            .where(Article.scoring_state == "queued")
-            .order_by(Article.scoring_priority.desc(), Article.published_at.asc())  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
-            .limit(batch_size)
-        ).all()
-
-        if not articles:
-            return 0
-
-        # Load preferences
-        preferences = session.exec(select(UserPreferences)).first()
-        if not preferences:
-            preferences = UserPreferences(interests="", anti_interests="")
-            session.add(preferences)
-            session.commit()
-
-        from backend.llm_providers.base import ProviderTaskConfig
+        preferences = _load_preferences(session)
 
         score_config = ProviderTaskConfig(
             endpoint=scoring_runtime.endpoint,
             model=scoring_runtime.model,
             thinking=scoring_runtime.thinking,
             api_key=scoring_runtime.api_key,
+            endpoints=scoring_runtime.endpoints,
         )
         if score_config.model is None:
             logger.warning("Scoring skipped: unresolved provider configuration")
             return 0
 
-        # Transition to 'scoring'
-        batch_ids: set[int] = set()
-        article_map: dict[int, Article] = {}
-        for art in articles:
-            art.scoring_state = "scoring"
-            session.add(art)
-            batch_ids.add(art.id)  # pyright: ignore[reportArgumentType]
-            article_map[art.id] = art  # pyright: ignore[reportArgumentType]
-        session.commit()
+        # Claim queued articles (moves them to 'scoring' under a lease)
+        articles = claim_batch(session, TASK_SCORING, batch_size)
 
-        set_scoring_context(next(iter(batch_ids)))
+        if not articles:
+            return 0
 
-        # Build article dicts
-        article_dicts: list[dict] = []
-        for art in articles:
-            text = art.content_markdown or art.content or art.summary or ""
-            article_dicts.append(
-                {
-                    "id": art.id,
-                    "title": art.title,
-                    "content_markdown": text,
-                }
+        article_map: dict[int, Article] = {
+            art.id: art  # pyright: ignore[reportAssignmentType]
+            for art in articles
+        }
+        set_scoring_context(next(iter(article_map)))
+
+        article_dicts = _article_dicts(articles)
+        categories_by_article = self._categories_by_article(session, list(article_map))
+
+        # Serve previously seen content from the result cache
+        cache_keys = _result_cache_keys(
+            TASK_SCORING,
+            scoring_runtime,
+            article_dicts,
+            SCORING_PROMPT_VERSION,
+            SCORING_MAX_CHARS,
+            llm_cache.interests_hash(preferences.interests, preferences.anti_interests),
+        )
+        cached_results = _load_cached_results(
+            session, TASK_SCORING, cache_keys, ArticleScoringResult
+        )
+        pending_articles = [art for art in articles if art.id not in cached_results]
+
+        # Articles the local pre-scorer is confident about skip the LLM;
+        # rescores the user asked for always get one
+        local_results = prescore(
+            [a for a in pending_articles if a.queue_lane != LANE_INTERACTIVE],
+            categories_by_article,
+            preferences,
+        )
+        if local_results:
+            _apply_scores(
+                session,
+                [(article_map[aid], r) for aid, r in local_results.items()],
+                categories_by_article,
+                SCORE_TIER_LOCAL,
             )
+            session.commit()
+            pending_articles = [
+                art for art in pending_articles if art.id not in local_results
+            ]
+
+        skip = cached_results.keys() | local_results.keys()
+        pending_dicts = [a for a in article_dicts if a["id"] not in skip]
+        pending_ids = {a["id"] for a in pending_dicts}
+        fresh_results: dict[int, ArticleScoringResult] = {}
+        # Scores kept from the cascade's small model; not cached, since the
+        # result cache is keyed by the route's model
+        small_results: dict[int, ArticleScoringResult] = {}
+
+        def apply_result(result: ArticleScoringResult) -> None:
+            # Persist each score as soon as the provider has it, ignoring
+            # hallucinated IDs and repeats of already applied results
+            aid = result.article_id
+            if aid not in pending_ids or aid in fresh_results:
+                return
+            fresh_results[aid] = result
+            _apply_scores(session, [(article_map[aid], result)], categories_by_article)
+            session.commit()
 
-        # Load categories from DB for each article
-        categories_by_article: dict[int, list[Category]] = {}
-        for aid in batch_ids:
-            cats = list(
-                session.exec(
-                    select(Category)
-                    .join(ArticleCategoryLink)
-                    .where(ArticleCategoryLink.article_id == aid)
-                ).all()
+        def apply_small_result(result: ArticleScoringResult) -> None:
+            small_results[result.article_id] = result
+            _apply_scores(
+                session,
+                [(article_map[result.article_id], result)],
+                categories_by_article,
+                SCORE_TIER_SMALL,
             )
-            categories_by_article[aid] = cats
+            session.commit()
 
         set_scoring_phase("scoring")
+        call_started = time.monotonic()
+        call_failed = False
+        isolated: list[int] | None = None
         try:
-            score_results = await provider.score(
-                article_dicts,
-                preferences.interests,
-                preferences.anti_interests,
-                config=score_config,
+            cascade_model = get_settings().pipeline.cascade_model
+            if pending_dicts and cascade_model and cascade_model != score_config.model:
+                kept = await self._score_with_small_model(
+                    provider,
+                    replace(score_config, model=cascade_model),
+                    preferences,
+                    pending_dicts,
+                    apply_small_result,
+                )
+                # Only the uncertain rest goes to the route's model
+                pending_dicts = [a for a in pending_dicts if a["id"] not in kept]
+                pending_articles = [a for a in pending_articles if a.id not in kept]
+                pending_ids -= kept
+            score_results, isolated = (
+                await _call_isolating_failures(
+                    TASK_SCORING,
+                    lambda batch: provider.score(
+                        batch,
+                        preferences.interests,
+                        preferences.anti_interests,
+                        config=score_config,
+                        on_result=apply_result,
+                    ),
+                    pending_dicts,
+                    fresh_results,
+                    retried=any(a.scoring_attempts for a in pending_articles),
+                )
+                if pending_dicts
+                else ([], None)
             )
         except asyncio.CancelledError:
             logger.info("Scoring cancelled; re-queueing batch")
             set_scoring_context(None)
             session.rollback()
-            for art in articles:
-                art.scoring_state = "queued"
-                session.add(art)
+            session.exec(  # pyright: ignore[reportCallIssue]
+                update(Article)
+                .where(
+                    col(Article.id).in_(
+                        article_map.keys()
+                        - fresh_results.keys()
+                        - small_results.keys()
+                        - local_results.keys()
+                    )
+                )
+                .values(scoring_state="queued")
+            )
             session.commit()
             raise
         except Exception as e:
             set_scoring_context(None)
+            unfinished = [
+                art.id for art in pending_articles if art.id not in fresh_results
+            ]
+            record_batch_failure(TASK_SCORING, len(unfinished), e)
             rate_limit_delay = _extract_rate_limit_delay(e)
             if rate_limit_delay is not None:
                 logger.warning(
@@ -503,61 +1318,218 @@ class ScoringWorker:
             else:
                 logger.error("Scoring failed: %s", e, exc_info=True)
 
-            # Increment attempts and re-queue or fail
-            for art in articles:
-                art.scoring_attempts += 1
-                if art.scoring_attempts >= MAX_TASK_RETRIES:
-                    art.scoring_state = "failed"
-                else:
-                    art.scoring_state = "queued"
-                session.add(art)
+            # Increment attempts and re-queue or fail; streamed scores stay
+            _requeue_or_fail(session, TASK_SCORING, unfinished)
             session.commit()
-            return 0
+            call_failed = True
+            score_results = []
 
-        # Build result map, ignoring hallucinated IDs
-        score_result_map: dict[int, object] = {}
+        # Scores the provider returned without streaming them, plus cache
+        # hits, are applied together in one transaction
+        unapplied: list[tuple[Article, ArticleScoringResult]] = []
         for result in score_results:
-            if result.article_id in batch_ids:
-                score_result_map[result.article_id] = result
-
-        # Apply scores
-        processed = 0
-        for aid, scoring in score_result_map.items():
-            art = article_map[aid]
-            art.interest_score = scoring.interest_score
-            art.quality_score = scoring.quality_score
-            art.score_reasoning = scoring.reasoning
-            art.composite_score = compute_composite_score(
-                scoring.interest_score,
-                scoring.quality_score,
-                categories_by_article.get(aid, []),
+            aid = result.article_id
+            if aid in pending_ids and aid not in fresh_results:
+                fresh_results[aid] = result
+                unapplied.append((article_map[aid], result))
+        unapplied.extend((article_map[aid], r) for aid, r in cached_results.items())
+        if pending_dicts and not call_failed and isolated is None:
+            record_batch_success(
+                TASK_SCORING,
+                len(pending_dicts),
+                len(fresh_results),
+                time.monotonic() - call_started,
             )
-            art.scoring_state = "scored"
-            art.scored_at = datetime.now()
-            art.scoring_priority = 0
-            art.scoring_attempts = 0
-            art.rescore_mode = None
-            session.add(art)
-            logger.info(
-                f"Article {aid} scored: "
-                f"interest={art.interest_score}, "
-                f"quality={art.quality_score}, "
-                f"composite={art.composite_score:.2f}"
+        _store_results(session, TASK_SCORING, cache_keys, fresh_results)
+
+        # Re-queue articles with no score result; articles that broke the
+        # batch on their own fail outright
+        _fail_isolated(session, TASK_SCORING, isolated or [])
+        missing = (
+            []
+            if call_failed
+            else sorted(pending_ids - fresh_results.keys() - set(isolated or []))
+        )
+        for aid in missing:
+            logger.warning("Article %s: no score result, re-queued", aid)
+        _requeue_or_fail(session, TASK_SCORING, missing)
+        _apply_scores(session, unapplied, categories_by_article)
+        session.commit()
+
+        set_scoring_context(None)
+        return (
+            len(fresh_results)
+            + len(small_results)
+            + len(local_results)
+            + len(cached_results)
+        )
+
+    async def _score_with_small_model(
+        self,
+        provider: LLMProvider,
+        config: ProviderTaskConfig,
+        preferences: UserPreferences,
+        articles: list[dict],
+        apply_result: Callable[[ArticleScoringResult], None],
+    ) -> set[int]:
+        """First tier of the scoring cascade.
+
+        Scores outside the uncertain band go to apply_result as they stream
+        in. Returns the IDs kept that way; scores inside the band, articles
+        missing from the response, and everything after a failed call are
+        left for the route's model.
+        """
+        settings = get_settings().pipeline
+        ids = {a["id"] for a in articles}
+        kept: set[int] = set()
+
+        def keep_confident(result: ArticleScoringResult) -> None:
+            aid = result.article_id
+            if aid not in ids or aid in kept:
+                return
+            if (
+                settings.cascade_uncertain_min
+                <= result.interest_score
+                <= settings.cascade_uncertain_max
+            ):
+                return
+            kept.add(aid)
+            apply_result(result)
+
+        try:
+            results = await provider.score(
+                articles,
+                preferences.interests,
+                preferences.anti_interests,
+                config=config,
+                on_result=keep_confident,
             )
-            processed += 1
-
-        # Re-queue articles with no score result
-        for aid in batch_ids:
-            if aid not in score_result_map:
-                art = article_map[aid]
-                art.scoring_attempts += 1
-                if art.scoring_attempts >= MAX_TASK_RETRIES:
-                    art.scoring_state = "failed"
-                else:
-                    art.scoring_state = "queued"
-                session.add(art)
-                logger.warning("Article %s: no score result, re-queued", aid)
+        except Exception as e:
+            logger.warning("Cascade model %s failed; escalating: %s", config.model, e)
+            results = []
+        for result in results:
+            keep_confident(result)
+        LLM_CASCADE_ARTICLES.inc(len(kept), outcome="kept")
+        LLM_CASCADE_ARTICLES.inc(len(ids) - len(kept), outcome="escalated")
+        return kept
+
+    def _categories_by_article(
+        self, session: Session, article_ids: list[int]
+    ) -> dict[int, list[CatalogCategory]]:
+        """Load the categories of a whole batch in one query."""
+        catalog = get_catalog(session)
+        categories_by_article: dict[int, list[CatalogCategory]] = {
+            aid: [] for aid in article_ids
+        }
+        for aid, category_id in session.exec(
+            select(
+                ArticleCategoryLink.article_id, ArticleCategoryLink.category_id
+            ).where(col(ArticleCategoryLink.article_id).in_(article_ids))
+        ).all():
+            if category_id in catalog.by_id:
+                categories_by_article[aid].append(catalog.by_id[category_id])
+        return categories_by_article
+
+    def prepare_batch_job(
+        self,
+        session: Session,
+        articles: list[Article],
+        runtime: TaskRuntimeResolution,
+        batch_size: int,
+    ) -> tuple[list[tuple[str, str]], list[int], str]:
+        """Apply result cache hits for a claimed backlog, then build prompts.
+
+        Returns one (system prompt, user message) per batch_size articles, the
+        IDs those prompts cover, and the interests digest they were built with.
+        """
+        preferences = _load_preferences(session)
+        digest = llm_cache.interests_hash(
+            preferences.interests, preferences.anti_interests
+        )
+        article_map = {art.id: art for art in articles}
+        article_dicts = _article_dicts(articles)
+        cached = _load_cached_results(
+            session,
+            TASK_SCORING,
+            _result_cache_keys(
+                TASK_SCORING,
+                runtime,
+                article_dicts,
+                SCORING_PROMPT_VERSION,
+                SCORING_MAX_CHARS,
+                digest,
+            ),
+            ArticleScoringResult,
+        )
+        _apply_scores(
+            session,
+            [(article_map[aid], r) for aid, r in cached.items()],
+            self._categories_by_article(session, list(cached)),
+        )
+        session.commit()
+
+        pending = [a for a in article_dicts if a["id"] not in cached]
+        prompts = [
+            build_batch_scoring_prompt(
+                chunk, preferences.interests, preferences.anti_interests
+            )
+            for chunk in _chunks(pending, batch_size)
+        ]
+        return prompts, [a["id"] for a in pending], digest
 
+    def complete_batch_job(
+        self,
+        session: Session,
+        articles: list[Article],
+        results: list[ArticleScoringResult],
+        runtime: TaskRuntimeResolution,
+        interests_digest: str | None,
+    ) -> int:
+        """Apply an offline batch job's scores like a synchronous batch's.
+
+        Composite scores use the articles' current categories. Articles
+        without a result count an attempt and are re-queued. Returns the
+        number scored.
+        """
+        article_map = {art.id: art for art in articles}
+        fresh: dict[int, ArticleScoringResult] = {}
+        for result in results:
+            if result.article_id in article_map:
+                fresh.setdefault(result.article_id, result)
+        cache_keys = _result_cache_keys(
+            TASK_SCORING,
+            runtime,
+            _article_dicts(articles),
+            SCORING_PROMPT_VERSION,
+            SCORING_MAX_CHARS,
+            interests_digest,
+        )
+        _store_results(session, TASK_SCORING, cache_keys, fresh)
+        missing = sorted(article_map.keys() - fresh.keys())
+        for aid in missing:
+            logger.warning("Article %s: no score result, re-queued", aid)
+        _requeue_or_fail(session, TASK_SCORING, missing)  # pyright: ignore[reportArgumentType]
+        _apply_scores(
+            session,
+            [(article_map[aid], r) for aid, r in fresh.items()],
+            self._categories_by_article(session, list(fresh)),
+        )
         session.commit()
-        set_scoring_context(None)
-        return processed
+        return len(fresh)
+
+
+def get_cascade_stats() -> dict:
+    """Counters for /api/scoring/status."""
+    settings = get_settings().pipeline
+    kept = LLM_CASCADE_ARTICLES.value(outcome="kept")
+    escalated = LLM_CASCADE_ARTICLES.value(outcome="escalated")
+    return {
+        "model": settings.cascade_model or None,
+        "uncertain_band": [
+            settings.cascade_uncertain_min,
+            settings.cascade_uncertain_max,
+        ],
+        "kept": int(kept),
+        "escalated": int(escalated),
+        "escalated_share": escalated / (kept + escalated) if kept + escalated else None,
+    }
@@ -0,0 +1,268 @@
+"""Tests for offline batch jobs on hosted providers."""
+
+import asyncio
+import json
+import re
+
+import pytest
+from sqlmodel import select
+
+from backend import batch_jobs
+from backend.config import get_settings
+from backend.deps import TASK_SCORING, TaskRuntimeResolution
+from backend.leases import BATCH_JOB_OWNER_PREFIX
+from backend.llm_providers import google
+from backend.llm_providers.base import BatchJobStatus, ProviderTaskConfig
+from backend.models import LLMProviderConfig, ProviderBatchJob
+from backend.prompts import ArticleScoringResult, BatchScoringResponse
+
+
+class FakeBatchProvider:
+    """Provider whose batch jobs finish when the test says so."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.prompts: list[tuple[str, str]] = []
+        self.status = BatchJobStatus(state="running")
+
+    def parse_config(self, _config_json, _task):
+        return ProviderTaskConfig(endpoint=None, model="m", thinking=False)
+
+    async def submit_batch_job(self, _config, _task, prompts, _schema):
+        self.prompts = prompts
+        return "batches/1"
+
+    async def poll_batch_job(self, _config, _job_name, _schema):
+        return self.status
+
+
+@pytest.fixture
+def provider(test_session, monkeypatch):
+    fake = FakeBatchProvider()
+    test_session.add(LLMProviderConfig(provider="fake", config_json="{}"))
+    test_session.commit()
+
+    async def _ready(_session, task):
+        return TaskRuntimeResolution(
+            task=task,
+            provider="fake",
+            model="fake-model",
+            endpoint=None,
+            thinking=False,
+            api_key=None,
+            ready=True,
+            reason=None,
+        )
+
+    pipeline = get_settings().pipeline
+    monkeypatch.setattr(pipeline, "batch_job_threshold", 3)
+    monkeypatch.setattr(pipeline, "max_batch_size", 2)
+    monkeypatch.setattr(batch_jobs, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(batch_jobs, "get_provider", lambda _name: fake)
+    monkeypatch.setattr(batch_jobs, "_submit_retry_at", {})
+    return fake
+
+
+def _score(article_id: int) -> ArticleScoringResult:
+    return ArticleScoringResult(
+        article_id=article_id, interest_score=7, quality_score=6, reasoning="ok"
+    )
+
+
+@pytest.mark.asyncio
+async def test_backlog_submitted_and_results_applied(
+    test_session, make_feed, make_article, provider
+):
+    feed = make_feed()
+    articles = [
+        make_article(feed.id, scoring_state="queued", queue_lane="backlog")
+        for _ in range(3)
+    ]
+    ids = [a.id for a in articles]
+    # Interactive and fresh work stays with the synchronous workers
+    others = [
+        make_article(feed.id, scoring_state="queued", queue_lane=lane)
+        for lane in ("interactive", "fresh")
+    ]
+
+    job = await batch_jobs.submit_backlog(test_session, TASK_SCORING)
+    assert job is not None
+    assert len(provider.prompts) == 2  # max_batch_size articles per request
+    for art in articles:
+        test_session.refresh(art)
+        assert art.scoring_state == "scoring"
+        assert art.lease_owner.startswith(BATCH_JOB_OWNER_PREFIX)
+    for art in others:
+        test_session.refresh(art)
+        assert art.scoring_state == "queued"
+    # One job per task at a time
+    assert await batch_jobs.submit_backlog(test_session, TASK_SCORING) is None
+
+    assert await batch_jobs.poll_batch_jobs(test_session) == 0
+    provider.status = BatchJobStatus(
+        state="succeeded", results=[_score(ids[0]), _score(ids[1]), _score(999)]
+    )
+    assert await batch_jobs.poll_batch_jobs(test_session) == 2
+
+    for art in articles:
+        test_session.refresh(art)
+    assert [a.scoring_state for a in articles] == ["scored", "scored", "queued"]
+    assert articles[0].interest_score == 7
+    assert articles[2].scoring_attempts == 1
+    job = test_session.exec(select(ProviderBatchJob)).one()
+    assert job.state == "applied"
+
+
+@pytest.mark.asyncio
+async def test_requeued_articles_keep_their_newer_state(
+    test_session, make_feed, make_article, provider
+):
+    feed = make_feed()
+    articles = [
+        make_article(feed.id, scoring_state="queued", queue_lane="backlog")
+        for _ in range(3)
+    ]
+    await batch_jobs.submit_backlog(test_session, TASK_SCORING)
+
+    # Rescored after an interests change while the job was running
+    articles[0].scoring_state = "queued"
+    test_session.add(articles[0])
+    test_session.commit()
+
+    provider.status = BatchJobStatus(
+        state="succeeded", results=[_score(a.id) for a in articles]
+    )
+    assert await batch_jobs.poll_batch_jobs(test_session) == 2
+    test_session.refresh(articles[0])
+    assert articles[0].scoring_state == "queued"
+    assert articles[0].interest_score is None
+
+
+@pytest.mark.asyncio
+async def test_small_queue_stays_synchronous(
+    test_session, make_feed, make_article, provider
+):
+    feed = make_feed()
+    make_article(feed.id, scoring_state="queued", queue_lane="backlog")
+    # Only the backlog lane counts towards the threshold
+    for _ in range(3):
+        make_article(feed.id, scoring_state="queued", queue_lane="fresh")
+
+    assert await batch_jobs.submit_backlog(test_session, TASK_SCORING) is None
+    assert provider.prompts == []
+
+
+class FakeGeminiBatchAPI:
+    """Local HTTP stand-in for the Gemini batch endpoints."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.done = False
+        self.endpoint = ""
+
+    async def start(self) -> asyncio.Server:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.endpoint = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        return server
+
+    def _response(self, method: str, path: str, body: bytes) -> dict:
+        if method == "POST" and path.endswith(":batchGenerateContent"):
+            self.requests = json.loads(body)["batch"]["inputConfig"]["requests"][
+                "requests"
+            ]
+            return {"name": "batches/1", "metadata": {"state": "BATCH_STATE_PENDING"}}
+        if not self.done:
+            return {"name": "batches/1", "metadata": {"state": "BATCH_STATE_RUNNING"}}
+        responses = []
+        for item in self.requests:
+            text = item["request"]["contents"][0]["parts"][0]["text"]
+            results = [
+                {
+                    "article_id": int(aid),
+                    "interest_score": 8,
+                    "quality_score": 7,
+                    "reasoning": "fine",
+                }
+                for aid in re.findall(r"<article id:(\d+)>", text)
+            ]
+            responses.append(
+                {
+                    "response": {
+                        "candidates": [
+                            {
+                                "content": {
+                                    "role": "model",
+                                    "parts": [
+                                        {"text": json.dumps({"results": results})}
+                                    ],
+                                }
+                            }
+                        ]
+                    }
+                }
+            )
+        return {
+            "name": "batches/1",
+            "metadata": {
+                "state": "BATCH_STATE_SUCCEEDED",
+                "output": {"inlinedResponses": {"inlinedResponses": responses}},
+            },
+        }
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while request_line := await reader.readline():
+                method, path, _ = request_line.decode().split(" ", 2)
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length) if length else b""
+                payload = json.dumps(self._response(method, path, body)).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_google_batch_job_against_local_stand_in(monkeypatch):
+    api = FakeGeminiBatchAPI()
+    server = await api.start()
+    monkeypatch.setenv("GOOGLE_GEMINI_BASE_URL", api.endpoint)
+    monkeypatch.setattr(google, "_clients", {})
+    provider = google.GoogleProvider()
+    config = ProviderTaskConfig(
+        endpoint=None, model="gemini-2.5-flash", thinking=False, api_key="k"
+    )
+    prompts = [
+        ("system", "<article id:1>\nTitle: a\n</article>"),
+        ("system", "<article id:2>\nTitle: b\n</article>"),
+    ]
+    try:
+        job_name = await provider.submit_batch_job(
+            config, TASK_SCORING, prompts, BatchScoringResponse
+        )
+        assert job_name == "batches/1"
+        assert len(api.requests) == 2
+        assert api.requests[0]["request"]["systemInstruction"]["parts"] == [
+            {"text": "system"}
+        ]
+
+        status = await provider.poll_batch_job(config, job_name, BatchScoringResponse)
+        assert status.state == "running"
+
+        api.done = True
+        status = await provider.poll_batch_job(config, job_name, BatchScoringResponse)
+        assert status.state == "succeeded"
+        assert [r.article_id for r in status.results] == [1, 2]
+    finally:
+        await provider.close()
+        server.close()
+        await server.wait_closed()
@@ -1,7 +1,18 @@
 """Tests for batch prompt builder functions."""
 
-from backend.prompts.categorization import build_batch_categorization_prompt
-from backend.prompts.scoring import build_batch_scoring_prompt
+from backend.prompts.categorization import (
+    BATCH_CATEGORIZATION_INSTRUCTIONS,
+    build_batch_categorization_prompt,
+)
+from backend.prompts.combined import (
+    BATCH_COMBINED_INSTRUCTIONS,
+    ArticleCombinedResult,
+    build_batch_combined_prompt,
+)
+from backend.prompts.scoring import (
+    BATCH_SCORING_INSTRUCTIONS,
+    build_batch_scoring_prompt,
+)
 
 SAMPLE_ARTICLES = [
     {"id": 1, "title": "AI Advances", "content_markdown": "Content about AI."},
@@ -67,6 +78,22 @@ class TestBuildBatchCategorizationPrompt:
         assert "Politics" in system_prompt
         assert "Sports" in system_prompt
 
+    def test_system_prompt_is_byte_stable_across_batches(self):
+        first, _ = build_batch_categorization_prompt(
+            articles=SAMPLE_ARTICLES[:1],
+            existing_categories=EXISTING_CATEGORIES,
+            category_hierarchy={"Technology": ["Programming", "AI"]},
+            hidden_categories=["Sports", "Politics"],
+        )
+        second, _ = build_batch_categorization_prompt(
+            articles=SAMPLE_ARTICLES[1:],
+            existing_categories=list(reversed(EXISTING_CATEGORIES)),
+            category_hierarchy={"Technology": ["AI", "Programming"]},
+            hidden_categories=["Politics", "Sports"],
+        )
+        assert first == second
+        assert first.startswith(BATCH_CATEGORIZATION_INSTRUCTIONS)
+
 
 class TestBuildBatchScoringPrompt:
     def test_returns_tuple(self):
@@ -109,3 +136,48 @@ class TestBuildBatchScoringPrompt:
         )
         assert "results" in system_prompt.lower()
         assert "article_id" in system_prompt
+
+    def test_system_prompt_starts_with_static_instructions(self):
+        system_prompt, _ = build_batch_scoring_prompt(
+            articles=SAMPLE_ARTICLES,
+            interests="AI",
+            anti_interests="Sports",
+        )
+        assert system_prompt.startswith(BATCH_SCORING_INSTRUCTIONS)
+        assert "**User Interests:**\nAI" in system_prompt
+
+
+class TestBuildBatchCombinedPrompt:
+    def test_preferences_precede_category_context(self):
+        system_prompt, user_message = build_batch_combined_prompt(
+            articles=SAMPLE_ARTICLES,
+            existing_categories=EXISTING_CATEGORIES,
+            interests="AI",
+            anti_interests="Sports",
+            hidden_categories=["Gossip"],
+        )
+        assert system_prompt.startswith(BATCH_COMBINED_INSTRUCTIONS)
+        assert (
+            system_prompt.index("**User Interests:**\nAI")
+            < system_prompt.index("**Existing categories:** AI, Science, Technology")
+            < system_prompt.index("Gossip")
+        )
+        assert "<article id:2>" in user_message
+
+    def test_result_splits_into_task_results(self):
+        result = ArticleCombinedResult(
+            article_id=7,
+            categories=["AI"],
+            suggested_new=["Robotics"],
+            suggested_parent="Technology",
+            interest_score=8,
+            quality_score=6,
+            reasoning="Relevant",
+        )
+        assert result.categorization().suggested_new == ["Robotics"]
+        assert result.scoring().model_dump() == {
+            "article_id": 7,
+            "interest_score": 8,
+            "quality_score": 6,
+            "reasoning": "Relevant",
+        }
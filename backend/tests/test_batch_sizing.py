@@ -0,0 +1,110 @@
+"""Tests for the adaptive per-task batch size controller."""
+
+import httpx
+import pytest
+
+from backend import batch_sizing
+from backend.batch_sizing import (
+    GROW_AFTER_CLEAN_BATCHES,
+    AdaptiveBatchController,
+    classify_batch_error,
+)
+from backend.llm_providers.base import LLMValidationError
+
+
+def _controller(configured: int = 4, min_size: int = 1, max_size: int | None = 10):
+    controller = AdaptiveBatchController("scoring", min_size, max_size)
+    controller.effective_size(configured)
+    return controller
+
+
+def test_starts_at_configured_size_clamped_to_bounds():
+    assert _controller(configured=4).current == 4
+    assert _controller(configured=20, max_size=8).current == 8
+    assert _controller(configured=1, min_size=2).current == 2
+    # Without an upper bound the configured size is kept, and is the bound
+    unbounded = _controller(configured=30, max_size=None)
+    assert (unbounded.current, unbounded.max_size) == (30, 30)
+
+
+def test_grows_after_clean_full_batches():
+    controller = _controller(configured=4)
+    for _ in range(GROW_AFTER_CLEAN_BATCHES):
+        controller.record_success(requested=4, returned=4, elapsed=4.0)
+    assert controller.current == 5
+    assert "grew" in controller.reason
+
+
+def test_partial_batches_do_not_count_toward_growth():
+    controller = _controller(configured=4)
+    for _ in range(GROW_AFTER_CLEAN_BATCHES * 2):
+        controller.record_success(requested=2, returned=2, elapsed=1.0)
+    assert controller.current == 4
+
+
+def test_holds_when_larger_batches_are_slower_per_article():
+    controller = _controller(configured=4)
+    for _ in range(GROW_AFTER_CLEAN_BATCHES):
+        controller.record_success(requested=4, returned=4, elapsed=4.0)
+    assert controller.current == 5
+    # Size 5 takes 2s/article vs 1s/article at size 4
+    for _ in range(GROW_AFTER_CLEAN_BATCHES):
+        controller.record_success(requested=5, returned=5, elapsed=10.0)
+    assert controller.current == 5
+    assert "holding" in controller.reason
+
+
+def test_missing_results_shrink_batch():
+    controller = _controller(configured=6)
+    controller.record_success(requested=6, returned=3, elapsed=6.0)
+    assert controller.current == 3
+    assert "3/6 results missing" in controller.reason
+    assert controller.missing_rate > 0
+
+
+def test_validation_failure_halves_batch():
+    controller = _controller(configured=8)
+    controller.record_failure(requested=8, signal="validation")
+    assert controller.current == 4
+    assert controller.validation_errors == 1
+
+
+def test_shrink_never_goes_below_min():
+    controller = _controller(configured=2, min_size=2)
+    controller.record_failure(requested=2, signal="timeout")
+    assert controller.current == 2
+
+
+def test_config_change_reseeds_controller():
+    controller = _controller(configured=8)
+    controller.record_failure(requested=8, signal="timeout")
+    assert controller.effective_size(8) == 4
+    assert controller.effective_size(6) == 6
+
+
+def test_classify_batch_error():
+    assert (
+        classify_batch_error(LLMValidationError("{}", None, is_retryable=False))
+        == "validation"
+    )
+    assert classify_batch_error(httpx.ReadTimeout("slow")) == "timeout"
+    assert classify_batch_error(RuntimeError("429 Too Many Requests")) is None
+
+
+@pytest.fixture
+def fresh_controllers(monkeypatch):
+    monkeypatch.setattr(batch_sizing, "_controllers", {})
+
+
+def test_status_endpoint_reports_batch_size(test_client, fresh_controllers):
+    batch_sizing.resolve_batch_size("scoring", 5)
+    batch_sizing.record_batch_success("scoring", 5, 2, 5.0)
+
+    response = test_client.get("/api/scoring/status")
+    assert response.status_code == 200
+    data = response.json()
+    status = data["scoring_worker"]["batch_size"]
+    assert status["effective"] == 2
+    assert status["configured"] == 5
+    assert "missing" in status["reason"]
+    assert data["categorization"]["batch_size"]["effective"] is None
@@ -0,0 +1,275 @@
+"""Tests for LLM record/replay cassettes."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import backend.scoring_queue as scoring_queue_module
+from backend.config import get_settings
+from backend.llm_providers import registry
+from backend.llm_providers.base import (
+    BatchJobProvider,
+    CombinedTaskProvider,
+    EmbeddingProvider,
+    ProviderTaskConfig,
+)
+from backend.llm_providers.cassette import (
+    CassetteMiss,
+    RecordingProvider,
+    ReplayedError,
+    ReplayProvider,
+    recording_provider,
+    replay_provider,
+)
+from backend.models import UserPreferences
+from backend.prompts import ArticleCombinedResult, ArticleScoringResult
+from backend.prompts.grouping import GroupingResponse, GroupSuggestion
+from backend.scoring_queue import CategorizationWorker
+
+CONFIG = ProviderTaskConfig(endpoint="http://x", model="m", thinking=False)
+
+
+class StubProvider:
+    """Streams a score of article_id % 10 for every article but the last."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.fail = False
+
+    async def score(self, articles, interests, anti_interests, config, on_result=None):
+        if self.fail:
+            raise RuntimeError("429 Too Many Requests")
+        results = []
+        for article in articles[:-1]:
+            result = ArticleScoringResult(
+                article_id=article["id"],
+                interest_score=article["id"] % 10,
+                quality_score=5,
+                reasoning="stub",
+            )
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+        return results
+
+    async def suggest_groups(self, all_categories, existing_groups, config):
+        return GroupingResponse(
+            groups=[GroupSuggestion(parent="Tech", children=all_categories)]
+        )
+
+
+class CombinedStub:
+    """Categorizes every article as AI and scores it 8, in one call."""
+
+    name = "combined"
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse_config(self, _config_json, _task):
+        return CONFIG
+
+    async def categorize_and_score(
+        self,
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ):
+        self.calls += 1
+        return [
+            ArticleCombinedResult(
+                article_id=a["id"],
+                categories=["AI"],
+                interest_score=8,
+                quality_score=6,
+                reasoning="stub",
+            )
+            for a in articles
+        ]
+
+    async def embed(self, texts, config):
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def _articles(*ids: int) -> list[dict]:
+    return [
+        {"id": i, "title": f"Title {i}", "content_markdown": f"Body {i}"} for i in ids
+    ]
+
+
+async def _record(tmp_path, *batches: list[dict]) -> str:
+    path = str(tmp_path / "cassette.jsonl")
+    recorder = RecordingProvider(StubProvider(), path)  # pyright: ignore[reportArgumentType]
+    for batch in batches:
+        await recorder.score(batch, "ai", "", CONFIG)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_replay_maps_recorded_results_onto_new_ids(tmp_path):
+    path = await _record(tmp_path, _articles(1, 2, 3))
+    replay = ReplayProvider(path, realtime=False)
+    streamed = []
+
+    # Same articles under different IDs, as in a freshly ingested database
+    results = await replay.score(
+        [
+            {**a, "id": new_id}
+            for a, new_id in zip(_articles(1, 2, 3), (11, 12, 13), strict=True)
+        ],
+        "ai",
+        "",
+        CONFIG,
+        on_result=streamed.append,
+    )
+
+    assert [(r.article_id, r.interest_score) for r in results] == [(11, 1), (12, 2)]
+    assert streamed == results
+    assert replay.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_batch_assembled_per_article(tmp_path):
+    path = await _record(tmp_path, _articles(1, 2, 3), _articles(4, 5))
+    replay = ReplayProvider(path, realtime=False)
+
+    results = await replay.score(_articles(2, 4, 5), "ai", "", CONFIG)
+
+    # Article 5 was dropped when recorded, so it gets no result on replay
+    assert {r.article_id for r in results} == {2, 4}
+    assert replay.article_hits == 1
+    with pytest.raises(CassetteMiss):
+        await replay.score(_articles(2, 4), "other interests", "", CONFIG)
+
+
+@pytest.mark.asyncio
+async def test_recorded_errors_and_groupings_replayed(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    stub = StubProvider()
+    recorder = RecordingProvider(stub, path)  # pyright: ignore[reportArgumentType]
+    stub.fail = True
+    with pytest.raises(RuntimeError):
+        await recorder.score(_articles(1, 2), "ai", "", CONFIG)
+    groups = await recorder.suggest_groups(["ai", "web"], {}, CONFIG)
+
+    replay = ReplayProvider(path, realtime=False)
+    with pytest.raises(ReplayedError, match="429"):
+        await replay.score(_articles(1, 2), "ai", "", CONFIG)
+    assert await replay.suggest_groups(["ai", "web"], {}, CONFIG) == groups
+
+
+def test_registry_wraps_providers_when_cassette_configured(tmp_path, monkeypatch):
+    pipeline = get_settings().pipeline
+    monkeypatch.setattr(registry, "_cassette_providers", {})
+    monkeypatch.setattr(pipeline, "llm_record_path", str(tmp_path / "rec.jsonl"))
+
+    provider = registry.get_provider("ollama")
+    assert isinstance(provider, RecordingProvider)
+    assert provider.inner is registry.PROVIDERS["ollama"]
+    assert registry.get_provider("ollama") is provider
+
+    (tmp_path / "replay.jsonl").write_text("")
+    monkeypatch.setattr(pipeline, "llm_replay_path", str(tmp_path / "replay.jsonl"))
+    assert isinstance(registry.get_provider("ollama"), ReplayProvider)
+
+
+def test_wrappers_expose_only_the_protocols_the_provider_implements(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    path.write_text("")
+
+    stub = recording_provider(StubProvider(), str(path))  # pyright: ignore[reportArgumentType]
+    assert not isinstance(stub, CombinedTaskProvider | EmbeddingProvider)
+    recorder = recording_provider(CombinedStub(), str(path))  # pyright: ignore[reportArgumentType]
+    assert isinstance(recorder, RecordingProvider)
+    assert isinstance(recorder, CombinedTaskProvider)
+    assert isinstance(recorder, EmbeddingProvider)
+    assert not isinstance(recorder, BatchJobProvider)
+
+    google = registry.PROVIDERS["google"]
+    assert isinstance(recording_provider(google, str(path)), BatchJobProvider)
+    # A batch job would escape the cassette, so replay never offers one
+    assert not isinstance(replay_provider(str(path), inner=google), BatchJobProvider)
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_recorded_and_replayed(
+    tmp_path, test_session, make_feed, make_article, monkeypatch
+):
+    stub = CombinedStub()
+    pipeline = get_settings().pipeline
+    monkeypatch.setattr(registry, "_cassette_providers", {})
+    monkeypatch.setitem(registry.PROVIDERS, stub.name, stub)
+    monkeypatch.setattr(pipeline, "llm_record_path", str(tmp_path / "rec.jsonl"))
+    monkeypatch.setattr(pipeline, "combined_mode", True)
+
+    async def _ready(*_a, **_kw):
+        return SimpleNamespace(
+            ready=True,
+            provider=stub.name,
+            model="m",
+            endpoint="http://x",
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    for limiter in ("is_categorization_rate_limited", "is_scoring_rate_limited"):
+        monkeypatch.setattr(scoring_queue_module, limiter, lambda: False)
+    test_session.add(UserPreferences(interests="ai", anti_interests=""))
+    feed = make_feed()
+    article = make_article(
+        feed.id, categorization_state="queued", content_markdown="Body"
+    )
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=5
+    )
+
+    assert processed == 1
+    assert stub.calls == 1
+    test_session.refresh(article)
+    assert (article.categorization_state, article.scoring_state) == (
+        "categorized",
+        "scored",
+    )
+    (entry,) = [
+        json.loads(line) for line in (tmp_path / "rec.jsonl").read_text().splitlines()
+    ]
+    assert entry["method"] == "categorize_and_score"
+
+    # The same run replayed from the cassette never reaches the provider
+    monkeypatch.setattr(pipeline, "llm_record_path", None)
+    monkeypatch.setattr(pipeline, "llm_replay_path", str(tmp_path / "rec.jsonl"))
+    article.categorization_state = "queued"
+    article.scoring_state = "unscored"
+    article.interest_score = None
+    test_session.add(article)
+    test_session.commit()
+
+    assert await CategorizationWorker().process_next_batch(test_session, 5) == 1
+    assert stub.calls == 1
+    test_session.refresh(article)
+    assert (article.scoring_state, article.interest_score) == ("scored", 8)
+
+
+@pytest.mark.asyncio
+async def test_embeddings_recorded_and_replayed_per_text(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    recorder = recording_provider(CombinedStub(), path)  # pyright: ignore[reportArgumentType]
+    assert isinstance(recorder, EmbeddingProvider)
+    vectors = await recorder.embed(["a", "bb"], CONFIG)
+
+    replay = replay_provider(path, realtime=False)
+    assert isinstance(replay, EmbeddingProvider)
+    assert await replay.embed(["a", "bb"], CONFIG) == vectors
+    assert await replay.embed(["bb"], CONFIG) == vectors[1:]
+    with pytest.raises(CassetteMiss):
+        await replay.embed(["a", "new"], CONFIG)
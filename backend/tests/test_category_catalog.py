@@ -0,0 +1,86 @@
+"""Tests for the in-memory category catalog and its invalidation."""
+
+from sqlalchemy import event, update
+from sqlmodel import Session
+
+from backend.category_catalog import get_catalog
+from backend.models import Category
+from backend.scoring import get_active_categories
+
+
+def _category(session, name: str, **overrides) -> Category:
+    category = Category(display_name=name, slug=name.lower(), **overrides)
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+    return category
+
+
+def _count_category_queries(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, _params, _context, _executemany):
+        if "FROM categories" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+def test_catalog_matches_table_and_is_reused(test_session, test_engine):
+    parent = _category(test_session, "Science")
+    _category(test_session, "Physics", parent_id=parent.id)
+    _category(test_session, "Gossip", is_hidden=True)
+
+    queries = _count_category_queries(test_engine)
+    assert get_active_categories(test_session) == (
+        ["Physics", "Science"],
+        {"Science": ["Physics"]},
+        ["Gossip"],
+    )
+    catalog = get_catalog(test_session)
+    assert catalog.by_slug["physics"].parent is catalog.by_slug["science"]
+    assert get_catalog(test_session) is catalog
+    assert len(queries) == 1
+
+
+def test_committed_category_writes_invalidate(test_session, test_engine):
+    science = _category(test_session, "Science")
+    catalog = get_catalog(test_session)
+
+    _category(test_session, "Physics")
+    after_insert = get_catalog(test_session)
+    assert after_insert is not catalog
+    assert "physics" in after_insert.by_slug
+
+    with Session(test_engine) as other:
+        other.exec(  # pyright: ignore[reportCallIssue]
+            update(Category)
+            .where(Category.id == science.id)  # pyright: ignore[reportArgumentType]
+            .values(weight="boost")
+        )
+        assert get_catalog(test_session) is after_insert  # not committed yet
+        other.commit()
+    assert get_catalog(test_session).by_slug["science"].weight == "boost"
+
+
+def test_rolled_back_writes_keep_catalog(test_session):
+    _category(test_session, "Science")
+    catalog = get_catalog(test_session)
+
+    test_session.add(Category(display_name="Physics", slug="physics"))
+    test_session.flush()
+    test_session.rollback()
+
+    assert get_catalog(test_session) is catalog
+
+
+def test_endpoint_edit_invalidates(test_client, test_session):
+    science = _category(test_session, "Science")
+    assert get_catalog(test_session).by_id[science.id].weight is None
+
+    response = test_client.patch(
+        f"/api/categories/{science.id}", json={"weight": "reduce"}
+    )
+    assert response.status_code == 200
+    assert get_catalog(test_session).by_id[science.id].weight == "reduce"
@@ -0,0 +1,61 @@
+"""Tests for the per-batch category shortlist."""
+
+from backend.category_catalog import get_catalog
+from backend.category_shortlist import shortlist_categories
+from backend.models import Category
+
+
+def _categories(session, parent_children: dict[str, list[str]], hidden=()):
+    for parent_name, children in parent_children.items():
+        parent = Category(display_name=parent_name, slug=parent_name.lower())
+        session.add(parent)
+        session.flush()
+        for name in children:
+            session.add(
+                Category(
+                    display_name=name,
+                    slug=name.lower().replace(" ", "-"),
+                    parent_id=parent.id,
+                )
+            )
+    for name in hidden:
+        session.add(Category(display_name=name, slug=name.lower(), is_hidden=True))
+    session.commit()
+
+
+def test_small_catalog_is_sent_whole(test_session):
+    _categories(test_session, {"Science": ["Space"]}, hidden=["Gossip"])
+    catalog = get_catalog(test_session)
+
+    assert shortlist_categories(catalog, [{"title": "x"}], size=10) == (
+        catalog.active_names,
+        catalog.hierarchy,
+        catalog.hidden_names,
+    )
+
+
+def test_shortlist_keeps_matching_branches(test_session):
+    _categories(
+        test_session,
+        {
+            "Science": ["Space", "Climate"],
+            "Entertainment": ["Video Games", "Film", "Music"],
+            "Business": ["Startups", "Finance"],
+        },
+        hidden=["Celebrity", "Crypto"],
+    )
+    articles = [
+        {"title": "Rocket reaches space", "content_markdown": "A launch to orbit."},
+        {"title": "Indie gaming", "content_markdown": "Small studios and games."},
+        {"title": "Celebrity news", "content_markdown": "Red carpet."},
+    ]
+
+    names, hierarchy, hidden = shortlist_categories(
+        get_catalog(test_session), articles, size=5
+    )
+
+    assert {"Space", "Video Games", "Science", "Entertainment"} <= set(names)
+    assert "Finance" not in names
+    assert hierarchy == {"Entertainment": ["Video Games"], "Science": ["Space"]}
+    # Hidden categories are never cut, even without a lexical hit
+    assert hidden == ["Celebrity", "Crypto"]
@@ -0,0 +1,229 @@
+"""Tests for the embedding index and k-NN categorization."""
+
+import random
+
+import pytest
+from sqlmodel import select
+
+import backend.embeddings as embeddings_module
+import backend.scoring_queue as scoring_queue_module
+from backend import metrics
+from backend.embeddings import (
+    EmbeddingIndex,
+    backfill,
+    categorize_by_neighbours,
+    get_knn_stats,
+)
+from backend.llm_providers.base import ProviderTaskConfig
+from backend.models import Article, ArticleCategoryLink
+from backend.prompts import ArticleCategoryResult
+from backend.scoring_queue import CategorizationWorker
+
+_DIM = 8
+_rng = random.Random(3)
+
+
+def _near(axis: int) -> list[float]:
+    """A vector close to one axis, i.e. to one topic."""
+    vector = [_rng.uniform(-0.05, 0.05) for _ in range(_DIM)]
+    vector[axis] += 1.0
+    return vector
+
+
+class EmbeddingProvider:
+    """Embeds "topic N" texts near axis N; categorizes everything as Misc."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.embed_calls: list[list[str]] = []
+        self.categorize_calls: list[list[dict]] = []
+
+    async def embed(self, texts, config):
+        self.embed_calls.append(texts)
+        return [_near(int(text.split()[1])) for text in texts]
+
+    async def categorize(self, articles, *_args, on_result=None, **_kwargs):
+        self.categorize_calls.append(articles)
+        return [
+            ArticleCategoryResult(article_id=a["id"], categories=["Misc"])
+            for a in articles
+        ]
+
+
+_CONFIG = ProviderTaskConfig(endpoint="http://fake", model="fake", thinking=False)
+
+
+@pytest.fixture(autouse=True)
+def _index(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        embeddings_module, "index_directory", lambda: str(tmp_path / "embeddings")
+    )
+    pipeline = embeddings_module.get_settings().pipeline
+    monkeypatch.setattr(pipeline, "embedding_model", "embed-model")
+    monkeypatch.setattr(pipeline, "knn_min_similarity", 0.9)
+    embeddings_module.reset()
+    yield
+    embeddings_module.reset()
+
+
+def _categorized(session, feed, topic: int, count: int, category):
+    """LLM-categorized articles about one topic, indexed."""
+    articles = []
+    for _ in range(count):
+        art = Article(
+            feed_id=feed.id,
+            title=f"topic {topic}",
+            url=f"https://example.com/{topic}/{len(articles)}-{_rng.random()}",
+            categorization_state="categorized",
+            category_source="llm",
+            scoring_state="scored",
+        )
+        session.add(art)
+        session.flush()
+        session.add(ArticleCategoryLink(article_id=art.id, category_id=category.id))
+        articles.append(art)
+    session.commit()
+    embeddings_module.index_vectors({art.id: _near(topic) for art in articles})
+    return articles
+
+
+def test_index_persists_and_keeps_latest_rows(tmp_path):
+    index = EmbeddingIndex(str(tmp_path), "m", _DIM)
+    index.add({1: _near(0), 2: _near(1)})
+    index.add({1: _near(2)})  # recategorized: the new vector replaces the old
+
+    assert index.search(_near(2), k=1)[0][0] == 1
+    assert [aid for aid, _ in index.search(_near(0), k=5) if aid == 1] == []
+    index.close()
+
+    reopened = EmbeddingIndex(str(tmp_path), "m", _DIM)
+    assert len(reopened) == 2
+    assert reopened.search(_near(1), k=1)[0][0] == 2
+    assert 2 not in {aid for aid, _ in reopened.search(_near(1), k=5, exclude=2)}
+    reopened.close()
+
+    # A torn append is cut back to the complete rows
+    with open(tmp_path / "vectors.f32", "ab") as f:
+        f.write(b"\0" * 5)
+    torn = EmbeddingIndex(str(tmp_path), "m", _DIM)
+    assert len(torn) == 2
+    torn.add({3: _near(3)})
+    assert torn.search(_near(3), k=1)[0][0] == 3
+    torn.close()
+
+    assert len(EmbeddingIndex(str(tmp_path), "other-model", _DIM)) == 0
+
+
+def test_neighbours_must_agree(test_session, make_feed, make_category):
+    feed = make_feed()
+    rust = make_category(display_name="Rust", slug="rust")
+    go = make_category(display_name="Go", slug="go")
+    hidden = make_category(display_name="Hidden", slug="hidden", is_hidden=True)
+    _categorized(test_session, feed, 0, 5, rust)
+    _categorized(test_session, feed, 1, 3, rust)
+    _categorized(test_session, feed, 1, 3, go)
+    _categorized(test_session, feed, 2, 5, hidden)
+
+    results = categorize_by_neighbours(
+        test_session, {100: _near(0), 101: _near(1), 102: _near(2), 103: _near(3)}
+    )
+
+    # Split vote, hidden category, no neighbours close enough
+    assert list(results) == [100]
+    assert results[100].categories == ["rust"]
+
+
+@pytest.mark.asyncio
+async def test_worker_skips_llm_when_neighbours_agree(
+    test_session, make_feed, make_category, monkeypatch
+):
+    feed = make_feed()
+    rust = make_category(display_name="Rust", slug="rust")
+    _categorized(test_session, feed, 0, 5, rust)
+    familiar = Article(
+        feed_id=feed.id,
+        title="topic 0",
+        url="https://example.com/familiar",
+        categorization_state="queued",
+    )
+    novel = Article(
+        feed_id=feed.id,
+        title="topic 5",
+        url="https://example.com/novel",
+        categorization_state="queued",
+    )
+    test_session.add_all([familiar, novel])
+    test_session.commit()
+
+    provider = EmbeddingProvider()
+
+    async def _ready(*_a, **_kw):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            ready=True,
+            provider="fake",
+            model="fake-model",
+            endpoint="http://fake",
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(scoring_queue_module, "get_provider", lambda _name: provider)
+    monkeypatch.setattr(
+        scoring_queue_module, "is_categorization_rate_limited", lambda: False
+    )
+    assigned_before = metrics.KNN_ARTICLES.value(outcome="assigned")
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=2
+    )
+
+    assert processed == 2
+    assert [a["id"] for a in provider.categorize_calls[0]] == [novel.id]
+    for art, source in ((familiar, "knn"), (novel, "llm")):
+        test_session.refresh(art)
+        assert (art.categorization_state, art.category_source) == (
+            "categorized",
+            source,
+        )
+    assert test_session.exec(
+        select(ArticleCategoryLink.category_id).where(
+            ArticleCategoryLink.article_id == familiar.id
+        )
+    ).all() == [rust.id]
+    assert metrics.KNN_ARTICLES.value(outcome="assigned") == assigned_before + 1
+
+    # Only the LLM's categorization joined the index
+    stats = get_knn_stats()
+    assert stats["indexed"] == 6
+    assert 0 < stats["llm_calls_avoided"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_walks_down_from_newest(test_session, make_feed, monkeypatch):
+    monkeypatch.setattr(embeddings_module, "BACKFILL_BATCH", 3)
+    feed = make_feed()
+    for i, source in enumerate(["llm", "llm", "knn", "llm", "llm", "llm"]):
+        test_session.add(
+            Article(
+                feed_id=feed.id,
+                title=f"topic {i}",
+                url=f"https://example.com/backfill-{i}",
+                categorization_state="categorized",
+                category_source=source,
+            )
+        )
+    test_session.commit()
+    provider = EmbeddingProvider()
+
+    assert await backfill(test_session, provider, _CONFIG) == 3
+    assert await backfill(test_session, provider, _CONFIG) == 2
+    assert await backfill(test_session, provider, _CONFIG) == 0
+
+    embeddings_module.reset()
+    assert get_knn_stats()["indexed"] == 5
+    assert embeddings_module._get_index().backfill_before == 1  # pyright: ignore[reportOptionalMemberAccess]
@@ -0,0 +1,234 @@
+"""Tests for SimHash near-duplicate detection and result inheritance."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import select
+
+import backend.database as database_module
+import backend.scoring_queue as scoring_queue_module
+from backend.feeds import save_articles
+from backend.fingerprint import (
+    MIN_WORDS,
+    NO_FINGERPRINT,
+    SIMHASH_BANDS,
+    compute_simhash,
+    find_near_duplicate,
+    hamming_distance,
+    simhash_bands,
+)
+from backend.models import Article, ArticleCategoryLink, ArticleSimhashBand, Feed
+from backend.scoring_queue import CategorizationWorker
+
+_rng = random.Random(42)
+_WORDS = [f"word{i}" for i in range(500)]
+STORY = " ".join(_rng.choices(_WORDS, k=400))
+OTHER_STORY = " ".join(_rng.choices(_WORDS, k=400))
+
+
+def _edited(text: str) -> str:
+    words = text.split()
+    words[100] = "changed"
+    return " ".join(words) + " Read more at the source."
+
+
+def test_short_text_has_no_fingerprint():
+    assert compute_simhash(None) is None
+    assert compute_simhash(" ".join(["word"] * (MIN_WORDS - 1))) is None
+
+
+def test_fingerprint_is_signed_64_bit_and_deterministic():
+    fp = compute_simhash(STORY)
+    assert fp is not None
+    assert -(2**63) <= fp < 2**63
+    assert compute_simhash(STORY) == fp
+
+
+def test_near_duplicates_are_close_and_unrelated_far():
+    fp = compute_simhash(STORY)
+    edited = compute_simhash(_edited(STORY))
+    other = compute_simhash(OTHER_STORY)
+    assert fp is not None and edited is not None and other is not None
+
+    assert hamming_distance(fp, edited) < SIMHASH_BANDS
+    assert hamming_distance(fp, other) > 16
+
+
+def test_save_articles_indexes_fingerprint(test_session, make_feed):
+    feed = make_feed()
+    entries = [
+        {"link": "https://example.com/long", "title": "Long", "summary": STORY},
+        {"link": "https://example.com/short", "title": "Short", "summary": "Hi"},
+    ]
+    _, (long_id, short_id) = save_articles(test_session, feed.id, entries)
+
+    bands = test_session.exec(select(ArticleSimhashBand)).all()
+    assert {b.article_id for b in bands} == {long_id}
+    assert len(bands) == SIMHASH_BANDS
+
+
+def test_backfill_marks_short_articles_and_skips_them_later(
+    test_engine, test_session, make_feed, monkeypatch
+):
+    feed = make_feed()
+    for url, text in (("long", STORY), ("short", "Hi"), ("empty", None)):
+        test_session.add(
+            Article(
+                feed_id=feed.id,
+                title=url,
+                url=f"https://example.com/{url}",
+                content_markdown=text,
+            )
+        )
+    test_session.commit()
+    monkeypatch.setattr(database_module, "engine", test_engine)
+    monkeypatch.setattr(database_module, "_FINGERPRINT_BACKFILL_CHUNK", 1)
+
+    database_module._backfill_fingerprints()
+
+    simhashes = dict(test_session.exec(select(Article.title, Article.simhash)).all())
+    assert simhashes["long"] == compute_simhash(STORY)
+    assert simhashes["short"] == NO_FINGERPRINT
+    assert simhashes["empty"] is None
+    assert len(test_session.exec(select(ArticleSimhashBand)).all()) == SIMHASH_BANDS
+
+    fingerprinted: list[int] = []
+    monkeypatch.setattr(
+        "backend.fingerprint.fingerprint_article",
+        lambda _session, article: fingerprinted.append(article.id),
+    )
+    database_module._backfill_fingerprints()
+    assert fingerprinted == []
+
+
+def _indexed(session, feed: Feed, url: str, fingerprint: int, **overrides) -> Article:
+    article = Article(feed_id=feed.id, title=url, url=url, simhash=fingerprint)
+    for field, value in overrides.items():
+        setattr(article, field, value)
+    session.add(article)
+    session.flush()
+    for band, value in enumerate(simhash_bands(fingerprint)):
+        session.add(ArticleSimhashBand(article_id=article.id, band=band, value=value))
+    session.commit()
+    return article
+
+
+def test_lookup_requires_shared_bands_without_losing_matches(test_session, make_feed):
+    feed = make_feed()
+    fingerprint = compute_simhash(STORY)
+    assert fingerprint is not None
+    # One flipped bit in each of six bands: at the default maximum distance
+    # of 6, and sharing only the two bands left
+    six_bands = fingerprint ^ sum(1 << (band * 8) for band in range(6))
+    source = _indexed(
+        test_session,
+        feed,
+        "https://a.example/1",
+        six_bands,
+        categorization_state="categorized",
+        scoring_state="scored",
+    )
+    copy = _indexed(test_session, feed, "https://b.example/1", fingerprint)
+
+    assert hamming_distance(fingerprint, six_bands) == 6
+    assert find_near_duplicate(test_session, copy).id == source.id
+
+
+def _ingest(session, feed, url: str, text: str):
+    _, (article_id,) = save_articles(
+        session, feed.id, [{"link": url, "title": "Story", "summary": text}]
+    )
+    return article_id
+
+
+@pytest.fixture
+def patched_provider(monkeypatch):
+    calls: list[list[int]] = []
+
+    class _Provider:
+        async def categorize(self, articles, *_a, **_kw):
+            calls.append([a["id"] for a in articles])
+            return []
+
+    async def _ready(*_a, **_kw):
+        return SimpleNamespace(
+            ready=True,
+            provider="fake",
+            model="fake-model",
+            endpoint=None,
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(scoring_queue_module, "get_provider", lambda _n: _Provider())
+    monkeypatch.setattr(
+        scoring_queue_module, "is_categorization_rate_limited", lambda: False
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_inherits_categories_and_scores(
+    test_session, make_feed, make_category, patched_provider
+):
+    feed = make_feed()
+    category = make_category(display_name="Space", slug="space", weight="boost")
+    source_id = _ingest(test_session, feed, "https://a.example/story", STORY)
+    copy_id = _ingest(test_session, feed, "https://b.example/story", _edited(STORY))
+
+    source = test_session.get(Article, source_id)
+    source.categorization_state = "categorized"
+    source.scoring_state = "scored"
+    source.interest_score = 9
+    source.quality_score = 7
+    source.score_reasoning = "Great space story"
+    test_session.add(source)
+    test_session.add(ArticleCategoryLink(article_id=source_id, category_id=category.id))
+    copy = test_session.get(Article, copy_id)
+    copy.categorization_state = "queued"
+    test_session.add(copy)
+    test_session.commit()
+
+    assert find_near_duplicate(test_session, copy).id == source_id
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=5
+    )
+
+    assert processed == 1
+    assert patched_provider == []
+    test_session.refresh(copy)
+    assert copy.categorization_state == "categorized"
+    assert copy.scoring_state == "scored"
+    assert (copy.interest_score, copy.quality_score) == (9, 7)
+    assert copy.score_reasoning == "Great space story"
+    assert copy.composite_score is not None and copy.composite_score > 0
+    assert [c.slug for c in copy.categories_rel] == ["space"]
+
+
+@pytest.mark.asyncio
+async def test_rescore_request_does_not_inherit(
+    test_session, make_feed, patched_provider
+):
+    feed = make_feed()
+    source_id = _ingest(test_session, feed, "https://a.example/story", STORY)
+    copy_id = _ingest(test_session, feed, "https://b.example/story", STORY)
+
+    source = test_session.get(Article, source_id)
+    source.categorization_state = "categorized"
+    source.scoring_state = "scored"
+    source.interest_score = 5
+    source.quality_score = 5
+    test_session.add(source)
+    copy = test_session.get(Article, copy_id)
+    copy.categorization_state = "queued"
+    copy.scoring_priority = 1
+    test_session.add(copy)
+    test_session.commit()
+
+    await CategorizationWorker().process_next_batch(test_session, batch_size=5)
+
+    assert patched_provider == [[copy_id]]
@@ -238,3 +238,184 @@ async def test_list_models_empty_selected_returns_empty(monkeypatch):
 
     result = await provider.list_models(config)
     assert result == [], f"Expected empty list but got {len(result)} models"
+
+
+# --- Context caching ---
+
+
+def _cache_client(created: list[str], deleted: list[str], error=None):
+    from types import SimpleNamespace
+
+    async def _create(model, config):
+        if error is not None:
+            raise error
+        created.append(config.system_instruction)
+        return SimpleNamespace(name=f"cachedContents/{len(created)}")
+
+    async def _delete(name):
+        deleted.append(name)
+
+    return SimpleNamespace(
+        aio=SimpleNamespace(caches=SimpleNamespace(create=_create, delete=_delete))
+    )
+
+
+_CACHE_CONFIG = ProviderTaskConfig(
+    endpoint=None, model="gemini-2.5-flash", thinking=False, api_key="k"
+)
+
+
+@pytest.mark.asyncio
+async def test_context_cache_created_on_reuse_and_replaced_on_change(monkeypatch):
+    """A system prompt is cached once reused; a changed prompt starts over."""
+    from backend.llm_providers import google
+
+    monkeypatch.setattr(google, "_context_caches", {})
+    created: list[str] = []
+    deleted: list[str] = []
+    client = _cache_client(created, deleted)
+    prompt = "instructions " * 400
+
+    async def _cached(system_prompt: str) -> str | None:
+        return await google._cached_system_prompt(
+            client, _CACHE_CONFIG, "scoring", system_prompt
+        )
+
+    assert await _cached("short") is None
+    assert await _cached(prompt) is None
+    name = await _cached(prompt)
+    assert name == "cachedContents/1"
+    assert await _cached(prompt) == name
+
+    changed = prompt + "new interests"
+    assert await _cached(changed) is None
+    assert deleted == [name]
+    assert await _cached(changed) == "cachedContents/2"
+    assert created == [prompt, changed]
+
+
+@pytest.mark.asyncio
+async def test_context_cache_create_retried_after_backoff(monkeypatch):
+    from backend.llm_providers import google
+
+    monkeypatch.setattr(google, "_context_caches", {})
+    now = [1000.0]
+    monkeypatch.setattr(google.time, "monotonic", lambda: now[0])
+    created: list[str] = []
+    client = _cache_client(created, [], error=RuntimeError("unavailable"))
+    prompt = "instructions " * 400
+
+    async def _cached() -> str | None:
+        return await google._cached_system_prompt(
+            client, _CACHE_CONFIG, "scoring", prompt
+        )
+
+    assert await _cached() is None
+    assert await _cached() is None  # create fails
+    (entry,) = google._context_caches.values()
+    assert entry.retry_at == now[0] + google._CONTEXT_CACHE_RETRY_SECONDS
+
+    client.aio.caches = _cache_client(created, []).aio.caches
+    assert await _cached() is None  # still backing off
+    now[0] = entry.retry_at
+    assert await _cached() == "cachedContents/1"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_keeps_context_cache(monkeypatch):
+    """Only a rejected cache triggers a resend; a 429 propagates as is."""
+    from types import SimpleNamespace
+
+    from google.genai import errors
+    from pydantic import BaseModel
+
+    from backend.llm_providers import google
+
+    class _Result(BaseModel):
+        ok: bool
+
+    sent: list[str | None] = []
+    error = errors.ClientError(
+        429, {"error": {"message": "Quota exceeded", "status": "RESOURCE_EXHAUSTED"}}
+    )
+
+    async def _generate_content(model, contents, config):
+        sent.append(config.cached_content)
+        raise error
+
+    client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=_generate_content))
+    )
+
+    async def _client(_key):
+        return client
+
+    async def _cached(*_args):
+        return "cachedContents/1"
+
+    forgotten: list[str] = []
+    monkeypatch.setattr(google, "_get_client", _client)
+    monkeypatch.setattr(google, "_cached_system_prompt", _cached)
+    monkeypatch.setattr(google, "_forget_context_cache", forgotten.append)
+
+    with pytest.raises(errors.ClientError):
+        await GoogleProvider()._generate(
+            _CACHE_CONFIG, "system", "user", _Result, cache_task="scoring"
+        )
+    assert sent == ["cachedContents/1"]
+    assert forgotten == []
+
+    error.code = 403
+    error.message = "CachedContent not found (or permission denied)"
+    with pytest.raises(errors.ClientError):
+        await GoogleProvider()._generate(
+            _CACHE_CONFIG, "system", "user", _Result, cache_task="scoring"
+        )
+    assert sent == ["cachedContents/1", "cachedContents/1", None]
+    assert forgotten == ["cachedContents/1"]
+
+
+# --- Client reuse ---
+
+
+@pytest.mark.asyncio
+async def test_client_shared_per_api_key_until_close(monkeypatch):
+    from backend.llm_providers import google
+
+    monkeypatch.setattr(google, "_clients", {})
+    provider = GoogleProvider()
+
+    first = await google._get_client("key-a")
+    assert await google._get_client("key-a") is first
+    assert await google._get_client("key-b") is not first
+
+    await provider.close()
+    assert google._clients == {}
+    assert await google._get_client("key-a") is not first
+    await provider.close()
+
+
+def test_decrypted_api_key_memoized_until_ciphertext_changes(monkeypatch):
+    from backend import encryption
+    from backend.llm_providers import google
+
+    calls: list[str] = []
+
+    def _decrypt(ciphertext, _keyfile):
+        calls.append(ciphertext)
+        return f"plain-{ciphertext}"
+
+    monkeypatch.setattr(encryption, "decrypt_value", _decrypt)
+    monkeypatch.setattr(google, "_decrypted_key", None)
+    provider = GoogleProvider()
+
+    for _ in range(3):
+        config = provider.parse_config(
+            _google_config_json(api_key_encrypted="cipher-1"), "scoring"
+        )
+    assert config.api_key == "plain-cipher-1"
+    config = provider.parse_config(
+        _google_config_json(api_key_encrypted="cipher-2"), "scoring"
+    )
+    assert config.api_key == "plain-cipher-2"
+    assert calls == ["cipher-1", "cipher-2"]
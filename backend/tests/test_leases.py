@@ -0,0 +1,184 @@
+"""Tests for lease-based queue claiming and expired lease recovery."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from backend import leases, metrics
+from backend.deps import TASK_CATEGORIZATION, TASK_SCORING
+from backend.leases import (
+    BATCH_JOB_OWNER_PREFIX,
+    LANE_BACKLOG,
+    LANE_FRESH,
+    LANE_INTERACTIVE,
+    WORKER_ID,
+    claim_batch,
+    reap_expired_leases,
+)
+
+
+def test_claim_takes_queue_order_and_never_double_claims(
+    test_session, make_feed, make_article
+):
+    feed = make_feed()
+    base = datetime(2026, 1, 1)
+    old = make_article(feed.id, scoring_state="queued", published_at=base)
+    new = make_article(
+        feed.id, scoring_state="queued", published_at=base + timedelta(days=1)
+    )
+    urgent = make_article(
+        feed.id,
+        scoring_state="queued",
+        queue_lane=LANE_INTERACTIVE,
+        published_at=base + timedelta(days=2),
+    )
+    make_article(feed.id, scoring_state="scored")
+
+    first = claim_batch(test_session, TASK_SCORING, 2)
+    second = claim_batch(test_session, TASK_SCORING, 2)
+
+    assert [a.id for a in first] == [urgent.id, old.id]
+    assert [a.id for a in second] == [new.id]
+    assert claim_batch(test_session, TASK_SCORING, 2) == []
+    for article in first + second:
+        assert article.scoring_state == "scoring"
+        assert article.lease_owner == WORKER_ID
+        assert article.lease_expires_at > datetime.now()
+
+
+def test_reaper_releases_only_expired_leases(
+    test_session, test_engine, make_feed, make_article
+):
+    feed = make_feed()
+    past = datetime.now() - timedelta(minutes=1)
+    future = datetime.now() + timedelta(minutes=10)
+    expired = make_article(
+        feed.id, categorization_state="categorizing", lease_expires_at=past
+    )
+    live = make_article(feed.id, scoring_state="scoring", lease_expires_at=future)
+    legacy = make_article(feed.id, scoring_state="scoring")
+
+    with test_engine.begin() as conn:
+        assert reap_expired_leases(conn) == 2
+
+    for article in (expired, live, legacy):
+        test_session.refresh(article)
+    assert expired.categorization_state == "queued"
+    assert expired.lease_expires_at is None
+    assert live.scoring_state == "scoring"
+    assert legacy.scoring_state == "queued"
+
+    with test_engine.begin() as conn:
+        assert reap_expired_leases(conn, expired_only=False) == 1
+    test_session.refresh(live)
+    assert live.scoring_state == "queued"
+
+
+def test_startup_reaper_keeps_articles_held_by_batch_jobs(
+    test_session, test_engine, make_feed, make_article
+):
+    feed = make_feed()
+    held = make_article(
+        feed.id,
+        scoring_state="scoring",
+        lease_owner=f"{BATCH_JOB_OWNER_PREFIX}job",
+        lease_expires_at=datetime.now() + timedelta(hours=48),
+    )
+
+    with test_engine.begin() as conn:
+        assert reap_expired_leases(conn, expired_only=False) == 0
+    test_session.refresh(held)
+    assert held.scoring_state == "scoring"
+
+
+def test_fresh_lane_keeps_its_share_during_bulk_rescore(
+    test_session, make_feed, make_article, monkeypatch
+):
+    monkeypatch.setattr(leases, "_lane_credit", {})
+    feed = make_feed()
+    base = datetime(2026, 1, 1)
+    # The backlog is older, so plain oldest-first would drain it first
+    for i in range(8):
+        make_article(
+            feed.id,
+            scoring_state="queued",
+            queue_lane=LANE_BACKLOG,
+            published_at=base + timedelta(minutes=i),
+        )
+    for i in range(3):
+        make_article(
+            feed.id,
+            scoring_state="queued",
+            queue_lane=LANE_FRESH,
+            published_at=base + timedelta(days=1, minutes=i),
+        )
+
+    lanes = [
+        a.queue_lane
+        for _ in range(4)
+        for a in claim_batch(test_session, TASK_SCORING, 1)
+    ]
+    assert sorted(lanes) == [LANE_BACKLOG, LANE_FRESH, LANE_FRESH, LANE_FRESH]
+
+    # Once fresh work runs out the backlog gets every slot
+    assert [a.queue_lane for a in claim_batch(test_session, TASK_SCORING, 3)] == [
+        LANE_BACKLOG
+    ] * 3
+
+
+def test_interactive_preempts_and_wait_is_recorded_per_lane(
+    test_session, make_feed, make_article
+):
+    feed = make_feed()
+    make_article(
+        feed.id, categorization_state="queued", published_at=datetime(2026, 1, 1)
+    )
+    urgent = make_article(
+        feed.id,
+        categorization_state="queued",
+        queue_lane=LANE_INTERACTIVE,
+        queued_at=datetime.now() - timedelta(seconds=3),
+    )
+    waits = metrics.QUEUE_WAIT_SECONDS.count(
+        task=TASK_CATEGORIZATION, lane=LANE_INTERACTIVE
+    )
+
+    assert [a.id for a in claim_batch(test_session, TASK_CATEGORIZATION, 1)] == [
+        urgent.id
+    ]
+    assert (
+        metrics.QUEUE_WAIT_SECONDS.count(
+            task=TASK_CATEGORIZATION, lane=LANE_INTERACTIVE
+        )
+        == waits + 1
+    )
+
+
+def test_queue_scan_uses_composite_index(test_session):
+    for task_column, index in (
+        ("categorization_state", "ix_articles_categorization_queue"),
+        ("scoring_state", "ix_articles_scoring_queue"),
+    ):
+        plan = " ".join(
+            row[-1]
+            for row in test_session.connection().execute(
+                text(
+                    f"EXPLAIN QUERY PLAN SELECT id FROM articles "
+                    f"WHERE {task_column} = 'queued' AND queue_lane = 'fresh' "
+                    f"ORDER BY published_at ASC LIMIT 10"
+                )
+            )
+        )
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_claim_respects_task_state(test_session, make_feed, make_article):
+    feed = make_feed()
+    article = make_article(feed.id, categorization_state="queued")
+
+    assert claim_batch(test_session, TASK_SCORING, 5) == []
+    assert [a.id for a in claim_batch(test_session, TASK_CATEGORIZATION, 5)] == [
+        article.id
+    ]
+    assert article.categorization_state == "categorizing"
@@ -0,0 +1,276 @@
+"""Tests for the content-addressed LLM result cache."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import select
+
+import backend.scoring_queue as scoring_queue_module
+from backend import llm_cache
+from backend.models import Article, Category, LLMResultCache, UserPreferences
+from backend.prompts import ArticleCategoryResult, ArticleScoringResult
+from backend.scoring_queue import CategorizationWorker, ScoringWorker
+
+
+class CountingProvider:
+    """Fake provider that records which article IDs reach the LLM."""
+
+    name = "fake"
+
+    def __init__(self, *, score_error: Exception | None = None):
+        self.categorized: list[int] = []
+        self.scored: list[int] = []
+        self.score_error = score_error
+
+    async def categorize(self, articles, *_args, **_kwargs):
+        self.categorized.extend(a["id"] for a in articles)
+        return [
+            ArticleCategoryResult(article_id=a["id"], categories=["Technology"])
+            for a in articles
+        ]
+
+    async def score(self, articles, *_args, **_kwargs):
+        if self.score_error:
+            raise self.score_error
+        self.scored.extend(a["id"] for a in articles)
+        return [
+            ArticleScoringResult(
+                article_id=a["id"], interest_score=8, quality_score=6, reasoning="ok"
+            )
+            for a in articles
+        ]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    fake = CountingProvider()
+
+    async def _ready(*_a, **_kw):
+        return SimpleNamespace(
+            ready=True,
+            provider="fake",
+            model="fake-model",
+            endpoint=None,
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(scoring_queue_module, "get_provider", lambda _name: fake)
+    monkeypatch.setattr(
+        scoring_queue_module, "is_categorization_rate_limited", lambda: False
+    )
+    monkeypatch.setattr(scoring_queue_module, "is_scoring_rate_limited", lambda: False)
+    monkeypatch.setattr(llm_cache, "_stats", {})
+    return fake
+
+
+def _article(session, feed, url: str, content: str, **overrides) -> Article:
+    article = Article(
+        feed_id=feed.id,
+        title="Same story",
+        url=url,
+        published_at=datetime.now(),
+        content=content,
+        categorization_state="queued",
+        **overrides,
+    )
+    session.add(article)
+    session.commit()
+    session.refresh(article)
+    return article
+
+
+def _categorize_as(provider: CountingProvider, category: str):
+    async def _categorize(articles, *_args, **_kwargs):
+        provider.categorized = [a["id"] for a in articles]
+        return [
+            ArticleCategoryResult(article_id=a["id"], categories=[category])
+            for a in articles
+        ]
+
+    return _categorize
+
+
+def _preferences(session, interests: str = "technology"):
+    prefs = session.exec(select(UserPreferences)).first() or UserPreferences()
+    prefs.interests = interests
+    session.add(prefs)
+    session.commit()
+
+
+def test_cache_key_depends_on_every_component():
+    base = ("scoring", "ollama", "qwen3:8b", 1, "content", "interests")
+    key = llm_cache.cache_key(*base)
+    assert key == llm_cache.cache_key(*base)
+    for i, changed in enumerate(("categorization", "google", "other", 2, "c2", "i2")):
+        variant = list(base)
+        variant[i] = changed
+        assert llm_cache.cache_key(*variant) != key
+
+
+def test_content_hash_ignores_text_beyond_prompt_truncation():
+    head = "para\n\n" * 10
+    a = {"title": "T", "content_markdown": head + "x" * 5000}
+    b = {"title": "T", "content_markdown": head + "y" * 5000}
+    assert llm_cache.content_hash(a, 40) == llm_cache.content_hash(b, 40)
+    assert llm_cache.content_hash(a, 10_000) != llm_cache.content_hash(b, 10_000)
+
+
+def test_evict_removes_least_recently_used(test_session):
+    for i in range(3):
+        test_session.add(
+            LLMResultCache(
+                key=f"k{i}",
+                task="scoring",
+                result_json="{}",
+                size_bytes=100,
+                last_used_at=datetime(2026, 1, 1 + i),
+            )
+        )
+    test_session.commit()
+
+    assert llm_cache.evict(test_session, max_bytes=150) == 2
+    remaining = test_session.exec(select(LLMResultCache.key)).all()
+    assert remaining == ["k2"]
+
+
+def test_store_replaces_existing_entries(test_session):
+    llm_cache.store(test_session, "scoring", {"k": '{"v": 1}'})
+    llm_cache.store(test_session, "scoring", {"k": '{"v": 2}', "k2": "{}"})
+
+    rows = dict(
+        test_session.exec(select(LLMResultCache.key, LLMResultCache.result_json)).all()
+    )
+    assert rows == {"k": '{"v": 2}', "k2": "{}"}
+
+
+def test_store_leaves_commit_to_caller_and_evicts_over_budget(
+    test_session, monkeypatch
+):
+    pipeline = llm_cache.get_settings().pipeline
+    monkeypatch.setattr(pipeline, "result_cache_max_bytes", 25)
+
+    llm_cache.store(test_session, "scoring", {"a": "x" * 9})
+    test_session.rollback()
+    assert test_session.exec(select(LLMResultCache.key)).all() == []
+
+    # 10 bytes per entry: the third store goes over budget and evicts the
+    # least recently used entry
+    for key in ("a", "b", "c"):
+        llm_cache.store(test_session, "scoring", {key: "x" * 9})
+        test_session.commit()
+    assert sorted(test_session.exec(select(LLMResultCache.key)).all()) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_content_served_from_cache(test_session, sample_feed, provider):
+    """A re-published item under a new URL costs no LLM calls."""
+    _preferences(test_session)
+    first = _article(test_session, sample_feed, "https://a.example/1", "Body")
+    await CategorizationWorker().process_next_batch(test_session, batch_size=5)
+    await ScoringWorker().process_next_batch(test_session, batch_size=5)
+    assert provider.categorized == [first.id]
+    assert provider.scored == [first.id]
+
+    repost = _article(test_session, sample_feed, "https://b.example/1", "Body")
+    await CategorizationWorker().process_next_batch(test_session, batch_size=5)
+    await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    assert provider.categorized == [first.id]
+    assert provider.scored == [first.id]
+    test_session.refresh(repost)
+    assert repost.categorization_state == "categorized"
+    assert [c.display_name for c in repost.categories_rel] == ["Technology"]
+    assert repost.scoring_state == "scored"
+    assert repost.interest_score == 8
+    assert repost.quality_score == 6
+
+    stats = llm_cache.get_cache_stats()
+    assert stats["tasks"]["categorization"] == {"hits": 1, "misses": 1}
+    assert stats["tasks"]["scoring"] == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_does_not_revive_hidden_category(
+    test_session, sample_feed, provider
+):
+    _preferences(test_session)
+    _article(test_session, sample_feed, "https://a.example/1", "Body")
+    await CategorizationWorker().process_next_batch(test_session, batch_size=5)
+    category = test_session.exec(
+        select(Category).where(Category.display_name == "Technology")
+    ).one()
+    category.is_hidden = True
+    test_session.add(category)
+    test_session.commit()
+
+    # The cached answer only names the hidden category: a miss, not a revival
+    provider.categorize = _categorize_as(provider, "Science")
+    repost = _article(test_session, sample_feed, "https://b.example/1", "Body")
+    await CategorizationWorker().process_next_batch(test_session, batch_size=5)
+
+    test_session.refresh(category)
+    test_session.refresh(repost)
+    assert category.is_hidden
+    assert provider.categorized == [repost.id]
+    assert [c.display_name for c in repost.categories_rel] == ["Science"]
+
+
+@pytest.mark.asyncio
+async def test_interest_change_misses_scoring_cache(
+    test_session, sample_feed, provider
+):
+    _preferences(test_session, "technology")
+    article = _article(
+        test_session, sample_feed, "https://a.example/1", "Body", scoring_state="queued"
+    )
+    await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    _preferences(test_session, "gardening")
+    article.scoring_state = "queued"
+    test_session.add(article)
+    test_session.commit()
+    await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    assert provider.scored == [article.id, article.id]
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_applied_when_llm_call_fails(
+    test_session, sample_feed, provider
+):
+    _preferences(test_session)
+    _article(
+        test_session, sample_feed, "https://a.example/1", "Seen", scoring_state="queued"
+    )
+    await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    provider.score_error = RuntimeError("boom")
+    repost = _article(
+        test_session, sample_feed, "https://b.example/1", "Seen", scoring_state="queued"
+    )
+    fresh = _article(
+        test_session, sample_feed, "https://c.example/1", "New", scoring_state="queued"
+    )
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    assert processed == 1
+    test_session.refresh(repost)
+    test_session.refresh(fresh)
+    assert repost.scoring_state == "scored"
+    assert fresh.scoring_state == "queued"
+    assert fresh.scoring_attempts == 1
+
+
+def test_status_endpoint_reports_cache_counters(test_client, monkeypatch):
+    monkeypatch.setattr(llm_cache, "_stats", {"scoring": {"hits": 3, "misses": 1}})
+
+    response = test_client.get("/api/scoring/status")
+    assert response.status_code == 200
+    cache = response.json()["result_cache"]
+    assert cache["hits"] == 3
+    assert cache["misses"] == 1
+    assert cache["hit_rate"] == 0.75
@@ -0,0 +1,70 @@
+"""Tests for the in-process metrics and the /metrics endpoint."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from backend import metrics
+from backend.feeds import fetch_feed
+from backend.llm_providers.base import LLMValidationError, validate_llm_response
+from backend.prompts import BatchScoringResponse
+
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = metrics.Histogram(
+        "test_latency_seconds", "Test.", ["route"], buckets=(0.1, 1.0)
+    )
+    metrics._registry.remove(histogram)
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, route="a")
+
+    assert histogram.render() == [
+        "# HELP test_latency_seconds Test.",
+        "# TYPE test_latency_seconds histogram",
+        'test_latency_seconds_bucket{route="a",le="0.1"} 1',
+        'test_latency_seconds_bucket{route="a",le="1.0"} 3',
+        'test_latency_seconds_bucket{route="a",le="+Inf"} 4',
+        'test_latency_seconds_sum{route="a"} 4.05',
+        'test_latency_seconds_count{route="a"} 4',
+    ]
+
+
+def test_validation_failures_counted_by_kind():
+    before = metrics.LLM_VALIDATION_FAILURES.value(kind="json")
+
+    with pytest.raises(LLMValidationError):
+        validate_llm_response("{not json", BatchScoringResponse)
+
+    assert metrics.LLM_VALIDATION_FAILURES.value(kind="json") == before + 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_feed_fetch_records_latency_and_bytes():
+    xml = (_FIXTURES_DIR / "rss2_sample.xml").read_text()
+    respx.get("https://example.com/feed.xml").mock(
+        return_value=httpx.Response(200, text=xml)
+    )
+    fetched = metrics.FEED_FETCH_SECONDS.count(outcome="ok")
+    downloaded = metrics.FEED_FETCH_BYTES.value()
+
+    await fetch_feed("https://example.com/feed.xml")
+
+    assert metrics.FEED_FETCH_SECONDS.count(outcome="ok") == fetched + 1
+    assert metrics.FEED_FETCH_BYTES.value() == downloaded + len(xml.encode())
+
+
+def test_metrics_endpoint_serves_text_format(test_client: TestClient):
+    metrics.RATE_LIMIT_WAITS.inc(task="scoring")
+
+    response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE rss_llm_request_seconds histogram" in response.text
+    assert 'rss_rate_limit_waits_total{task="scoring"}' in response.text
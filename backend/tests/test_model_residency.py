@@ -0,0 +1,164 @@
+"""Tests for Ollama model preloading and exclusive model scheduling."""
+
+import pytest
+
+from backend import model_residency, ollama_service
+from backend.deps import TASK_CATEGORIZATION, TASK_SCORING, TaskRuntimeResolution
+from backend.model_residency import PipelinePlan, prepare_pipeline
+
+
+class FakeOllama:
+    """Ollama server holding at most ``capacity`` models, evicting the oldest."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.loaded: list[str] = []
+        self.loads: list[str] = []
+
+    async def list_models(self, _host):
+        return [{"name": name, "is_loaded": True} for name in self.loaded]
+
+    async def load_model(self, _host, model, _keep_alive, _options):
+        self.loads.append(model)
+        others = [m for m in self.loaded if m != model]
+        self.loaded = [*others, model][-self.capacity :]
+
+    async def unload_model(self, _host, model):
+        self.loaded.remove(model)
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    models = {TASK_CATEGORIZATION: "small:1b", TASK_SCORING: "big:8b"}
+
+    def _resolve(_session, task):
+        return TaskRuntimeResolution(
+            task=task,
+            provider="ollama",
+            model=models[task],
+            endpoint="http://localhost:11434",
+            thinking=False,
+            api_key=None,
+            ready=True,
+            reason=None,
+        )
+
+    monkeypatch.setattr(model_residency, "resolve_task_runtime", _resolve)
+    monkeypatch.setattr(model_residency, "_stats", {"model_loads": 0, "model_swaps": 0})
+    monkeypatch.setattr(model_residency, "_co_resident", {})
+    monkeypatch.setattr(model_residency, "_active_model", {})
+    return models
+
+
+def _serve(monkeypatch, server: FakeOllama) -> None:
+    monkeypatch.setattr(ollama_service, "list_models", server.list_models)
+    monkeypatch.setattr(ollama_service, "load_model", server.load_model)
+    monkeypatch.setattr(ollama_service, "unload_model", server.unload_model)
+
+
+@pytest.mark.asyncio
+async def test_models_preloaded_once_when_both_fit(
+    test_session, make_feed, make_article, routes, monkeypatch
+):
+    server = FakeOllama(capacity=2)
+    _serve(monkeypatch, server)
+    feed = make_feed()
+    make_article(feed.id, categorization_state="queued", scoring_state="queued")
+
+    assert await prepare_pipeline(test_session) == PipelinePlan()
+    assert await prepare_pipeline(test_session) == PipelinePlan()
+    assert server.loads == ["small:1b", "big:8b"]
+    assert model_residency.get_residency_stats()["model_swaps"] == 0
+
+
+@pytest.mark.asyncio
+async def test_categorization_drained_before_switching(
+    test_session, make_feed, make_article, routes, monkeypatch
+):
+    server = FakeOllama(capacity=1)
+    _serve(monkeypatch, server)
+    feed = make_feed()
+    article = make_article(
+        feed.id, categorization_state="queued", scoring_state="queued"
+    )
+
+    plan = await prepare_pipeline(test_session)
+    assert plan == PipelinePlan(categorize=True, score=False)
+    assert server.loaded == ["small:1b"]
+    assert await prepare_pipeline(test_session) == plan
+
+    article.categorization_state = "categorized"
+    test_session.add(article)
+    test_session.commit()
+    assert await prepare_pipeline(test_session) == PipelinePlan(
+        categorize=False, score=True
+    )
+    assert server.loaded == ["big:8b"]
+    stats = model_residency.get_residency_stats()
+    assert stats["model_swaps"] == 1
+    # Probe loaded both once, then small again and big on the switch
+    assert server.loads == ["small:1b", "big:8b", "small:1b", "big:8b"]
+    assert stats["model_loads"] == 4
+
+
+@pytest.mark.asyncio
+async def test_no_queued_work_loads_nothing(test_session, routes, monkeypatch):
+    server = FakeOllama(capacity=2)
+    _serve(monkeypatch, server)
+
+    assert await prepare_pipeline(test_session) == PipelinePlan()
+    assert server.loads == []
+
+
+@pytest.mark.asyncio
+async def test_every_endpoint_prepared_for_balanced_tasks(
+    test_session, make_feed, make_article, routes, monkeypatch
+):
+    hosts = ["http://a:11434", "http://b:11434"]
+    servers = {host: FakeOllama(capacity=1) for host in hosts}
+
+    async def _list(host):
+        return await servers[host].list_models(host)
+
+    async def _load(host, *args):
+        await servers[host].load_model(host, *args)
+
+    async def _unload(host, model):
+        await servers[host].unload_model(host, model)
+
+    monkeypatch.setattr(ollama_service, "list_models", _list)
+    monkeypatch.setattr(ollama_service, "load_model", _load)
+    monkeypatch.setattr(ollama_service, "unload_model", _unload)
+
+    def _resolve(_session, task):
+        return TaskRuntimeResolution(
+            task=task,
+            provider="ollama",
+            model=routes[task],
+            endpoint=hosts[0],
+            thinking=False,
+            api_key=None,
+            ready=True,
+            reason=None,
+            endpoints=hosts,
+        )
+
+    monkeypatch.setattr(model_residency, "resolve_task_runtime", _resolve)
+    feed = make_feed()
+    article = make_article(
+        feed.id, categorization_state="queued", scoring_state="queued"
+    )
+
+    assert await prepare_pipeline(test_session) == PipelinePlan(
+        categorize=True, score=False
+    )
+    assert all(s.loaded == ["small:1b"] for s in servers.values())
+
+    article.categorization_state = "categorized"
+    test_session.add(article)
+    test_session.commit()
+    assert await prepare_pipeline(test_session) == PipelinePlan(
+        categorize=False, score=True
+    )
+    assert all(s.loaded == ["big:8b"] for s in servers.values())
+    assert model_residency.get_residency_stats()["model_swaps"] == 2
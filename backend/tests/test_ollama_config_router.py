@@ -35,7 +35,7 @@ def test_update_ollama_config_persists_provider_config_and_routes(
 
     response = test_client.put("/api/providers/ollama/config", json=payload)
     assert response.status_code == 200
-    assert response.json() == payload
+    assert response.json() == {**payload, "extra_endpoints": []}
 
     provider_row = test_session.exec(
         select(LLMProviderConfig).where(LLMProviderConfig.provider == "ollama")
@@ -81,6 +81,46 @@ def test_ollama_config_accepts_batch_size_10():
     assert config.batch_size == 10
 
 
+def test_ollama_config_normalizes_extra_endpoints():
+    """Extra endpoints get the default port and duplicates of the primary drop."""
+    import pytest
+    from pydantic import ValidationError
+
+    from backend.llm_providers.ollama import OllamaProviderConfig
+
+    config = OllamaProviderConfig(
+        extra_endpoints=["http://gpu-box", "http://10.0.0.2:11500/", "http://gpu-box"]
+    )
+    assert config.extra_endpoints == ["http://gpu-box:11434", "http://10.0.0.2:11500"]
+    assert OllamaProviderConfig(
+        extra_endpoints=["http://localhost:11434"]
+    ).endpoints == ["http://localhost:11434"]
+
+    with pytest.raises(ValidationError):
+        OllamaProviderConfig(extra_endpoints=["http://gpu-box/api"])
+
+
+def test_update_ollama_config_keeps_extra_endpoints_when_omitted(
+    test_client: TestClient,
+):
+    payload = {
+        "base_url": "http://localhost",
+        "port": 11434,
+        "categorization_model": "qwen3:4b",
+        "scoring_model": None,
+        "use_separate_models": False,
+    }
+    test_client.put(
+        "/api/providers/ollama/config",
+        json={**payload, "extra_endpoints": ["http://gpu-box:11434"]},
+    )
+
+    response = test_client.put("/api/providers/ollama/config", json=payload)
+    assert response.json()["extra_endpoints"] == ["http://gpu-box:11434"]
+    config = test_client.get("/api/ollama/config").json()
+    assert config["extra_endpoints"] == ["http://gpu-box:11434"]
+
+
 def test_test_connection_returns_health_response_shape(test_client: TestClient):
     """POST /api/ollama/test-connection returns correct response shape."""
     response = test_client.post(
@@ -0,0 +1,79 @@
+"""Tests for least-loaded routing across Ollama endpoints."""
+
+import httpx
+import pytest
+
+from backend.llm_providers.ollama_pool import EndpointPool
+
+A, B = "http://a:11434", "http://b:11434"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(clock: Clock, healthy: set[str] | None = None) -> EndpointPool:
+    async def _probe(endpoint: str) -> bool:
+        return healthy is None or endpoint in healthy
+
+    return EndpointPool((httpx.ConnectError,), _probe, base_backoff=5, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_requests_go_to_least_loaded_endpoint():
+    pool = _pool(Clock())
+
+    async with pool.lease([A, B]) as first:
+        async with pool.lease([A, B]) as second:
+            assert {first, second} == {A, B}
+    # Idle again: ties go to the endpoint that has served fewer requests
+    async with pool.lease([A, B]):
+        pass
+    async with pool.lease([A, B]) as endpoint:
+        assert endpoint == B
+    assert {s["endpoint"]: s["requests"] for s in pool.snapshot()} == {A: 2, B: 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_endpoint_ejected_with_backoff_and_probed():
+    clock = Clock()
+    healthy = {B}
+    pool = _pool(clock, healthy)
+
+    with pytest.raises(httpx.ConnectError):
+        async with pool.lease([A, B]) as endpoint:
+            assert endpoint == A
+            raise httpx.ConnectError("refused")
+    for _ in range(3):
+        async with pool.lease([A, B]) as endpoint:
+            assert endpoint == B
+
+    # Backoff over but the probe still fails: ejected for twice as long
+    clock.now = 5
+    async with pool.lease([A, B]) as endpoint:
+        assert endpoint == B
+    clock.now = 14
+    async with pool.lease([A, B]) as endpoint:
+        assert endpoint == B
+
+    healthy.add(A)
+    clock.now = 15
+    async with pool.lease([A, B]) as endpoint:
+        assert endpoint == A
+    assert [s["failures"] for s in pool.snapshot() if s["endpoint"] == A] == [0]
+
+
+@pytest.mark.asyncio
+async def test_all_ejected_uses_endpoint_due_back_first():
+    clock = Clock()
+    pool = _pool(clock)
+    pool.eject(A)
+    pool.eject(A)
+    pool.eject(B)
+
+    async with pool.lease([A, B]) as endpoint:
+        assert endpoint == B
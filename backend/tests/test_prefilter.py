@@ -0,0 +1,192 @@
+"""Tests for pre-filter rules: matcher, ingestion and API."""
+
+import random
+from collections.abc import Callable
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+import backend.database as database_module
+from backend.feeds import save_articles
+from backend.fingerprint import find_near_duplicate, fingerprint_article
+from backend.models import Article, Feed, PrefilterRule
+from backend.prefilter import PrefilterMatcher, rule_regex
+from backend.scoring_queue import CategorizationWorker
+
+
+def _rule(rule_id: int, target: str, pattern: str = "", **overrides) -> PrefilterRule:
+    return PrefilterRule(
+        id=rule_id, name=f"rule {rule_id}", target=target, pattern=pattern, **overrides
+    )
+
+
+def _article(**overrides) -> Article:
+    defaults = {"feed_id": 1, "title": "Title", "url": "https://example.com/a"}
+    defaults.update(overrides)
+    return Article(**defaults)
+
+
+def test_matcher_finds_the_matching_rule():
+    matcher = PrefilterMatcher(
+        [
+            _rule(1, "title", "sponsored"),
+            _rule(2, "url", "/promo/"),
+            _rule(3, "content", r"giveaway\s+ends", is_regex=True),
+            _rule(4, "author", "Press Office", feed_id=2),
+            _rule(5, "feed", feed_id=3),
+            _rule(6, "title", "C++"),
+        ]
+    )
+
+    assert matcher.match(_article(title="A SPONSORED post")) == 1
+    # Keywords match whole words, URLs anywhere
+    assert matcher.match(_article(title="Unsponsored")) is None
+    assert matcher.match(_article(url="https://example.com/promo/x")) == 2
+    assert matcher.match(_article(content_markdown="The Giveaway  ends soon")) == 3
+    assert matcher.match(_article(author="Press Office")) is None
+    assert matcher.match(_article(feed_id=2, author="Press Office")) == 4
+    assert matcher.match(_article(feed_id=3)) == 5
+    assert matcher.match(_article(title="Why C++ is hard")) == 6
+    assert matcher.match(_article(title="Ordinary news")) is None
+
+
+def test_rule_regex_rejects_patterns_the_matcher_cannot_combine():
+    for pattern in ("(unclosed", r"(a)\1", "(?P<x>a)", "(?i)late-flag"):
+        with pytest.raises(ValueError):
+            rule_regex("title", pattern, is_regex=True)
+    with pytest.raises(ValueError):
+        rule_regex("title", "  ", is_regex=False)
+    assert rule_regex("title", "(a|b)c", is_regex=True) == "(a|b)c"
+
+
+def test_save_articles_blocks_matches_without_queueing_them(
+    test_session: Session, make_feed: Callable[..., Feed]
+):
+    feed = make_feed()
+    rule = PrefilterRule(name="No deals", target="title", pattern="deal")
+    test_session.add(rule)
+    test_session.commit()
+
+    _, article_ids = save_articles(
+        test_session,
+        feed.id,  # pyright: ignore[reportArgumentType]
+        [
+            {"link": "https://example.com/1", "title": "Deal of the day"},
+            {"link": "https://example.com/2", "title": "Another DEAL"},
+            {"link": "https://example.com/3", "title": "Compiler news"},
+        ],
+    )
+    enqueued = CategorizationWorker().enqueue_articles(test_session, article_ids)
+
+    assert enqueued == 1
+    blocked = test_session.exec(
+        select(Article).where(Article.category_source == "rule")
+    ).all()
+    assert sorted(a.url for a in blocked) == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+    assert all(
+        (a.scoring_state, a.composite_score, a.score_reasoning)
+        == ("scored", 0.0, "Blocked: rule 'No deals'")
+        for a in blocked
+    )
+    test_session.refresh(rule)
+    assert rule.hit_count == 2
+    assert rule.last_hit_at is not None
+
+    # Disabled rules stop matching (edits bump updated_at, as the API does)
+    rule.enabled = False
+    rule.updated_at = datetime.now()
+    test_session.commit()
+    save_articles(
+        test_session,
+        feed.id,  # pyright: ignore[reportArgumentType]
+        [{"link": "https://example.com/4", "title": "Deal again"}],
+    )
+    article = test_session.exec(
+        select(Article).where(Article.url == "https://example.com/4")
+    ).one()
+    assert article.categorization_state == "uncategorized"
+
+
+def test_rule_blocked_articles_are_never_near_duplicate_sources(
+    test_engine, test_session: Session, make_feed: Callable[..., Feed], monkeypatch
+):
+    blocked_feed, other_feed = make_feed(), make_feed()
+    test_session.add(
+        PrefilterRule(name="Mirror", target="feed", feed_id=blocked_feed.id)
+    )
+    test_session.commit()
+    rng = random.Random(7)
+    story = " ".join(rng.choices([f"word{i}" for i in range(500)], k=400))
+
+    save_articles(
+        test_session,
+        blocked_feed.id,  # pyright: ignore[reportArgumentType]
+        [{"link": "https://mirror.example/1", "title": "Story", "summary": story}],
+    )
+    # The startup backfill leaves rule-blocked articles unfingerprinted
+    monkeypatch.setattr(database_module, "engine", test_engine)
+    database_module._backfill_fingerprints()
+    blocked = test_session.exec(
+        select(Article).where(Article.category_source == "rule")
+    ).one()
+    test_session.refresh(blocked)
+    assert blocked.simhash is None
+
+    # Even one fingerprinted before this fix is not a source for a copy
+    # that no rule covers
+    fingerprint_article(test_session, blocked)
+    test_session.commit()
+    _, (copy_id,) = save_articles(
+        test_session,
+        other_feed.id,  # pyright: ignore[reportArgumentType]
+        [{"link": "https://origin.example/1", "title": "Story", "summary": story}],
+    )
+    copy = test_session.get(Article, copy_id)
+    assert copy is not None and copy.simhash == blocked.simhash
+    assert find_near_duplicate(test_session, copy) is None
+
+
+def test_prefilter_rule_api(
+    test_client: TestClient,
+    make_feed: Callable[..., Feed],
+):
+    feed = make_feed()
+    created = test_client.post(
+        "/api/prefilter-rules",
+        json={"name": "Promo", "target": "url", "pattern": "/promo/"},
+    )
+    assert created.status_code == 201
+    rule_id = created.json()["id"]
+    assert created.json()["hit_count"] == 0
+
+    for payload, status in (
+        ({"name": "Bad", "target": "title", "pattern": "(", "is_regex": True}, 400),
+        ({"name": "Feed", "target": "feed"}, 400),
+        ({"name": "Feed", "target": "feed", "feed_id": 999}, 404),
+        ({"name": "Other", "target": "summary", "pattern": "x"}, 422),
+    ):
+        assert test_client.post("/api/prefilter-rules", json=payload).status_code == (
+            status
+        )
+
+    updated = test_client.patch(
+        f"/api/prefilter-rules/{rule_id}",
+        json={"target": "feed", "feed_id": feed.id},
+    )
+    assert updated.status_code == 200
+    assert (updated.json()["target"], updated.json()["feed_id"]) == ("feed", feed.id)
+    assert (
+        test_client.patch(
+            f"/api/prefilter-rules/{rule_id}", json={"feed_id": None}
+        ).status_code
+        == 400
+    )
+
+    assert test_client.delete(f"/api/prefilter-rules/{rule_id}").status_code == 200
+    assert test_client.get("/api/prefilter-rules").json() == []
+    assert test_client.delete(f"/api/prefilter-rules/{rule_id}").status_code == 404
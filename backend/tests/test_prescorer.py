@@ -0,0 +1,182 @@
+"""Tests for the local pre-scorer."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import backend.prescorer as prescorer_module
+import backend.scoring_queue as scoring_queue_module
+from backend.models import Article, UserPreferences
+from backend.prescorer import HOLDOUT_MODULUS, prescore, read_model, train, write_model
+from backend.scoring_queue import ScoringWorker
+
+_rng = random.Random(7)
+_TOPICS = {
+    # feed title: (words, interest, quality)
+    "Compilers": ([f"rust{i}" for i in range(40)], 9, 8),
+    "Gossip": ([f"celeb{i}" for i in range(40)], 1, 3),
+}
+
+
+def _labelled_articles(session, make_feed, count: int, **overrides) -> None:
+    feeds = {title: make_feed(title=title) for title in _TOPICS}
+    start = datetime.now()
+    for i in range(count):
+        title = "Compilers" if i % 2 else "Gossip"
+        words, interest, quality = _TOPICS[title]
+        defaults = {
+            "feed_id": feeds[title].id,
+            "title": " ".join(_rng.sample(words, 5)),
+            "url": f"https://example.com/{feeds[title].id}/{i}",
+            "content_markdown": " ".join(_rng.choices(words, k=80)),
+            "scoring_state": "scored",
+            "score_tier": "large",
+            "interest_score": interest,
+            "quality_score": quality,
+            "scored_at": start + timedelta(seconds=i),
+        }
+        defaults.update(overrides)
+        session.add(Article(**defaults))
+    session.commit()
+
+
+@pytest.fixture(autouse=True)
+def _preferences(test_session):
+    test_session.add(UserPreferences(interests="compilers", anti_interests="gossip"))
+    test_session.commit()
+
+
+def test_training_is_incremental_and_skips_held_out_articles(test_session, make_feed):
+    _labelled_articles(test_session, make_feed, 200)
+    # Scores that did not come from an LLM are never learned from
+    _labelled_articles(test_session, make_feed, 20, score_tier="local")
+
+    model = train(test_session, None)
+    held_out = sum(1 for i in range(1, 201) if i % HOLDOUT_MODULUS == 0)
+    assert model.trained == 200 - held_out
+    assert model.report is not None
+    assert model.report["held_out"] == held_out
+    assert model.report["interest_within_one"] == 1.0
+
+    assert train(test_session, model).trained == 200 - held_out
+
+
+def test_confident_predictions_skip_the_llm(test_session, make_feed, monkeypatch):
+    _labelled_articles(test_session, make_feed, 400)
+    model = train(test_session, None)
+    monkeypatch.setattr(prescorer_module, "_current_model", lambda: model)
+    pipeline = prescorer_module.get_settings().pipeline
+    monkeypatch.setattr(pipeline, "prescorer_enabled", True)
+    monkeypatch.setattr(pipeline, "prescorer_min_examples", 100)
+    preferences = test_session.get(UserPreferences, 1)
+
+    feed_id = test_session.get(Article, 1).feed_id  # pyright: ignore[reportOptionalMemberAccess]
+    familiar = Article(
+        feed_id=feed_id,
+        title="celeb1 celeb2",
+        url="https://example.com/new",
+        content_markdown=" ".join(_TOPICS["Gossip"][0]),
+    )
+    unfamiliar = Article(
+        feed_id=feed_id,
+        title="quantum",
+        url="https://example.com/other",
+        content_markdown="entirely unseen vocabulary about quantum chemistry",
+    )
+    test_session.add_all([familiar, unfamiliar])
+    test_session.commit()
+
+    results = prescore([familiar, unfamiliar], {}, preferences)  # pyright: ignore[reportArgumentType]
+    assert list(results) == [familiar.id]
+    assert results[familiar.id].interest_score == 1  # pyright: ignore[reportArgumentType]
+
+    # Not before the model has seen enough scores, nor under new interests
+    monkeypatch.setattr(pipeline, "prescorer_min_examples", 1000)
+    assert prescore([familiar], {}, preferences) == {}  # pyright: ignore[reportArgumentType]
+    monkeypatch.setattr(pipeline, "prescorer_min_examples", 100)
+    preferences.interests = "gossip"  # pyright: ignore[reportOptionalMemberAccess]
+    assert prescore([familiar], {}, preferences) == {}  # pyright: ignore[reportArgumentType]
+
+
+def test_new_interests_start_a_new_model(test_session, make_feed):
+    _labelled_articles(test_session, make_feed, 50)
+    model = train(test_session, None)
+
+    preferences = test_session.get(UserPreferences, 1)
+    preferences.interests = "gossip"  # pyright: ignore[reportOptionalMemberAccess]
+    preferences.updated_at = datetime.now() + timedelta(hours=1)  # pyright: ignore[reportOptionalMemberAccess]
+    test_session.commit()
+
+    # Everything stored was scored under the old interests
+    retrained = train(test_session, model)
+    assert retrained is not model
+    assert retrained.trained == 0
+
+
+def test_model_round_trips_through_disk(test_session, make_feed, tmp_path):
+    _labelled_articles(test_session, make_feed, 30)
+    model = train(test_session, None)
+    path = str(tmp_path / "prescorer.pkl")
+
+    write_model(model, path)
+    loaded = read_model(path)
+
+    assert loaded is not None
+    assert (loaded.trained, loaded.watermark) == (model.trained, model.watermark)
+    assert read_model(str(tmp_path / "missing.pkl")) is None
+
+
+@pytest.mark.asyncio
+async def test_scoring_worker_applies_local_scores(
+    test_session, make_feed, monkeypatch
+):
+    _labelled_articles(test_session, make_feed, 400)
+    model = train(test_session, None)
+    monkeypatch.setattr(prescorer_module, "_current_model", lambda: model)
+    pipeline = prescorer_module.get_settings().pipeline
+    monkeypatch.setattr(pipeline, "prescorer_enabled", True)
+    monkeypatch.setattr(pipeline, "prescorer_min_examples", 100)
+
+    feed_id = test_session.get(Article, 1).feed_id  # pyright: ignore[reportOptionalMemberAccess]
+    queued = Article(
+        feed_id=feed_id,
+        title="celeb1 celeb2",
+        url="https://example.com/queued",
+        content_markdown=" ".join(_TOPICS["Gossip"][0]),
+        categorization_state="categorized",
+        scoring_state="queued",
+    )
+    test_session.add(queued)
+    test_session.commit()
+
+    async def _ready(*_a, **_kw):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            ready=True,
+            provider="fake",
+            model="fake-model",
+            endpoint="http://fake",
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    class _NoLLM:
+        async def score(self, *args, **kwargs):
+            raise AssertionError("LLM called for a confident article")
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(scoring_queue_module, "get_provider", lambda _name: _NoLLM())
+    monkeypatch.setattr(scoring_queue_module, "is_scoring_rate_limited", lambda: False)
+
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=1)
+
+    assert processed == 1
+    test_session.refresh(queued)
+    assert (queued.scoring_state, queued.score_tier, queued.interest_score) == (
+        "scored",
+        "local",
+        1,
+    )
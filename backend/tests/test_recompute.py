@@ -0,0 +1,146 @@
+"""Tests for set-based composite score recomputation after category edits."""
+
+from datetime import datetime
+
+import pytest
+
+from backend.models import ArticleCategoryLink
+from backend.recompute import affected_article_ids, recompute_composite_scores
+from backend.scoring import compute_composite_score
+
+
+@pytest.fixture
+def link(test_session):
+    def _link(article, *categories):
+        for category in categories:
+            test_session.add(
+                ArticleCategoryLink(article_id=article.id, category_id=category.id)
+            )
+        test_session.commit()
+
+    return _link
+
+
+def test_matches_python_composite_score(
+    test_session, test_engine, make_feed, make_article, make_category, link
+):
+    feed = make_feed()
+    parent = make_category(weight="boost")
+    inherits = make_category(parent_id=parent.id)
+    reduce = make_category(weight="reduce")
+    maxed = make_category(weight="max")
+
+    cases = [
+        (7, 8, [inherits]),
+        (9, 10, [maxed]),
+        (5, 3, [reduce, inherits]),
+        (10, 10, [maxed, parent]),
+        (6, 0, []),
+    ]
+    articles = []
+    for interest, quality, cats in cases:
+        article = make_article(
+            feed.id, interest_score=interest, quality_score=quality, composite_score=-1
+        )
+        link(article, *cats)
+        articles.append((article, interest, quality, cats))
+
+    stats = recompute_composite_scores(test_engine, [a.id for a, *_ in articles])
+
+    assert stats.updated == len(cases)
+    for article, interest, quality, cats in articles:
+        test_session.refresh(article)
+        for cat in cats:
+            test_session.refresh(cat)
+        assert article.composite_score == pytest.approx(
+            compute_composite_score(interest, quality, cats)
+        )
+
+
+def test_affected_articles_include_children(
+    test_session, make_feed, make_article, make_category, link
+):
+    feed = make_feed()
+    parent = make_category()
+    child = make_category(parent_id=parent.id)
+    other = make_category()
+    via_child = make_article(feed.id)
+    unrelated = make_article(feed.id)
+    link(via_child, child)
+    link(unrelated, other)
+
+    assert affected_article_ids(test_session, [parent.id]) == [via_child.id]
+
+
+def test_weight_change_endpoint_recomputes_and_blocks(
+    test_client, test_session, make_feed, make_article, make_category, link
+):
+    feed = make_feed()
+    parent = make_category()
+    child = make_category(parent_id=parent.id)
+    article = make_article(
+        feed.id, interest_score=8, quality_score=10, composite_score=8.0
+    )
+    link(article, child)
+
+    response = test_client.patch(f"/api/categories/{parent.id}", json={"weight": "max"})
+    assert response.status_code == 200
+    test_session.refresh(article)
+    assert article.composite_score == pytest.approx(16.0)
+
+    test_client.patch(f"/api/categories/{parent.id}", json={"weight": "block"})
+    test_session.refresh(article)
+    assert article.composite_score == 0.0
+    assert article.interest_score == 8
+
+    # LLM scores were kept, so unblocking needs no rescore
+    test_client.patch(f"/api/categories/{parent.id}", json={"weight": "normal"})
+    test_session.refresh(article)
+    assert article.composite_score == pytest.approx(8.0)
+    assert article.scoring_state == "scored"
+
+
+def test_unblocking_requeues_articles_never_scored(
+    test_client, test_session, make_feed, make_article, make_category, link
+):
+    feed = make_feed()
+    blocked = make_category(weight="block")
+    article = make_article(
+        feed.id,
+        interest_score=0,
+        quality_score=0,
+        composite_score=0.0,
+        score_reasoning=f"Blocked: {blocked.display_name}",
+        queue_lane="interactive",
+        queued_at=datetime(2026, 1, 1),
+        next_attempt_at=datetime(2999, 1, 1),
+    )
+    link(article, blocked)
+
+    test_client.patch(f"/api/categories/{blocked.id}", json={"weight": "inherit"})
+
+    test_session.refresh(article)
+    assert article.scoring_state == "queued"
+    assert article.categorization_state == "categorized"
+    # Queued like any rescore: backlog lane, fresh queue time, due now
+    assert article.queue_lane == "backlog"
+    assert article.queued_at > datetime(2026, 1, 1)
+    assert article.next_attempt_at is None
+
+
+def test_delete_category_recomputes_remaining(
+    test_client, test_session, make_feed, make_article, make_category, link
+):
+    feed = make_feed()
+    boosted = make_category(weight="max")
+    reduced = make_category(weight="reduce")
+    article = make_article(
+        feed.id, interest_score=10, quality_score=10, composite_score=12.5
+    )
+    link(article, boosted, reduced)
+
+    response = test_client.delete(f"/api/categories/{boosted.id}")
+    assert response.status_code == 200
+
+    test_session.refresh(article)
+    assert article.composite_score == pytest.approx(5.0)
@@ -1,14 +1,16 @@
 """Tests for per-task activity and rate-limit tracking in scoring.py."""
 
+import asyncio
+
+import pytest
+
 from backend import scoring
 
 
 def _reset_state():
     """Reset all module-level activity and rate-limit state between tests."""
-    scoring._categorization_activity["article_id"] = None
-    scoring._categorization_activity["phase"] = "idle"
-    scoring._scoring_activity["article_id"] = None
-    scoring._scoring_activity["phase"] = "idle"
+    scoring._categorization_batches.clear()
+    scoring._scoring_batches.clear()
     scoring._categorization_rate_limited_until = 0.0
     scoring._scoring_rate_limited_until = 0.0
 
@@ -46,6 +48,30 @@ class TestCategorizationActivity:
         copy["phase"] = "mutated"
         assert scoring.get_categorization_activity()["phase"] == "starting"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_tracked_separately(self):
+        first_done = asyncio.Event()
+        second_started = asyncio.Event()
+
+        async def _first():
+            scoring.set_categorization_context(1)
+            await second_started.wait()
+            scoring.set_categorization_context(None)
+            first_done.set()
+
+        async def _second():
+            scoring.set_categorization_context(2)
+            second_started.set()
+            await first_done.wait()
+            # The other batch finishing leaves this one visible
+            assert scoring.get_categorization_activity()["article_id"] == 2
+            scoring.set_categorization_phase("categorizing")
+            assert scoring.get_categorization_activity()["phase"] == "categorizing"
+            scoring.set_categorization_context(None)
+
+        await asyncio.gather(_first(), _second())
+        assert scoring.get_categorization_activity()["phase"] == "idle"
+
 
 # --- Scoring activity (existing, still works) ---
 
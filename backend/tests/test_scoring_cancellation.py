@@ -43,6 +43,7 @@ async def test_categorization_requeues_cancelled_article(
         endpoint="http://localhost:11434",
         thinking=False,
         api_key=None,
+        endpoints=None,
     )
 
     async def fake_readiness(*_args, **_kwargs):
@@ -1,15 +1,16 @@
 """Tests for CategorizationWorker and ScoringWorker batch processing."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
 from sqlmodel import select
 
 import backend.scoring_queue as scoring_queue_module
-from backend.llm_providers.base import ProviderTaskConfig
+from backend import metrics
+from backend.llm_providers.base import LLMValidationError, ProviderTaskConfig
 from backend.models import Article, ArticleCategoryLink, Category, Feed, UserPreferences
-from backend.prompts import ArticleCategoryResult
+from backend.prompts import ArticleCategoryResult, ArticleCombinedResult
 from backend.prompts.scoring import ArticleScoringResult
 from backend.scoring_queue import CategorizationWorker, ScoringWorker
 
@@ -26,6 +27,7 @@ def _fake_runtime():
         endpoint="http://fake",
         thinking=False,
         api_key=None,
+        endpoints=None,
     )
 
 
@@ -63,6 +65,7 @@ class FakeProvider:
         config,
         category_hierarchy,
         hidden_categories,
+        on_result=None,
     ):
         self.categorize_calls.append(articles)
         if self._cat_error:
@@ -75,7 +78,7 @@ class FakeProvider:
             for a in articles
         ]
 
-    async def score(self, articles, interests, anti_interests, config):
+    async def score(self, articles, interests, anti_interests, config, on_result=None):
         self.score_calls.append(articles)
         if self._score_error:
             raise self._score_error
@@ -89,6 +92,95 @@ class FakeProvider:
         ]
 
 
+class PoisonProvider(FakeProvider):
+    """Fails validation for any batch containing one of the poison IDs."""
+
+    def __init__(self, poison: set[int], *, is_retryable: bool = False):
+        super().__init__()
+        self.poison = poison
+        self.is_retryable = is_retryable
+
+    def _check(self, articles, calls):
+        if self.poison & {a["id"] for a in articles}:
+            calls.append(articles)
+            raise LLMValidationError(
+                '{"results": [{"article_id": "?"}]}',
+                ValueError("bad output"),
+                is_retryable=self.is_retryable,
+            )
+
+    async def categorize(self, articles, *args, **kwargs):
+        self._check(articles, self.categorize_calls)
+        return await super().categorize(articles, *args, **kwargs)
+
+    async def score(self, articles, *args, **kwargs):
+        self._check(articles, self.score_calls)
+        return await super().score(articles, *args, **kwargs)
+
+
+class CombinedProvider(FakeProvider):
+    """Fake provider that also categorizes and scores in one call."""
+
+    def __init__(
+        self, categories: dict[int, list[str]], error: Exception | None = None
+    ):
+        super().__init__()
+        self.categories = categories
+        self.error = error
+        self.combined_calls: list[list[dict]] = []
+
+    async def categorize_and_score(
+        self,
+        articles,
+        existing_categories,
+        interests,
+        anti_interests,
+        config,
+        category_hierarchy,
+        hidden_categories,
+        on_result=None,
+    ):
+        self.combined_calls.append(articles)
+        if self.error:
+            raise self.error
+        return [
+            ArticleCombinedResult(
+                article_id=a["id"],
+                categories=self.categories[a["id"]],
+                interest_score=8,
+                quality_score=10,
+                reasoning="test",
+            )
+            for a in articles
+        ]
+
+
+class CascadeProvider(FakeProvider):
+    """Small model answers from a fixed table; the large one scores 7."""
+
+    def __init__(self, small_scores: dict[int, int], *, small_error=None):
+        super().__init__()
+        self.small_scores = small_scores
+        self.small_error = small_error
+        self.small_calls: list[list[dict]] = []
+
+    async def score(self, articles, interests, anti_interests, config, on_result=None):
+        if config.model != "small-model":
+            return await super().score(articles, interests, anti_interests, config)
+        self.small_calls.append(articles)
+        if self.small_error:
+            raise self.small_error
+        return [
+            ArticleScoringResult(
+                article_id=a["id"],
+                interest_score=self.small_scores[a["id"]],
+                quality_score=5,
+                reasoning="small",
+            )
+            for a in articles
+        ]
+
+
 def _patch_queue(monkeypatch, provider: FakeProvider):
     """Monkeypatch scoring_queue module to use the given FakeProvider."""
     monkeypatch.setattr(
@@ -210,6 +302,120 @@ async def test_categorization_error_increments_attempts(
     assert art.categorization_attempts == 1
 
 
+@pytest.mark.asyncio
+async def test_failed_batch_cools_down_while_fresh_work_continues(
+    test_session, sample_feed, monkeypatch
+):
+    """A failed article is not claimed again before its backoff has passed."""
+    _setup_preferences(test_session)
+    failing = _make_queued_article(test_session, sample_feed, 0)
+    _patch_queue(monkeypatch, FakeProvider(cat_error=RuntimeError("LLM exploded")))
+    before = datetime.now()
+    await CategorizationWorker().process_next_batch(test_session, batch_size=1)
+
+    test_session.refresh(failing)
+    # First retry: 60s base delay with equal jitter
+    assert (
+        before + timedelta(seconds=30)
+        <= failing.next_attempt_at
+        <= datetime.now() + timedelta(seconds=60)
+    )
+
+    fresh = _make_queued_article(test_session, sample_feed, 1)
+    provider = FakeProvider(
+        cat_results=[ArticleCategoryResult(article_id=fresh.id, categories=["tech"])]
+    )
+    _patch_queue(monkeypatch, provider)
+    await CategorizationWorker().process_next_batch(test_session, batch_size=2)
+
+    assert [[a["id"] for a in call] for call in provider.categorize_calls] == [
+        [fresh.id]
+    ]
+    test_session.refresh(failing)
+    assert failing.categorization_state == "queued"
+
+
+def test_retry_delay_doubles_up_to_cap(monkeypatch):
+    pipeline = scoring_queue_module.get_settings().pipeline
+    monkeypatch.setattr(pipeline, "retry_backoff_seconds", 10.0)
+    monkeypatch.setattr(pipeline, "retry_backoff_max_seconds", 30.0)
+
+    for attempts, full in ((1, 10), (2, 20), (3, 30), (6, 30)):
+        delay = scoring_queue_module.retry_delay(attempts).total_seconds()
+        assert full / 2 <= delay <= full
+
+
+@pytest.mark.asyncio
+async def test_deterministic_failure_bisected_to_bad_article(
+    test_session, sample_feed, monkeypatch
+):
+    """Only the article that breaks validation fails; its neighbours finish."""
+    _setup_preferences(test_session)
+    arts = [_make_queued_article(test_session, sample_feed, i) for i in range(4)]
+    bad = arts[2]
+    provider = PoisonProvider({bad.id})
+    _patch_queue(monkeypatch, provider)
+    calls_before = metrics.LLM_ISOLATION_CALLS.value(task="categorization")
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=4
+    )
+
+    assert processed == 3
+    # Whole batch, both halves, then both quarters of the failing half
+    assert [len(call) for call in provider.categorize_calls] == [4, 2, 2, 1, 1]
+    assert metrics.LLM_ISOLATION_CALLS.value(task="categorization") == calls_before + 4
+    for art in arts:
+        test_session.refresh(art)
+    assert bad.categorization_state == "failed"
+    assert [a.categorization_state for a in arts if a is not bad] == ["categorized"] * 3
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_bisected_only_once_retried(
+    test_session, sample_feed, monkeypatch, make_category
+):
+    """Malformed JSON is retried whole first; bisected if it fails again."""
+    _setup_preferences(test_session)
+    cat = make_category(display_name="Technology", slug="technology")
+    arts = [
+        _make_queued_article(
+            test_session,
+            sample_feed,
+            i,
+            categorization_state="categorized",
+            scoring_state="queued",
+        )
+        for i in range(2)
+    ]
+    for art in arts:
+        test_session.add(ArticleCategoryLink(article_id=art.id, category_id=cat.id))
+    test_session.commit()
+    provider = PoisonProvider({arts[0].id}, is_retryable=True)
+    _patch_queue(monkeypatch, provider)
+
+    await ScoringWorker().process_next_batch(test_session, batch_size=2)
+    for art in arts:
+        test_session.refresh(art)
+    assert [(a.scoring_state, a.scoring_attempts) for a in arts] == [("queued", 1)] * 2
+
+    for art in arts:
+        art.next_attempt_at = None
+        test_session.add(art)
+    test_session.commit()
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=2)
+
+    assert processed == 1
+    assert [len(call) for call in provider.score_calls] == [2, 2, 1, 1]
+    for art in arts:
+        test_session.refresh(art)
+    # Malformed output alone is not proof: the bad article keeps retrying
+    assert [(a.scoring_state, a.scoring_attempts) for a in arts] == [
+        ("queued", 2),
+        ("scored", 0),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_categorization_max_retries_sets_failed(
     test_session, sample_feed, monkeypatch
@@ -230,6 +436,92 @@ async def test_categorization_max_retries_sets_failed(
     assert art.categorization_attempts == 3
 
 
+@pytest.mark.asyncio
+async def test_combined_mode_scores_in_the_categorization_call(
+    test_session, sample_feed, monkeypatch, make_category
+):
+    """One call per batch; weights and blocking apply as in two stages."""
+    _setup_preferences(test_session)
+    make_category(display_name="AI", slug="ai", weight="boost")
+    make_category(display_name="Sports", slug="sports", weight="block")
+    boosted = _make_queued_article(test_session, sample_feed, 0)
+    blocked = _make_queued_article(test_session, sample_feed, 1)
+    provider = CombinedProvider({boosted.id: ["AI"], blocked.id: ["Sports"]})
+    _patch_queue(monkeypatch, provider)
+    monkeypatch.setattr(
+        scoring_queue_module.get_settings().pipeline, "combined_mode", True
+    )
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=2
+    )
+
+    assert processed == 2
+    assert len(provider.combined_calls) == 1
+    assert provider.categorize_calls == []
+    test_session.refresh(boosted)
+    test_session.refresh(blocked)
+    assert (boosted.categorization_state, boosted.scoring_state) == (
+        "categorized",
+        "scored",
+    )
+    assert boosted.composite_score == 12.0  # 8 x 1.5 (boost) x 1.0 (quality)
+    assert blocked.scoring_state == "scored"
+    assert blocked.composite_score == 0.0
+    assert blocked.score_reasoning == "Blocked: Sports"
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_rate_limit_throttles_scoring_route(
+    test_session, sample_feed, monkeypatch
+):
+    """A 429 on a combined call is the scoring route's; no batch-size success."""
+    _setup_preferences(test_session)
+    art = _make_queued_article(test_session, sample_feed, 0)
+    provider = CombinedProvider({}, error=RuntimeError("429 RESOURCE_EXHAUSTED"))
+    _patch_queue(monkeypatch, provider)
+    monkeypatch.setattr(
+        scoring_queue_module.get_settings().pipeline, "combined_mode", True
+    )
+    limited: list[str] = []
+    monkeypatch.setattr(
+        scoring_queue_module,
+        "set_scoring_rate_limited",
+        lambda _delay: limited.append("scoring"),
+    )
+    monkeypatch.setattr(
+        scoring_queue_module,
+        "set_categorization_rate_limited",
+        lambda _delay: limited.append("categorization"),
+    )
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=1
+    )
+
+    assert processed == 0
+    assert limited == ["scoring"]
+    test_session.refresh(art)
+    assert art.categorization_state == "queued"
+
+    # A successful combined call leaves the categorization batch size alone
+    successes: list[str] = []
+    monkeypatch.setattr(
+        scoring_queue_module,
+        "record_batch_success",
+        lambda task, *_args: successes.append(task),
+    )
+    provider.error = None
+    provider.categories = {art.id: ["Technology"]}
+    art.next_attempt_at = None
+    test_session.add(art)
+    test_session.commit()
+    assert (
+        await CategorizationWorker().process_next_batch(test_session, batch_size=1) == 1
+    )
+    assert successes == []
+
+
 @pytest.mark.asyncio
 async def test_categorization_rate_limit_skips(test_session, sample_feed, monkeypatch):
     """Rate limited → returns 0, no processing."""
@@ -286,6 +578,42 @@ async def test_categorization_deletes_old_category_links(
     assert "technology" in slugs
 
 
+@pytest.mark.asyncio
+async def test_categorization_mixed_batch(
+    test_session, sample_feed, monkeypatch, make_category
+):
+    """Blocked, routed and missing results in one batch are each handled."""
+    _setup_preferences(test_session)
+    make_category(display_name="Sports", slug="sports", weight="block")
+    routed, blocked, missing = [
+        _make_queued_article(test_session, sample_feed, i) for i in range(3)
+    ]
+
+    cat_results = [
+        ArticleCategoryResult(
+            article_id=routed.id,
+            categories=["Technology", "technology"],
+            suggested_new=["Technology"],
+        ),
+        ArticleCategoryResult(article_id=blocked.id, categories=["Sports"]),
+    ]
+    _patch_queue(monkeypatch, FakeProvider(cat_results=cat_results))
+
+    processed = await CategorizationWorker().process_next_batch(
+        test_session, batch_size=3
+    )
+
+    assert processed == 2
+    for art in (routed, blocked, missing):
+        test_session.refresh(art)
+    assert routed.scoring_state == "queued"
+    assert [c.slug for c in routed.categories_rel] == ["technology"]
+    assert blocked.scoring_state == "scored"
+    assert blocked.score_reasoning == "Blocked: Sports"
+    assert missing.categorization_state == "queued"
+    assert missing.categorization_attempts == 1
+
+
 @pytest.mark.asyncio
 async def test_score_only_skips_categorization_worker(
     test_session, sample_feed, monkeypatch, make_category
@@ -389,6 +717,84 @@ async def test_scoring_loads_categories_from_db(
     assert art.composite_score > 0
 
 
+def _make_scoring_articles(session, feed, count):
+    return [
+        _make_queued_article(
+            session,
+            feed,
+            i,
+            categorization_state="categorized",
+            scoring_state="queued",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cascade_escalates_only_uncertain_scores(
+    test_session, sample_feed, monkeypatch
+):
+    """Clear small-model scores are kept; the uncertain one goes to the large."""
+    _setup_preferences(test_session)
+    low, high, unsure = _make_scoring_articles(test_session, sample_feed, 3)
+    provider = CascadeProvider({low.id: 1, high.id: 9, unsure.id: 5})
+    _patch_queue(monkeypatch, provider)
+    monkeypatch.setattr(
+        scoring_queue_module.get_settings().pipeline, "cascade_model", "small-model"
+    )
+    kept_before = metrics.LLM_CASCADE_ARTICLES.value(outcome="kept")
+    escalated_before = metrics.LLM_CASCADE_ARTICLES.value(outcome="escalated")
+
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=3)
+
+    assert processed == 3
+    assert len(provider.small_calls[0]) == 3
+    assert [a["id"] for a in provider.score_calls[0]] == [unsure.id]
+    for art, tier, interest in (
+        (low, "small", 1),
+        (high, "small", 9),
+        (unsure, "large", 7),
+    ):
+        test_session.refresh(art)
+        assert art.scoring_state == "scored"
+        assert (art.score_tier, art.interest_score) == (tier, interest)
+    assert metrics.LLM_CASCADE_ARTICLES.value(outcome="kept") == kept_before + 2
+    assert (
+        metrics.LLM_CASCADE_ARTICLES.value(outcome="escalated") == escalated_before + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_cascade_escalates_batch_when_small_output_invalid(
+    test_session, sample_feed, monkeypatch
+):
+    """A small-model validation failure sends the whole batch to the large."""
+    _setup_preferences(test_session)
+    articles = _make_scoring_articles(test_session, sample_feed, 2)
+    provider = CascadeProvider(
+        {},
+        small_error=LLMValidationError(
+            '{"results": [', ValueError("truncated"), is_retryable=True
+        ),
+    )
+    _patch_queue(monkeypatch, provider)
+    monkeypatch.setattr(
+        scoring_queue_module.get_settings().pipeline, "cascade_model", "small-model"
+    )
+
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=2)
+
+    assert processed == 2
+    assert len(provider.score_calls[0]) == 2
+    for art in articles:
+        test_session.refresh(art)
+        assert (art.scoring_state, art.score_tier, art.scoring_attempts) == (
+            "scored",
+            "large",
+            0,
+        )
+
+
 @pytest.mark.asyncio
 async def test_scoring_error_increments_attempts(
     test_session, sample_feed, monkeypatch, make_category
@@ -508,6 +914,8 @@ async def test_enqueue_articles_sets_categorization_queued(test_session, sample_
     test_session.refresh(art)
     assert art.categorization_state == "queued"
     assert art.categorization_attempts == 0
+    assert art.queue_lane == "fresh"
+    assert art.queued_at is not None
 
 
 @pytest.mark.asyncio
@@ -561,11 +969,12 @@ async def test_enqueue_recent_full_rescore(test_session, sample_feed):
     test_session.refresh(art)
     assert art.categorization_state == "queued"
     assert art.categorization_attempts == 0
+    assert art.queue_lane == "backlog"
 
 
 @pytest.mark.asyncio
 async def test_enqueue_single_for_rescoring(test_session, sample_feed):
-    """Sets categorization_state='queued', scoring_priority=1."""
+    """Sets categorization_state='queued', scoring_priority=1, interactive lane."""
     art = Article(
         feed_id=sample_feed.id,
         title="Test",
@@ -586,6 +995,7 @@ async def test_enqueue_single_for_rescoring(test_session, sample_feed):
     assert art.categorization_state == "queued"
     assert art.categorization_attempts == 0
     assert art.scoring_priority == 1
+    assert art.queue_lane == "interactive"
 
 
 # ---------------------------------------------------------------------------
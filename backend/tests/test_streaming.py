@@ -0,0 +1,155 @@
+"""Tests for incremental application of streamed batch LLM results."""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import Session
+
+import backend.scoring_queue as scoring_queue_module
+from backend.llm_providers import ollama
+from backend.llm_providers.streaming import StreamingResultsParser
+from backend.models import Article
+from backend.prompts import ArticleCategoryResult, ArticleScoringResult
+from backend.scoring_queue import ScoringWorker
+
+
+def _score(article_id: int, reasoning: str = "ok") -> dict:
+    return {
+        "article_id": article_id,
+        "interest_score": 7,
+        "quality_score": 5,
+        "reasoning": reasoning,
+    }
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 1000])
+def test_parser_emits_each_item_when_it_closes(size):
+    # Braces, brackets and escaped quotes inside strings must not confuse it
+    doc = json.dumps(
+        {
+            "note": "results",
+            "results": [_score(1, 'a {"tricky"} ] value'), _score(2)],
+        }
+    )
+    parser = StreamingResultsParser(ArticleScoringResult)
+
+    emitted: list[list[int]] = []
+    for chunk in _chunks(doc, size):
+        emitted.append([r.article_id for r in parser.feed(chunk)])
+
+    assert [aid for batch in emitted for aid in batch] == [1, 2]
+    assert parser.invalid == 0
+
+
+def test_parser_skips_invalid_items_and_nested_objects():
+    doc = json.dumps(
+        {
+            "results": [
+                {"article_id": 1, "categories": ["a"], "extra": {"x": 1}},
+                {"article_id": 2, "categories": ["a", "b", "c", "d", "e"]},
+                {"article_id": 3, "categories": []},
+            ]
+        }
+    )
+    parser = StreamingResultsParser(ArticleCategoryResult)
+
+    assert [r.article_id for r in parser.feed(doc)] == [1, 3]
+    assert parser.invalid == 1
+
+
+class _FakeOllamaClient:
+    def __init__(self, chunks: list[str], error: Exception | None = None):
+        self.chunks = chunks
+        self.error = error
+
+    async def chat(self, **_kwargs):
+        async def _stream():
+            for text in self.chunks:
+                yield {"message": {"content": text}}
+            if self.error:
+                raise self.error
+
+        return _stream()
+
+
+@pytest.mark.asyncio
+async def test_ollama_keeps_streamed_results_when_stream_breaks(monkeypatch):
+    head = '{"results": [' + json.dumps(_score(1)) + ", " + json.dumps(_score(2))
+    client = _FakeOllamaClient(
+        _chunks(head + ', {"article_id": 3, "inter', 10),
+        error=ConnectionError("connection reset"),
+    )
+    monkeypatch.setattr(ollama, "get_ollama_client", lambda _host: client)
+
+    seen: list[int] = []
+    results = await ollama.score_articles(
+        [],
+        "",
+        "",
+        host="http://fake",
+        model="m",
+        on_result=lambda r: seen.append(r.article_id),
+    )
+
+    assert seen == [1, 2]
+    assert [r.article_id for r in results] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_worker_persists_streamed_scores_before_failure(
+    test_session, sample_feed, monkeypatch
+):
+    articles = []
+    for i in range(3):
+        article = Article(
+            feed_id=sample_feed.id,
+            title=f"Article {i}",
+            url=f"https://example.com/{i}",
+            content=f"Body {i}",
+            published_at=datetime(2026, 1, 1) + timedelta(hours=i),
+            scoring_state="queued",
+        )
+        test_session.add(article)
+        articles.append(article)
+    test_session.commit()
+    first, second, third = articles
+
+    class _Provider:
+        async def score(self, batch, *_args, on_result=None, **_kwargs):
+            # The worker commits streamed results before the call returns
+            on_result(ArticleScoringResult(**_score(batch[0]["id"])))
+            with Session(test_session.get_bind()) as other:
+                assert other.get(Article, batch[0]["id"]).scoring_state == "scored"
+            on_result(ArticleScoringResult(**_score(batch[1]["id"])))
+            raise ConnectionError("stream dropped")
+
+    async def _ready(*_a, **_kw):
+        return SimpleNamespace(
+            ready=True,
+            provider="fake",
+            model="fake-model",
+            endpoint=None,
+            thinking=False,
+            api_key=None,
+            endpoints=None,
+        )
+
+    monkeypatch.setattr(scoring_queue_module, "evaluate_task_readiness", _ready)
+    monkeypatch.setattr(scoring_queue_module, "get_provider", lambda _n: _Provider())
+    monkeypatch.setattr(scoring_queue_module, "is_scoring_rate_limited", lambda: False)
+
+    processed = await ScoringWorker().process_next_batch(test_session, batch_size=5)
+
+    assert processed == 2
+    for article in articles:
+        test_session.refresh(article)
+    assert first.scoring_state == second.scoring_state == "scored"
+    assert first.scoring_attempts == 0
+    assert third.scoring_state == "queued"
+    assert third.scoring_attempts == 1
@@ -181,3 +181,25 @@ async def test_evaluate_task_readiness_model_missing(
     runtime = await evaluate_task_readiness(test_session, TASK_CATEGORIZATION)
     assert runtime.ready is False
     assert runtime.reason == "model_missing"
+
+
+@pytest.mark.asyncio
+async def test_registered_provider_is_routable(
+    test_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A provider added with register_provider resolves and passes readiness."""
+    from backend.benchmarks.fake_provider import FAKE_MODEL, FakeProvider
+    from backend.llm_providers import registry
+
+    monkeypatch.setattr(registry, "PROVIDERS", dict(registry.PROVIDERS))
+    registry.register_provider(FakeProvider())
+    test_session.add(LLMProviderConfig(provider="fake", config_json="{}"))
+    test_session.add(
+        LLMTaskRoute(task=TASK_CATEGORIZATION, provider="fake", model=FAKE_MODEL)
+    )
+    test_session.commit()
+
+    runtime = await evaluate_task_readiness(test_session, TASK_CATEGORIZATION)
+    assert runtime.ready is True
+    assert runtime.provider == "fake"
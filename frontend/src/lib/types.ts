@@ -34,6 +34,8 @@ export interface Article {
   quality_score: number | null;
   composite_score: number | null;
   score_reasoning: string | null;
+  // "local" (pre-scorer), "small" or "large" (scoring cascade models)
+  score_tier?: string | null;
   scoring_state: string;
   scored_at: string | null;
   re_evaluating?: boolean;
@@ -120,6 +122,7 @@ export interface OllamaConfig {
   scoring_model: string | null;
   use_separate_models: boolean;
   batch_size: number;
+  extra_endpoints?: string[];
 }
 
 export interface GoogleConfig {
@@ -191,6 +194,52 @@ export type SortOption = "score_desc" | "score_asc" | "date_desc" | "date_asc";
 
 export type FilterTab = "unread" | "all" | "scoring" | "blocked" | "failed";
 
+export interface BatchSizeStatus {
+  effective: number | null;
+  configured?: number | null;
+  min?: number;
+  max?: number;
+  reason: string;
+  per_article_latency_s?: number | null;
+  missing_rate?: number;
+  validation_errors?: number;
+  timeouts?: number;
+}
+
+export interface ResultCacheStatus {
+  enabled: boolean;
+  hits: number;
+  misses: number;
+  hit_rate: number | null;
+  tasks: Record<string, { hits: number; misses: number }>;
+}
+
+export interface NearDuplicateStatus {
+  enabled: boolean;
+  max_distance: number;
+  inherited: number;
+}
+
+export interface ModelResidencyStatus {
+  enabled: boolean;
+  model_loads: number;
+  model_swaps: number;
+}
+
+export interface OllamaEndpointStatus {
+  endpoint: string;
+  healthy: boolean;
+  in_flight: number;
+  requests: number;
+  failures: number;
+}
+
+export interface BatchJobsStatus {
+  threshold: number;
+  running_jobs: number;
+  articles_in_jobs: number;
+}
+
 export interface ScoringStatus {
   unscored: number;
   queued: number;
@@ -217,13 +266,20 @@ export interface ScoringStatus {
     ready_reason: string | null;
     phase: string;
     rate_limit_retry_after: number | null;
+    batch_size?: BatchSizeStatus;
   };
   scoring_worker?: {
     ready: boolean;
     ready_reason: string | null;
     phase: string;
     rate_limit_retry_after: number | null;
+    batch_size?: BatchSizeStatus;
   };
+  result_cache?: ResultCacheStatus;
+  near_duplicates?: NearDuplicateStatus;
+  model_residency?: ModelResidencyStatus;
+  ollama_endpoints?: OllamaEndpointStatus[];
+  batch_jobs?: BatchJobsStatus;
 }
 
 export interface DownloadStatus {